@@ -0,0 +1,64 @@
+from tlaplus_cli.bench.gate import (
+    GATE_METRICS,
+    MetricCheck,
+    baseline_results,
+    baseline_settings,
+    check_metric,
+    gate_results,
+    load_baseline,
+    parse_tolerances,
+)
+from tlaplus_cli.bench.measure import MeasuredRuns, RunMeasurement, measure_tlc
+from tlaplus_cli.bench.overrides import (
+    FIXTURES_FILE,
+    OverrideResult,
+    bench_overrides,
+    load_fixtures,
+    override_results_to_json,
+)
+from tlaplus_cli.bench.runner import (
+    BenchResult,
+    BenchSettings,
+    resolve_bench_versions,
+    results_to_json,
+    run_benchmarks,
+)
+from tlaplus_cli.bench.stats import Change, Summary, relative_change, summarize
+from tlaplus_cli.bench.workloads import (
+    Workload,
+    configured_workloads,
+    materialize_builtin_workloads,
+    select_workloads,
+)
+
+__all__ = [
+    "FIXTURES_FILE",
+    "GATE_METRICS",
+    "BenchResult",
+    "BenchSettings",
+    "Change",
+    "MeasuredRuns",
+    "MetricCheck",
+    "OverrideResult",
+    "RunMeasurement",
+    "Summary",
+    "Workload",
+    "baseline_results",
+    "baseline_settings",
+    "bench_overrides",
+    "check_metric",
+    "configured_workloads",
+    "gate_results",
+    "load_baseline",
+    "load_fixtures",
+    "materialize_builtin_workloads",
+    "measure_tlc",
+    "override_results_to_json",
+    "parse_tolerances",
+    "relative_change",
+    "resolve_bench_versions",
+    "results_to_json",
+    "run_benchmarks",
+    "select_workloads",
+    "summarize",
+]
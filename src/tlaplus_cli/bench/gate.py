@@ -0,0 +1,191 @@
+"""Performance regression gate: compare fresh benchmark runs to a stored baseline.
+
+A baseline is the JSON written by ``tla bench --json`` (or ``tla bench gate
+--json``): raw runs per version and workload plus the settings they were
+measured with. It is read from a file or from a git ref (``main`` reads the
+configured baseline file at that ref, ``main:path/to/file.json`` a given
+path).
+
+Each gated metric is compared by the ratio of its medians. A change only
+counts as a regression when it is worse than the metric's tolerance *plus* a
+noise allowance of ``mad_factor`` scaled MADs (the relative MADs of both
+samples combined), so a run on a noisy shared machine widens its own
+threshold instead of failing the gate.
+"""
+
+import json
+import math
+import subprocess
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from tlaplus_cli.bench.measure import RunMeasurement
+from tlaplus_cli.bench.runner import BenchResult, BenchSettings
+from tlaplus_cli.bench.stats import Summary, summarize
+
+# metric -> +1 if higher is worse, -1 if lower is worse
+GATE_METRICS = {"wall_time": 1, "states_per_sec": -1, "distinct_states": 1}
+# MAD * 1.4826 estimates the standard deviation of normally distributed samples.
+_MAD_SCALE = 1.4826
+
+
+@dataclass
+class MetricCheck:
+    workload: str
+    metric: str
+    baseline: Summary
+    candidate: Summary
+    delta: float
+    allowed: float
+
+    @property
+    def worse(self) -> float:
+        """The change in the direction that makes the metric worse (negative for an improvement)."""
+        return self.delta * GATE_METRICS[self.metric]
+
+    @property
+    def regressed(self) -> bool:
+        return self.worse > self.allowed
+
+    @property
+    def improved(self) -> bool:
+        return -self.worse > self.allowed
+
+
+def _read_git(spec: str) -> str:
+    try:
+        proc = subprocess.run(["git", "show", spec], capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        msg = "git not found; cannot read a baseline from a ref"
+        raise ValueError(msg) from None
+    if proc.returncode != 0:
+        msg = f"cannot read baseline {spec}: {proc.stderr.strip() or 'git show failed'}"
+        raise ValueError(msg)
+    return proc.stdout
+
+
+def load_baseline(source: str, default_file: str) -> dict[str, Any]:
+    """Read a baseline from the file *source* or from a git ref.
+
+    A ref without a path (``main``) reads *default_file* at that ref.
+
+    Raises:
+        ValueError: if the baseline cannot be read or is not a benchmark result file.
+    """
+    path = Path(source)
+    if path.is_file():
+        text = path.read_text(encoding="utf-8")
+    else:
+        text = _read_git(source if ":" in source else f"{source}:{default_file}")
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict) or not isinstance(data.get("results"), list):
+        msg = f"baseline {source} is not a tla bench JSON file"
+        raise ValueError(msg)  # noqa: TRY004
+    return data
+
+
+def baseline_settings(data: Mapping[str, Any]) -> BenchSettings:
+    """The settings the baseline was measured with (defaults for anything missing)."""
+    recorded = data.get("settings") or {}
+    return BenchSettings(**{k: v for k, v in recorded.items() if k in BenchSettings.__dataclass_fields__})
+
+
+def baseline_results(data: Mapping[str, Any], version: str) -> dict[str, BenchResult]:
+    """The baseline result per workload.
+
+    When a workload was measured on several versions, the entry for *version*
+    is preferred, otherwise the first one is used.
+    """
+    results: dict[str, BenchResult] = {}
+    for entry in data["results"]:
+        workload = entry["workload"]
+        if workload in results and entry["version"] != version:
+            continue
+        runs = [
+            RunMeasurement(
+                exit_code=r["exit_code"],
+                wall_time=r["wall_time"],
+                states_generated=r.get("states_generated"),
+                distinct_states=r.get("distinct_states"),
+                peak_rss=r.get("peak_rss"),
+            )
+            for r in entry["runs"]
+        ]
+        results[workload] = BenchResult(version=entry["version"], workload=workload, runs=runs)
+    return results
+
+
+def check_metric(  # noqa: PLR0913
+    workload: str,
+    metric: str,
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    *,
+    tolerance: float,
+    mad_factor: float,
+) -> MetricCheck | None:
+    """Compare one metric; None if either side has no values or the baseline median is zero."""
+    base, cand = summarize(baseline), summarize(candidate)
+    if base is None or cand is None or not base.median:
+        return None
+    noise = mad_factor * _MAD_SCALE * math.hypot(base.spread, cand.spread)
+    return MetricCheck(
+        workload=workload,
+        metric=metric,
+        baseline=base,
+        candidate=cand,
+        delta=cand.median / base.median - 1,
+        allowed=tolerance + noise,
+    )
+
+
+def gate_results(
+    baseline: Mapping[str, BenchResult],
+    candidates: Sequence[BenchResult],
+    tolerances: Mapping[str, float],
+    *,
+    mad_factor: float,
+) -> list[MetricCheck]:
+    """Check every gated metric of every candidate against its baseline workload."""
+    checks = []
+    for result in candidates:
+        base = baseline.get(result.workload)
+        if base is None:
+            continue
+        for metric, tolerance in tolerances.items():
+            check = check_metric(
+                result.workload,
+                metric,
+                base.values(metric),
+                result.values(metric),
+                tolerance=tolerance,
+                mad_factor=mad_factor,
+            )
+            if check is not None:
+                checks.append(check)
+    return checks
+
+
+def parse_tolerances(values: Sequence[str], defaults: Mapping[str, float]) -> dict[str, float]:
+    """Apply ``METRIC=FRACTION`` overrides (e.g. ``wall_time=0.2`` or ``wall_time=20%``) to *defaults*.
+
+    Raises:
+        ValueError: for an unknown metric (also in *defaults*) or a malformed value.
+    """
+    tolerances: dict[str, float] = {}
+    for value in [f"{m}={t}" for m, t in defaults.items()] + list(values):
+        metric, sep, amount = value.partition("=")
+        if not sep or metric not in GATE_METRICS:
+            msg = f"invalid tolerance {value!r}: expected METRIC=FRACTION with METRIC one of {', '.join(GATE_METRICS)}"
+            raise ValueError(msg)
+        try:
+            tolerances[metric] = float(amount[:-1]) / 100 if amount.endswith("%") else float(amount)
+        except ValueError:
+            msg = f"invalid tolerance {value!r}: {amount!r} is not a number"
+            raise ValueError(msg) from None
+    return tolerances
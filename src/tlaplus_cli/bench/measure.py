@@ -0,0 +1,69 @@
+"""Timing and resource measurement of a single TLC process."""
+
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from tlaplus_cli.bench.stats import Summary, summarize
+from tlaplus_cli.tlc.affinity import wait_with_rusage
+from tlaplus_cli.tlc.output import TlcOutputParser, TlcStats
+
+
+@dataclass
+class RunMeasurement:
+    exit_code: int
+    wall_time: float
+    states_generated: int | None = None
+    distinct_states: int | None = None
+    peak_rss: int | None = None
+
+    @property
+    def states_per_sec(self) -> float | None:
+        if self.states_generated is None or self.wall_time <= 0:
+            return None
+        return self.states_generated / self.wall_time
+
+
+class MeasuredRuns:
+    """Mixin for results that hold a list of measured runs."""
+
+    runs: list[RunMeasurement]
+
+    @property
+    def failed(self) -> bool:
+        return any(r.exit_code != 0 for r in self.runs)
+
+    def values(self, metric: str) -> list[float]:
+        """Values of *metric* over the successful runs."""
+        values = (getattr(r, metric) for r in self.runs if r.exit_code == 0)
+        return [float(v) for v in values if v is not None]
+
+    def summary(self, metric: str) -> Summary | None:
+        return summarize(self.values(metric))
+
+
+def measure_tlc(cmd: list[str], cwd: Path) -> tuple[RunMeasurement, TlcStats]:
+    """Run a TLC command to completion, capturing its output, wall time and peak RSS."""
+    parser = TlcOutputParser()
+    start = time.perf_counter()
+    try:
+        proc = subprocess.Popen(cmd, cwd=str(cwd), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    except FileNotFoundError:
+        msg = "'java' not found. Please install Java."
+        raise FileNotFoundError(msg) from None
+
+    for line in proc.stdout or ():
+        parser.feed(line)
+    exit_code, peak_rss = wait_with_rusage(proc)
+    wall_time = time.perf_counter() - start
+
+    stats = parser.stats
+    measurement = RunMeasurement(
+        exit_code=exit_code,
+        wall_time=wall_time,
+        states_generated=stats.states_generated,
+        distinct_states=stats.distinct_states,
+        peak_rss=peak_rss,
+    )
+    return measurement, stats
@@ -0,0 +1,518 @@
+"""Microbenchmarks of compiled Java overrides against their TLA+ definitions.
+
+Benchmarks come from a fixture file (``bench.yaml`` in a modules directory,
+see ``OverrideBenchFixtures``). For each argument list:
+
+- A generated Java harness finds the ``@TLAPlusOperator`` method for the
+  operator among the compiled classes and calls it with TLC ``Value``
+  arguments built from the fixture. After a time-based warm-up it measures
+  several rounds, printing ns/op per round and allocated bytes per
+  operation as one JSON line.
+- TLC evaluates the operator's TLA+ definition, without the overrides on the
+  classpath, in an ``ASSUME`` that applies it *n* times. A run with *n* = 0
+  is subtracted, so JVM start-up and parsing cancel out.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from string import Template
+from typing import Any
+
+import yaml
+from pydantic import ValidationError
+
+from tlaplus_cli.bench.stats import Summary, summarize
+from tlaplus_cli.config.schema import OverrideBenchCase, OverrideBenchFixtures
+from tlaplus_cli.tlc.compiler import ModuleSources
+
+FIXTURES_FILE = "bench.yaml"
+HARNESS_CLASS = "TlaModulesBench"
+TLA_HARNESS = "TlaModulesBenchHarness"
+
+_HARNESS = Template("""\
+import java.lang.management.ManagementFactory;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.lang.reflect.Modifier;
+import java.util.Arrays;
+import java.util.Locale;
+import tlc2.overrides.TLAPlusOperator;
+import tlc2.value.impl.*;
+import util.UniqueString;
+
+public final class $name {
+    static volatile int sink;
+
+    public static void main(String[] args) {
+        long warmup = Long.parseLong(args[0]) * 1_000_000L;
+        long measure = Long.parseLong(args[1]) * 1_000_000L;
+        int rounds = Integer.parseInt(args[2]);
+        String[] classes = Arrays.copyOfRange(args, 3, args.length);
+$cases
+    }
+
+    static Method find(String[] classes, String module, String operator) {
+        for (String name : classes) {
+            Method[] methods;
+            try {
+                methods = Class.forName(name, false, $name.class.getClassLoader()).getDeclaredMethods();
+            } catch (Throwable e) {
+                continue;
+            }
+            for (Method m : methods) {
+                TLAPlusOperator op = m.getAnnotation(TLAPlusOperator.class);
+                if (op != null && Modifier.isStatic(m.getModifiers())
+                        && op.identifier().equals(operator) && op.module().equals(module)) {
+                    m.setAccessible(true);
+                    return m;
+                }
+            }
+        }
+        return null;
+    }
+
+    static long run(Method m, Object[] args, long n) throws Exception {
+        int h = 0;
+        for (long i = 0; i < n; i++) {
+            h += System.identityHashCode(m.invoke(null, args));
+        }
+        sink += h;
+        return n;
+    }
+
+    static long allocated(java.lang.management.ThreadMXBean threads) {
+        if (threads instanceof com.sun.management.ThreadMXBean) {
+            return ((com.sun.management.ThreadMXBean) threads).getThreadAllocatedBytes(Thread.currentThread().getId());
+        }
+        return -1;
+    }
+
+    static void bench(String[] classes, String module, String operator, int input, Object[] args,
+                      long warmup, long measure, int rounds) {
+        String head = "{\\"module\\":" + quote(module) + ",\\"operator\\":" + quote(operator) + ",\\"input\\":" + input;
+        Method m = find(classes, module, operator);
+        if (m == null) {
+            System.out.println(head + ",\\"error\\":\\"no @TLAPlusOperator override found\\"}");
+            return;
+        }
+        try {
+            java.lang.management.ThreadMXBean threads = ManagementFactory.getThreadMXBean();
+            long batch = 1;
+            long end = System.nanoTime() + warmup;
+            while (true) {
+                long t0 = System.nanoTime();
+                run(m, args, batch);
+                long t1 = System.nanoTime();
+                if (t1 >= end) {
+                    break;
+                }
+                if (t1 - t0 < 1_000_000L) {
+                    batch *= 2;
+                }
+            }
+            StringBuilder ns = new StringBuilder();
+            long totalOps = 0;
+            long startBytes = allocated(threads);
+            for (int r = 0; r < rounds; r++) {
+                long ops = 0;
+                long start = System.nanoTime();
+                long now;
+                do {
+                    ops += run(m, args, batch);
+                    now = System.nanoTime();
+                } while (now - start < measure);
+                totalOps += ops;
+                ns.append(r > 0 ? "," : "").append(String.format(Locale.ROOT, "%.3f", (double) (now - start) / ops));
+            }
+            long bytes = allocated(threads) - startBytes;
+            String perOp = startBytes < 0 ? "null" : String.format(Locale.ROOT, "%.1f", (double) bytes / totalOps);
+            System.out.println(head + ",\\"ns_per_op\\":[" + ns + "],\\"bytes_per_op\\":" + perOp + "}");
+        } catch (Throwable e) {
+            Throwable cause = e instanceof InvocationTargetException ? e.getCause() : e;
+            System.out.println(head + ",\\"error\\":" + quote(String.valueOf(cause)) + "}");
+        }
+    }
+
+    static String quote(String s) {
+        StringBuilder b = new StringBuilder("\\"");
+        for (char c : s.toCharArray()) {
+            if (c == '"' || c == '\\\\') {
+                b.append('\\\\').append(c);
+            } else if (c < 0x20) {
+                b.append(String.format("\\\\u%04x", (int) c));
+            } else {
+                b.append(c);
+            }
+        }
+        return b.append('"').toString();
+    }
+}
+""")
+
+
+def load_fixtures(path: Path) -> OverrideBenchFixtures:
+    """Load a benchmark fixture file.
+
+    Raises:
+        ValueError: if it is not valid YAML or does not match the schema.
+    """
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        return OverrideBenchFixtures.model_validate(data)
+    except (OSError, yaml.YAMLError, ValidationError) as e:
+        msg = f"Invalid benchmark fixtures {path}: {e}"
+        raise ValueError(msg) from None
+
+
+def _tagged(value: dict[str, Any]) -> tuple[str, Any] | None:
+    """``("set", items)`` or ``("range", [lo, hi])`` for the tagged mappings, else None."""
+    if len(value) == 1:
+        tag, payload = next(iter(value.items()))
+        if tag in ("set", "range") and isinstance(payload, list):
+            return tag, payload
+    return None
+
+
+def _bad_value(value: Any) -> ValueError:
+    return ValueError(f"unsupported fixture value: {value!r}")
+
+
+def _java_mapping(value: dict[str, Any]) -> str:
+    tagged = _tagged(value)
+    if tagged is not None and tagged[0] == "range" and len(tagged[1]) == 2:
+        lo, hi = tagged[1]
+        return f"new IntervalValue({int(lo)}, {int(hi)})"
+    if tagged is not None and tagged[0] == "set":
+        return f"new SetEnumValue(new Value[] {{{', '.join(map(java_value, tagged[1]))}}}, false)"
+    if not value or not all(isinstance(k, str) for k in value):
+        raise _bad_value(value)
+    names = ", ".join(f"UniqueString.uniqueStringOf({json.dumps(k)})" for k in value)
+    values = ", ".join(java_value(v) for v in value.values())
+    return f"new RecordValue(new UniqueString[] {{{names}}}, new Value[] {{{values}}}, false)"
+
+
+def java_value(value: Any) -> str:
+    """Java expression constructing the TLC ``Value`` for a fixture value.
+
+    Raises:
+        ValueError: for values that have no TLC counterpart here (e.g. floats).
+    """
+    if isinstance(value, bool):
+        return "BoolValue.ValTrue" if value else "BoolValue.ValFalse"
+    if isinstance(value, int):
+        return f"IntValue.gen({value})"
+    if isinstance(value, str):
+        return f"new StringValue({json.dumps(value)})"
+    if isinstance(value, list):
+        return f"new TupleValue(new Value[] {{{', '.join(map(java_value, value))}}})"
+    if isinstance(value, dict):
+        return _java_mapping(value)
+    raise _bad_value(value)
+
+
+def _tla_mapping(value: dict[str, Any]) -> str:
+    tagged = _tagged(value)
+    if tagged is not None and tagged[0] == "range" and len(tagged[1]) == 2:
+        lo, hi = tagged[1]
+        return f"{int(lo)}..{int(hi)}"
+    if tagged is not None and tagged[0] == "set":
+        return f"{{{', '.join(map(tla_value, tagged[1]))}}}"
+    if not value or not all(isinstance(k, str) for k in value):
+        raise _bad_value(value)
+    return f"[{', '.join(f'{k} |-> {tla_value(v)}' for k, v in value.items())}]"
+
+
+def tla_value(value: Any) -> str:
+    """TLA+ expression for a fixture value.
+
+    Raises:
+        ValueError: for values that have no TLA+ counterpart here.
+    """
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        return json.dumps(value)
+    if isinstance(value, list):
+        return f"<<{', '.join(map(tla_value, value))}>>"
+    if isinstance(value, dict):
+        return _tla_mapping(value)
+    raise _bad_value(value)
+
+
+def harness_source(cases: Sequence[OverrideBenchCase]) -> str:
+    """Java source of the harness class calling every case's override on each of its inputs."""
+    calls = []
+    for case in cases:
+        for i, args in enumerate(case.inputs):
+            values = ", ".join(map(java_value, args))
+            calls.append(
+                f"        bench(classes, {json.dumps(case.module)}, {json.dumps(case.operator)}, {i}, "
+                f"new Object[] {{{values}}}, warmup, measure, rounds);"
+            )
+    return _HARNESS.substitute(name=HARNESS_CLASS, cases="\n".join(calls))
+
+
+def tla_harness(case: OverrideBenchCase, args: Sequence[Any], evals: int) -> str:
+    """TLA+ module whose ``ASSUME`` applies the operator *evals* times.
+
+    Wrapping the application in a one-element tuple forces its evaluation
+    at a constant, negligible extra cost.
+    """
+    names = [f"BenchIn{i}" for i in range(1, len(args) + 1)]
+    call = f"{case.operator}({', '.join(names)})" if names else case.operator
+    extends = ", ".join(dict.fromkeys([case.module, "Sequences"]))
+    lines = [
+        f"---- MODULE {TLA_HARNESS} ----",
+        f"EXTENDS {extends}",
+        "VARIABLE bench_x",
+        *(f"{name} == {tla_value(a)}" for name, a in zip(names, args, strict=True)),
+        f"ASSUME \\A bench_i \\in 1..{evals} : Len(<<{call}>>) = 1",
+        "Init == bench_x = 0",
+        "Next == UNCHANGED bench_x",
+        "====",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def override_classes(classes_dir: Path) -> list[str]:
+    """Binary names of the compiled classes under *classes_dir*."""
+    if not classes_dir.is_dir():
+        return []
+    names = []
+    for f in sorted(classes_dir.rglob("*.class")):
+        rel = f.relative_to(classes_dir).with_suffix("")
+        if rel.parts[0] != "META-INF" and rel.name != "module-info":
+            names.append(".".join(rel.parts))
+    return names
+
+
+@dataclass
+class OverrideResult:
+    module: str
+    operator: str
+    input: int
+    args: str
+    java_ns: list[float] = field(default_factory=list)
+    bytes_per_op: float | None = None
+    tla_ns: float | None = None
+    error: str | None = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.module}!{self.operator}"
+
+    @property
+    def java_summary(self) -> Summary | None:
+        return summarize(self.java_ns) if self.java_ns else None
+
+    @property
+    def speedup(self) -> float | None:
+        """How many times faster the override is than TLC evaluating the definition."""
+        summary = self.java_summary
+        if summary is None or self.tla_ns is None or summary.median <= 0:
+            return None
+        return self.tla_ns / summary.median
+
+
+def _run(cmd: list[str], cwd: Path, what: str) -> subprocess.CompletedProcess[str]:
+    try:
+        return subprocess.run(cmd, cwd=str(cwd), capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        msg = f"'{cmd[0]}' not found; {what} needs a JDK on PATH."
+        raise FileNotFoundError(msg) from None
+
+
+def run_java_harness(  # noqa: PLR0913
+    sources: ModuleSources,
+    results: Sequence[OverrideResult],
+    cases: Sequence[OverrideBenchCase],
+    java_opts: Sequence[str],
+    workdir: Path,
+    *,
+    warmup_ms: int,
+    measure_ms: int,
+    rounds: int,
+) -> None:
+    """Compile and run the harness, filling in the Java side of *results*.
+
+    Raises:
+        RuntimeError: if the harness does not compile or produces no results.
+    """
+    source = workdir / f"{HARNESS_CLASS}.java"
+    source.write_text(harness_source(cases))
+    classpath = os.pathsep.join([str(sources.classes_dir), sources.classpath])
+    compiled = _run(["javac", "-cp", classpath, "-d", str(workdir), str(source)], workdir, "the harness")
+    if compiled.returncode != 0:
+        msg = f"Compiling the benchmark harness failed:\n{(compiled.stderr or compiled.stdout).strip()}"
+        raise RuntimeError(msg)
+
+    cmd = [
+        "java",
+        *java_opts,
+        "-cp",
+        os.pathsep.join([str(workdir), classpath]),
+        HARNESS_CLASS,
+        str(warmup_ms),
+        str(measure_ms),
+        str(rounds),
+        *override_classes(sources.classes_dir),
+    ]
+    completed = _run(cmd, workdir, "the harness")
+    by_key = {(r.module, r.operator, r.input): r for r in results}
+    seen = 0
+    for line in completed.stdout.splitlines():
+        if not line.startswith("{"):
+            continue
+        try:
+            data = json.loads(line)
+            result = by_key[data["module"], data["operator"], data["input"]]
+        except (ValueError, KeyError):
+            continue
+        seen += 1
+        result.java_ns = [float(v) for v in data.get("ns_per_op", [])]
+        result.bytes_per_op = data.get("bytes_per_op")
+        result.error = data.get("error")
+    if not seen:
+        msg = f"The benchmark harness failed:\n{(completed.stderr or completed.stdout).strip()}"
+        raise RuntimeError(msg)
+
+
+def _tlc_error(completed: subprocess.CompletedProcess[str]) -> str:
+    lines = completed.stdout.splitlines()
+    error = next((line for line in lines if line.startswith("Error:")), None)
+    return error or (completed.stderr.strip().splitlines() or [f"exit code {completed.returncode}"])[-1]
+
+
+def time_tla_operator(  # noqa: PLR0913
+    sources: ModuleSources,
+    case: OverrideBenchCase,
+    args: Sequence[Any],
+    workdir: Path,
+    *,
+    java_opts: Sequence[str],
+    java_class: str,
+    library_dirs: Sequence[Path],
+    evals: int,
+    repeat: int = 2,
+) -> float:
+    """Nanoseconds per application of the operator's TLA+ definition, evaluated by TLC.
+
+    Raises:
+        RuntimeError: if TLC fails to evaluate the definition.
+    """
+    library = os.pathsep.join(str(d) for d in library_dirs)
+    cmd = [
+        "java",
+        *java_opts,
+        f"-DTLA-Library={library}",
+        "-cp",
+        sources.classpath,
+        java_class,
+        "-metadir",
+        str(workdir / "states"),
+        f"{TLA_HARNESS}.tla",
+    ]
+    (workdir / f"{TLA_HARNESS}.cfg").write_text("INIT Init\nNEXT Next\n")
+    timings = []
+    for n in (0, evals):
+        (workdir / f"{TLA_HARNESS}.tla").write_text(tla_harness(case, args, n))
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            completed = _run(cmd, workdir, "TLC")
+            elapsed = time.perf_counter() - start
+            if completed.returncode != 0:
+                msg = f"TLC failed to evaluate {case.module}!{case.operator}: {_tlc_error(completed)}"
+                raise RuntimeError(msg)
+            best = min(best, elapsed)
+        timings.append(best)
+    return max(timings[1] - timings[0], 0.0) * 1e9 / evals
+
+
+def bench_overrides(  # noqa: PLR0913
+    fixtures: OverrideBenchFixtures,
+    sources: ModuleSources,
+    *,
+    java_opts: Sequence[str],
+    java_class: str,
+    library_dirs: Sequence[Path],
+    warmup_ms: int,
+    measure_ms: int,
+    rounds: int,
+    tla_evals: int | None,
+    on_result: Callable[[OverrideResult], None] | None = None,
+) -> list[OverrideResult]:
+    """Benchmark every fixture input through the Java harness and, unless *tla_evals* is None, through TLC.
+
+    Raises:
+        FileNotFoundError: if ``javac``/``java`` is missing.
+        RuntimeError: if the harness fails.
+        ValueError: if a fixture value is not supported.
+    """
+    cases = fixtures.benchmarks
+    results = [
+        OverrideResult(case.module, case.operator, i, ", ".join(map(tla_value, args)))
+        for case in cases
+        for i, args in enumerate(case.inputs)
+    ]
+    with tempfile.TemporaryDirectory(prefix="tla-modules-bench-") as tmp:
+        workdir = Path(tmp)
+        run_java_harness(
+            sources,
+            results,
+            cases,
+            java_opts,
+            workdir,
+            warmup_ms=warmup_ms,
+            measure_ms=measure_ms,
+            rounds=rounds,
+        )
+        inputs = [(case, args) for case in cases for args in case.inputs]
+        for result, (case, args) in zip(results, inputs, strict=True):
+            if tla_evals is not None:
+                try:
+                    result.tla_ns = time_tla_operator(
+                        sources,
+                        case,
+                        args,
+                        workdir,
+                        java_opts=java_opts,
+                        java_class=java_class,
+                        library_dirs=library_dirs,
+                        evals=tla_evals,
+                    )
+                except RuntimeError as e:
+                    result.error = result.error or str(e)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+def override_results_to_json(results: Sequence[OverrideResult]) -> list[dict[str, Any]]:
+    rows = []
+    for r in results:
+        summary = r.java_summary
+        rows.append(
+            {
+                "module": r.module,
+                "operator": r.operator,
+                "input": r.input,
+                "args": r.args,
+                "java_ns_per_op": summary.median if summary else None,
+                "java_ns_per_op_mad": summary.mad if summary else None,
+                "java_ns_per_op_rounds": r.java_ns,
+                "bytes_per_op": r.bytes_per_op,
+                "tla_ns_per_op": r.tla_ns,
+                "speedup": r.speedup,
+                "error": r.error,
+            }
+        )
+    return rows
@@ -0,0 +1,155 @@
+"""Cross-version TLC throughput benchmarks."""
+
+import platform
+import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from tlaplus_cli.bench.measure import MeasuredRuns, RunMeasurement, measure_tlc
+from tlaplus_cli.bench.workloads import Workload
+from tlaplus_cli.versioning import (
+    LocalVersion,
+    _utc_now_iso,
+    get_pinned_version_dir,
+    list_local_versions,
+    resolve_latest_version,
+)
+
+METRICS = ("states_per_sec", "distinct_states", "wall_time", "peak_rss")
+
+
+@dataclass
+class BenchSettings:
+    warmup: int = 1
+    repeat: int = 5
+    workers: int = 1
+    seed: int = 0
+
+
+@dataclass
+class BenchResult(MeasuredRuns):
+    version: str
+    workload: str
+    runs: list[RunMeasurement] = field(default_factory=list)
+
+
+def resolve_bench_versions(names: Sequence[str] | None) -> list[LocalVersion]:
+    """Resolve installed versions by name (e.g. 'v1.8.0') or directory name.
+
+    Defaults to the pinned version. When a name matches several installed
+    builds, the latest one is used.
+
+    Raises:
+        ValueError: if a version is not installed (or nothing is pinned).
+    """
+    local = list_local_versions()
+    if not names:
+        pinned = get_pinned_version_dir()
+        match = next((lv for lv in local if pinned and lv.path == pinned), None)
+        if match is None:
+            msg = "no version specified and no version is pinned"
+            raise ValueError(msg)
+        return [match]
+
+    versions = []
+    for name in names:
+        latest = resolve_latest_version([lv for lv in local if name in (lv.name, lv.path.name)])
+        if latest is None:
+            msg = f"version {name} is not installed"
+            raise ValueError(msg)
+        versions.append(latest)
+    return versions
+
+
+def build_bench_command(  # noqa: PLR0913
+    jar: Path,
+    workload: Workload,
+    settings: BenchSettings,
+    java_opts: Sequence[str],
+    metadir: Path,
+    *,
+    java_class: str = "tlc2.TLC",
+) -> list[str]:
+    """Build the TLC command line for one benchmark run."""
+    cmd = [
+        "java",
+        *java_opts,
+        "-cp",
+        str(jar),
+        java_class,
+        "-workers",
+        str(settings.workers),
+        "-seed",
+        str(settings.seed),
+        "-fp",
+        str(settings.seed % 131),
+        "-metadir",
+        str(metadir),
+    ]
+    if workload.cfg:
+        cmd.extend(["-config", str(workload.cfg)])
+    cmd.append(workload.spec.name)
+    return cmd
+
+
+def _measure(
+    version: LocalVersion, workload: Workload, settings: BenchSettings, java_opts: Sequence[str], java_class: str
+) -> RunMeasurement:
+    jar = version.path / "tla2tools.jar"
+    with tempfile.TemporaryDirectory(prefix="tla-bench-") as metadir:
+        cmd = build_bench_command(jar, workload, settings, java_opts, Path(metadir), java_class=java_class)
+        measurement, _ = measure_tlc(cmd, workload.spec.parent)
+    return measurement
+
+
+def run_benchmarks(  # noqa: PLR0913
+    versions: Sequence[LocalVersion],
+    workloads: Sequence[Workload],
+    settings: BenchSettings,
+    java_opts: Sequence[str],
+    *,
+    java_class: str = "tlc2.TLC",
+    on_run: Callable[[BenchResult, RunMeasurement, bool], None] | None = None,
+) -> list[BenchResult]:
+    """Benchmark every workload on every version.
+
+    For each workload, every version is first warmed up, then the measured
+    repetitions run round-robin across versions so that drift in machine load
+    affects all versions alike. *on_run* is called after each run with the
+    result it belongs to, the measurement and whether it was a warm-up.
+    """
+    results: list[BenchResult] = []
+    for workload in workloads:
+        by_version = {v.path.name: BenchResult(version=v.path.name, workload=workload.name) for v in versions}
+        for round_no in range(settings.warmup + settings.repeat):
+            warmup = round_no < settings.warmup
+            for v in versions:
+                result = by_version[v.path.name]
+                measurement = _measure(v, workload, settings, java_opts, java_class)
+                if not warmup:
+                    result.runs.append(measurement)
+                if on_run:
+                    on_run(result, measurement, warmup)
+        results.extend(by_version.values())
+    return results
+
+
+def results_to_json(results: Sequence[BenchResult], settings: BenchSettings) -> dict[str, Any]:
+    """Serialize benchmark results (raw runs plus per-metric summaries)."""
+    return {
+        "created_at": _utc_now_iso(),
+        "host": platform.node(),
+        "settings": asdict(settings),
+        "results": [
+            {
+                "version": r.version,
+                "workload": r.workload,
+                "failed": r.failed,
+                "runs": [asdict(run) | {"states_per_sec": run.states_per_sec} for run in r.runs],
+                "summary": {m: asdict(s) if (s := r.summary(m)) else None for m in METRICS},
+            }
+            for r in results
+        ],
+    }
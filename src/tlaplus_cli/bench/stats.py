@@ -0,0 +1,75 @@
+"""Robust summary statistics for repeated measurements."""
+
+import random
+import statistics
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+@dataclass
+class Summary:
+    median: float
+    mad: float
+    min: float
+    max: float
+    n: int
+
+    @property
+    def spread(self) -> float:
+        """Median absolute deviation relative to the median (0.0 when the median is 0)."""
+        return self.mad / self.median if self.median else 0.0
+
+
+def summarize(values: Sequence[float]) -> Summary | None:
+    """Return the median, median absolute deviation and range of *values* (None if empty)."""
+    if not values:
+        return None
+    median = statistics.median(values)
+    mad = statistics.median(abs(v - median) for v in values)
+    return Summary(median=median, mad=mad, min=min(values), max=max(values), n=len(values))
+
+
+@dataclass
+class Change:
+    """Relative change of the median (``candidate / baseline - 1``) with a confidence interval."""
+
+    delta: float
+    low: float
+    high: float
+
+
+def relative_change(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    *,
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> Change | None:
+    """Compare two samples by the ratio of their medians.
+
+    The interval is a percentile bootstrap over resampled medians, seeded so
+    that the same measurements always give the same interval. Returns None if
+    either sample is empty or the baseline median is zero.
+    """
+    if not baseline or not candidate:
+        return None
+    base_median = statistics.median(baseline)
+    if not base_median:
+        return None
+
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(resamples):
+        a = statistics.median(rng.choices(baseline, k=len(baseline)))
+        b = statistics.median(rng.choices(candidate, k=len(candidate)))
+        if a:
+            ratios.append(b / a)
+    ratios.sort()
+    alpha = (1 - confidence) / 2
+    delta = statistics.median(candidate) / base_median - 1
+    if not ratios:
+        return Change(delta=delta, low=delta, high=delta)
+    low = ratios[int(alpha * (len(ratios) - 1))] - 1
+    high = ratios[int((1 - alpha) * (len(ratios) - 1))] - 1
+    return Change(delta=delta, low=low, high=high)
@@ -0,0 +1,68 @@
+"""Benchmark workloads: built-in reference specs and user-configured specs."""
+
+import importlib.resources
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from tlaplus_cli.config.schema import BenchWorkloadConfig
+
+# name -> (spec file, cfg file) shipped under tlaplus_cli/resources/bench/<name>/
+BUILTIN_WORKLOADS = {
+    "cli": ("cli.tla", "cli.cfg"),
+    "queue": ("queue.tla", "queue.cfg"),
+}
+
+
+@dataclass
+class Workload:
+    name: str
+    spec: Path
+    cfg: Path | None = None
+
+
+def materialize_builtin_workloads(dest: Path) -> list[Workload]:
+    """Copy the built-in workload specs into *dest* and return them.
+
+    The files are copied (rather than used in place) so that they are real
+    files even when the package is installed as a zip, and so that TLC never
+    writes into the installed package.
+    """
+    root = importlib.resources.files("tlaplus_cli.resources").joinpath("bench")
+    workloads = []
+    for name, (spec, cfg) in BUILTIN_WORKLOADS.items():
+        target = dest / name
+        target.mkdir(parents=True, exist_ok=True)
+        for entry in root.joinpath(name).iterdir():
+            if entry.is_file():
+                (target / entry.name).write_bytes(entry.read_bytes())
+        workloads.append(Workload(name=name, spec=target / spec, cfg=target / cfg))
+    return workloads
+
+
+def configured_workloads(configs: Sequence[BenchWorkloadConfig]) -> list[Workload]:
+    """Build workloads from config entries. Relative paths are resolved from the current directory."""
+    return [
+        Workload(
+            name=c.name,
+            spec=Path(c.spec).resolve(),
+            cfg=Path(c.cfg).resolve() if c.cfg else None,
+        )
+        for c in configs
+    ]
+
+
+def select_workloads(available: Sequence[Workload], names: Sequence[str] | None) -> list[Workload]:
+    """Return the workloads named in *names* (all of *available* if empty).
+
+    Raises:
+        ValueError: if a name does not match any workload.
+    """
+    if not names:
+        return list(available)
+    by_name = {w.name: w for w in available}
+    unknown = [n for n in names if n not in by_name]
+    if unknown:
+        msg = f"unknown workload(s): {', '.join(unknown)} (available: {', '.join(by_name)})"
+        raise ValueError(msg)
+    return [by_name[n] for n in names]
@@ -4,12 +4,19 @@ import importlib.metadata
 
 import typer
 
+from tlaplus_cli.cmd.bench import app as bench_app
 from tlaplus_cli.cmd.check_java import check_java
 from tlaplus_cli.cmd.config import app as config_app
+from tlaplus_cli.cmd.coverage import app as coverage_app
 from tlaplus_cli.cmd.fetch_cache import app as fetch_cache_app
+from tlaplus_cli.cmd.graph import app as graph_app
 from tlaplus_cli.cmd.modules import app as modules_app
+from tlaplus_cli.cmd.parse import parse
+from tlaplus_cli.cmd.queue import app as queue_app
+from tlaplus_cli.cmd.runs import app as runs_app
 from tlaplus_cli.cmd.tlc import tlc as run_tlc_cmd
 from tlaplus_cli.cmd.tools import app as tools_app
+from tlaplus_cli.cmd.trace import app as trace_app
 from tlaplus_cli.config.loader import load_config
 
 app = typer.Typer(
@@ -50,9 +57,16 @@ app.add_typer(modules_app, name="modules")
 app.add_typer(tools_app, name="tools")
 app.add_typer(fetch_cache_app, name="fetch-cache")
 app.add_typer(config_app, name="config")
+app.add_typer(bench_app, name="bench")
+app.add_typer(trace_app, name="trace")
+app.add_typer(graph_app, name="graph")
+app.add_typer(coverage_app, name="coverage")
+app.add_typer(runs_app, name="runs")
+app.add_typer(queue_app, name="queue")
 
 app.command(name="tlc")(run_tlc_cmd)
 app.command(name="check-java")(check_java)
+app.command(name="parse")(parse)
 
 
 def main() -> None:
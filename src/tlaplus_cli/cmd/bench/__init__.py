@@ -0,0 +1,9 @@
+import typer
+
+app = typer.Typer(
+    name="bench",
+    help="Benchmark TLC throughput across installed toolset versions.",
+    invoke_without_command=True,
+)
+
+from . import gate, run  # noqa: F401, E402
@@ -0,0 +1,178 @@
+import json
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.bench import (
+    BenchResult,
+    BenchSettings,
+    MetricCheck,
+    Workload,
+    baseline_results,
+    baseline_settings,
+    configured_workloads,
+    gate_results,
+    load_baseline,
+    materialize_builtin_workloads,
+    parse_tolerances,
+    resolve_bench_versions,
+    results_to_json,
+    run_benchmarks,
+    select_workloads,
+)
+from tlaplus_cli.cmd.bench import app
+from tlaplus_cli.cmd.bench.run import _fmt, _report_run
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.config.schema import Settings
+from tlaplus_cli.java import validate_java_version
+
+
+def _verdict(check: MetricCheck) -> str:
+    if check.regressed:
+        return "[red]regression[/red]"
+    if check.improved:
+        return "[green]improved[/green]"
+    return "ok"
+
+
+def _print_checks(checks: list[MetricCheck]) -> None:
+    table = Table(title="Benchmark gate (median ± relative MAD)")
+    table.add_column("Workload", style="magenta")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Allowed", justify="right")
+    table.add_column("Verdict")
+
+    for c in checks:
+        fmt = "{:.2f}" if c.metric == "wall_time" else "{:,.0f}"
+        table.add_row(
+            c.workload,
+            c.metric,
+            _fmt(c.baseline, fmt),
+            _fmt(c.candidate, fmt),
+            f"{c.delta:+.1%}",
+            f"±{c.allowed:.1%}",
+            _verdict(c),
+        )
+    Console().print(table)
+
+
+def _select(config: Settings, tmp: Path, names: list[str] | None, baseline: dict[str, BenchResult]) -> list[Workload]:
+    available = configured_workloads(config.bench.workloads)
+    if config.bench.builtin_workloads:
+        available = materialize_builtin_workloads(tmp) + available
+    if names:
+        return select_workloads(available, names)
+    known = {w.name for w in available}
+    for name in baseline:
+        if name not in known:
+            typer.echo(f"Warning: baseline workload {name} is not configured here; skipped.", err=True)
+    return [w for w in available if w.name in baseline]
+
+
+def _merge(results: list[BenchResult], extra: list[BenchResult]) -> None:
+    by_workload = {r.workload: r for r in results}
+    for r in extra:
+        by_workload[r.workload].runs.extend(r.runs)
+
+
+def _report(results: list[BenchResult], checks: list[MetricCheck]) -> None:
+    failed = [r.workload for r in results if r.failed]
+    regressions = [c for c in checks if c.regressed]
+    for c in regressions:
+        typer.echo(f"Regression: {c.workload} {c.metric} {c.delta:+.1%} (allowed ±{c.allowed:.1%})", err=True)
+    if failed:
+        typer.echo(f"Error: TLC failed on {', '.join(failed)}.", err=True)
+    if regressions or failed:
+        typer.echo(f"Gate failed: {len(regressions)} regression(s), {len(failed)} failed workload(s).", err=True)
+        raise typer.Exit(1)
+    typer.echo(f"Gate passed: {len(checks)} check(s) within tolerance.")
+
+
+@app.command()
+def gate(  # noqa: PLR0913, PLR0917
+    baseline: str = typer.Option(
+        ..., "--baseline", "-b", help="Baseline results: a tla bench JSON file, a git ref or REF:PATH."
+    ),
+    version: str | None = typer.Option(None, "--version", "-V", help="Installed version to run (default: pinned)."),
+    workloads: list[str] = typer.Option(  # noqa: B008
+        None, "--workload", "-w", help="Workload to gate (repeatable; default: all in the baseline)."
+    ),
+    warmup: int | None = typer.Option(None, "--warmup", min=0, help="Warm-up runs per workload."),
+    repeat: int | None = typer.Option(None, "--repeat", "-n", min=1, help="Measured runs per workload."),
+    tolerance: list[str] = typer.Option(  # noqa: B008
+        None, "--tolerance", "-t", help="Allowed change as METRIC=FRACTION, e.g. wall_time=0.2 (repeatable)."
+    ),
+    mad_factor: float | None = typer.Option(None, "--mad-factor", min=0, help="Noise allowance in scaled MADs."),
+    retries: int | None = typer.Option(None, "--retries", min=0, help="Re-measure suspected regressions N times."),
+    json_path: Path | None = typer.Option(None, "--json", help="Also write the new results as JSON to this file."),  # noqa: B008
+) -> None:
+    """Re-run the baseline's workloads and fail if any got materially slower."""
+    config = load_config()
+    gate_config = config.bench.gate
+    try:
+        tolerances = parse_tolerances(tolerance or [], gate_config.tolerance)
+        data = load_baseline(baseline, gate_config.baseline_file)
+        validate_java_version(config.java.min_version)
+        [target] = resolve_bench_versions([version] if version else None)
+    except (RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    recorded = baseline_settings(data)
+    settings = BenchSettings(
+        warmup=config.bench.warmup if warmup is None else warmup,
+        repeat=config.bench.repeat if repeat is None else repeat,
+        workers=recorded.workers,
+        seed=recorded.seed,
+    )
+    base = baseline_results(data, target.path.name)
+    factor = gate_config.mad_factor if mad_factor is None else mad_factor
+
+    with tempfile.TemporaryDirectory(prefix="tla-bench-workloads-") as tmp:
+        try:
+            selected = _select(config, Path(tmp), workloads, base)
+        except ValueError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1) from None
+        if not selected:
+            typer.echo("Error: No baseline workloads to run.", err=True)
+            raise typer.Exit(1)
+
+        typer.echo(
+            f"Gating {len(selected)} workload(s) on {target.path.name} against {baseline} "
+            f"({settings.warmup} warm-up + {settings.repeat} measured runs each) ..."
+        )
+
+        def measure(ws: list[Workload], s: BenchSettings) -> list[BenchResult]:
+            return run_benchmarks(
+                [target], ws, s, config.java.opts, java_class=config.tlc.java_class, on_run=_report_run
+            )
+
+        try:
+            results = measure(selected, settings)
+            checks = gate_results(base, results, tolerances, mad_factor=factor)
+            for _ in range(gate_config.retries if retries is None else retries):
+                suspects = {c.workload for c in checks if c.regressed}
+                if not suspects:
+                    break
+                typer.echo(f"Re-measuring {', '.join(sorted(suspects))} to confirm ...")
+                again = [w for w in selected if w.name in suspects]
+                _merge(results, measure(again, replace(settings, warmup=0)))
+                checks = gate_results(base, results, tolerances, mad_factor=factor)
+        except FileNotFoundError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1) from None
+
+    _print_checks(checks)
+    if json_path:
+        json_path.write_text(json.dumps(results_to_json(results, settings), indent=2), encoding="utf-8")
+        typer.echo(f"Results written to {json_path}")
+
+    _report(results, checks)
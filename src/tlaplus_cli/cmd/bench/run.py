@@ -0,0 +1,134 @@
+import json
+import tempfile
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.bench import (
+    BenchResult,
+    BenchSettings,
+    RunMeasurement,
+    Summary,
+    configured_workloads,
+    materialize_builtin_workloads,
+    resolve_bench_versions,
+    results_to_json,
+    run_benchmarks,
+    select_workloads,
+)
+from tlaplus_cli.cmd.bench import app
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.java import validate_java_version
+from tlaplus_cli.units import format_size
+
+
+def _fmt(summary: Summary | None, fmt: str = "{:,.0f}") -> str:
+    if summary is None:
+        return "-"
+    text = fmt.format(summary.median)
+    if summary.n > 1:
+        text += f" ± {summary.spread:.1%}"
+    return text
+
+
+def _fmt_rss(summary: Summary | None) -> str:
+    return format_size(int(summary.median)) if summary else "-"
+
+
+def _print_results(results: list[BenchResult]) -> None:
+    table = Table(title="TLC Benchmark (median ± relative MAD)")
+    table.add_column("Version", style="cyan")
+    table.add_column("Workload", style="magenta")
+    table.add_column("States/s", justify="right", style="green")
+    table.add_column("Distinct states", justify="right")
+    table.add_column("Wall time (s)", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("Runs", justify="right")
+
+    for r in results:
+        table.add_row(
+            r.version,
+            r.workload,
+            "[red]failed[/red]" if r.failed else _fmt(r.summary("states_per_sec")),
+            _fmt(r.summary("distinct_states")),
+            _fmt(r.summary("wall_time"), "{:.2f}"),
+            _fmt_rss(r.summary("peak_rss")),
+            str(len(r.runs)),
+        )
+    Console().print(table)
+
+
+def _report_run(result: BenchResult, measurement: RunMeasurement, warmup: bool) -> None:
+    label = "warm-up" if warmup else f"run {len(result.runs)}"
+    status = "ok" if measurement.exit_code == 0 else f"exit {measurement.exit_code}"
+    typer.echo(f"  {result.version} / {result.workload} {label}: {measurement.wall_time:.2f}s ({status})")
+
+
+@app.callback()
+def bench(  # noqa: PLR0913, PLR0917
+    ctx: typer.Context,
+    versions: list[str] = typer.Option(  # noqa: B008
+        None, "--version", "-V", help="Installed version to benchmark (repeatable; default: pinned)."
+    ),
+    workloads: list[str] = typer.Option(  # noqa: B008
+        None, "--workload", "-w", help="Workload to run (repeatable; default: all)."
+    ),
+    warmup: int | None = typer.Option(None, "--warmup", min=0, help="Warm-up runs per version and workload."),
+    repeat: int | None = typer.Option(None, "--repeat", "-n", min=1, help="Measured runs per version and workload."),
+    workers: int | None = typer.Option(None, "--workers", min=1, help="TLC worker threads."),
+    seed: int | None = typer.Option(None, "--seed", help="Fixed TLC seed (also selects the fingerprint function)."),
+    json_path: Path | None = typer.Option(None, "--json", help="Also write the results as JSON to this file."),  # noqa: B008
+) -> None:
+    """Run reference specs against installed versions and report throughput."""
+    if ctx.invoked_subcommand is not None:
+        return
+
+    config = load_config()
+    settings = BenchSettings(
+        warmup=config.bench.warmup if warmup is None else warmup,
+        repeat=config.bench.repeat if repeat is None else repeat,
+        workers=config.bench.workers if workers is None else workers,
+        seed=config.bench.seed if seed is None else seed,
+    )
+
+    try:
+        validate_java_version(config.java.min_version)
+        targets = resolve_bench_versions(versions)
+    except (RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    with tempfile.TemporaryDirectory(prefix="tla-bench-workloads-") as tmp:
+        available = configured_workloads(config.bench.workloads)
+        if config.bench.builtin_workloads:
+            available = materialize_builtin_workloads(Path(tmp)) + available
+        try:
+            selected = select_workloads(available, workloads)
+        except ValueError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1) from None
+        if not selected:
+            typer.echo("Error: No benchmark workloads configured.", err=True)
+            raise typer.Exit(1)
+
+        typer.echo(
+            f"Benchmarking {len(selected)} workload(s) on {len(targets)} version(s) "
+            f"({settings.warmup} warm-up + {settings.repeat} measured runs each) ..."
+        )
+        try:
+            results = run_benchmarks(
+                targets, selected, settings, config.java.opts, java_class=config.tlc.java_class, on_run=_report_run
+            )
+        except FileNotFoundError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1) from None
+
+    _print_results(results)
+    if json_path:
+        json_path.write_text(json.dumps(results_to_json(results, settings), indent=2), encoding="utf-8")
+        typer.echo(f"Results written to {json_path}")
+
+    if any(r.failed for r in results):
+        raise typer.Exit(1)
@@ -0,0 +1,5 @@
+import typer
+
+app = typer.Typer(name="coverage", help="Aggregate TLC coverage across runs.", no_args_is_help=True)
+
+from . import diff, ingest, show  # noqa: F401, E402
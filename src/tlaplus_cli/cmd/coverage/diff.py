@@ -0,0 +1,43 @@
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.cmd.coverage import app
+from tlaplus_cli.cmd.coverage.show import SPEC_ARGUMENT, load_store
+from tlaplus_cli.coverage import coverage_delta
+
+
+def _fmt(value: float | None) -> str:
+    return "-" if value is None else f"{value:,.1f}"
+
+
+@app.command()
+def diff(
+    spec: str = SPEC_ARGUMENT,
+    old: str = typer.Argument(help="Baseline commit."),
+    new: str | None = typer.Argument(None, help="Commit to compare (default: the most recently updated)."),
+) -> None:
+    """Compare per-run coverage between two commits."""
+    before = load_store(spec, old)
+    after = load_store(spec, new)
+
+    table = Table(title=f"Generated states per run: {before.directory.name} → {after.directory.name}")
+    table.add_column("Action", style="magenta")
+    table.add_column(before.directory.name, justify="right")
+    table.add_column(after.directory.name, justify="right")
+    table.add_column("Change", justify="right")
+    for delta in coverage_delta(before, after):
+        if delta.new == 0 and delta.old:
+            change = "[red]now cold[/red]"
+        elif delta.old == 0 and delta.new:
+            change = "[green]now covered[/green]"
+        elif delta.change is None:
+            change = "-"
+        else:
+            change = f"{delta.change:+.1%}"
+        table.add_row(delta.action, _fmt(delta.old), _fmt(delta.new), change)
+    Console().print(table)
+
+    per_run_before = before.total_evaluations() / max(before.runs, 1)
+    per_run_after = after.total_evaluations() / max(after.runs, 1)
+    typer.echo(f"Evaluations per run: {per_run_before:,.0f} → {per_run_after:,.0f}")
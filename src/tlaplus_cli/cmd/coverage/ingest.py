@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import typer
+
+from tlaplus_cli.cmd.coverage import app
+from tlaplus_cli.coverage import parse_coverage, record_coverage
+from tlaplus_cli.tlc.runner import resolve_spec_file
+
+
+@app.command(name="import")
+def import_logs(
+    spec: str = typer.Argument(help="Name or path of the TLA+ specification the logs belong to."),
+    logs: list[Path] = typer.Argument(help="Saved TLC output containing -coverage statistics."),  # noqa: B008
+    commit: str | None = typer.Option(None, "--commit", help="Record under this commit (default: the spec's HEAD)."),
+) -> None:
+    """Merge the coverage statistics of saved TLC logs into the coverage store."""
+    try:
+        spec_file, _ = resolve_spec_file(spec)
+    except FileNotFoundError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    reports = []
+    for log in logs:
+        try:
+            report = parse_coverage(log.read_text(errors="replace"))
+        except OSError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1) from None
+        if not report:
+            typer.echo(f"Skipping {log}: no coverage statistics found.")
+            continue
+        reports.append(report)
+
+    if not reports:
+        typer.echo("Error: None of the logs contained coverage statistics.", err=True)
+        raise typer.Exit(1)
+    try:
+        store = record_coverage(spec_file, *reports, commit=commit)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    typer.echo(f"Coverage for {spec_file.stem} at {store.directory.name} now covers {store.runs} runs.")
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.cmd.coverage import app
+from tlaplus_cli.coverage import CoverageStore, open_store
+
+SPEC_ARGUMENT = typer.Argument(help="Spec name or path (coverage is stored per spec file name).")
+COMMIT_HELP = "Commit to show (default: the most recently updated)."
+
+
+def load_store(spec: str, commit: str | None) -> CoverageStore:
+    """Open the coverage store of *spec*, exiting with an error if there is none."""
+    try:
+        return open_store(Path(spec).stem, commit)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+
+@app.command()
+def show(
+    spec: str = SPEC_ARGUMENT,
+    commit: str | None = typer.Option(None, "--commit", help=COMMIT_HELP),
+    top: int = typer.Option(10, "--top", min=1, help="Hot expressions to list."),
+) -> None:
+    """Per-action and per-expression counters merged over all recorded runs."""
+    store = load_store(spec, commit)
+    total = store.total_evaluations()
+    typer.echo(f"Spec:        {Path(spec).stem}")
+    typer.echo(f"Commit:      {store.directory.name}")
+    typer.echo(f"Runs:        {store.runs}")
+    typer.echo(f"Evaluations: {total:,}")
+    console = Console()
+
+    table = Table(title="Actions")
+    table.add_column("Action", style="magenta")
+    table.add_column("Distinct", justify="right", style="green")
+    table.add_column("Generated", justify="right", style="green")
+    for key, (distinct, generated) in store.action_counts().items():
+        name = f"[red]{key} (never enabled)[/red]" if generated == 0 else str(key)
+        table.add_row(name, f"{distinct:,}", f"{generated:,}")
+    console.print(table)
+
+    table = Table(title=f"Hot expressions (top {top})")
+    table.add_column("Location", style="cyan")
+    table.add_column("Action", style="magenta")
+    table.add_column("Evaluations", justify="right", style="green")
+    table.add_column("Share", justify="right")
+    table.add_column("Cost", justify="right")
+    for location, count, cost in store.hot_expressions(top):
+        share = f"{count / total:.1%}" if total else "-"
+        table.add_row(str(location), location.action, f"{count:,}", share, f"{cost:,}" if cost else "-")
+    console.print(table)
+
+    modules = store.module_evaluations()
+    if len(modules) > 1:
+        table = Table(title="Evaluations per module")
+        table.add_column("Module", style="cyan")
+        table.add_column("Evaluations", justify="right", style="green")
+        table.add_column("Share", justify="right")
+        for module, count in modules.most_common():
+            table.add_row(module, f"{count:,}", f"{count / total:.1%}" if total else "-")
+        console.print(table)
+
+    cold = store.cold_actions()
+    if cold:
+        typer.echo(f"Never enabled in {store.runs} runs: {', '.join(map(str, cold))}")
@@ -0,0 +1,5 @@
+import typer
+
+app = typer.Typer(name="graph", help="Analyze state graphs written by 'tla tlc --graph'.", no_args_is_help=True)
+
+from . import stats  # noqa: F401, E402
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.cmd.graph import app
+from tlaplus_cli.graph import GraphReader, compute_stats
+
+
+@app.command()
+def stats(
+    path: Path = typer.Argument(help="Graph file written by 'tla tlc --graph'."),  # noqa: B008
+    top: int = typer.Option(10, "--top", min=1, help="Rows to show in the degree and level tables."),
+) -> None:
+    """Out-degree distribution, level widths, SCCs and per-action edge counts."""
+    try:
+        with GraphReader(path) as graph:
+            result = compute_stats(graph)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    typer.echo(f"States: {result.nodes:,} ({result.initial:,} initial)")
+    typer.echo(f"Edges:  {result.edges:,} ({result.self_loops:,} self-loops)")
+    typer.echo(f"Depth:  {result.depth}")
+    typer.echo(
+        f"SCCs:   {result.scc_count:,} (largest {result.largest_scc:,} states, "
+        f"{result.nontrivial_sccs:,} with more than one state)"
+    )
+    console = Console()
+
+    table = Table(title="Out-degree distribution")
+    table.add_column("Out-degree", justify="right", style="cyan")
+    table.add_column("States", justify="right", style="green")
+    for degree, count in result.out_degrees.most_common(top):
+        table.add_row(str(degree), f"{count:,}")
+    console.print(table)
+
+    table = Table(title="Widest levels")
+    table.add_column("Level", justify="right", style="cyan")
+    table.add_column("States", justify="right", style="green")
+    widest = sorted(result.level_widths.items(), key=lambda item: item[1], reverse=True)[:top]
+    for level, width in sorted(widest):
+        table.add_row(str(level), f"{width:,}")
+    console.print(table)
+
+    table = Table(title="Edges per action")
+    table.add_column("Action", style="magenta")
+    table.add_column("Edges", justify="right", style="green")
+    table.add_column("Share", justify="right")
+    for action, count in result.action_edges.most_common():
+        table.add_row(action, f"{count:,}", f"{count / result.edges:.1%}")
+    console.print(table)
@@ -0,0 +1,120 @@
+import json
+import subprocess
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.bench import FIXTURES_FILE, OverrideResult, bench_overrides, load_fixtures, override_results_to_json
+from tlaplus_cli.cmd.modules import app
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.tlc.compiler import compile_modules, module_sources
+
+
+def _fmt_ns(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value:,.1f}" if value < 1000 else f"{value:,.0f}"
+
+
+def _print_results(results: list[OverrideResult]) -> None:
+    table = Table(title="Override microbenchmarks (median ± relative MAD)")
+    table.add_column("Operator", style="cyan")
+    table.add_column("Arguments", style="magenta", max_width=40)
+    table.add_column("Java ns/op", justify="right", style="green")
+    table.add_column("B/op", justify="right")
+    table.add_column("TLA+ ns/op", justify="right")
+    table.add_column("Speedup", justify="right", style="yellow")
+    for r in results:
+        summary = r.java_summary
+        if r.error and summary is None:
+            java = f"[red]{r.error}[/red]"
+        elif summary is None:
+            java = "-"
+        else:
+            java = _fmt_ns(summary.median) + (f" ± {summary.spread:.1%}" if summary.n > 1 else "")
+        speedup = r.speedup
+        table.add_row(
+            r.label,
+            r.args,
+            java,
+            f"{r.bytes_per_op:,.0f}" if r.bytes_per_op is not None else "-",
+            _fmt_ns(r.tla_ns),
+            f"{speedup:,.1f}x" if speedup is not None else "-",
+        )
+    Console().print(table)
+
+
+def _find_fixtures(source_dirs: list[Path]) -> Path | None:
+    return next((d / FIXTURES_FILE for d in source_dirs if (d / FIXTURES_FILE).is_file()), None)
+
+
+@app.command(name="bench")
+def bench(  # noqa: PLR0913, PLR0917
+    path: str | None = typer.Argument(None, help="Project root directory (defaults to workspace root)."),
+    fixtures: Path | None = typer.Option(  # noqa: B008
+        None, "--fixtures", "-f", help=f"Benchmark fixture file (default: {FIXTURES_FILE} in a modules directory)."
+    ),
+    warmup_ms: int = typer.Option(500, "--warmup-ms", min=0, help="Warm-up time per input."),
+    measure_ms: int = typer.Option(1000, "--measure-ms", min=1, help="Measurement time per round."),
+    rounds: int = typer.Option(5, "--rounds", min=1, help="Measured rounds per input."),
+    tla_evals: int = typer.Option(
+        20000, "--tla-evals", min=1, help="Applications of the TLA+ definition timed through TLC."
+    ),
+    tla: bool = typer.Option(True, "--tla/--no-tla", help="Also time TLC evaluating the TLA+ definitions."),
+    json_path: Path | None = typer.Option(None, "--json", help="Also write the results as JSON to this file."),  # noqa: B008
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show compilation output."),
+) -> None:
+    """Build the overrides and compare them with their TLA+ definitions on fixture inputs."""
+    base_dir = Path(path).resolve() if path is not None else None
+    config = load_config()
+
+    typer.echo("Compiling Java files ...")
+    try:
+        compile_modules(base_dir, verbose)
+        sources = module_sources(base_dir)
+    except FileNotFoundError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    except subprocess.CalledProcessError:
+        typer.echo("Compilation failed!", err=True)
+        raise typer.Exit(1) from None
+
+    fixtures = fixtures or _find_fixtures(sources.source_dirs)
+    if fixtures is None:
+        typer.echo(f"Error: No {FIXTURES_FILE} found in the modules directories; pass --fixtures.", err=True)
+        raise typer.Exit(1)
+    try:
+        loaded = load_fixtures(fixtures)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    if not loaded.benchmarks:
+        typer.echo(f"Error: {fixtures} defines no benchmarks.", err=True)
+        raise typer.Exit(1)
+
+    count = sum(len(case.inputs) for case in loaded.benchmarks)
+    typer.echo(f"Benchmarking {count} input(s) ({rounds} x {measure_ms} ms after {warmup_ms} ms warm-up) ...")
+    try:
+        results = bench_overrides(
+            loaded,
+            sources,
+            java_opts=config.java.opts,
+            java_class=config.tlc.java_class,
+            library_dirs=[*sources.source_dirs, fixtures.parent.resolve()],
+            warmup_ms=warmup_ms,
+            measure_ms=measure_ms,
+            rounds=rounds,
+            tla_evals=tla_evals if tla else None,
+        )
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    _print_results(results)
+    if json_path:
+        json_path.write_text(json.dumps(override_results_to_json(results), indent=2), encoding="utf-8")
+        typer.echo(f"Results written to {json_path}")
+    if any(r.error for r in results):
+        raise typer.Exit(1)
@@ -1,19 +1,36 @@
 import subprocess
+import time
 from pathlib import Path
 
 import typer
 
 from tlaplus_cli.cmd.modules import app
-from tlaplus_cli.tlc.compiler import compile_modules
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.tlc.compile_server import CompileResult, CompileServer, affected_sources, clean_classes
+from tlaplus_cli.tlc.compiler import ModuleSources, compile_modules, module_sources, write_service_file
+from tlaplus_cli.tlc.jar import modules_jar_path, write_modules_jar
+from tlaplus_cli.watch import create_watcher, debounced
 
 
 @app.command(name="build")
-def build(
+def build(  # noqa: PLR0913, PLR0917
     path: str | None = typer.Argument(None, help="Project root directory (defaults to workspace root)."),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show compilation output."),
+    jar: bool = typer.Option(False, "--jar", help="Also package the classes into a reproducible modules.jar."),
+    merge_libs: bool = typer.Option(
+        False, "--merge-libs", help="Merge the modules' dependency jars into modules.jar (implies --jar)."
+    ),
+    watch: bool = typer.Option(
+        False, "--watch", "-w", help="Keep a warm compiler running and rebuild on every source or jar change."
+    ),
+    debounce_ms: int = typer.Option(100, "--debounce-ms", min=0, help="Quiet period that ends a batch of changes."),
+    poll: bool = typer.Option(False, "--poll", help="Poll file times instead of using inotify."),
 ) -> None:
     """Compile custom Java modules."""
     base_dir = Path(path).resolve() if path is not None else None
+    if watch:
+        _watch(base_dir, package=jar or merge_libs, merge_libs=merge_libs, debounce=debounce_ms / 1000, poll=poll)
+        return
 
     typer.echo("Compiling Java files ...")
     try:
@@ -28,3 +45,117 @@ def build(
     typer.echo(f"Successfully compiled to {classes_dir}")
     service_file = classes_dir / "META-INF" / "services" / "tlc2.overrides.ITLCOverrides"
     typer.echo(f"Created service file at {service_file}")
+
+    if jar or merge_libs:
+        _package(base_dir, classes_dir, merge_libs)
+
+
+def _package(base_dir: Path | None, classes_dir: Path, merge_libs: bool) -> None:
+    jar_path = modules_jar_path(classes_dir)
+    lib_jars = module_sources(base_dir).lib_jars if merge_libs else []
+    try:
+        contents = write_modules_jar(classes_dir, jar_path, lib_jars=lib_jars)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    typer.echo(f"Packaged {len(contents.entries)} entries into {jar_path}")
+    if lib_jars:
+        typer.echo(f"Merged {len(lib_jars)} dependency jar(s)")
+    if contents.duplicates:
+        typer.echo(f"Skipped {len(contents.duplicates)} duplicate class(es); the first copy on the classpath wins")
+
+
+def _is_build_input(path: Path) -> bool:
+    return path.suffix in {".java", ".jar"}
+
+
+def _start_server(sources: ModuleSources, server: CompileServer | None = None) -> CompileServer:
+    """Start a compile server for *sources*, or start *server* again."""
+    server = server or CompileServer(sources.classpath, sources.classes_dir)
+    try:
+        server.start()
+    except (FileNotFoundError, RuntimeError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    return server
+
+
+def _compile(server: CompileServer, sources: ModuleSources, files: list[Path]) -> CompileResult | None:
+    """Compile *files*; if the server dies, restart it and rebuild everything once."""
+    try:
+        return server.compile(files)
+    except RuntimeError as e:
+        typer.echo(f"Error: {e}; restarting the compiler", err=True)
+    server.close()
+    _start_server(sources, server)
+    clean_classes(sources.classes_dir)
+    try:
+        return server.compile(sources.java_files)
+    except RuntimeError as e:
+        typer.echo(f"Error: {e}; waiting for the next change", err=True)
+        return None
+
+
+def _rebuild(  # noqa: PLR0913
+    server: CompileServer,
+    sources: ModuleSources,
+    files: list[Path],
+    base_dir: Path | None,
+    *,
+    package: bool,
+    merge_libs: bool,
+) -> None:
+    """Compile *files* in the warm server and print its diagnostics."""
+    typer.echo(f"[{time.strftime('%H:%M:%S')}] Compiling {len(files)} file(s) ...")
+    result = _compile(server, sources, files)
+    if result is None:
+        return
+    for diagnostic in result.diagnostics:
+        typer.echo(str(diagnostic), err=diagnostic.is_error)
+    if not result.ok:
+        typer.echo(f"Build failed: {len(result.errors)} error(s) in {result.elapsed:.2f}s", err=True)
+        return
+    write_service_file(sources.classes_dir, load_config().tlc.overrides_class)
+    typer.echo(f"Build succeeded in {result.elapsed:.2f}s")
+    if package:
+        _package(base_dir, sources.classes_dir, merge_libs)
+
+
+def _watch(base_dir: Path | None, *, package: bool, merge_libs: bool, debounce: float, poll: bool) -> None:
+    try:
+        sources = module_sources(base_dir)
+    except FileNotFoundError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    server = _start_server(sources)
+    watcher = create_watcher([*sources.source_dirs, *sources.lib_dirs], accept=_is_build_input, poll=poll)
+    typer.echo(f"Watching {', '.join(str(d) for d in [*sources.source_dirs, *sources.lib_dirs])} (Ctrl+C to stop)")
+    try:
+        clean_classes(sources.classes_dir)
+        _rebuild(server, sources, sources.java_files, base_dir, package=package, merge_libs=merge_libs)
+        for changed in debounced(watcher, debounce):
+            try:
+                sources = module_sources(base_dir)
+            except FileNotFoundError as e:
+                typer.echo(f"Error: {e}; waiting for the next change", err=True)
+                continue
+            if not server.running or any(p.suffix == ".jar" for p in changed):
+                # The classpath changed (or the server died): restart it and rebuild everything.
+                server.close()
+                server = _start_server(sources)
+                files = sources.java_files
+            elif any(not p.exists() for p in changed):
+                files = sources.java_files
+            else:
+                files = affected_sources(changed, sources.java_files)
+            if files == sources.java_files:
+                clean_classes(sources.classes_dir)
+            if files:
+                _rebuild(server, sources, files, base_dir, package=package, merge_libs=merge_libs)
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
+    finally:
+        watcher.close()
+        server.close()
@@ -0,0 +1,66 @@
+import json
+import time
+from pathlib import Path
+
+import typer
+
+from tlaplus_cli.sany import CACHED, FAILED, ParseResult, parse_specs, workspace_specs
+from tlaplus_cli.tlc.runner import resolve_spec_file
+
+
+def _print_result(result: ParseResult, verbose: bool) -> None:
+    if result.ok:
+        if verbose:
+            typer.echo(f"{'·' if result.status == CACHED else '✓'} {result.spec}")
+        return
+    typer.echo(f"✗ {result.spec}")
+    for error in result.errors:
+        typer.echo(f"  {error}")
+    if not result.errors and result.log.strip():
+        for line in result.log.strip().splitlines()[-10:]:
+            typer.echo(f"  {line}")
+
+
+def parse(
+    specs: list[str] = typer.Argument(None, help="Specs to check, by name or path as for 'tla tlc'."),  # noqa: B008
+    all_specs: bool = typer.Option(False, "--all", help="Check every .tla file under the workspace root."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Parse every spec, even if it is unchanged."),
+    json_path: str | None = typer.Option(
+        None, "--json", help="Also write the results as JSON to this file ('-' = stdout)."
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="List specs that parsed cleanly too."),
+) -> None:
+    """Parse and semantically check specs with SANY, in one JVM, skipping unchanged ones."""
+    try:
+        files = workspace_specs() if all_specs else [resolve_spec_file(s)[0] for s in specs or ()]
+    except FileNotFoundError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    if not files:
+        typer.echo("Error: no specs given (name specs or pass --all)", err=True)
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    try:
+        results = parse_specs(files, use_cache=not no_cache)
+    except (FileNotFoundError, RuntimeError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    elapsed = time.perf_counter() - started
+
+    if json_path == "-":
+        typer.echo(json.dumps([r.to_json() for r in results], indent=2))
+    else:
+        for result in results:
+            _print_result(result, verbose)
+        if json_path:
+            Path(json_path).write_text(json.dumps([r.to_json() for r in results], indent=2), encoding="utf-8")
+    failed = sum(r.status == FAILED for r in results)
+    cached = sum(r.status == CACHED for r in results)
+    typer.echo(
+        f"Checked {len(results)} spec(s): {len(results) - failed - cached} parsed, {cached} unchanged, "
+        f"{failed} failed ({elapsed:.2f}s)",
+        err=json_path == "-",
+    )
+    if failed:
+        raise typer.Exit(1)
@@ -0,0 +1,5 @@
+import typer
+
+app = typer.Typer(name="queue", help="Queue TLC runs for the local scheduler daemon.", no_args_is_help=True)
+
+from . import cancel, list, logs, serve, submit, wait  # noqa: F401, E402
@@ -0,0 +1,29 @@
+import typer
+
+from tlaplus_cli.cmd.queue import app
+from tlaplus_cli.queue import CANCELLED, JobStore, daemon_pid
+
+
+@app.command()
+def cancel(job_ids: list[int] = typer.Argument(help="Job IDs as shown by 'tla queue list'.")) -> None:  # noqa: B008
+    """Cancel queued jobs and stop running ones."""
+    store = JobStore()
+    failed = False
+    for job_id in job_ids:
+        try:
+            job = store.cancel(job_id)
+        except KeyError:
+            typer.echo(f"Error: No job with ID {job_id} (see 'tla queue list').", err=True)
+            failed = True
+            continue
+        except ValueError as e:
+            typer.echo(f"Error: {e}", err=True)
+            failed = True
+            continue
+        if job.state == CANCELLED:
+            typer.echo(f"Cancelled job {job_id}.")
+        else:
+            when = "now" if daemon_pid(store) is not None else "when it runs again ('tla queue serve')"
+            typer.echo(f"Job {job_id} is running; the queue daemon stops it {when}.")
+    if failed:
+        raise typer.Exit(1)
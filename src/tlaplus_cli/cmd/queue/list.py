@@ -0,0 +1,81 @@
+import time
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.cmd.queue import app
+from tlaplus_cli.cmd.runs.list import format_time
+from tlaplus_cli.queue import CANCELLED, DONE, FAILED, QUEUED, RUNNING, Job, JobStore
+from tlaplus_cli.units import format_size
+
+STATE_STYLES = {QUEUED: "cyan", RUNNING: "yellow", DONE: "green", FAILED: "red", CANCELLED: "magenta"}
+JOB_ID_ARGUMENT = typer.Argument(help="Job ID as shown by 'tla queue list'.")
+
+
+def load_job(store: JobStore, job_id: int) -> Job:
+    """The job with *job_id*, exiting with an error if there is none."""
+    job = store.get(job_id)
+    if job is None:
+        typer.echo(f"Error: No job with ID {job_id} (see 'tla queue list').", err=True)
+        raise typer.Exit(1)
+    return job
+
+
+def format_state(job: Job) -> str:
+    style = STATE_STYLES.get(job.state, "white")
+    note = " (cancelling)" if job.cancel_requested else " (stopping)" if job.stop_requested else ""
+    return f"[{style}]{job.state}[/{style}]{note}"
+
+
+def format_runtime(job: Job, now: float) -> str:
+    if job.started_at is None:
+        return "-"
+    minutes, seconds = divmod(int((job.finished_at or now) - job.started_at), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s"
+
+
+@app.command(name="list")
+def list_jobs(
+    all_jobs: bool = typer.Option(False, "--all", "-a", help="Include finished jobs."),
+    user: str | None = typer.Option(None, "--user", "-u", help="Only jobs of this user."),
+    limit: int = typer.Option(20, "--limit", "-n", min=1, help="With --all, the number of newest jobs to show."),
+) -> None:
+    """List queued and running jobs in submission order."""
+    store = JobStore()
+    jobs = store.jobs(states=None if all_jobs else [QUEUED, RUNNING], user=user)
+    if all_jobs:
+        jobs = jobs[-limit:]
+    if not jobs:
+        typer.echo("No jobs in the queue." if not all_jobs else "No jobs submitted yet.")
+        return
+
+    now = time.time()
+    table = Table(title="TLC job queue")
+    table.add_column("ID", justify="right", style="cyan")
+    table.add_column("State")
+    table.add_column("Priority", justify="right")
+    table.add_column("User")
+    table.add_column("Spec", style="magenta")
+    table.add_column("Cores", justify="right")
+    table.add_column("Memory", justify="right")
+    table.add_column("Submitted")
+    table.add_column("Runtime", justify="right")
+    table.add_column("Preempted", justify="right")
+    table.add_column("Exit", justify="right")
+    for job in jobs:
+        table.add_row(
+            str(job.id),
+            format_state(job),
+            str(job.priority),
+            job.user,
+            job.spec_name,
+            str(job.cores),
+            format_size(job.memory) if job.memory else "-",
+            format_time(job.submitted_at),
+            format_runtime(job, now),
+            str(job.preemptions) if job.preemptions else "-",
+            str(job.exit_code) if job.exit_code is not None else "-",
+        )
+    Console().print(table)
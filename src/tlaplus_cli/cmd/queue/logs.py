@@ -0,0 +1,41 @@
+import sys
+import time
+
+import typer
+
+from tlaplus_cli.cmd.queue import app
+from tlaplus_cli.cmd.queue.list import JOB_ID_ARGUMENT, load_job
+from tlaplus_cli.queue import JobStore
+
+_FOLLOW_POLL = 0.5
+
+
+@app.command()
+def logs(
+    job_id: int = JOB_ID_ARGUMENT,
+    follow: bool = typer.Option(False, "--follow", "-f", help="Keep printing new output until the job finishes."),
+) -> None:
+    """Print a job's output (TLC's and the worker's, across preemptions)."""
+    store = JobStore()
+    job = load_job(store, job_id)
+    path = store.log_path(job_id)
+    if not follow and not path.exists():
+        typer.echo(f"No output for job {job_id} yet ({job.state}).")
+        return
+    offset = 0
+    while True:
+        finished = job.finished
+        try:
+            with path.open("rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        if data:
+            offset += len(data)
+            sys.stdout.write(data.decode("utf-8", errors="replace"))
+            sys.stdout.flush()
+        if not follow or finished:
+            return
+        time.sleep(_FOLLOW_POLL)
+        job = load_job(store, job_id)
@@ -0,0 +1,64 @@
+import os
+
+import typer
+
+from tlaplus_cli.cmd.queue import app
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.queue import Capacity, JobStore, QueueDaemon
+from tlaplus_cli.tlc.affinity import available_cpus
+from tlaplus_cli.units import format_size, parse_duration, parse_size
+
+
+def _physical_memory() -> int | None:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def queue_capacity(cores: int | None = None, memory: str | None = None) -> Capacity:
+    """The daemon's capacity: the options, else ``queue.cores``/``queue.memory``, else this machine."""
+    settings = load_config().queue
+    memory = memory or settings.memory
+    try:
+        limit = parse_size(memory) if memory else _physical_memory()
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    return Capacity(cores or settings.cores or len(available_cpus()), limit)
+
+
+@app.command()
+def serve(
+    cores: int | None = typer.Option(None, "--cores", min=1, help="Cores to hand out (default: queue.cores)."),
+    memory: str | None = typer.Option(None, "--memory", help="Memory to hand out, e.g. 64G (default: queue.memory)."),
+    once: bool = typer.Option(False, "--once", help="Run a single scheduling pass and exit."),
+) -> None:
+    """Run the queue daemon in the foreground.
+
+    Stopping the daemon leaves running jobs alone; the next daemon adopts them.
+    """
+    settings = load_config().queue
+    capacity = queue_capacity(cores, memory)
+    try:
+        preempt_after = parse_duration(settings.preempt_after) if settings.preempt_after else None
+    except ValueError as e:
+        typer.echo(f"Error: Invalid queue.preempt_after: {e}", err=True)
+        raise typer.Exit(1) from None
+    daemon = QueueDaemon(
+        JobStore(), capacity, pin_cpus=settings.pin_cpus, preempt_after=preempt_after, poll=settings.poll
+    )
+    try:
+        with daemon.lock():
+            if once:
+                daemon.step()
+                return
+            memory_text = f", {format_size(capacity.memory)}" if capacity.memory is not None else ""
+            preempt = f", preempting after {settings.preempt_after}" if preempt_after is not None else ""
+            typer.echo(f"Queue daemon serving {capacity.cores} cores{memory_text}{preempt}. Press Ctrl-C to stop.")
+            daemon.serve()
+    except RuntimeError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    except KeyboardInterrupt:
+        typer.echo("Queue daemon stopped; running jobs continue.")
@@ -0,0 +1,75 @@
+import getpass
+import os
+import time
+from pathlib import Path
+
+import typer
+
+from tlaplus_cli.cmd.queue import app
+from tlaplus_cli.cmd.queue.serve import queue_capacity
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.queue import Job, JobStore, daemon_pid, describe_job
+from tlaplus_cli.tlc.runner import resolve_spec_file
+from tlaplus_cli.ui import info
+from tlaplus_cli.units import format_size, parse_size
+
+
+def _current_user() -> str:
+    try:
+        return getpass.getuser()
+    except (OSError, KeyError):
+        return str(os.getuid())
+
+
+@app.command()
+def submit(  # noqa: PLR0913, PLR0917
+    spec: str = typer.Argument(help="Name of the TLA+ specification (without .tla extension)."),
+    cfg: Path | None = typer.Option(None, "--cfg", help="Model configuration (default: the spec's .cfg)."),  # noqa: B008
+    profile: str | None = typer.Option(
+        None, "--profile", "-p", help="Use this profile from java.profiles or the project's tla-tuning.yaml."
+    ),
+    priority: int = typer.Option(0, "--priority", "-P", help="Higher runs first; may preempt lower priorities."),
+    cores: int | None = typer.Option(
+        None, "--cores", "-c", min=1, help="Cores (and TLC workers) the job needs (default: queue.default_cores)."
+    ),
+    memory: str | None = typer.Option(None, "--memory", "-m", help="Memory the job needs, e.g. 16G."),
+    checkpoint: int | None = typer.Option(
+        None, "--checkpoint", min=0, help="Checkpoint interval in minutes (default: queue.checkpoint)."
+    ),
+    user: str | None = typer.Option(None, "--user", help="Submit on behalf of this user (for fair share)."),
+) -> None:
+    """Add a TLC run to the queue."""
+    try:
+        spec_file, _ = resolve_spec_file(spec)
+        needed = parse_size(memory) if memory is not None else None
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    if cfg is not None and not cfg.is_file():
+        typer.echo(f"Error: Model configuration {cfg} not found.", err=True)
+        raise typer.Exit(1)
+
+    settings = load_config().queue
+    job = Job(
+        spec=str(spec_file),
+        cwd=str(Path.cwd()),
+        user=user or _current_user(),
+        submitted_at=time.time(),
+        priority=priority,
+        cores=cores or settings.default_cores,
+        memory=needed,
+        profile=profile,
+        cfg=str(cfg.absolute()) if cfg is not None else None,
+        checkpoint=checkpoint if checkpoint is not None else settings.checkpoint,
+    )
+    capacity = queue_capacity()
+    if not capacity.fits(job):
+        limit = f" and {format_size(capacity.memory)}" if capacity.memory is not None else ""
+        typer.echo(f"Error: The job can never run; the queue has {capacity.cores} cores{limit}.", err=True)
+        raise typer.Exit(1)
+
+    store = JobStore()
+    store.submit(job)
+    typer.echo(f"Submitted {describe_job(job)}.")
+    if daemon_pid(store) is None:
+        info("No queue daemon is running; start one with 'tla queue serve'.")
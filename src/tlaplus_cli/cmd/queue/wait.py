@@ -0,0 +1,39 @@
+import time
+
+import typer
+
+from tlaplus_cli.cmd.queue import app
+from tlaplus_cli.cmd.queue.list import load_job
+from tlaplus_cli.queue import DONE, JobStore
+
+_WAIT_POLL = 1.0
+
+
+@app.command()
+def wait(
+    job_ids: list[int] = typer.Argument(help="Job IDs as shown by 'tla queue list'."),  # noqa: B008
+    timeout: float | None = typer.Option(None, "--timeout", min=0, help="Give up after this many seconds."),
+) -> None:
+    """Wait for jobs to finish.
+
+    Exits with the job's exit code for a single job, otherwise with 0 only if
+    every job is done.
+    """
+    store = JobStore()
+    jobs = [load_job(store, job_id) for job_id in job_ids]
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    while not all(job.finished for job in jobs):
+        if deadline is not None and time.monotonic() >= deadline:
+            pending = ", ".join(str(job.id) for job in jobs if not job.finished)
+            typer.echo(f"Error: timed out waiting for job(s) {pending}.", err=True)
+            raise typer.Exit(1)
+        time.sleep(_WAIT_POLL)
+        jobs = [load_job(store, job.id or 0) for job in jobs]
+
+    for job in jobs:
+        exit_code = f" (exit code {job.exit_code})" if job.exit_code is not None else ""
+        error = f": {job.error}" if job.error else ""
+        typer.echo(f"Job {job.id}: {job.state}{exit_code}{error}")
+    if len(jobs) == 1:
+        raise typer.Exit(jobs[0].exit_code if jobs[0].exit_code is not None else 1)
+    raise typer.Exit(0 if all(job.state == DONE for job in jobs) else 1)
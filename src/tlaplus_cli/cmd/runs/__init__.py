@@ -0,0 +1,5 @@
+import typer
+
+app = typer.Typer(name="runs", help="Query the history of TLC runs.", no_args_is_help=True)
+
+from . import compare, list, show  # noqa: F401, E402
@@ -0,0 +1,76 @@
+import shlex
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.cmd.runs import app
+from tlaplus_cli.cmd.runs.list import format_count
+from tlaplus_cli.cmd.runs.show import RUN_ID_ARGUMENT, load_run
+from tlaplus_cli.history import RunHistory, RunRecord
+from tlaplus_cli.units import format_size
+
+
+def _change(old: float | None, new: float | None) -> str:
+    if old is None or new is None or old == 0:
+        return "-"
+    return f"{(new - old) / old:+.1%}"
+
+
+def _inputs(run: RunRecord) -> dict[str, str]:
+    return {
+        "Spec": run.spec_hash[:12] if run.spec_hash else "-",
+        "Config": run.cfg_hash[:12] if run.cfg_hash else "-",
+        "Tools": run.tools_version or "-",
+        "Profile": run.profile or "-",
+        "JVM options": shlex.join(run.java_opts) or "-",
+        "TLC arguments": shlex.join(run.tlc_args) or "-",
+        "Host": run.host,
+    }
+
+
+@app.command()
+def compare(
+    old: int = RUN_ID_ARGUMENT,
+    new: int | None = typer.Argument(None, help="Run to compare with (default: the newest run of the same spec)."),
+) -> None:
+    """Compare the performance and inputs of two runs."""
+    before = load_run(old)
+    if new is None:
+        latest = RunHistory().runs(spec=before.spec_name, limit=1)
+        new = latest[0].id if latest and latest[0].id is not None else old
+    after = load_run(new)
+
+    table = Table(title=f"Run {before.id} ({before.spec_name}) → run {after.id} ({after.spec_name})")
+    table.add_column("Metric", style="magenta")
+    table.add_column(f"#{before.id}", justify="right")
+    table.add_column(f"#{after.id}", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_row("Outcome", before.outcome, after.outcome, "")
+    table.add_row(
+        "Wall time", f"{before.wall_time:.2f}s", f"{after.wall_time:.2f}s", _change(before.wall_time, after.wall_time)
+    )
+    metrics = [
+        ("States generated", before.states_generated, after.states_generated),
+        ("Distinct states", before.distinct_states, after.distinct_states),
+        ("States/s", before.states_per_sec, after.states_per_sec),
+        ("Peak states/s", before.peak_states_per_sec, after.peak_states_per_sec),
+    ]
+    for label, old_value, new_value in metrics:
+        table.add_row(label, format_count(old_value), format_count(new_value), _change(old_value, new_value))
+    table.add_row(
+        "Peak RSS",
+        format_size(before.peak_rss) if before.peak_rss else "-",
+        format_size(after.peak_rss) if after.peak_rss else "-",
+        _change(before.peak_rss, after.peak_rss),
+    )
+    Console().print(table)
+
+    old_inputs, new_inputs = _inputs(before), _inputs(after)
+    changed = [name for name in old_inputs if old_inputs[name] != new_inputs[name]]
+    if not changed:
+        typer.echo("Inputs: identical (spec, config, tools, options and host).")
+        return
+    typer.echo("Changed inputs:")
+    for name in changed:
+        typer.echo(f"  {name}: {old_inputs[name]} → {new_inputs[name]}")
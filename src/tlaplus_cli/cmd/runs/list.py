@@ -0,0 +1,66 @@
+import time
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.cmd.runs import app
+from tlaplus_cli.history import CRASH, FAIL, PASS, STOPPED, RunHistory, RunRecord
+from tlaplus_cli.units import format_size
+
+OUTCOME_STYLES = {PASS: "green", FAIL: "red", CRASH: "yellow", STOPPED: "magenta"}
+
+
+def format_time(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def format_outcome(record: RunRecord) -> str:
+    style = OUTCOME_STYLES.get(record.outcome, "white")
+    return f"[{style}]{record.outcome}[/{style}]"
+
+
+def format_count(value: float | None) -> str:
+    return "-" if value is None else f"{value:,.0f}"
+
+
+@app.command(name="list")
+def list_runs(
+    spec: str | None = typer.Option(None, "--spec", "-s", help="Only runs of this spec (module name)."),
+    outcome: str | None = typer.Option(
+        None, "--outcome", help="Only runs with this outcome: pass, fail, crash or stopped."
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", min=1, help="Number of runs to show, newest first."),
+) -> None:
+    """List recorded TLC runs, newest first."""
+    if outcome is not None and outcome not in OUTCOME_STYLES:
+        typer.echo(f"Error: Unknown outcome '{outcome}' (expected pass, fail, crash or stopped).", err=True)
+        raise typer.Exit(1)
+    runs = RunHistory().runs(spec=spec, outcome=outcome, limit=limit)
+    if not runs:
+        typer.echo("No runs recorded yet.")
+        return
+
+    table = Table(title="TLC runs")
+    table.add_column("ID", justify="right", style="cyan")
+    table.add_column("Started")
+    table.add_column("Spec", style="magenta")
+    table.add_column("Outcome")
+    table.add_column("Wall time", justify="right")
+    table.add_column("Distinct", justify="right")
+    table.add_column("States/s", justify="right", style="green")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("Tools")
+    for run in runs:
+        table.add_row(
+            str(run.id),
+            format_time(run.started_at),
+            run.spec_name,
+            format_outcome(run),
+            f"{run.wall_time:.2f}s",
+            format_count(run.distinct_states),
+            format_count(run.states_per_sec),
+            format_size(run.peak_rss) if run.peak_rss else "-",
+            run.tools_version or "-",
+        )
+    Console().print(table)
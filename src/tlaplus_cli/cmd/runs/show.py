@@ -0,0 +1,51 @@
+import shlex
+
+import typer
+from rich.console import Console
+
+from tlaplus_cli.cmd.runs import app
+from tlaplus_cli.cmd.runs.list import format_count, format_outcome, format_time
+from tlaplus_cli.history import RunHistory, RunRecord
+from tlaplus_cli.units import format_size
+
+RUN_ID_ARGUMENT = typer.Argument(help="Run ID as shown by 'tla runs list'.")
+
+
+def load_run(run_id: int) -> RunRecord:
+    """The run with *run_id*, exiting with an error if there is none."""
+    record = RunHistory().get(run_id)
+    if record is None:
+        typer.echo(f"Error: No run with ID {run_id} (see 'tla runs list').", err=True)
+        raise typer.Exit(1)
+    return record
+
+
+@app.command()
+def show(run_id: int = RUN_ID_ARGUMENT) -> None:
+    """Show everything recorded about one run."""
+    run = load_run(run_id)
+    host = run.host_info
+    rate = f"{format_count(run.states_per_sec)} average, {format_count(run.peak_states_per_sec)} peak"
+    rows = [
+        ("Run", f"{run.id} ({format_time(run.started_at)})"),
+        ("Spec", run.spec),
+        ("Outcome", format_outcome(run) + (f" (exit code {run.exit_code})" if run.exit_code else "")),
+        ("Error", run.error or "-"),
+        ("Wall time", f"{run.wall_time:.2f}s"),
+        ("States", f"{format_count(run.states_generated)} generated, {format_count(run.distinct_states)} distinct"),
+        ("Depth", format_count(run.depth)),
+        ("States/s", rate),
+        ("Peak RSS", format_size(run.peak_rss) if run.peak_rss else "-"),
+        ("Spec hash", run.spec_hash or "-"),
+        ("Config hash", run.cfg_hash or "-"),
+        ("Tools", f"{run.tools_version or '-'} ({run.tools_sha or 'unknown sha'})"),
+        ("Profile", run.profile or "-"),
+        ("JVM options", shlex.join(run.java_opts) or "-"),
+        ("TLC arguments", shlex.join(run.tlc_args) or "-"),
+        ("Host", f"{run.host} ({host.get('node')}, {host.get('cpus')} CPUs, {host.get('machine')})"),
+        ("Pinned CPUs", run.cpus or "-"),
+        ("Run directory", run.run_dir or "-"),
+    ]
+    console = Console()
+    for label, value in rows:
+        console.print(f"{label + ':':<15}{value}", highlight=False)
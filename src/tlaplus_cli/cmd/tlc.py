@@ -1,7 +1,54 @@
+import dataclasses
+import shlex
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
 import typer
+from rich.console import Console
+from rich.table import Table
 
-from tlaplus_cli.tlc.compiler import get_tlc_jar_path
-from tlaplus_cli.tlc.runner import get_tlc_version, resolve_spec_file, run_tlc
+from tlaplus_cli.bench import RunMeasurement, relative_change
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.coverage import (
+    CoverageParser,
+    CoverageReport,
+    SourceMap,
+    annotate_module,
+    rank_hotspots,
+    write_speedscope,
+)
+from tlaplus_cli.graph import GraphDump
+from tlaplus_cli.jfr import (
+    JDK,
+    TLC,
+    USER,
+    FlightRecording,
+    JfrSummary,
+    code_origin,
+    print_events,
+    summarize_events,
+)
+from tlaplus_cli.project import find_project_root
+from tlaplus_cli.tlc.affinity import Isolation, parse_cpu_list
+from tlaplus_cli.tlc.budget import Budget
+from tlaplus_cli.tlc.compiler import ModuleSources, get_tlc_jar_path
+from tlaplus_cli.tlc.logcapture import CONSOLE_MODES, TAIL, TlcLog
+from tlaplus_cli.tlc.profiles import save_spec_profile, spec_default_profile
+from tlaplus_cli.tlc.runner import (
+    LaunchPlan,
+    TlcPlan,
+    get_tlc_version,
+    plan_tlc_run,
+    resolve_launch_plan,
+    resolve_spec_file,
+    run_tlc,
+)
+from tlaplus_cli.tlc.tuning import ProfileResult, compare_profiles, pick_winner
+from tlaplus_cli.tlc.watch import CheckOutcome, WatchSession
+from tlaplus_cli.ui import warn
+from tlaplus_cli.units import format_size, parse_size
+from tlaplus_cli.watch import Watcher
 
 
 def version_callback(value: bool) -> None:
@@ -21,7 +68,441 @@ def version_callback(value: bool) -> None:
         raise typer.Exit(0)
 
 
-def tlc(
+def _fmt_change(baseline: ProfileResult, result: ProfileResult, metric: str) -> str:
+    if result is baseline:
+        return "baseline"
+    change = relative_change(baseline.values(metric), result.values(metric))
+    if change is None:
+        return "-"
+    return f"{change.delta:+.1%} [{change.low:+.1%}, {change.high:+.1%}]"
+
+
+def _print_comparison(results: list[ProfileResult], winner: ProfileResult | None) -> None:
+    baseline = results[0]
+    table = Table(title="Profile comparison (median, 95% CI vs. first profile)")
+    table.add_column("Profile", style="cyan")
+    table.add_column("States/s", justify="right", style="green")
+    table.add_column("Δ States/s", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("Δ Peak RSS", justify="right")
+    table.add_column("Runs", justify="right")
+
+    for r in results:
+        rate = r.summary("states_per_sec")
+        rss = r.summary("peak_rss")
+        name = f"{r.profile} ★" if r is winner else r.profile
+        table.add_row(
+            name,
+            "[red]failed[/red]" if r.failed else (f"{rate.median:,.0f}" if rate else "-"),
+            _fmt_change(baseline, r, "states_per_sec"),
+            format_size(int(rss.median)) if rss else "-",
+            _fmt_change(baseline, r, "peak_rss"),
+            str(len(r.runs)),
+        )
+    Console().print(table)
+
+
+def _report_profile_run(result: ProfileResult, measurement: RunMeasurement, warmup: bool) -> None:
+    label = "warm-up" if warmup else f"run {len(result.runs)}"
+    status = "ok" if measurement.exit_code == 0 else f"exit {measurement.exit_code}"
+    typer.echo(f"  {result.profile} {label}: {measurement.wall_time:.2f}s ({status})")
+
+
+def _compare(spec: str, profiles: list[str], *, repeat: int, save_winner: bool | None) -> None:
+    profiles = list(dict.fromkeys(profiles))
+    if len(profiles) < 2:
+        typer.echo("Error: --compare-opts needs at least two different profiles.", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"Comparing {len(profiles)} profiles ({repeat} measured runs each, alternating) ...")
+    try:
+        spec_file, results = compare_profiles(spec, profiles, repeat=repeat, on_run=_report_profile_run)
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    winner = pick_winner(results)
+    _print_comparison(results, winner)
+    if winner is None:
+        typer.echo("Error: Every profile failed; nothing to save.", err=True)
+        raise typer.Exit(1)
+
+    if spec_default_profile(load_config().java, spec_file) == winner.profile:
+        typer.echo(f"'{winner.profile}' is already the default profile for {spec_file.name}.")
+        return
+    if save_winner is None:
+        save_winner = typer.confirm(f"Save '{winner.profile}' as the default profile for {spec_file.name}?")
+    if save_winner:
+        save_spec_profile(spec_file, winner.profile)
+        typer.echo(f"Saved '{winner.profile}' as the default profile for {spec_file.name}.")
+
+
+_HOTSPOTS = 20
+_WATCH_TAIL = 10
+
+
+def _module_sources(spec_file: Path) -> SourceMap:
+    """Module sources next to the spec, then in the project's modules directory."""
+    config = load_config()
+    dirs = [spec_file.parent]
+    root = find_project_root(
+        spec_file, modules_dir=config.workspace.modules_dir, classes_dir=config.workspace.classes_dir
+    )
+    if root is not None:
+        dirs.append(root / config.workspace.modules_dir)
+    return SourceMap(dirs)
+
+
+def _print_spec_profile(spec_file: Path, report: CoverageReport, speedscope: Path | None) -> None:
+    sources = _module_sources(spec_file)
+    console = Console()
+    table = Table(title=f"Expression hot spots (top {_HOTSPOTS})")
+    table.add_column("Location", style="cyan")
+    table.add_column("Action", style="magenta")
+    table.add_column("Evaluations", justify="right", style="green")
+    table.add_column("Cost", justify="right", style="yellow")
+    table.add_column("Source")
+    for spot in rank_hotspots(report, sources, top=_HOTSPOTS):
+        table.add_row(
+            str(spot.location),
+            spot.location.action,
+            f"{spot.evaluations:,}",
+            f"{spot.cost:,}" if spot.cost else "-",
+            spot.source or "[dim](source not found)[/dim]",
+        )
+    console.print(table)
+
+    modules = dict.fromkeys(key.module for key in report.expressions)
+    for module in modules:
+        annotated = annotate_module(report, sources, module)
+        if annotated is None:
+            continue
+        console.rule(f"{module}.tla")
+        for line in annotated:
+            gutter = f"{line.evaluations:>12,}" if line.evaluations else " " * 12
+            cost = f"{line.cost:>12,}" if line.cost else " " * 12
+            console.print(f"{gutter} {cost} {line.number:>5} | {line.text}", markup=False, highlight=False)
+
+    if speedscope is not None:
+        write_speedscope(speedscope, report, sources, spec_file.name)
+        typer.echo(f"Speedscope profile written to {speedscope} (open it at https://www.speedscope.app)")
+
+
+_JFR_METHODS = 15
+
+
+def _print_jfr_summary(summary: JfrSummary) -> None:
+    console = Console()
+    total = summary.total_samples
+    typer.echo(f"CPU samples: {total:,}")
+    if total:
+        split = ", ".join(f"{origin} {summary.origin_samples[origin] / total:.1%}" for origin in (TLC, USER, JDK))
+        typer.echo(f"  Self time by code: {split}")
+        typer.echo(f"  Samples with user code on the stack: {summary.user_on_stack / total:.1%}")
+
+        table = Table(title=f"Top CPU methods (self samples, top {_JFR_METHODS})")
+        table.add_column("Method", style="cyan")
+        table.add_column("Code", style="magenta")
+        table.add_column("Samples", justify="right", style="green")
+        table.add_column("Share", justify="right")
+        for method, count in summary.cpu_samples.most_common(_JFR_METHODS):
+            origin = code_origin(method.rpartition(".")[0])
+            table.add_row(method, origin, f"{count:,}", f"{count / total:.1%}")
+        console.print(table)
+
+    if summary.contention_count:
+        table = Table(title="Monitor contention")
+        table.add_column("Monitor", style="cyan")
+        table.add_column("Blocked in", style="magenta")
+        table.add_column("Events", justify="right", style="green")
+        table.add_column("Blocked time", justify="right", style="yellow")
+        for site, count in summary.contention_count.most_common(_JFR_METHODS):
+            table.add_row(site[0], site[1], f"{count:,}", f"{summary.contention_time[site]:.3f}s")
+        console.print(table)
+    else:
+        typer.echo("Monitor contention: none recorded")
+
+    rate = summary.allocation_rate
+    rate_text = f"{format_size(int(rate))}/s" if rate is not None else "-"
+    typer.echo(f"Allocation (sampled): {format_size(summary.allocated_bytes)} total, {rate_text}")
+    typer.echo(
+        f"GC: {summary.gc_count} collections, {summary.gc_pause_total:.3f}s total pause, "
+        f"longest {summary.gc_pause_max:.3f}s"
+    )
+    if summary.user_contention():
+        warn(
+            "Worker threads block on monitors in user override code, which serializes TLC's workers; "
+            "see docs/thread-safty-note.md."
+        )
+
+
+def _summarize_recording(recording: FlightRecording) -> None:
+    if recording.path is None or not recording.exists:
+        typer.echo("No flight recording was written; nothing to summarize.", err=True)
+        return
+    typer.echo(f"Flight recording: {recording.path}")
+    try:
+        summary = summarize_events(print_events(recording.path))
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        return
+    _print_jfr_summary(summary)
+
+
+def _print_plan(plan: TlcPlan, extra_args: list[str]) -> None:
+    profile = f"{plan.profile} (from {plan.profile_source})" if plan.profile else "none (java.opts)"
+    typer.echo(f"Profile: {profile}")
+    typer.echo(f"Working directory: {plan.spec_file.parent}")
+    typer.echo(shlex.join(plan.command("<run-dir>", extra_args)))
+
+
+def _print_launch_plan(launch: LaunchPlan) -> None:
+    plan = launch.plan
+    if launch.cached:
+        source = f"cached, resolved {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(launch.resolved))}"
+    else:
+        source = "resolved now"
+    rows: list[tuple[str, object]] = [
+        ("Java", launch.java or "java (not found on PATH)"),
+        ("Toolset", launch.jar),
+        ("Working directory", plan.spec_file.parent),
+        ("Profile", f"{plan.profile} (from {plan.profile_source})" if plan.profile else "none (java.opts)"),
+        ("JVM options", shlex.join(plan.java_opts) or "-"),
+        ("Main class", plan.java_class),
+        ("TLC arguments", shlex.join(plan.tlc_args) or "-"),
+    ]
+    typer.echo(f"Launch plan for {plan.spec_file.name} ({source})")
+    for label, value in rows:
+        typer.echo(f"  {label + ':':<19}{value}")
+    for heading, entries in (("Classpath", plan.classpath), ("Library paths", launch.library_paths)):
+        typer.echo(f"  {heading + ':':<19}{entries[0] if entries else '-'}")
+        for entry in entries[1:]:
+            typer.echo(f"  {'':<19}{entry}")
+    if launch.plan_file is not None:
+        typer.echo(f"  {'Plan cache:':<19}{launch.plan_file} ({launch.stamps} paths checked per launch)")
+    else:
+        typer.echo(f"  {'Plan cache:':<19}not cached (modules.jar is out of date)")
+
+
+def _show_plans(spec: str, profiles: list[str | None], cli_args: list[str]) -> None:
+    try:
+        launches = [resolve_launch_plan(spec, profile=p, cli_args=cli_args) for p in profiles]
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    for i, launch in enumerate(launches):
+        if i:
+            typer.echo()
+        _print_launch_plan(launch)
+
+
+def _dry_run(
+    spec: str,
+    profiles: list[str | None],
+    cli_args: list[str],
+    extra_args: list[str],
+    recording: FlightRecording | None,
+) -> None:
+    try:
+        plans = [plan_tlc_run(spec, profile=p, cli_args=cli_args) for p in profiles]
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    for i, plan in enumerate(plans):
+        if i:
+            typer.echo()
+        if recording is not None:
+            plan = dataclasses.replace(plan, java_opts=[*plan.java_opts, *recording.java_opts("<run-dir>")])  # noqa: PLW2901
+        _print_plan(plan, extra_args)
+
+
+def _tlc_log(log_dir: Path | None, max_size: str | None, console: str | None) -> TlcLog | None:
+    if log_dir is None:
+        return None
+    settings = load_config().tlc.log
+    console = console or settings.console
+    if console not in CONSOLE_MODES:
+        typer.echo(f"Error: --log-console must be one of {', '.join(CONSOLE_MODES)}", err=True)
+        raise typer.Exit(1)
+    try:
+        size = parse_size(max_size or settings.max_size)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    return TlcLog(
+        log_dir.absolute(), size, backups=settings.backups, console=console, console_rate=settings.console_rate
+    )
+
+
+def _budget(max_time: str | None, max_states: str | None, max_disk: str | None, min_throughput: str | None) -> Budget:
+    try:
+        return Budget.from_options(
+            load_config().tlc.budget,
+            max_time=max_time,
+            max_states=max_states,
+            max_disk=max_disk,
+            min_throughput=min_throughput,
+        )
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+
+def _isolation(
+    cpus: int | None, cpu_list: str | None, address_space: str | None, open_files: int | None
+) -> Isolation | None:
+    if cpus is not None and cpu_list is not None:
+        typer.echo("Error: --cpus and --cpu-list cannot be combined", err=True)
+        raise typer.Exit(1)
+    if cpus is None and cpu_list is None and address_space is None and open_files is None:
+        return None
+    try:
+        return Isolation(
+            cpus=parse_cpu_list(cpu_list) if cpu_list is not None else cpus,
+            address_space=parse_size(address_space) if address_space is not None else None,
+            open_files=open_files,
+        )
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+
+def _print_log_summary(log: TlcLog) -> None:
+    files = log.log.files if log.log is not None else []
+    written = log.log.written if log.log is not None else 0
+    compressed = sum(f.stat().st_size for f in files)
+    typer.echo(f"TLC output: {log.lines:,} lines, {format_size(written)} ({format_size(compressed)} compressed)")
+    if files:
+        rotated = f" and {len(files) - 1} rotated file(s)" if len(files) > 1 else ""
+        typer.echo(f"  Log: {files[0]}{rotated}")
+    if log.log is not None and log.log.rotations > log.backups:
+        typer.echo(f"  The oldest {log.log.rotations - log.backups} file(s) of output were discarded.")
+    if log.suppressed and log.console == TAIL:
+        typer.echo(f"  {log.suppressed:,} lines were not shown on the console.")
+    stats = log.stats
+    found = f"{stats.distinct_states:,} distinct states" if stats.distinct_states is not None else "no states"
+    depth = f", depth {stats.depth}" if stats.depth is not None else ""
+    if stats.error is not None:
+        typer.echo(f"  Result: {stats.error} ({found})")
+    else:
+        typer.echo(f"  Result: {'no error found' if stats.completed else 'incomplete'} ({found}{depth})")
+
+
+def _report_run(
+    spec: str,
+    coverage_parser: CoverageParser | None,
+    speedscope: Path | None,
+    recording: FlightRecording | None,
+    log: TlcLog | None,
+) -> None:
+    """Print what the run collected besides TLC's own output."""
+    if log is not None:
+        _print_log_summary(log)
+    if coverage_parser is not None:
+        if coverage_parser.report:
+            spec_file, _ = resolve_spec_file(spec)
+            _print_spec_profile(spec_file, coverage_parser.report, speedscope)
+        else:
+            typer.echo("No coverage statistics in TLC's output; nothing to profile.", err=True)
+    if recording is not None:
+        _summarize_recording(recording)
+
+
+def _print_outcome(plan: TlcPlan, outcome: CheckOutcome) -> None:
+    name = plan.spec_file.name
+    stats = outcome.stats
+    if outcome.cancelled:
+        typer.echo(f"… {name}: cancelled by a newer change after {outcome.elapsed:.2f}s")
+    elif outcome.passed:
+        found = f"{stats.distinct_states:,} distinct states" if stats.distinct_states is not None else "no states"
+        depth = f", depth {stats.depth}" if stats.depth is not None else ""
+        typer.echo(f"✓ PASS {name}: {found}{depth} ({outcome.elapsed:.2f}s)")
+    else:
+        reason = stats.error or f"exit code {outcome.returncode}"
+        typer.echo(f"✗ FAIL {name}: {reason} ({outcome.elapsed:.2f}s)")
+        if outcome.trace_states and outcome.run_dir is not None:
+            typer.echo(f"  Counterexample: {outcome.trace_states} states ('tla trace show {outcome.run_dir.name}')")
+        elif stats.error is None:
+            for line in outcome.tail[-_WATCH_TAIL:]:
+                typer.echo(f"  {line}")
+
+
+def _rebuild_overrides(session: WatchSession, sources: ModuleSources, changed: set[Path]) -> bool:
+    """Recompile overrides touched by *changed*; False if they do not compile."""
+    try:
+        result = session.rebuild_overrides(sources, changed)
+    except (FileNotFoundError, RuntimeError) as e:
+        warn(f"Overrides not recompiled: {e}")
+        return True
+    if result is None:
+        return True
+    for diagnostic in result.diagnostics:
+        typer.echo(str(diagnostic), err=diagnostic.is_error)
+    if not result.ok:
+        typer.echo(f"✗ Overrides failed to compile: {len(result.errors)} error(s)")
+    return result.ok
+
+
+def _check_once(session: WatchSession, plan: TlcPlan, watcher: Watcher, changed: set[Path]) -> set[Path]:
+    """Rebuild touched overrides and run TLC once. Returns the changes that cancelled the run, if any."""
+    overrides = session.overrides(plan)
+    if overrides is not None and not _rebuild_overrides(session, overrides, changed):
+        return set()
+    typer.echo(f"[{time.strftime('%H:%M:%S')}] Checking {plan.spec_file.name} ...")
+    outcome, cancelled_by = session.check(plan, watcher)
+    _print_outcome(plan, outcome)
+    return cancelled_by
+
+
+def _reject_conflicts(option: str, conflicts: Mapping[str, object]) -> None:
+    """Exit with an error if any flag in *conflicts* was given (is not None) together with *option*."""
+    used = [flag for flag, value in conflicts.items() if value is not None]
+    if used:
+        typer.echo(f"Error: {option} cannot be combined with {', '.join(used)}", err=True)
+        raise typer.Exit(1)
+
+
+def _watch_spec(spec: str, profile: str | None, *, debounce: float, poll: bool) -> None:
+    """Re-run TLC whenever the spec's inputs change, until interrupted."""
+    session = WatchSession(spec, profile=profile)
+    try:
+        plan = session.plan()
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    watched: list[Path] = []
+    watcher: Watcher | None = None
+    changed: set[Path] = set()
+    try:
+        while True:
+            paths = session.inputs(plan, session.overrides(plan))
+            if watcher is None or paths != watched:
+                if watcher is not None:
+                    watcher.close()
+                watcher, watched = session.watcher(paths, poll=poll), paths
+                typer.echo(f"Watching {len(paths)} input(s) of {plan.spec_file.name} (Ctrl+C to stop)")
+            changed = _check_once(session, plan, watcher, changed)
+            session.prepare(plan)
+            changed = changed or watcher.wait(None)
+            while more := watcher.wait(debounce):
+                changed |= more
+            try:
+                plan = session.plan()
+            except (FileNotFoundError, RuntimeError, ValueError) as e:
+                typer.echo(f"Error: {e}; still watching the previous inputs", err=True)
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
+    except FileNotFoundError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+    finally:
+        if watcher is not None:
+            watcher.close()
+        session.close()
+
+
+def tlc(  # noqa: PLR0913, PLR0917
     spec: str = typer.Argument(help="Name of the TLA+ specification (without .tla extension)."),
     version: bool | None = typer.Option(
         None,
@@ -30,6 +511,88 @@ def tlc(
         callback=version_callback,
         is_eager=True,
     ),
+    checkpoint: int | None = typer.Option(
+        None, "--checkpoint", min=0, help="Checkpoint interval in minutes (keeps the run's metadir)."
+    ),
+    keep_metadir: bool = typer.Option(False, "--keep-metadir", help="Keep the run's metadir after success."),
+    profile: str | None = typer.Option(
+        None, "--profile", "-p", help="Use this profile from java.profiles or the project's tla-tuning.yaml."
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Print the effective java command without running it."),
+    print_plan: bool = typer.Option(
+        False, "--print-plan", help="Print the resolved launch plan (Java, toolset, classpath, options) and exit."
+    ),
+    record_trace: bool | None = typer.Option(
+        None,
+        "--record-trace/--no-record-trace",
+        help="Store any counterexample for 'tla trace show' (default: tlc.record_trace).",
+    ),
+    graph: Path | None = typer.Option(  # noqa: B008
+        None, "--graph", help="Write the state graph as a compact binary edge list (see 'tla graph stats')."
+    ),
+    coverage: int | None = typer.Option(
+        None,
+        "--coverage",
+        min=1,
+        help="Collect TLC coverage every N minutes and merge it into the coverage store (see 'tla coverage').",
+    ),
+    profile_spec: bool = typer.Option(
+        False,
+        "--profile-spec",
+        help="Collect expression evaluation counts and costs; print hot spots and the annotated source.",
+    ),
+    speedscope: Path | None = typer.Option(  # noqa: B008
+        None, "--speedscope", help="With --profile-spec, also write a speedscope JSON profile to this file."
+    ),
+    jfr: bool = typer.Option(
+        False, "--jfr", help="Record the run with Java Flight Recorder and summarize hot methods and contention."
+    ),
+    jfr_duration: int | None = typer.Option(
+        None, "--jfr-duration", min=1, help="Stop the flight recording after this many seconds (implies --jfr)."
+    ),
+    compare_opts: list[str] = typer.Option(  # noqa: B008
+        None,
+        "--compare-opts",
+        help="Benchmark the spec under this java.profiles entry (repeat for each profile; 'default' = java.opts).",
+    ),
+    repeat: int = typer.Option(3, "--repeat", min=1, help="Measured runs per profile with --compare-opts."),
+    save_winner: bool | None = typer.Option(
+        None,
+        "--save-winner/--no-save-winner",
+        help="Save the fastest profile as the spec's default without asking.",
+    ),
+    watch: bool = typer.Option(
+        False, "--watch", "-w", help="Re-check on every change to the spec, its modules, the .cfg or the overrides."
+    ),
+    debounce_ms: int = typer.Option(100, "--debounce-ms", min=0, help="Quiet period that ends a batch of changes."),
+    poll: bool = typer.Option(False, "--poll", help="With --watch, poll file times instead of using inotify."),
+    log_dir: Path | None = typer.Option(  # noqa: B008
+        None, "--log-dir", help="Write TLC's output to gzip-compressed, rotated log files in this directory."
+    ),
+    log_max_size: str | None = typer.Option(
+        None, "--log-max-size", help="Rotate a log after this much output, e.g. 500M (default: tlc.log.max_size)."
+    ),
+    log_console: str | None = typer.Option(
+        None, "--log-console", help="With --log-dir: 'tail' (rate-limited output) or 'summary' (default: tlc.log)."
+    ),
+    max_time: str | None = typer.Option(
+        None, "--max-time", help="Stop the run after this long, e.g. 12h (default: tlc.budget.max_time)."
+    ),
+    max_states: str | None = typer.Option(
+        None, "--max-states", help="Stop the run after this many distinct states, e.g. 2G."
+    ),
+    max_disk: str | None = typer.Option(None, "--max-disk", help="Stop the run when its metadir exceeds this size."),
+    min_throughput: str | None = typer.Option(
+        None, "--min-throughput", help="Stop the run when it generates fewer states than e.g. '5000/s over 10m'."
+    ),
+    cpus: int | None = typer.Option(
+        None, "--cpus", min=1, help="Pin TLC to this many free CPUs (one NUMA node if possible) with as many workers."
+    ),
+    cpu_list: str | None = typer.Option(None, "--cpu-list", help="Pin TLC to these CPUs, e.g. 0-3,8."),
+    max_address_space: str | None = typer.Option(
+        None, "--max-address-space", help="RLIMIT_AS for the JVM, e.g. 64G (must leave room for the heap)."
+    ),
+    max_open_files: int | None = typer.Option(None, "--max-open-files", min=1, help="RLIMIT_NOFILE for the JVM."),
 ) -> None:
     """Run TLC model checker on a TLA+ specification."""
     if version:
@@ -41,11 +604,89 @@ def tlc(
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1) from None
 
+    if log_dir is None and (log_max_size is not None or log_console is not None):
+        typer.echo("Error: --log-max-size and --log-console need --log-dir", err=True)
+        raise typer.Exit(1)
+
+    recording = FlightRecording(duration=jfr_duration) if jfr or jfr_duration is not None else None
+
+    # Options that change a single run, as given (before --profile-spec implies --coverage);
+    # --compare-opts and --watch would ignore them.
+    incompatible = {
+        "--graph": graph,
+        "--coverage": coverage,
+        "--profile-spec": profile_spec or None,
+        "--speedscope": speedscope,
+        "--jfr": recording,
+        "--checkpoint": checkpoint,
+        "--keep-metadir": keep_metadir or None,
+        "--log-dir": log_dir,
+        "--max-time": max_time,
+        "--max-states": max_states,
+        "--max-disk": max_disk,
+        "--min-throughput": min_throughput,
+        "--cpus": cpus,
+        "--cpu-list": cpu_list,
+        "--max-address-space": max_address_space,
+        "--max-open-files": max_open_files,
+    }
+
+    profile_spec = profile_spec or speedscope is not None
+    if profile_spec and coverage is None:
+        coverage = 1
+
+    if dry_run or print_plan:
+        cli_args = [
+            *(["-checkpoint", str(checkpoint)] if checkpoint is not None else []),
+            *(["-coverage", str(coverage)] if coverage is not None else []),
+        ]
+        profiles: list[str | None] = list(compare_opts) if compare_opts else [profile]
+        if print_plan:
+            _show_plans(spec, profiles, cli_args)
+            return
+        extra_args = GraphDump(Path("<run-dir>"), graph, spec_name).tlc_args if graph else []
+        _dry_run(spec, profiles, cli_args, extra_args, recording)
+        return
+
+    if compare_opts:
+        conflicts = {
+            **incompatible,
+            "--profile": profile,
+            "--record-trace": record_trace,
+            "--watch": watch or None,
+        }
+        _reject_conflicts("--compare-opts", conflicts)
+        _compare(spec, compare_opts, repeat=repeat, save_winner=save_winner)
+        return
+
+    if watch:
+        _reject_conflicts("--watch", incompatible)
+        _watch_spec(spec, profile, debounce=debounce_ms / 1000, poll=poll)
+        return
+
+    log = _tlc_log(log_dir, log_max_size, log_console)
+    budget = _budget(max_time, max_states, max_disk, min_throughput)
+    isolation = _isolation(cpus, cpu_list, max_address_space, max_open_files)
     typer.echo(f"Running TLC on {spec_name} ...")
+    coverage_parser = CoverageParser() if profile_spec else None
     try:
-        exit_code = run_tlc(spec)
-    except FileNotFoundError as e:
+        exit_code = run_tlc(
+            spec,
+            profile=profile,
+            checkpoint=checkpoint,
+            keep_metadir=keep_metadir,
+            record_trace=record_trace,
+            graph=graph,
+            coverage=coverage,
+            coverage_parser=coverage_parser,
+            flight_recording=recording,
+            log=log,
+            budget=budget,
+            isolation=isolation,
+        )
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1) from None
 
+    _report_run(spec, coverage_parser, speedscope, recording, log)
     raise typer.Exit(exit_code)
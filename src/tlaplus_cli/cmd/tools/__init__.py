@@ -1,8 +1,10 @@
 import typer
 
 from tlaplus_cli.cmd.tools.meta import app as meta_app
+from tlaplus_cli.cmd.tools.mirror import app as mirror_app
 
 app = typer.Typer(name="tools", help="Manage TLC tools (tla2tools.jar).", no_args_is_help=True)
 app.add_typer(meta_app, name="meta")
+app.add_typer(mirror_app, name="mirror")
 
-from . import dir, install, list, path, pin, uninstall, upgrade  # noqa: F401, E402
+from . import dir, gc, install, list, path, pin, uninstall, upgrade  # noqa: F401, E402
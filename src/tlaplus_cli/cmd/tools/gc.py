@@ -0,0 +1,48 @@
+from datetime import UTC, datetime
+
+import typer
+
+from tlaplus_cli.cmd.tools import app
+from tlaplus_cli.units import format_size, parse_duration, parse_size
+from tlaplus_cli.versioning import collect_gc_entries, plan_gc, remove_entries
+
+
+def _format_last_used(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=UTC).strftime("%Y-%m-%d")
+
+
+@app.command(name="gc")
+def gc(
+    keep_last: int | None = typer.Option(None, "--keep-last", min=0, help="Always keep the N most recently used."),
+    max_size: str | None = typer.Option(None, "--max-size", help="Evict until the cache fits, e.g. '2G'."),
+    older_than: str | None = typer.Option(None, "--older-than", help="Evict versions unused for, e.g., '30d'."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only report what would be removed."),
+) -> None:
+    """Evict least-recently-used TLC versions from the local cache (never the pinned one)."""
+    if keep_last is None and max_size is None and older_than is None:
+        typer.echo("Error: Specify at least one of --keep-last, --max-size or --older-than.", err=True)
+        raise typer.Exit(1)
+
+    try:
+        size_limit = parse_size(max_size) if max_size is not None else None
+        age_limit = parse_duration(older_than) if older_than is not None else None
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    victims = plan_gc(collect_gc_entries(), keep_last=keep_last, max_size=size_limit, older_than=age_limit)
+    if not victims:
+        typer.echo("Nothing to collect.")
+        return
+
+    verb = "Would remove" if dry_run else "Removing"
+    for entry in victims:
+        last_used = _format_last_used(entry.last_used)
+        typer.echo(f"{verb} {entry.version.path.name} ({format_size(entry.size)}, last used {last_used})")
+
+    if dry_run:
+        typer.echo(f"Would reclaim {format_size(sum(entry.size for entry in victims))}.")
+        return
+
+    reclaimed = remove_entries(victims)
+    typer.echo(f"Reclaimed {format_size(reclaimed)}.")
@@ -5,9 +5,12 @@ import typer
 
 from tlaplus_cli.cmd.tools import app
 from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.units import format_size
 from tlaplus_cli.versioning import (
-    download_version,
+    RemoteVersion,
+    auto_gc,
     download_version_from_url,
+    download_versions,
     fetch_remote_versions,
     get_pinned_version_dir,
     get_tools_dir,
@@ -24,56 +27,103 @@ def _auto_pin_if_needed(version_dir: Path) -> None:
         set_pin(version_dir)
 
 
-@app.command()
-def install(
-    version: str = typer.Argument(None, help="Version tag (e.g. 'v1.8.0') or a direct URL to tla2tools.jar."),
-    force: bool = typer.Option(False, "--force", "-f", help="Re-download if already installed."),
-) -> None:
-    """Download and install a specific TLC version."""
-    if version and is_url(version):
-        try:
-            version_dir = download_version_from_url(version)
-        except (requests.RequestException, OSError, ValueError) as e:
-            typer.echo(f"Error: Failed to download: {e}", err=True)
-            raise typer.Exit(1) from e
-        else:
-            typer.echo("Download complete.")
-            typer.echo(f"Successfully installed from URL to {version_dir}")
-            _auto_pin_if_needed(version_dir)
-            return
+def _auto_gc(installed: list[Path]) -> None:
+    """Run the automatic tools-cache GC if a size threshold is configured."""
+    gc_config = load_config().tools.gc
+    for e in auto_gc(gc_config.max_size, gc_config.keep_last, protect=installed):
+        typer.echo(f"Auto-GC: removed {e.version.path.name} ({format_size(e.size)})")
+
 
+def _install_from_url(url: str) -> Path | None:
+    try:
+        version_dir = download_version_from_url(url)
+    except (requests.RequestException, OSError, ValueError) as e:
+        typer.echo(f"Error: Failed to download: {e}", err=True)
+        return None
+    typer.echo("Download complete.")
+    typer.echo(f"Successfully installed from URL to {version_dir}")
+    return version_dir
+
+
+def _resolve_targets(names: list[str]) -> list[RemoteVersion]:
+    """Resolve version names (or the latest stable release) with a single remote fetch."""
     config = load_config()
-    versions, status = fetch_remote_versions(config.tla.urls.tags, config.tla.urls.releases, config.tla.urls.per_page)
+    urls = config.tla.urls
+    versions, status = fetch_remote_versions(urls.tags, urls.releases, urls.per_page, mirror=urls.mirror)
 
     if not versions:
         typer.echo(f"Error: Could not fetch remote versions (status: {status.value})", err=True)
         raise typer.Exit(1)
 
-    target = None
-    if version:
-        target = next((v for v in versions if v.name == version), None)
-        if not target:
-            typer.echo(f"Error: Version {version} not found.", err=True)
-            raise typer.Exit(1)
-    else:
+    if not names:
         typer.echo("No version specified, selecting latest stable release.")
         # Default to latest non-prerelease
-        target = next((v for v in versions if not v.prerelease), versions[0])
+        return [next((v for v in versions if not v.prerelease), versions[0])]
 
-    # Check if already installed
-    target_dir = get_tools_dir() / f"{target.name}-{target.short_sha}"
-    if target_dir.exists() and not force:
-        typer.echo(f"Version {target.name} is already installed.")
-        typer.echo(f"Successfully installed {target.name} to {target_dir}")
-        _auto_pin_if_needed(target_dir)
-        return
+    targets = []
+    for name in names:
+        target = next((v for v in versions if v.name == name), None)
+        if not target:
+            typer.echo(f"Error: Version {name} not found.", err=True)
+            raise typer.Exit(1)
+        targets.append(target)
+    return targets
+
+
+def _install_targets(targets: list[RemoteVersion], *, force: bool, jobs: int) -> dict[str, Path | None]:
+    """Install resolved versions concurrently. Returns the version directory (or None on failure) per name."""
+    installed: dict[str, Path | None] = {}
+    pending = []
+    for target in targets:
+        # Check if already installed
+        target_dir = get_tools_dir() / f"{target.name}-{target.short_sha}"
+        if target_dir.exists() and not force:
+            typer.echo(f"Version {target.name} is already installed.")
+            typer.echo(f"Successfully installed {target.name} to {target_dir}")
+            installed[target.name] = target_dir
+        else:
+            pending.append(target)
+
+    for result in download_versions(pending, force=force, max_workers=jobs):
+        name = result.target.name
+        if result.error is not None:
+            typer.echo(f"Error: Failed to download {name}: {result.error}", err=True)
+            installed[name] = None
+        else:
+            typer.echo(f"Download complete: {name}.")
+            typer.echo(f"Successfully installed {name} to {result.version_dir}")
+            installed[name] = result.version_dir
+    return installed
 
-    try:
-        version_dir = download_version(target, force=force)
-        typer.echo("Download complete.")
-        typer.echo(f"Successfully installed {target.name} to {version_dir}")
-    except (requests.RequestException, OSError) as e:
-        typer.echo(f"Error: Failed to download: {e}", err=True)
-        raise typer.Exit(1) from e
 
-    _auto_pin_if_needed(version_dir)
+@app.command()
+def install(
+    versions: list[str] = typer.Argument(  # noqa: B008
+        None, help="Version tags (e.g. 'v1.8.0') or direct URLs to tla2tools.jar."
+    ),
+    force: bool = typer.Option(False, "--force", "-f", help="Re-download if already installed."),
+    jobs: int = typer.Option(4, "--jobs", "-j", min=1, help="Maximum number of concurrent downloads."),
+) -> None:
+    """Download and install one or more TLC versions."""
+    requested = list(dict.fromkeys(versions or []))
+    names = [v for v in requested if not is_url(v)]
+
+    results: dict[str, Path | None] = {}
+    if names or not requested:
+        targets = _resolve_targets(names)
+        results.update(_install_targets(targets, force=force, jobs=jobs))
+        if not requested:
+            requested = [t.name for t in targets]
+
+    # URL installs are timestamp-tagged, so they run one at a time.
+    for url in (v for v in requested if is_url(v)):
+        results[url] = _install_from_url(url)
+
+    installed = [d for d in (results.get(v) for v in requested) if d is not None]
+    if installed:
+        # The first successfully installed version (in argument order) wins the auto-pin.
+        _auto_pin_if_needed(installed[0])
+        _auto_gc(installed)
+
+    if len(installed) < len(requested):
+        raise typer.Exit(1)
@@ -16,7 +16,8 @@ from tlaplus_cli.versioning import (
 @app.command(name="list")
 def list_versions() -> None:
     config = load_config()
-    versions, status = fetch_remote_versions(config.tla.urls.tags, config.tla.urls.releases, config.tla.urls.per_page)
+    urls = config.tla.urls
+    versions, status = fetch_remote_versions(urls.tags, urls.releases, urls.per_page, mirror=urls.mirror)
 
     local_versions = list_local_versions()
     pinned_dir = get_pinned_version_dir()
@@ -29,6 +30,8 @@ def list_versions() -> None:
     title = "TLA+ Tools Versions"
     if status == FetchStatus.STALE:
         title += " (cached)"
+    elif status == FetchStatus.MIRROR:
+        title += " (mirror)"
     elif status == FetchStatus.UNAVAILABLE:
         typer.echo("⚠ remote data unavailable")
 
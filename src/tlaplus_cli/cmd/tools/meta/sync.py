@@ -13,7 +13,8 @@ from tlaplus_cli.versioning import (
 def meta_sync() -> None:
     """Synchronize local metadata with remote GitHub information."""
     config = load_config()
-    versions, status = fetch_remote_versions(config.tla.urls.tags, config.tla.urls.releases, config.tla.urls.per_page)
+    urls = config.tla.urls
+    versions, status = fetch_remote_versions(urls.tags, urls.releases, urls.per_page, mirror=urls.mirror)
 
     if not versions:
         typer.echo(f"Error: Could not fetch remote versions (status: {status.value})", err=True)
@@ -0,0 +1,5 @@
+import typer
+
+app = typer.Typer(name="mirror", help="Manage a local mirror of toolset versions.", no_args_is_help=True)
+
+from . import sync  # noqa: F401, E402
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import requests
+import typer
+
+from tlaplus_cli.cmd.tools.mirror import app
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.versioning import fetch_remote_versions, sync_mirror
+
+
+@app.command(name="sync")
+def mirror_sync(
+    directory: str = typer.Argument(..., help="Mirror directory to populate."),
+    versions: list[str] = typer.Argument(None, help="Version tags to mirror (defaults to all)."),  # noqa: B008
+) -> None:
+    """Populate a local mirror directory with jars and a versions.json index from upstream."""
+    mirror_dir = Path(directory).resolve()
+    config = load_config()
+    urls = config.tla.urls
+    remote, status = fetch_remote_versions(urls.tags, urls.releases, urls.per_page)
+
+    if not remote:
+        typer.echo(f"Error: Could not fetch remote versions (status: {status.value})", err=True)
+        raise typer.Exit(1)
+
+    if versions:
+        missing = [v for v in versions if v not in {r.name for r in remote}]
+        if missing:
+            typer.echo(f"Error: Version(s) not found: {', '.join(missing)}", err=True)
+            raise typer.Exit(1)
+        remote = [r for r in remote if r.name in versions]
+
+    try:
+        fetched = sync_mirror(mirror_dir, remote)
+    except (requests.RequestException, OSError) as e:
+        typer.echo(f"Error: Failed to sync mirror: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    for v in fetched:
+        typer.echo(f"Mirrored {v.name}-{v.short_sha}")
+    typer.echo(f"Mirror at {mirror_dir} is up to date ({len(remote)} version(s), {len(fetched)} new).")
+    typer.echo(f"Set tla.urls.mirror to '{mirror_dir.as_uri()}' to use it.")
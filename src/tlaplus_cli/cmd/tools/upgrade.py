@@ -39,7 +39,8 @@ def upgrade(version: str = typer.Argument(None, help="Specific version to upgrad
     target_name, local_path = _resolve_upgrade_target(version, pinned_dir)
 
     config = load_config()
-    versions, status = fetch_remote_versions(config.tla.urls.tags, config.tla.urls.releases, config.tla.urls.per_page)
+    urls = config.tla.urls
+    versions, status = fetch_remote_versions(urls.tags, urls.releases, urls.per_page, mirror=urls.mirror)
 
     if not versions:
         typer.echo(f"Error: Could not fetch remote versions (status: {status.value})", err=True)
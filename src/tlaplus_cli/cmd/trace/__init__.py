@@ -0,0 +1,5 @@
+import typer
+
+app = typer.Typer(name="trace", help="Inspect recorded counterexamples.", no_args_is_help=True)
+
+from . import diff, show  # noqa: F401, E402
@@ -0,0 +1,59 @@
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from tlaplus_cli.cmd.trace import app
+from tlaplus_cli.cmd.trace.show import RUN_ARGUMENT, open_trace, parse_vars
+from tlaplus_cli.trace import DiffSummary, change_masks, changed_steps, load_columns, summarize_changes
+
+_MAX_LISTED_STUTTERS = 20
+
+
+def _print_summary(summary: DiffSummary, top: int) -> None:
+    stutter = len(summary.stutter_steps)
+    typer.echo(f"Steps: {summary.steps} ({stutter} stutter step{'s' if stutter != 1 else ''})")
+    if summary.stutter_steps:
+        shown = ", ".join(str(n) for n in summary.stutter_steps[:_MAX_LISTED_STUTTERS])
+        more = " ..." if stutter > _MAX_LISTED_STUTTERS else ""
+        typer.echo(f"Stutter steps reach states: {shown}{more}")
+
+    table = Table(title="Most frequently changing variables")
+    table.add_column("Variable", style="cyan")
+    table.add_column("Changes", justify="right", style="green")
+    table.add_column("Steps", justify="right")
+    for name, count in summary.changes.most_common(top):
+        share = count / summary.steps if summary.steps else 0.0
+        table.add_row(name, str(count), f"{share:.1%}")
+    Console().print(table)
+
+    table = Table(title="Steps per action")
+    table.add_column("Action", style="magenta")
+    table.add_column("Steps", justify="right", style="green")
+    for action, count in summary.actions.most_common():
+        table.add_row(action, str(count))
+    Console().print(table)
+
+
+@app.command()
+def diff(
+    run: str | None = RUN_ARGUMENT,
+    variables: str | None = typer.Option(None, "--vars", help="Only report changes to these (comma-separated)."),
+    action: str | None = typer.Option(None, "--action", "-a", help="Only report steps taken by this action."),
+    stats: bool = typer.Option(False, "--stats", help="Print only the summary statistics."),
+    top: int = typer.Option(10, "--top", min=1, help="Number of variables in the summary."),
+) -> None:
+    """Show which variables changed at each step of a recorded counterexample."""
+    with open_trace(run) as trace:
+        names = parse_vars(variables, trace.variables)
+        columns = load_columns(trace)
+        masks = change_masks(columns)
+
+        if not stats:
+            for index, changed in changed_steps(columns, masks, variables=names, action=action):
+                state = trace.state(index)
+                typer.echo(f"State {state.number}: {state.label}  [{', '.join(changed)}]")
+                for name in changed:
+                    typer.echo(f"/\\ {name} = {state.values.get(name, '(unchanged)')}")
+                typer.echo()
+
+        _print_summary(summarize_changes(columns, masks), top)
@@ -0,0 +1,71 @@
+import typer
+
+from tlaplus_cli.cmd.trace import app
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.tlc.rundir import find_run_dir
+from tlaplus_cli.trace import TRACE_DIR, TraceReader, TraceState
+
+
+def open_trace(run: str | None) -> TraceReader:
+    """Open the trace of a run (see ``find_run_dir``), exiting with an error if there is none."""
+    try:
+        run_dir = find_run_dir(run, load_config().tlc.run_dir, containing=TRACE_DIR)
+        return TraceReader(run_dir / TRACE_DIR)
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+
+def parse_vars(text: str | None, available: list[str]) -> list[str] | None:
+    """Parse a comma-separated variable filter, exiting with an error on unknown names."""
+    if not text:
+        return None
+    names = [n.strip() for n in text.split(",") if n.strip()]
+    unknown = [n for n in names if n not in available]
+    if unknown:
+        typer.echo(f"Error: Unknown variable(s): {', '.join(unknown)} (trace has: {', '.join(available)})", err=True)
+        raise typer.Exit(1)
+    return names
+
+
+def print_state(state: TraceState, names: list[str] | None) -> None:
+    typer.echo(f"State {state.number}: {state.label}")
+    for name in names if names is not None else list(state.values):
+        if name in state.values:
+            typer.echo(f"/\\ {name} = {state.values[name]}")
+
+
+RUN_ARGUMENT = typer.Argument(
+    None, help="Run directory, its name, or a spec name (newest run). Default: newest run with a trace."
+)
+
+
+@app.command()
+def show(
+    run: str | None = RUN_ARGUMENT,
+    state: int | None = typer.Option(
+        None, "--state", "-s", help="State number as printed by TLC (negative values count from the end)."
+    ),
+    variables: str | None = typer.Option(None, "--vars", help="Comma-separated variables to show."),
+) -> None:
+    """Show a recorded counterexample, or jump straight to one of its states."""
+    with open_trace(run) as trace:
+        names = parse_vars(variables, trace.variables)
+        if state is None:
+            meta = trace.meta
+            typer.echo(f"Run:       {trace.directory.parent}")
+            typer.echo(f"Spec:      {meta.get('spec')}")
+            typer.echo(f"Error:     {meta.get('error') or '-'}")
+            lasso = f" (loops back to state {meta['back_to']})" if meta.get("back_to") else ""
+            typer.echo(f"States:    {len(trace)}{lasso}")
+            typer.echo(f"Variables: {', '.join(trace.variables)}")
+            typer.echo("Use --state N to show a state.")
+            return
+
+        index = state - 1 if state > 0 else len(trace) + state
+        try:
+            record = trace.state(index)
+        except IndexError:
+            typer.echo(f"Error: State {state} is out of range (trace has {len(trace)} states).", err=True)
+            raise typer.Exit(1) from None
+        print_state(record, names)
@@ -9,6 +9,7 @@ class TlaUrls(BaseModel):
     tags: str
     releases: str
     per_page: int = 30
+    mirror: str | None = None
 
 
 class TlaConfig(BaseModel):
@@ -22,14 +23,55 @@ class WorkspaceConfig(BaseModel):
     classes_dir: Path
 
 
+class RunDirConfig(BaseModel):
+    scratch_dirs: list[str] = Field(default_factory=list)
+    estimated_size: str = "1G"
+    min_free: str = "512M"
+    keep: int = 10
+    max_age: str = "7d"
+
+
+class TlcLogConfig(BaseModel):
+    max_size: str = "100M"
+    backups: int = 4
+    console: str = "tail"
+    console_rate: int = 20
+
+
+class TlcBudgetConfig(BaseModel):
+    max_time: str | None = None
+    max_states: str | None = None
+    max_disk: str | None = None
+    min_throughput: str | None = None
+
+
 class TlcConfig(BaseModel):
     java_class: str = "tlc2.TLC"
     overrides_class: str = "tlc2.overrides.TLCOverrides"
+    run_dir: RunDirConfig = Field(default_factory=RunDirConfig)
+    record_trace: bool = False
+    history: bool = True
+    log: TlcLogConfig = Field(default_factory=TlcLogConfig)
+    budget: TlcBudgetConfig = Field(default_factory=TlcBudgetConfig)
+
+
+class JavaProfile(BaseModel):
+    """A named set of JVM options and extra TLC flags.
+
+    ``opts`` replaces ``java.opts`` when set (GC choices do not combine);
+    ``tlc_args`` are added to the TLC command line.
+    """
+
+    opts: list[str] | None = None
+    tlc_args: list[str] = Field(default_factory=list)
 
 
 class JavaConfig(BaseModel):
     min_version: int = 11
     opts: list[str] = Field(default_factory=lambda: ["-XX:+IgnoreUnrecognizedVMOptions", "-XX:+UseParallelGC"])
+    profiles: dict[str, JavaProfile] = Field(default_factory=dict)
+    # Absolute spec path -> profile name used by default for that spec.
+    spec_profiles: dict[str, str] = Field(default_factory=dict)
 
     @model_validator(mode="before")
     @classmethod
@@ -41,10 +83,95 @@ class JavaConfig(BaseModel):
         return data
 
 
+class ManifestRule(BaseModel):
+    """Per-spec settings in a project's tuning manifest.
+
+    ``spec`` and ``cfg`` are globs matched against paths relative to the
+    project root (or against the file name when the glob has no ``/``).
+    """
+
+    spec: str = "*"
+    cfg: str | None = None
+    profile: str | None = None
+    workers: int | str | None = None
+    fpmem: float | None = None
+    checkpoint: int | None = None
+    tlc_args: list[str] = Field(default_factory=list)
+
+
+class ProjectManifest(BaseModel):
+    profiles: dict[str, JavaProfile] = Field(default_factory=dict)
+    specs: list[ManifestRule] = Field(default_factory=list)
+
+
+class ToolsGcConfig(BaseModel):
+    max_size: str | None = None
+    keep_last: int = 1
+
+
+class ToolsConfig(BaseModel):
+    gc: ToolsGcConfig = Field(default_factory=ToolsGcConfig)
+
+
+class BenchWorkloadConfig(BaseModel):
+    name: str
+    spec: Path
+    cfg: Path | None = None
+
+
+class BenchGateConfig(BaseModel):
+    baseline_file: str = "bench-baseline.json"
+    tolerance: dict[str, float] = Field(
+        default_factory=lambda: {"wall_time": 0.10, "states_per_sec": 0.10, "distinct_states": 0.05}
+    )
+    mad_factor: float = 3.0
+    retries: int = 1
+
+
+class BenchConfig(BaseModel):
+    builtin_workloads: bool = True
+    workloads: list[BenchWorkloadConfig] = Field(default_factory=list)
+    warmup: int = 1
+    repeat: int = 5
+    workers: int = 1
+    seed: int = 0
+    gate: BenchGateConfig = Field(default_factory=BenchGateConfig)
+
+
+class QueueConfig(BaseModel):
+    cores: int | None = None
+    memory: str | None = None
+    default_cores: int = 1
+    pin_cpus: bool = True
+    checkpoint: int | None = None
+    preempt_after: str | None = None
+    poll: float = 1.0
+
+
+class OverrideBenchCase(BaseModel):
+    """An override to benchmark: ``module``'s ``operator`` applied to each argument list in ``inputs``.
+
+    Values are YAML scalars (integers, booleans, strings), lists (tuples) and
+    mappings (records); ``{set: [...]}`` is a set and ``{range: [lo, hi]}``
+    the interval ``lo..hi``.
+    """
+
+    module: str
+    operator: str
+    inputs: list[list[Any]] = Field(default_factory=lambda: [[]])
+
+
+class OverrideBenchFixtures(BaseModel):
+    benchmarks: list[OverrideBenchCase] = Field(default_factory=list)
+
+
 class Settings(BaseModel):
     tla: TlaConfig
     workspace: WorkspaceConfig
     tlc: TlcConfig
     java: JavaConfig = Field(default_factory=JavaConfig)
+    tools: ToolsConfig = Field(default_factory=ToolsConfig)
+    bench: BenchConfig = Field(default_factory=BenchConfig)
+    queue: QueueConfig = Field(default_factory=QueueConfig)
     module_path: str | None = None
     module_lib_path: str | None = None
@@ -0,0 +1,41 @@
+from tlaplus_cli.coverage.hotspots import (
+    AnnotatedLine,
+    HotSpot,
+    SourceMap,
+    annotate_module,
+    rank_hotspots,
+    speedscope_profile,
+    write_speedscope,
+)
+from tlaplus_cli.coverage.parser import ActionKey, CoverageParser, CoverageReport, ExpressionKey, parse_coverage
+from tlaplus_cli.coverage.store import (
+    ActionDelta,
+    CoverageStore,
+    coverage_delta,
+    current_commit,
+    list_commits,
+    open_store,
+    record_coverage,
+)
+
+__all__ = [
+    "ActionDelta",
+    "ActionKey",
+    "AnnotatedLine",
+    "CoverageParser",
+    "CoverageReport",
+    "CoverageStore",
+    "ExpressionKey",
+    "HotSpot",
+    "SourceMap",
+    "annotate_module",
+    "coverage_delta",
+    "current_commit",
+    "list_commits",
+    "open_store",
+    "parse_coverage",
+    "rank_hotspots",
+    "record_coverage",
+    "speedscope_profile",
+    "write_speedscope",
+]
@@ -0,0 +1,148 @@
+"""Expression cost hot spots mapped back to spec source.
+
+TLC's coverage statistics give, per expression location, an evaluation count
+and (for set enumerations such as ``SUBSET`` or set comprehensions) a cost.
+This module ranks them, extracts the matching source text, builds an
+annotated view of a module and exports a speedscope profile.
+"""
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from tlaplus_cli.coverage.parser import CoverageReport, ExpressionKey
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+_SNIPPET_WIDTH = 60
+
+
+@dataclass
+class HotSpot:
+    location: ExpressionKey
+    evaluations: int
+    cost: int
+    source: str | None = None
+
+    @property
+    def weight(self) -> int:
+        return self.evaluations + self.cost
+
+
+@dataclass
+class AnnotatedLine:
+    number: int
+    text: str
+    evaluations: int = 0
+    cost: int = 0
+
+
+class SourceMap:
+    """Lazily loaded module sources, looked up as ``<Module>.tla`` in *search_dirs*."""
+
+    def __init__(self, search_dirs: Sequence[Path]) -> None:
+        self.search_dirs = list(search_dirs)
+        self._lines: dict[str, list[str] | None] = {}
+
+    def path(self, module: str) -> Path | None:
+        return next((d / f"{module}.tla" for d in self.search_dirs if (d / f"{module}.tla").is_file()), None)
+
+    def lines(self, module: str) -> list[str] | None:
+        if module not in self._lines:
+            path = self.path(module)
+            self._lines[module] = path.read_text(errors="replace").splitlines() if path else None
+        return self._lines[module]
+
+    def snippet(self, location: ExpressionKey) -> str | None:
+        """Source text of *location* (1-based lines and columns, inclusive), on one line."""
+        lines = self.lines(location.module)
+        if lines is None or location.end_line > len(lines):
+            return None
+        if location.line == location.end_line:
+            text = lines[location.line - 1][location.col - 1 : location.end_col]
+        else:
+            parts = [lines[location.line - 1][location.col - 1 :]]
+            parts.extend(lines[location.line : location.end_line - 1])
+            parts.append(lines[location.end_line - 1][: location.end_col])
+            text = " ".join(p.strip() for p in parts)
+        text = " ".join(text.split())
+        return text if len(text) <= _SNIPPET_WIDTH else text[: _SNIPPET_WIDTH - 1] + "…"
+
+
+def rank_hotspots(report: CoverageReport, sources: SourceMap, *, top: int) -> list[HotSpot]:
+    """The *top* expressions by evaluations plus enumeration cost, with their source text."""
+    spots = [HotSpot(key, count, cost) for key, (count, cost) in report.expressions.items() if count or cost]
+    spots.sort(key=lambda s: s.weight, reverse=True)
+    spots = spots[:top]
+    for spot in spots:
+        spot.source = sources.snippet(spot.location)
+    return spots
+
+
+def annotate_module(report: CoverageReport, sources: SourceMap, module: str) -> list[AnnotatedLine] | None:
+    """Every line of *module* with the counters of the expressions that start on it.
+
+    A line shows the largest evaluation count among its expressions (nested
+    sub-expressions would otherwise be counted several times) and the summed cost.
+    """
+    lines = sources.lines(module)
+    if lines is None:
+        return None
+    annotated = [AnnotatedLine(i, text) for i, text in enumerate(lines, start=1)]
+    for key, (count, cost) in report.expressions.items():
+        if key.module == module and 0 < key.line <= len(annotated):
+            line = annotated[key.line - 1]
+            line.evaluations = max(line.evaluations, count)
+            line.cost += cost
+    return annotated
+
+
+def speedscope_profile(report: CoverageReport, sources: SourceMap, name: str) -> dict[str, Any]:
+    """A speedscope "sampled" profile: one stack per (action, expression), weighted by evaluations."""
+    frames: list[dict[str, Any]] = []
+    frame_ids: dict[tuple[str, ...], int] = {}
+
+    def frame(key: tuple[str, ...], info: dict[str, Any]) -> int:
+        if key not in frame_ids:
+            frame_ids[key] = len(frames)
+            frames.append(info)
+        return frame_ids[key]
+
+    samples: list[list[int]] = []
+    weights: list[int] = []
+    for key, (count, _) in report.expressions.items():
+        if not count:
+            continue
+        path = sources.path(key.module)
+        action = frame(("action", key.action), {"name": key.action})
+        label = sources.snippet(key) or str(key)
+        expression = frame(
+            ("expr", str(key), key.action),
+            {"name": f"{label} ({key})", "file": str(path) if path else key.module, "line": key.line, "col": key.col},
+        )
+        samples.append([action, expression])
+        weights.append(count)
+
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "exporter": "tlaplus-cli",
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "none",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+    }
+
+
+def write_speedscope(path: Path, report: CoverageReport, sources: SourceMap, name: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(speedscope_profile(report, sources, name)))
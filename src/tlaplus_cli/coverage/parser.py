@@ -0,0 +1,109 @@
+"""Parsing of TLC's ``-coverage`` statistics.
+
+TLC prints a block like the following every ``-coverage`` minutes and once
+more at the end of the run::
+
+    The coverage statistics at 2024-05-01 10:00:00
+    <Init line 10, col 1 to line 10, col 4 of module Spec>: 2:2
+      line 11, col 5 to line 11, col 14 of module Spec: 2
+    <Next line 13, col 1 to line 13, col 4 of module Spec>: 5:20
+      line 14, col 5 to line 14, col 20 of module Spec: 20
+      |line 15, col 8 to line 15, col 12 of module Spec: 40:120
+    End of statistics.
+
+An action header carries ``distinct:generated`` states (headers without
+counts, e.g. invariants, only group their expressions). Expression lines
+carry an evaluation count and, for set enumerations, a cost. Blocks are
+cumulative, so the last complete one describes the whole run.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+_LOCATION = r"line (\d+), col (\d+) to line (\d+), col (\d+) of module (\w+)"
+_START = "The coverage statistics at"
+_END = "End of statistics."
+_ACTION_RE = re.compile(rf"^<(\S+) {_LOCATION}>(?::\s*(\d+):(\d+))?")
+_EXPR_RE = re.compile(rf"^\s*\|*{_LOCATION}:\s*(\d+)(?::(\d+))?")
+
+
+class ActionKey(NamedTuple):
+    module: str
+    name: str
+    line: int
+    col: int
+
+    def __str__(self) -> str:
+        return f"{self.module}!{self.name}"
+
+
+class ExpressionKey(NamedTuple):
+    module: str
+    action: str
+    line: int
+    col: int
+    end_line: int
+    end_col: int
+
+    def __str__(self) -> str:
+        return f"{self.module}:{self.line}:{self.col}-{self.end_line}:{self.end_col}"
+
+
+@dataclass
+class CoverageReport:
+    """Counters from one coverage block.
+
+    ``actions`` maps to ``(distinct, generated)`` states, ``expressions`` to
+    ``(evaluations, cost)``; the same location reached under several nesting
+    levels of one action is summed.
+    """
+
+    actions: dict[ActionKey, tuple[int, int]] = field(default_factory=dict)
+    expressions: dict[ExpressionKey, tuple[int, int]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.actions or self.expressions)
+
+
+class CoverageParser:
+    """Collect the last complete coverage block from TLC output, one line at a time."""
+
+    def __init__(self) -> None:
+        self.report: CoverageReport | None = None
+        self._current: CoverageReport | None = None
+        self._action = ""
+
+    def feed(self, line: str) -> None:
+        if line.startswith(_START):
+            self._current = CoverageReport()
+            self._action = ""
+            return
+        current = self._current
+        if current is None:
+            return
+        if line.startswith(_END):
+            self.report, self._current = current, None
+            return
+
+        m = _ACTION_RE.match(line)
+        if m:
+            self._action = m.group(1)
+            if m.group(7) is not None:
+                key = ActionKey(m.group(6), m.group(1), int(m.group(2)), int(m.group(3)))
+                current.actions[key] = (int(m.group(7)), int(m.group(8)))
+            return
+
+        m = _EXPR_RE.match(line)
+        if m:
+            location = ExpressionKey(m.group(5), self._action, *(int(m.group(i)) for i in range(1, 5)))
+            count, cost = current.expressions.get(location, (0, 0))
+            current.expressions[location] = (count + int(m.group(6)), cost + int(m.group(7) or 0))
+
+
+def parse_coverage(text: str) -> CoverageReport | None:
+    """Parse the final coverage block of a complete TLC output transcript."""
+    parser = CoverageParser()
+    for line in text.splitlines():
+        parser.feed(line)
+    return parser.report
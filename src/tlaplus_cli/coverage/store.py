@@ -0,0 +1,258 @@
+"""Persistent cross-run coverage counters.
+
+Coverage is accumulated per spec and per commit of the spec's repository
+(``worktree`` outside git) under ``<cache>/coverage/<spec>/<commit>/``:
+
+- ``keys.json``: the action and expression locations, in column order, and
+  the number of merged runs.
+- ``counters.bin``: four ``int64`` columns back to back: distinct and
+  generated states per action, evaluations and cost per expression.
+
+Merging a run appends any new locations and adds the run's counters
+column-wise, so the cost of a merge is independent of how many runs the
+store already holds. Merges hold an exclusive ``flock`` on ``.lock`` in the
+store directory from load to save (readers take it shared; on Windows,
+where there is no ``flock``, everyone takes an exclusive ``msvcrt`` lock),
+so concurrent runs of the same spec do not lose each other's counters, and
+both files are replaced atomically.
+"""
+
+import contextlib
+import json
+import operator
+import subprocess
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from tlaplus_cli.config.loader import cache_dir
+from tlaplus_cli.coverage.parser import ActionKey, CoverageReport, ExpressionKey
+
+KEYS_FILE = "keys.json"
+COUNTERS_FILE = "counters.bin"
+LOCK_FILE = ".lock"
+NO_COMMIT = "worktree"
+FORMAT_VERSION = 1
+_COLUMNS = ("distinct", "generated", "evaluations", "cost")
+
+
+def coverage_root() -> Path:
+    return cache_dir() / "coverage"
+
+
+def current_commit(path: Path) -> str:
+    """Short commit id of the git checkout containing *path*, or ``worktree``."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=str(path), capture_output=True, text=True, check=False
+        )
+    except OSError:
+        return NO_COMMIT
+    commit = result.stdout.strip() if result.returncode == 0 else ""
+    return commit or NO_COMMIT
+
+
+@contextlib.contextmanager
+def _locked(directory: Path, *, shared: bool = False) -> Iterator[None]:
+    """Hold the store's lock: exclusive for a merge, *shared* for reading."""
+    directory.mkdir(parents=True, exist_ok=True)
+    with (directory / LOCK_FILE).open("a+") as f:
+        if sys.platform == "win32":
+            import msvcrt  # noqa: PLC0415
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # noqa: PLC0415
+
+            fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            yield
+
+
+def _accumulate(total: "array[int]", incoming: "array[int]") -> "array[int]":
+    return array("q", map(operator.add, total, incoming))
+
+
+class CoverageStore:
+    """Coverage counters of one spec at one commit."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.actions: list[ActionKey] = []
+        self.expressions: list[ExpressionKey] = []
+        self.columns = {name: array("q") for name in _COLUMNS}
+        self.runs = 0
+        keys_file = directory / KEYS_FILE
+        if not keys_file.is_file():
+            return
+        try:
+            keys = json.loads(keys_file.read_text())
+            self.actions = [ActionKey(*k) for k in keys["actions"]]
+            self.expressions = [ExpressionKey(*k) for k in keys["expressions"]]
+            self.runs = keys["runs"]
+            data = array("q", (directory / COUNTERS_FILE).read_bytes())
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            msg = f"Corrupt coverage store {directory}: {e}"
+            raise ValueError(msg) from None
+        sizes = [len(self.actions)] * 2 + [len(self.expressions)] * 2
+        if len(data) != sum(sizes):
+            msg = f"Corrupt coverage store {directory}: counter size mismatch"
+            raise ValueError(msg)
+        start = 0
+        for name, size in zip(_COLUMNS, sizes, strict=True):
+            self.columns[name] = data[start : start + size]
+            start += size
+
+    def _merge(self, keys: list[Any], counts: dict[Any, tuple[int, int]], names: tuple[str, str]) -> None:
+        index = {key: i for i, key in enumerate(keys)}
+        for key in counts:
+            if key not in index:
+                index[key] = len(keys)
+                keys.append(key)
+        for column_index, name in enumerate(names):
+            column = self.columns[name]
+            column.extend([0] * (len(keys) - len(column)))
+            incoming = array("q", bytes(8 * len(keys)))
+            for key, values in counts.items():
+                incoming[index[key]] = values[column_index]
+            self.columns[name] = _accumulate(column, incoming)
+
+    def add(self, report: CoverageReport) -> None:
+        """Merge the counters of one run."""
+        self._merge(self.actions, report.actions, ("distinct", "generated"))
+        self._merge(self.expressions, report.expressions, ("evaluations", "cost"))
+        self.runs += 1
+
+    def save(self) -> None:
+        """Write the store; callers merging into an existing store must hold its lock (see ``record_coverage``)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        counters = self.directory / f".{COUNTERS_FILE}.tmp"
+        with counters.open("wb") as f:
+            for name in _COLUMNS:
+                self.columns[name].tofile(f)
+        keys = {
+            "format": FORMAT_VERSION,
+            "runs": self.runs,
+            "actions": [list(k) for k in self.actions],
+            "expressions": [list(k) for k in self.expressions],
+        }
+        tmp = self.directory / f".{KEYS_FILE}.tmp"
+        tmp.write_text(json.dumps(keys))
+        counters.replace(self.directory / COUNTERS_FILE)
+        tmp.replace(self.directory / KEYS_FILE)
+
+    def action_counts(self) -> dict[ActionKey, tuple[int, int]]:
+        return dict(
+            zip(self.actions, zip(self.columns["distinct"], self.columns["generated"], strict=True), strict=True)
+        )
+
+    def cold_actions(self) -> list[ActionKey]:
+        """Actions that never generated a state in any merged run."""
+        return [key for key, generated in zip(self.actions, self.columns["generated"], strict=True) if generated == 0]
+
+    def hot_expressions(self, top: int) -> list[tuple[ExpressionKey, int, int]]:
+        """The *top* expressions by evaluation count, as ``(key, evaluations, cost)``."""
+        rows = zip(self.expressions, self.columns["evaluations"], self.columns["cost"], strict=True)
+        return sorted(rows, key=operator.itemgetter(1), reverse=True)[:top]
+
+    def total_evaluations(self) -> int:
+        return sum(self.columns["evaluations"])
+
+    def module_evaluations(self) -> Counter[str]:
+        totals: Counter[str] = Counter()
+        for key, count in zip(self.expressions, self.columns["evaluations"], strict=True):
+            totals[key.module] += count
+        return totals
+
+
+def store_dir(spec_name: str, commit: str) -> Path:
+    return coverage_root() / spec_name / commit
+
+
+def list_commits(spec_name: str) -> list[str]:
+    """Commits with stored coverage for *spec_name*, most recently updated first."""
+    root = coverage_root() / spec_name
+    if not root.is_dir():
+        return []
+    found = [d for d in root.iterdir() if (d / KEYS_FILE).is_file()]
+    found.sort(key=lambda d: (d / KEYS_FILE).stat().st_mtime, reverse=True)
+    return [d.name for d in found]
+
+
+def open_store(spec_name: str, commit: str | None = None) -> CoverageStore:
+    """Open the store for *commit* (default: the most recently updated one).
+
+    Raises:
+        FileNotFoundError: if there is no stored coverage.
+        ValueError: if the store is corrupt.
+    """
+    if commit is None:
+        commits = list_commits(spec_name)
+        if not commits:
+            msg = f"No coverage recorded for {spec_name}. Run 'tla tlc {spec_name} --coverage N' first."
+            raise FileNotFoundError(msg)
+        commit = commits[0]
+    directory = store_dir(spec_name, commit)
+    if not (directory / KEYS_FILE).is_file():
+        msg = f"No coverage recorded for {spec_name} at {commit}."
+        raise FileNotFoundError(msg)
+    with _locked(directory, shared=True):
+        return CoverageStore(directory)
+
+
+def record_coverage(spec_file: Path, *reports: CoverageReport, commit: str | None = None) -> CoverageStore:
+    """Merge *reports* into the store for *spec_file* at *commit* (default: its current commit).
+
+    Raises:
+        ValueError: if the existing store is corrupt.
+    """
+    if commit is None:
+        commit = current_commit(spec_file.parent)
+    directory = store_dir(spec_file.stem, commit)
+    with _locked(directory):
+        store = CoverageStore(directory)
+        for report in reports:
+            store.add(report)
+        store.save()
+    return store
+
+
+@dataclass
+class ActionDelta:
+    """Per-run generated states of one action in two stores (``None``: not present)."""
+
+    action: str
+    old: float | None
+    new: float | None
+
+    @property
+    def change(self) -> float | None:
+        if self.old is None or self.new is None or self.old == 0:
+            return None
+        return self.new / self.old - 1
+
+
+def coverage_delta(old: CoverageStore, new: CoverageStore) -> list[ActionDelta]:
+    """Compare average generated states per run, matching actions by module and name.
+
+    Locations shift between commits, so actions are matched by name only.
+    """
+
+    def per_run(store: CoverageStore) -> dict[str, float]:
+        rates: Counter[str] = Counter()
+        for key, (_, generated) in store.action_counts().items():
+            rates[str(key)] += generated
+        return {name: total / max(store.runs, 1) for name, total in rates.items()}
+
+    before, after = per_run(old), per_run(new)
+    names = list(dict.fromkeys([*before, *after]))
+    return [ActionDelta(name, before.get(name), after.get(name)) for name in names]
@@ -0,0 +1,13 @@
+from tlaplus_cli.graph.dot import GraphDump, convert_dot
+from tlaplus_cli.graph.stats import GraphStats, compute_stats, scc_sizes
+from tlaplus_cli.graph.store import GraphReader, GraphWriter
+
+__all__ = [
+    "GraphDump",
+    "GraphReader",
+    "GraphStats",
+    "GraphWriter",
+    "compute_stats",
+    "convert_dot",
+    "scc_sizes",
+]
@@ -0,0 +1,100 @@
+"""Conversion of TLC's ``-dump dot`` output into the binary graph format.
+
+TLC writes one node or edge per line::
+
+    -8633283946425227367 [label="/\\\\ x = 0",style = filled]
+    -8633283946425227367 -> 4562335153414153186 [label="Next",color="black",fontcolor="black"];
+
+Initial states are the filled nodes. State labels are discarded.
+"""
+
+import contextlib
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from tlaplus_cli.graph.store import GraphWriter
+
+_EDGE_RE = re.compile(r'^(-?\d+) -> (-?\d+)(?: \[label="((?:[^"\\]|\\.)*)")?')
+_NODE_RE = re.compile(r"^(-?\d+) \[")
+DUMP_FILE = "graph.dot"
+
+
+def convert_dot(lines: Iterable[str], writer: GraphWriter) -> None:
+    """Feed DOT lines into *writer*."""
+    for line in lines:
+        m = _EDGE_RE.match(line)
+        if m:
+            writer.add_edge(int(m.group(1)), int(m.group(2)), m.group(3))
+            continue
+        m = _NODE_RE.match(line)
+        if m:
+            writer.add_node(int(m.group(1)), initial=line.rstrip().rstrip(";").endswith("style = filled]"))
+
+
+class GraphDump:
+    """Have TLC dump its state graph into *run_dir* and convert it to *output* while it runs.
+
+    Where named pipes are available, TLC writes into a FIFO read by a
+    background thread, so the DOT text never reaches the disk. Otherwise the
+    DOT file is converted (and deleted) after TLC exits.
+    """
+
+    def __init__(self, run_dir: Path, output: Path, spec: str) -> None:
+        self.output = output
+        self.spec = spec
+        self.dump_path = run_dir / DUMP_FILE
+        self._fifo = hasattr(os, "mkfifo")
+        self._opened = threading.Event()
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def tlc_args(self) -> list[str]:
+        return ["-dump", "dot,actionlabels", str(self.dump_path)]
+
+    def __enter__(self) -> Self:
+        if self._fifo:
+            os.mkfifo(self.dump_path)
+            self._thread = threading.Thread(target=self._convert, name="tla-graph-dump", daemon=True)
+            self._thread.start()
+        return self
+
+    def _convert(self) -> None:
+        try:
+            writer = GraphWriter(self.output)
+            with self.dump_path.open(encoding="utf-8", errors="replace") as f:
+                self._opened.set()
+                convert_dot(f, writer)
+            writer.close(spec=self.spec)
+        except BaseException as e:
+            self._error = e
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None
+    ) -> None:
+        if self._thread is not None:
+            # If TLC never opened the pipe (e.g. it failed early), open the write
+            # end ourselves so the reader sees EOF instead of blocking forever.
+            while not self._opened.is_set() and self._thread.is_alive():
+                try:
+                    os.close(os.open(self.dump_path, os.O_WRONLY | os.O_NONBLOCK))
+                except OSError:
+                    time.sleep(0.01)  # the reader is not waiting on the pipe yet
+                else:
+                    break
+            self._thread.join()
+        elif self.dump_path.is_file():
+            with self.dump_path.open(encoding="utf-8", errors="replace") as f:
+                writer = GraphWriter(self.output)
+                convert_dot(f, writer)
+                writer.close(spec=self.spec)
+        with contextlib.suppress(OSError):
+            self.dump_path.unlink()
+        if self._error is not None and exc_type is None:
+            raise self._error
@@ -0,0 +1,126 @@
+"""State-graph statistics over a memory-mapped binary graph.
+
+Besides the mapped files, memory use is a few compact arrays: a CSR
+adjacency (8 bytes per node plus 4 per edge) and the bookkeeping for
+Tarjan's SCC algorithm (about 13 bytes per node).
+"""
+
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+
+from tlaplus_cli.graph.store import NO_ACTION, NO_LEVEL, GraphReader
+
+_UNVISITED = 0xFFFFFFFF
+
+
+@dataclass
+class GraphStats:
+    nodes: int
+    edges: int
+    initial: int
+    out_degrees: Counter[int] = field(default_factory=Counter)
+    level_widths: dict[int, int] = field(default_factory=dict)
+    action_edges: Counter[str] = field(default_factory=Counter)
+    scc_count: int = 0
+    largest_scc: int = 0
+    nontrivial_sccs: int = 0
+    self_loops: int = 0
+
+    @property
+    def depth(self) -> int:
+        return max(self.level_widths, default=-1) + 1
+
+
+def _adjacency(graph: GraphReader, stats: GraphStats) -> tuple["array[int]", "array[int]"]:
+    """Build a CSR adjacency (offsets, targets) in two passes over the edge list."""
+    n = graph.node_count
+    offsets = array("Q", bytes(8 * (n + 1)))
+    action_counts = array("Q", bytes(8 * (len(graph.actions) + 1)))
+    for src, dst, action in graph.edges():
+        offsets[src + 1] += 1
+        action_counts[len(graph.actions) if action == NO_ACTION else action] += 1
+        if src == dst:
+            stats.self_loops += 1
+
+    for name, count in zip([*graph.actions, "(unlabeled)"], action_counts, strict=True):
+        if count:
+            stats.action_edges[name] = count
+    stats.out_degrees = Counter(offsets[v + 1] for v in range(n))
+    for v in range(n):
+        offsets[v + 1] += offsets[v]
+
+    targets = array("I", bytes(4 * graph.edge_count))
+    fill = array("Q", offsets[:-1])
+    for src, dst, _ in graph.edges():
+        targets[fill[src]] = dst
+        fill[src] += 1
+    return offsets, targets
+
+
+def scc_sizes(offsets: "array[int]", targets: "array[int]") -> list[int]:
+    """Sizes of the strongly connected components (iterative Tarjan)."""
+    n = len(offsets) - 1
+    index = array("I", [_UNVISITED]) * n
+    low = array("I", [0]) * n
+    on_stack = bytearray(n)
+    stack = array("I")
+    call_nodes = array("I")
+    call_edges = array("Q")
+    sizes: list[int] = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != _UNVISITED:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call_nodes.append(root)
+        call_edges.append(offsets[root])
+        while call_nodes:
+            v = call_nodes[-1]
+            i = call_edges[-1]
+            if i < offsets[v + 1]:
+                call_edges[-1] = i + 1
+                w = targets[i]
+                if index[w] == _UNVISITED:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    call_nodes.append(w)
+                    call_edges.append(offsets[w])
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+
+            call_nodes.pop()
+            call_edges.pop()
+            if call_nodes:
+                u = call_nodes[-1]
+                low[u] = min(low[u], low[v])
+            if low[v] == index[v]:
+                size = 0
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    size += 1
+                    if w == v:
+                        break
+                sizes.append(size)
+    return sizes
+
+
+def compute_stats(graph: GraphReader) -> GraphStats:
+    stats = GraphStats(nodes=graph.node_count, edges=graph.edge_count, initial=int(graph.meta.get("initial", 0)))
+    widths: Counter[int] = Counter(level for _, level in graph.nodes() if level != NO_LEVEL)
+    stats.level_widths = dict(sorted(widths.items()))
+
+    offsets, targets = _adjacency(graph, stats)
+    sizes = scc_sizes(offsets, targets)
+    stats.scc_count = len(sizes)
+    stats.largest_scc = max(sizes, default=0)
+    stats.nontrivial_sccs = sum(1 for s in sizes if s > 1)
+    return stats
@@ -0,0 +1,170 @@
+"""Compact binary state graph.
+
+A graph written to ``out.bin`` consists of:
+
+- ``out.bin``: fixed-size edge records ``<src id: u32, dst id: u32, action id: u16>``.
+- ``out.bin.nodes``: one ``<fingerprint: i64, level: u32>`` record per node,
+  indexed by the dense node ids used in the edge list.
+- ``out.bin.json``: metadata (counts, action names).
+
+Node ids are assigned in the order states first appear in TLC's dump. The
+level is the BFS depth (initial states are level 0).
+
+While converting, the writer keeps each node's fingerprint and level in
+compact arrays and finds node ids through an open-addressing table of
+``u32`` ids (at most half full), so it needs 20 to 28 bytes per state,
+whatever the number of edges.
+"""
+
+import json
+import mmap
+import struct
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Self
+
+EDGE = struct.Struct("<IIH")
+NODE = struct.Struct("<qI")
+NO_LEVEL = 0xFFFFFFFF
+NO_ACTION = 0xFFFF
+FORMAT_VERSION = 1
+_EMPTY = 0xFFFFFFFF
+_GOLDEN = 0x9E3779B97F4A7C15  # Fibonacci hashing: spreads fingerprints that differ only in high bits.
+_WORD = (1 << 64) - 1
+_MIN_BITS = 10
+
+
+def nodes_path(path: Path) -> Path:
+    return path.with_name(path.name + ".nodes")
+
+
+def meta_path(path: Path) -> Path:
+    return path.with_name(path.name + ".json")
+
+
+class GraphWriter:
+    """Stream nodes and edges into the binary format."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._edges = path.open("wb")
+        self._table = array("I", [_EMPTY]) * (1 << _MIN_BITS)
+        self._mask = (1 << _MIN_BITS) - 1
+        self._shift = 64 - _MIN_BITS
+        self._fingerprints = array("q")
+        self._levels = array("I")
+        self._actions: dict[str, int] = {}
+        self.initial = 0
+        self.edge_count = 0
+
+    def _node(self, fingerprint: int) -> int:
+        """The id of *fingerprint*, assigning the next one to a new state (linear probing)."""
+        table, fingerprints = self._table, self._fingerprints
+        slot = ((fingerprint * _GOLDEN) & _WORD) >> self._shift
+        while (node := table[slot]) != _EMPTY:
+            if fingerprints[node] == fingerprint:
+                return node
+            slot = (slot + 1) & self._mask
+        node = table[slot] = len(fingerprints)
+        fingerprints.append(fingerprint)
+        self._levels.append(NO_LEVEL)
+        if node >= self._mask >> 1:
+            self._grow()
+        return node
+
+    def _grow(self) -> None:
+        table = array("I", [_EMPTY]) * (2 * len(self._table))
+        mask, shift = len(table) - 1, self._shift - 1
+        for node, fingerprint in enumerate(self._fingerprints):
+            slot = ((fingerprint * _GOLDEN) & _WORD) >> shift
+            while table[slot] != _EMPTY:
+                slot = (slot + 1) & mask
+            table[slot] = node
+        self._table, self._mask, self._shift = table, mask, shift
+
+    def add_node(self, fingerprint: int, *, initial: bool = False) -> None:
+        node = self._node(fingerprint)
+        if initial and self._levels[node] != 0:
+            self._levels[node] = 0
+            self.initial += 1
+
+    def add_edge(self, src: int, dst: int, action: str | None = None) -> None:
+        s, d = self._node(src), self._node(dst)
+        if self._levels[d] == NO_LEVEL and self._levels[s] != NO_LEVEL:
+            self._levels[d] = self._levels[s] + 1
+        action_id = NO_ACTION if action is None else self._actions.setdefault(action, len(self._actions))
+        self._edges.write(EDGE.pack(s, d, action_id))
+        self.edge_count += 1
+
+    def close(self, **meta: Any) -> None:
+        self._edges.close()
+        with nodes_path(self.path).open("wb") as f:
+            for fingerprint, level in zip(self._fingerprints, self._levels, strict=True):
+                f.write(NODE.pack(fingerprint, level))
+        info = {
+            "format": FORMAT_VERSION,
+            "nodes": len(self._fingerprints),
+            "edges": self.edge_count,
+            "initial": self.initial,
+            "actions": list(self._actions),
+            **meta,
+        }
+        meta_path(self.path).write_text(json.dumps(info, indent=2), encoding="utf-8")
+
+
+class GraphReader:
+    """Read-only, memory-mapped access to a binary graph."""
+
+    def __init__(self, path: Path) -> None:
+        if not meta_path(path).is_file():
+            msg = f"Not a state graph written by 'tla tlc --graph': {path}"
+            raise FileNotFoundError(msg)
+        self.path = path
+        self.meta: dict[str, Any] = json.loads(meta_path(path).read_text(encoding="utf-8"))
+        if self.meta.get("format") != FORMAT_VERSION:
+            msg = f"Unsupported graph format in {path}"
+            raise ValueError(msg)
+        self.actions: list[str] = self.meta["actions"]
+        self._files = [path.open("rb"), nodes_path(path).open("rb")]
+        self._edges, self._nodes = (_map(f) for f in self._files)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._nodes) // NODE.size
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges) // EDGE.size
+
+    def edges(self) -> Iterator[tuple[int, int, int]]:
+        """(src id, dst id, action id) for every edge, in dump order."""
+        return EDGE.iter_unpack(self._edges)
+
+    def nodes(self) -> Iterator[tuple[int, int]]:
+        """(fingerprint, level) for every node, by id."""
+        return NODE.iter_unpack(self._nodes)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for m in (self._edges, self._nodes):
+            if isinstance(m, mmap.mmap):
+                m.close()
+        for f in self._files:
+            f.close()
+
+
+def _map(f: BinaryIO) -> mmap.mmap | bytes:
+    """Memory-map a file read-only (empty files cannot be mapped)."""
+    if Path(f.name).stat().st_size == 0:
+        return b""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
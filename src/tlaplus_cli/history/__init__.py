@@ -0,0 +1,25 @@
+from tlaplus_cli.history.store import (
+    CRASH,
+    FAIL,
+    PASS,
+    STOPPED,
+    RunHistory,
+    RunRecord,
+    content_hash,
+    history_path,
+    host_fingerprint,
+    outcome_of,
+)
+
+__all__ = [
+    "CRASH",
+    "FAIL",
+    "PASS",
+    "STOPPED",
+    "RunHistory",
+    "RunRecord",
+    "content_hash",
+    "history_path",
+    "host_fingerprint",
+    "outcome_of",
+]
@@ -0,0 +1,247 @@
+"""Local history of TLC runs in SQLite (``<cache>/history.db``).
+
+Every ``tla tlc`` run adds one row: what was checked (spec and ``.cfg``
+content hashes, toolset version, JVM and TLC options, host), how long it
+took and how far it got. The database runs in WAL mode with a busy timeout,
+and rows are inserted in ``BEGIN IMMEDIATE`` transactions. Batch workers
+can therefore record runs concurrently while ``tla runs`` reads.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+from tlaplus_cli.config.loader import cache_dir
+
+DB_FILE = "history.db"
+SCHEMA_VERSION = 2
+PASS = "pass"
+FAIL = "fail"
+CRASH = "crash"
+STOPPED = "stopped"
+_BUSY_TIMEOUT = 30.0
+_JSON_COLUMNS = ("java_opts", "tlc_args", "host_info")
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    spec TEXT NOT NULL,
+    spec_name TEXT NOT NULL,
+    spec_hash TEXT,
+    cfg_hash TEXT,
+    tools_version TEXT,
+    tools_sha TEXT,
+    java_opts TEXT NOT NULL,
+    tlc_args TEXT NOT NULL,
+    profile TEXT,
+    host TEXT NOT NULL,
+    host_info TEXT NOT NULL,
+    wall_time REAL NOT NULL,
+    states_generated INTEGER,
+    distinct_states INTEGER,
+    depth INTEGER,
+    peak_states_per_sec REAL,
+    peak_rss INTEGER,
+    exit_code INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    error TEXT,
+    run_dir TEXT,
+    cpus TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_spec ON runs (spec_name, started_at);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (started_at);
+CREATE INDEX IF NOT EXISTS runs_by_spec_hash ON runs (spec_hash);
+CREATE INDEX IF NOT EXISTS runs_by_host ON runs (host, started_at);
+"""
+# Schema version -> statements that upgrade the previous version to it.
+_MIGRATIONS = {
+    2: "ALTER TABLE runs ADD COLUMN cpus TEXT;",
+}
+
+
+def history_path() -> Path:
+    return cache_dir() / DB_FILE
+
+
+def content_hash(path: Path) -> str | None:
+    """SHA-256 of *path*, or None if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _total_memory() -> int | None:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _cpu_model() -> str | None:
+    try:
+        with Path("/proc/cpuinfo").open(encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return None
+
+
+def host_fingerprint() -> tuple[str, dict[str, Any]]:
+    """A short id of this machine and the facts it is derived from."""
+    info = {
+        "node": platform.node(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "cpu": _cpu_model(),
+        "cpus": os.cpu_count(),
+        "memory": _total_memory(),
+    }
+    digest = hashlib.sha256(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+    return digest, info
+
+
+def outcome_of(exit_code: int, error: str | None, *, stopped: bool = False) -> str:
+    """``pass``, ``fail`` (TLC reported an error), ``crash`` (it exited without saying why) or
+    ``stopped`` (a run budget stopped it)."""
+    if stopped:
+        return STOPPED
+    if exit_code == 0:
+        return PASS
+    return FAIL if error else CRASH
+
+
+@dataclass
+class RunRecord:
+    spec: str
+    spec_name: str
+    started_at: float
+    wall_time: float
+    exit_code: int
+    outcome: str
+    spec_hash: str | None = None
+    cfg_hash: str | None = None
+    tools_version: str | None = None
+    tools_sha: str | None = None
+    java_opts: list[str] = field(default_factory=list)
+    tlc_args: list[str] = field(default_factory=list)
+    profile: str | None = None
+    host: str = ""
+    host_info: dict[str, Any] = field(default_factory=dict)
+    states_generated: int | None = None
+    distinct_states: int | None = None
+    depth: int | None = None
+    peak_states_per_sec: float | None = None
+    peak_rss: int | None = None
+    error: str | None = None
+    run_dir: str | None = None
+    cpus: str | None = None
+    id: int | None = None
+
+    @property
+    def states_per_sec(self) -> float | None:
+        """Average generation rate over the whole run."""
+        if self.states_generated is None or self.wall_time <= 0:
+            return None
+        return self.states_generated / self.wall_time
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "RunRecord":
+        values = {k: row[k] for k in row.keys()}  # noqa: SIM118
+        for column in _JSON_COLUMNS:
+            values[column] = json.loads(values[column])
+        return cls(**values)
+
+    def to_row(self) -> dict[str, Any]:
+        values = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "id"}
+        for column in _JSON_COLUMNS:
+            values[column] = json.dumps(values[column])
+        return values
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Create or upgrade the schema; the version is read again under the write lock."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+    script = _SCHEMA if version == 0 else "".join(_MIGRATIONS[v] for v in range(version + 1, SCHEMA_VERSION + 1))
+    for statement in filter(str.strip, script.split(";")):
+        conn.execute(statement)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+class RunHistory:
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or history_path()
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT, isolation_level=None)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("BEGIN IMMEDIATE")
+                _migrate(conn)
+                conn.execute("COMMIT")
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            conn.close()
+
+    def add(self, record: RunRecord) -> int:
+        """Insert *record* and return its id.
+
+        Raises:
+            sqlite3.Error: if the database cannot be written.
+        """
+        row = record.to_row()
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{c}" for c in row)
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(f"INSERT INTO runs ({columns}) VALUES ({placeholders})", row)
+            conn.execute("COMMIT")
+        record.id = cursor.lastrowid
+        return record.id or 0
+
+    def get(self, run_id: int) -> RunRecord | None:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return RunRecord.from_row(row) if row is not None else None
+
+    def runs(self, *, spec: str | None = None, outcome: str | None = None, limit: int = 20) -> list[RunRecord]:
+        """The newest runs first, optionally only of the spec (module name) *spec* or with *outcome*."""
+        if not self.path.exists():
+            return []
+        clauses, params = [], []
+        if spec is not None:
+            clauses.append("spec_name = ?")
+            params.append(spec)
+        if outcome is not None:
+            clauses.append("outcome = ?")
+            params.append(outcome)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT * FROM runs {where} ORDER BY started_at DESC, id DESC LIMIT ?"
+        with self._connect() as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+        return [RunRecord.from_row(r) for r in rows]
+
+    def count(self) -> int:
+        if not self.path.exists():
+            return 0
+        with self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
@@ -0,0 +1,16 @@
+from tlaplus_cli.jfr.recording import RECORDING_FILE, FlightRecording, iter_events, jfr_executable, print_events
+from tlaplus_cli.jfr.summary import JDK, TLC, USER, JfrSummary, code_origin, summarize_events
+
+__all__ = [
+    "JDK",
+    "RECORDING_FILE",
+    "TLC",
+    "USER",
+    "FlightRecording",
+    "JfrSummary",
+    "code_origin",
+    "iter_events",
+    "jfr_executable",
+    "print_events",
+    "summarize_events",
+]
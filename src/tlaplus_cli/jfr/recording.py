@@ -0,0 +1,113 @@
+"""Java Flight Recorder setup for TLC runs and streaming of ``jfr print --json``."""
+
+import json
+import os
+import shutil
+import subprocess
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+RECORDING_FILE = "tlc.jfr"
+EVENTS = ("jdk.ExecutionSample", "jdk.JavaMonitorEnter", "jdk.ObjectAllocationSample", "jdk.GarbageCollection")
+_CHUNK = 1 << 16
+
+
+@dataclass
+class FlightRecording:
+    """A flight recording of one TLC run, optionally limited to *duration* seconds."""
+
+    duration: int | None = None
+    path: Path | None = None
+
+    @property
+    def exists(self) -> bool:
+        return self.path is not None and self.path.is_file()
+
+    def java_opts(self, run_dir: Path | str) -> list[str]:
+        """JVM options that record into *run_dir*; also sets ``path``."""
+        self.path = Path(run_dir) / RECORDING_FILE
+        settings = f"filename={self.path},settings=profile,dumponexit=true"
+        if self.duration is not None:
+            settings += f",duration={self.duration}s"
+        return [f"-XX:StartFlightRecording={settings}"]
+
+
+def jfr_executable() -> str:
+    """Locate the ``jfr`` tool: on PATH, else next to the ``java`` executable.
+
+    Raises:
+        FileNotFoundError: if there is no ``jfr`` (it ships with JDK 11 and later).
+    """
+    found = shutil.which("jfr")
+    if found:
+        return found
+    java = shutil.which("java")
+    if java:
+        candidate = Path(os.path.realpath(java)).with_name("jfr")
+        if candidate.is_file():
+            return str(candidate)
+    msg = "'jfr' not found. It ships with JDK 11 and later; put the JDK's bin directory on PATH."
+    raise FileNotFoundError(msg)
+
+
+def iter_events(stream: IO[str]) -> Iterator[dict[str, Any]]:
+    """Yield the objects of the ``events`` array in ``jfr print --json`` output one at a time.
+
+    Only the event being decoded is held in memory, so recordings far larger
+    than RAM as JSON can be summarized.
+
+    Raises:
+        ValueError: if the output ends in the middle of an event.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    while True:
+        start = buf.find('"events"')
+        pos = buf.find("[", start) if start >= 0 else -1
+        if pos >= 0:
+            pos += 1
+            break
+        chunk = stream.read(_CHUNK)
+        if not chunk:
+            return
+        buf = buf[-len('"events"') :] + chunk if start < 0 else buf + chunk
+
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if buf.startswith("]", pos):
+            return
+        try:
+            event, pos = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            chunk = stream.read(_CHUNK)
+            if not chunk:
+                if pos >= len(buf):
+                    return
+                msg = "truncated 'jfr print --json' output"
+                raise ValueError(msg) from None
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        yield event
+
+
+def print_events(recording: Path) -> Iterator[dict[str, Any]]:
+    """Stream the summarized event types of *recording* through ``jfr print --json``.
+
+    Raises:
+        FileNotFoundError: if ``jfr`` or the recording is missing.
+        RuntimeError: if ``jfr`` fails.
+    """
+    if not recording.is_file():
+        msg = f"Flight recording not found: {recording}"
+        raise FileNotFoundError(msg)
+    cmd = [jfr_executable(), "print", "--json", "--events", ",".join(EVENTS), str(recording)]
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
+        if proc.stdout is not None:
+            yield from iter_events(proc.stdout)
+        stderr = proc.stderr.read() if proc.stderr is not None else ""
+    if proc.returncode != 0:
+        msg = f"'jfr print' failed: {stderr.strip() or f'exit code {proc.returncode}'}"
+        raise RuntimeError(msg)
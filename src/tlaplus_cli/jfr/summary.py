@@ -0,0 +1,140 @@
+"""Aggregation of flight-recorder events into a hot-method and contention summary.
+
+Classes are attributed to TLC (the ``tla2tools.jar`` packages), the JDK, or
+user code. User code is everything else on the classpath, i.e. the
+overrides compiled by ``tla modules build`` and their library jars.
+"""
+
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+TLC = "TLC"
+JDK = "JDK"
+USER = "user"
+_TLC_PACKAGES = ("tlc2.", "tla2sany.", "tla2tex.", "pcal.", "util.", "org.lamport.")
+_JDK_PACKAGES = ("java.", "javax.", "jdk.", "sun.", "com.sun.")
+_DURATION_RE = re.compile(r"^PT(?:(-?\d+)H)?(?:(-?\d+)M)?(?:(-?\d+(?:\.\d+)?)S)?$")
+_FRACTION_RE = re.compile(r"(\.\d{6})\d+")
+
+
+def code_origin(class_name: str) -> str:
+    """``TLC``, ``JDK`` or ``user`` for a fully qualified class name."""
+    if class_name.startswith(_TLC_PACKAGES):
+        return TLC
+    if class_name.startswith(_JDK_PACKAGES):
+        return JDK
+    return USER
+
+
+def parse_duration(value: Any) -> float:
+    """Seconds from a JFR timespan: an ISO-8601 duration string or nanoseconds."""
+    if isinstance(value, int | float):
+        return value / 1e9
+    m = _DURATION_RE.match(str(value))
+    if not m:
+        return 0.0
+    hours, minutes, seconds = (float(g) if g else 0.0 for g in m.groups())
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def parse_timestamp(value: Any) -> float | None:
+    """POSIX time from a JFR timestamp (ISO-8601, nanosecond precision is truncated)."""
+    try:
+        return datetime.fromisoformat(_FRACTION_RE.sub(r"\1", str(value)).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _frames(values: dict[str, Any]) -> list[str]:
+    """``Class.method`` for each frame of the event's stack trace, innermost first."""
+    trace = values.get("stackTrace") or {}
+    names = []
+    for frame in trace.get("frames") or ():
+        method = frame.get("method") or {}
+        owner = (method.get("type") or {}).get("name", "?")
+        names.append(f"{owner}.{method.get('name', '?')}")
+    return names
+
+
+def _origin(method: str) -> str:
+    return code_origin(method.rpartition(".")[0])
+
+
+@dataclass
+class JfrSummary:
+    cpu_samples: Counter[str] = field(default_factory=Counter)
+    origin_samples: Counter[str] = field(default_factory=Counter)
+    user_on_stack: int = 0
+    contention_count: Counter[tuple[str, str]] = field(default_factory=Counter)
+    contention_time: defaultdict[tuple[str, str], float] = field(default_factory=lambda: defaultdict(float))
+    allocated_bytes: int = 0
+    gc_count: int = 0
+    gc_pause_total: float = 0.0
+    gc_pause_max: float = 0.0
+    start: float | None = None
+    end: float | None = None
+
+    @property
+    def total_samples(self) -> int:
+        return sum(self.cpu_samples.values())
+
+    @property
+    def span(self) -> float:
+        """Seconds between the first and last event."""
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+    @property
+    def allocation_rate(self) -> float | None:
+        """Sampled allocation in bytes per second, if the recording spans any time."""
+        return self.allocated_bytes / self.span if self.span > 0 else None
+
+    def _timestamp(self, values: dict[str, Any]) -> None:
+        ts = parse_timestamp(values.get("startTime"))
+        if ts is not None:
+            self.start = ts if self.start is None else min(self.start, ts)
+            self.end = ts if self.end is None else max(self.end, ts)
+
+    def add(self, event: dict[str, Any]) -> None:
+        kind = event.get("type")
+        values = event.get("values") or {}
+        self._timestamp(values)
+        if kind == "jdk.ExecutionSample":
+            frames = _frames(values)
+            if frames:
+                self.cpu_samples[frames[0]] += 1
+                self.origin_samples[_origin(frames[0])] += 1
+                if any(_origin(f) == USER for f in frames):
+                    self.user_on_stack += 1
+        elif kind == "jdk.JavaMonitorEnter":
+            monitor = (values.get("monitorClass") or {}).get("name", "?")
+            frames = _frames(values)
+            site = (monitor, frames[0] if frames else "?")
+            self.contention_count[site] += 1
+            self.contention_time[site] += parse_duration(values.get("duration"))
+        elif kind == "jdk.ObjectAllocationSample":
+            self.allocated_bytes += int(values.get("weight") or 0)
+        elif kind == "jdk.GarbageCollection":
+            self.gc_count += 1
+            self.gc_pause_total += parse_duration(values.get("sumOfPauses"))
+            self.gc_pause_max = max(self.gc_pause_max, parse_duration(values.get("longestPause")))
+
+    def user_contention(self) -> list[tuple[str, str]]:
+        """Contention sites in user code or on user-defined monitors."""
+        return [
+            (monitor, method)
+            for monitor, method in self.contention_count
+            if (monitor != "?" and code_origin(monitor) == USER) or (method != "?" and _origin(method) == USER)
+        ]
+
+
+def summarize_events(events: Iterable[dict[str, Any]]) -> JfrSummary:
+    summary = JfrSummary()
+    for event in events:
+        summary.add(event)
+    return summary
@@ -1,3 +1,4 @@
 from tlaplus_cli.project.core import find_project_root
+from tlaplus_cli.project.manifest import MANIFEST_FILE, load_project_manifest, matching_rules
 
-__all__ = ["find_project_root"]
+__all__ = ["MANIFEST_FILE", "find_project_root", "load_project_manifest", "matching_rules"]
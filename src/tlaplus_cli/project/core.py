@@ -2,10 +2,17 @@
 
 from pathlib import Path
 
+from tlaplus_cli.project.manifest import MANIFEST_FILE
+
 
 def _is_project_root(directory: Path, modules_dir: Path | str, classes_dir: Path | str, lib_dir: Path | str) -> bool:
     """Return True if directory contains at least one project structure marker."""
-    return (directory / classes_dir).is_dir() or (directory / modules_dir).is_dir() or (directory / lib_dir).is_dir()
+    return (
+        (directory / classes_dir).is_dir()
+        or (directory / modules_dir).is_dir()
+        or (directory / lib_dir).is_dir()
+        or (directory / MANIFEST_FILE).is_file()
+    )
 
 
 def find_project_root(
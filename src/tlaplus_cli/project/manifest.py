@@ -0,0 +1,53 @@
+"""Project-level tuning manifest (``tla-tuning.yaml`` at the project root)."""
+
+from fnmatch import fnmatch
+from pathlib import Path
+
+import yaml
+from pydantic import ValidationError
+
+from tlaplus_cli.config.schema import ManifestRule, ProjectManifest
+
+MANIFEST_FILE = "tla-tuning.yaml"
+
+
+def load_project_manifest(project_root: Path | None) -> ProjectManifest | None:
+    """Load the manifest from *project_root*, or None if there is none.
+
+    Raises:
+        ValueError: if the manifest is not valid YAML or does not match the schema.
+    """
+    if project_root is None:
+        return None
+    path = project_root / MANIFEST_FILE
+    if not path.is_file():
+        return None
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        return ProjectManifest.model_validate(data)
+    except (yaml.YAMLError, ValidationError) as e:
+        msg = f"Invalid project manifest {path}: {e}"
+        raise ValueError(msg) from None
+
+
+def _glob_match(path: Path, project_root: Path, pattern: str) -> bool:
+    if "/" not in pattern:
+        return fnmatch(path.name, pattern)
+    try:
+        rel = path.resolve().relative_to(project_root.resolve())
+    except ValueError:
+        return False
+    return fnmatch(rel.as_posix(), pattern)
+
+
+def matching_rules(
+    manifest: ProjectManifest, project_root: Path, spec_file: Path, cfg_file: Path | None = None
+) -> list[ManifestRule]:
+    """Rules that apply to *spec_file* run with *cfg_file* (default: the ``.cfg`` next to it), in manifest order."""
+    cfg_file = cfg_file or spec_file.with_suffix(".cfg")
+    return [
+        rule
+        for rule in manifest.specs
+        if _glob_match(spec_file, project_root, rule.spec)
+        and (rule.cfg is None or _glob_match(cfg_file, project_root, rule.cfg))
+    ]
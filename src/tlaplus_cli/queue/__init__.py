@@ -0,0 +1,32 @@
+from tlaplus_cli.queue.daemon import QueueDaemon, daemon_pid, describe_job
+from tlaplus_cli.queue.scheduler import Capacity, Schedule, pick_victims, plan_starts
+from tlaplus_cli.queue.store import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    FINISHED,
+    QUEUED,
+    RUNNING,
+    Job,
+    JobStore,
+    queue_dir,
+)
+
+__all__ = [
+    "CANCELLED",
+    "DONE",
+    "FAILED",
+    "FINISHED",
+    "QUEUED",
+    "RUNNING",
+    "Capacity",
+    "Job",
+    "JobStore",
+    "QueueDaemon",
+    "Schedule",
+    "daemon_pid",
+    "describe_job",
+    "pick_victims",
+    "plan_starts",
+    "queue_dir",
+]
@@ -0,0 +1,208 @@
+"""The queue daemon: start queued jobs as workers, cancel and preempt them.
+
+Each job runs in its own worker process (``python -m
+tlaplus_cli.queue.worker``) in a new session, so cancelling a job can signal
+the worker and its TLC JVM together. Workers record their own result in the
+job store; the daemon only starts them, reaps them and notices workers
+that died without a result. Workers keep running if the daemon stops, and
+a restarted daemon adopts them by pid. One daemon runs per queue directory
+(an ``flock`` on ``daemon.lock``), so the daemon needs a Unix system.
+
+With CPU pinning, cores held by other ``tla tlc --cpus`` runs (see
+``tlaplus_cli.tlc.affinity``) are not handed out to queued jobs.
+"""
+
+import contextlib
+import os
+import signal
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+
+from tlaplus_cli.queue.scheduler import Capacity, pick_victims, plan_starts
+from tlaplus_cli.queue.store import QUEUED, RUNNING, Job, JobStore
+from tlaplus_cli.tlc.affinity import CpuLeases, pid_alive
+from tlaplus_cli.tlc.rundir import ACTIVE_MARKER
+from tlaplus_cli.ui import info, warn
+from tlaplus_cli.units import format_size
+
+LOCK_FILE = "daemon.lock"
+
+
+def daemon_pid(store: JobStore) -> int | None:
+    """The pid of the daemon serving *store*, or None if none is running."""
+    try:
+        pid = int((store.directory / LOCK_FILE).read_text().strip())
+    except (OSError, ValueError):
+        return None
+    return pid if pid_alive(pid) else None
+
+
+def describe_job(job: Job) -> str:
+    memory = f", {format_size(job.memory)}" if job.memory else ""
+    cores = f"{job.cores} core{'s' if job.cores != 1 else ''}"
+    return f"job {job.id} ({job.spec_name}, {job.user}, priority {job.priority}, {cores}{memory})"
+
+
+class QueueDaemon:
+    def __init__(  # noqa: PLR0913
+        self,
+        store: JobStore,
+        capacity: Capacity,
+        *,
+        pin_cpus: bool = True,
+        preempt_after: float | None = None,
+        poll: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.store = store
+        self.capacity = capacity
+        self.pin_cpus = pin_cpus
+        self.preempt_after = preempt_after
+        self.poll = poll
+        self.clock = clock
+        self._children: dict[int, subprocess.Popen[bytes]] = {}
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the daemon lock of the queue directory.
+
+        Raises:
+            RuntimeError: if another daemon serves this queue, or ``flock`` is unavailable.
+        """
+        try:
+            import fcntl  # noqa: PLC0415
+        except ImportError:
+            msg = "the queue daemon is not supported on this platform (it needs fcntl)"
+            raise RuntimeError(msg) from None
+        self.store.directory.mkdir(parents=True, exist_ok=True)
+        with (self.store.directory / LOCK_FILE).open("a+") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                msg = f"another queue daemon is running (pid {daemon_pid(self.store)})"
+                raise RuntimeError(msg) from None
+            f.truncate(0)
+            f.write(str(os.getpid()))
+            f.flush()
+            try:
+                yield
+            finally:
+                f.truncate(0)
+
+    def serve(self) -> None:
+        """Schedule until interrupted; running jobs are left to finish on their own."""
+        while True:
+            self.step()
+            time.sleep(self.poll)
+
+    def step(self) -> None:
+        """One scheduling pass: settle finished workers, start what fits, preempt if needed."""
+        self._reap()
+        running = [j for j in self.store.jobs(states=[RUNNING]) if self._settle(j)]
+        queued = []
+        for job in self.store.jobs(states=[QUEUED]):
+            if self.capacity.fits(job):
+                queued.append(job)
+            else:
+                self.store.fail(job.id or 0, f"needs more than the queue's {self._describe_capacity()}")
+                warn(f"Rejected {describe_job(job)}: it can never fit the queue")
+        capacity = self._capacity(running)
+        self._hold_checkpoints(queued)
+        schedule = plan_starts(queued, running, capacity)
+        for job in schedule.start:
+            self._start(job)
+        if schedule.blocked is not None and self.preempt_after is not None:
+            running = self.store.jobs(states=[RUNNING])
+            now = self.clock()
+            for victim in pick_victims(schedule.blocked, running, capacity, now=now, preempt_after=self.preempt_after):
+                self._preempt(victim, schedule.blocked)
+
+    def _describe_capacity(self) -> str:
+        memory = f" and {format_size(self.capacity.memory)}" if self.capacity.memory is not None else ""
+        return f"{self.capacity.cores} cores{memory}"
+
+    def _reap(self) -> None:
+        for job_id, proc in list(self._children.items()):
+            if proc.poll() is not None:
+                del self._children[job_id]
+
+    def _settle(self, job: Job) -> bool:
+        """Handle cancel requests and dead workers; True if the job is still running."""
+        job_id = job.id or 0
+        alive = job.worker_pid is not None and (job_id in self._children or pid_alive(job.worker_pid))
+        if alive and job.cancel_requested:
+            with contextlib.suppress(OSError):
+                os.killpg(job.worker_pid or 0, signal.SIGTERM)
+            return True
+        if alive:
+            return True
+        latest = self.store.get(job_id)
+        if latest is None or latest.state != RUNNING:
+            return False  # The worker recorded its result.
+        if latest.cancel_requested:
+            self.store.mark_cancelled(job_id)
+            info(f"Cancelled {describe_job(job)}")
+        elif latest.worker_pid is None:
+            # Claimed by a daemon that stopped before starting the worker.
+            self.store.requeue(job_id, recover=latest.recover, preempted=False)
+        else:
+            self.store.fail(job_id, "the worker exited without recording a result")
+            warn(f"The worker of {describe_job(job)} died; see 'tla queue logs {job_id}'")
+        return False
+
+    def _capacity(self, running: Sequence[Job]) -> Capacity:
+        """The configured capacity, less any CPUs leased by processes outside the queue."""
+        if not self.pin_cpus:
+            return self.capacity
+        leases = CpuLeases()
+        workers = {j.worker_pid for j in running}
+        foreign = sum(1 for cpu in leases.cpus if (owner := leases.owner(cpu)) is not None and owner not in workers)
+        return Capacity(min(self.capacity.cores, len(leases.cpus) - foreign), self.capacity.memory)
+
+    def _hold_checkpoints(self, queued: Sequence[Job]) -> None:
+        """Keep ``prune_run_dirs`` away from the checkpoints that preempted jobs will resume from."""
+        pid = str(os.getpid())
+        for job in queued:
+            if job.recover is None:
+                continue
+            marker = Path(job.recover) / ACTIVE_MARKER
+            with contextlib.suppress(OSError):
+                if marker.parent.is_dir() and (not marker.exists() or marker.read_text().strip() != pid):
+                    marker.write_text(pid)
+
+    def _start(self, job: Job) -> None:
+        job_id = job.id or 0
+        if not self.store.claim(job_id):
+            return
+        log = self.store.log_path(job_id)
+        log.parent.mkdir(parents=True, exist_ok=True)
+        cmd = [sys.executable, "-m", "tlaplus_cli.queue.worker", str(self.store.directory), str(job_id)]
+        try:
+            with log.open("ab") as out:
+                proc = subprocess.Popen(
+                    cmd,
+                    cwd=job.cwd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=out,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                )
+        except OSError as e:
+            self.store.fail(job_id, f"cannot start the worker: {e}")
+            warn(f"Failed to start {describe_job(job)}: {e}")
+            return
+        self._children[job_id] = proc
+        self.store.set_worker(job_id, proc.pid)
+        resume = f", resuming from {job.recover}" if job.recover else ""
+        info(f"Started {describe_job(job)}{resume}")
+
+    def _preempt(self, victim: Job, blocked: Job) -> None:
+        job_id = victim.id or 0
+        stop = self.store.stop_path(job_id)
+        stop.parent.mkdir(parents=True, exist_ok=True)
+        stop.write_text(f"preempted by job {blocked.id} (priority {blocked.priority})\n", encoding="utf-8")
+        self.store.request_stop(job_id)
+        info(f"Preempting {describe_job(victim)} for job {blocked.id}; it stops after its next checkpoint")
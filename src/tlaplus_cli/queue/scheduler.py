@@ -0,0 +1,116 @@
+"""Scheduling decisions for the job queue (pure functions; the daemon acts on them).
+
+Jobs declare the cores and memory they need and are packed into the
+queue's capacity. Priority is strict: the highest-priority queued job that
+does not fit blocks every job of lower priority, while jobs of the same
+priority are packed around it. Within a priority, jobs are taken in
+fair-share order: the next job comes from the user with the fewest cores
+in use (counting the jobs started in the same pass), oldest job first.
+
+With preemption enabled, a blocked job may evict running jobs of lower
+priority that have run for at least ``preempt_after`` seconds. Victims are
+asked to stop after their next checkpoint and are requeued to resume from
+it, so the preemption costs at most one checkpoint interval of work.
+"""
+
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from tlaplus_cli.queue.store import Job
+
+
+@dataclass(frozen=True)
+class Capacity:
+    """Resources the queue may hand out; ``memory`` None means memory is not limited."""
+
+    cores: int
+    memory: int | None = None
+
+    def fits(self, job: Job) -> bool:
+        """True if *job* could ever run (with the queue empty)."""
+        return _Free(self.cores, self.memory).fits(job)
+
+
+@dataclass
+class Schedule:
+    start: list[Job] = field(default_factory=list)
+    blocked: Job | None = None
+
+
+@dataclass
+class _Free:
+    cores: int
+    memory: int | None
+
+    def fits(self, job: Job) -> bool:
+        return job.cores <= self.cores and (self.memory is None or (job.memory or 0) <= self.memory)
+
+    def take(self, job: Job, sign: int = 1) -> None:
+        self.cores -= sign * job.cores
+        if self.memory is not None:
+            self.memory -= sign * (job.memory or 0)
+
+
+def _free(capacity: Capacity, running: Sequence[Job]) -> _Free:
+    free = _Free(capacity.cores, capacity.memory)
+    for job in running:
+        free.take(job)
+    return free
+
+
+def plan_starts(queued: Sequence[Job], running: Sequence[Job], capacity: Capacity) -> Schedule:
+    """The queued jobs to start now, in order, and the first job that had to wait (if any).
+
+    *capacity* is what is available to the queue right now; jobs that could
+    never fit the queue must be filtered out beforehand (the daemon fails them).
+    """
+    free = _free(capacity, running)
+    usage: Counter[str] = Counter()
+    for job in running:
+        usage[job.user] += job.cores
+    pending = list(queued)
+    schedule = Schedule()
+    while pending:
+        top = max(j.priority for j in pending)
+        tier = [j for j in pending if j.priority == top]
+        job = min(tier, key=lambda j: (usage[j.user], j.submitted_at, j.id or 0))
+        pending.remove(job)
+        if free.fits(job):
+            schedule.start.append(job)
+            free.take(job)
+            usage[job.user] += job.cores
+        elif schedule.blocked is None:
+            schedule.blocked = job
+            # Strict priority: nothing of lower priority may overtake the blocked job.
+            pending = [j for j in pending if j.priority >= top]
+    return schedule
+
+
+def pick_victims(
+    blocked: Job, running: Sequence[Job], capacity: Capacity, *, now: float, preempt_after: float
+) -> list[Job]:
+    """Running jobs to preempt so that *blocked* fits; empty if preemption would not help.
+
+    Jobs that are already stopping count as freed. Victims are taken lowest
+    priority first and, within a priority, largest first (fewest preemptions).
+    """
+    free = _free(capacity, [j for j in running if j.stop_requested is None])
+    if free.fits(blocked):
+        return []
+    candidates = [
+        j
+        for j in running
+        if j.stop_requested is None
+        and j.priority < blocked.priority
+        and j.started_at is not None
+        and now - j.started_at >= preempt_after
+    ]
+    candidates.sort(key=lambda j: (j.priority, -j.cores, -(j.memory or 0), -(j.started_at or 0)))
+    victims = []
+    for job in candidates:
+        victims.append(job)
+        free.take(job, -1)
+        if free.fits(blocked):
+            return victims
+    return []
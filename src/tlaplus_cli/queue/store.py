@@ -0,0 +1,258 @@
+"""Persistent job queue in SQLite (``<cache>/queue/jobs.db``).
+
+One row per submitted job: what to run (spec, ``.cfg``, profile), what it
+needs (cores, memory), its priority and owner, and where it is in its life
+cycle. ``queued`` jobs are started by the daemon (``running``) and end as
+``done``, ``failed`` or ``cancelled``; a preempted job goes back to
+``queued`` with the checkpoint it can resume from. Like the run history, the
+database runs in WAL mode and every write is a ``BEGIN IMMEDIATE``
+transaction, so the CLI, the daemon and its workers can update it
+concurrently. State changes are conditional on the current state, so a
+cancel racing with a start never loses either.
+"""
+
+import contextlib
+import sqlite3
+import time
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+
+from tlaplus_cli.config.loader import cache_dir
+
+DB_FILE = "jobs.db"
+SCHEMA_VERSION = 1
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = frozenset({DONE, FAILED, CANCELLED})
+_BUSY_TIMEOUT = 30.0
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    spec TEXT NOT NULL,
+    cwd TEXT NOT NULL,
+    user TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    priority INTEGER NOT NULL,
+    cores INTEGER NOT NULL,
+    memory INTEGER,
+    profile TEXT,
+    cfg TEXT,
+    checkpoint INTEGER,
+    state TEXT NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    exit_code INTEGER,
+    error TEXT,
+    worker_pid INTEGER,
+    run_dir TEXT,
+    recover TEXT,
+    preemptions INTEGER NOT NULL,
+    stop_requested REAL,
+    cancel_requested INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_state ON jobs (state, priority);
+"""
+
+
+def queue_dir() -> Path:
+    return cache_dir() / "queue"
+
+
+@dataclass
+class Job:
+    spec: str
+    cwd: str
+    user: str
+    submitted_at: float
+    priority: int = 0
+    cores: int = 1
+    memory: int | None = None
+    profile: str | None = None
+    cfg: str | None = None
+    checkpoint: int | None = None
+    state: str = QUEUED
+    started_at: float | None = None
+    finished_at: float | None = None
+    exit_code: int | None = None
+    error: str | None = None
+    worker_pid: int | None = None
+    run_dir: str | None = None
+    recover: str | None = None
+    preemptions: int = 0
+    stop_requested: float | None = None
+    cancel_requested: bool = False
+    id: int | None = None
+
+    @property
+    def spec_name(self) -> str:
+        return Path(self.spec).stem
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Job":
+        values = {k: row[k] for k in row.keys()}  # noqa: SIM118
+        values["cancel_requested"] = bool(values["cancel_requested"])
+        return cls(**values)
+
+    def to_row(self) -> dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "id"}
+
+
+class JobStore:
+    """The queue database and the per-job files (logs, stop requests) next to it."""
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = directory or queue_dir()
+        self.path = self.directory / DB_FILE
+
+    def log_path(self, job_id: int) -> Path:
+        """The job's output: TLC's and the worker's, appended across preemptions."""
+        return self.directory / "logs" / f"job-{job_id}.log"
+
+    def stop_path(self, job_id: int) -> Path:
+        """The file that asks the job's run to stop after its next checkpoint (see ``Budget.stop_file``)."""
+        return self.directory / "stop" / f"job-{job_id}"
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT, isolation_level=None)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("BEGIN IMMEDIATE")
+                for statement in filter(str.strip, _SCHEMA.split(";")):
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                conn.execute("COMMIT")
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            conn.close()
+
+    def _update(self, job_id: int, states: Collection[str], **values: Any) -> bool:
+        """Set *values* on the job if it is in one of *states*; returns whether it was."""
+        assignments = ", ".join(f"{k} = :{k}" for k in values)
+        marks = ", ".join(f":state{i}" for i in range(len(states)))
+        params = {**values, "id": job_id, **{f"state{i}": s for i, s in enumerate(states)}}
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(f"UPDATE jobs SET {assignments} WHERE id = :id AND state IN ({marks})", params)
+            conn.execute("COMMIT")
+        return cursor.rowcount > 0
+
+    def submit(self, job: Job) -> int:
+        """Add *job* to the queue and return its id."""
+        row = job.to_row()
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{c}" for c in row)
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(f"INSERT INTO jobs ({columns}) VALUES ({placeholders})", row)
+            conn.execute("COMMIT")
+        job.id = cursor.lastrowid
+        return job.id or 0
+
+    def get(self, job_id: int) -> Job | None:
+        if not self.path.exists():
+            return None
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.from_row(row) if row is not None else None
+
+    def jobs(self, *, states: Collection[str] | None = None, user: str | None = None) -> list[Job]:
+        """Jobs in submission order, optionally only those in *states* or of *user*."""
+        if not self.path.exists():
+            return []
+        clauses: list[str] = []
+        params: list[Any] = []
+        if states is not None:
+            clauses.append(f"state IN ({', '.join('?' for _ in states)})")
+            params.extend(states)
+        if user is not None:
+            clauses.append("user = ?")
+            params.append(user)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT * FROM jobs {where} ORDER BY id", params).fetchall()
+        return [Job.from_row(r) for r in rows]
+
+    def claim(self, job_id: int) -> bool:
+        """Mark a queued job as running; False if it is no longer queued (e.g. cancelled)."""
+        return self._update(
+            job_id, [QUEUED], state=RUNNING, started_at=time.time(), worker_pid=None, stop_requested=None
+        )
+
+    def set_worker(self, job_id: int, pid: int) -> None:
+        self._update(job_id, [RUNNING], worker_pid=pid)
+
+    def set_run_dir(self, job_id: int, run_dir: Path) -> None:
+        self._update(job_id, [RUNNING], run_dir=str(run_dir))
+
+    def finish(self, job_id: int, exit_code: int, error: str | None = None) -> None:
+        """Record a run that ended: ``done`` for exit code 0, else ``failed``."""
+        self._update(
+            job_id,
+            [RUNNING],
+            state=DONE if exit_code == 0 else FAILED,
+            exit_code=exit_code,
+            error=error,
+            finished_at=time.time(),
+        )
+
+    def fail(self, job_id: int, error: str) -> None:
+        self._update(job_id, [QUEUED, RUNNING], state=FAILED, error=error, finished_at=time.time())
+
+    def requeue(self, job_id: int, *, recover: str | None, preempted: bool = True) -> None:
+        """Put a running job back in the queue, to resume from the checkpoint in *recover* if given."""
+        job = self.get(job_id)
+        if job is None:
+            return
+        self._update(
+            job_id,
+            [RUNNING],
+            state=QUEUED,
+            started_at=None,
+            worker_pid=None,
+            stop_requested=None,
+            recover=recover,
+            preemptions=job.preemptions + int(preempted),
+        )
+
+    def request_stop(self, job_id: int) -> None:
+        """Note that the job was asked to stop; the daemon writes its ``stop_path``."""
+        self._update(job_id, [RUNNING], stop_requested=time.time())
+
+    def cancel(self, job_id: int) -> Job:
+        """Cancel a queued job, or ask the daemon to stop a running one. Returns the job as updated.
+
+        Raises:
+            KeyError: if there is no such job.
+            ValueError: if the job has already finished.
+        """
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        if self._update(job_id, [QUEUED], state=CANCELLED, finished_at=time.time()):
+            job.state = CANCELLED
+        elif self._update(job_id, [RUNNING], cancel_requested=1):
+            job.state, job.cancel_requested = RUNNING, True
+        else:
+            job = self.get(job_id) or job
+            msg = f"job {job_id} has already finished ({job.state})"
+            raise ValueError(msg)
+        return job
+
+    def mark_cancelled(self, job_id: int) -> None:
+        self._update(job_id, [RUNNING], state=CANCELLED, finished_at=time.time())
@@ -0,0 +1,99 @@
+"""Run one queued job: ``python -m tlaplus_cli.queue.worker QUEUE_DIR JOB_ID``.
+
+Started by the queue daemon with its output going to the job's log. The job
+runs through ``run_tlc`` like ``tla tlc`` would: on the job's cores (pinned
+with ``queue.pin_cpus``), with the job's stop file as a run budget so the
+daemon can preempt it, and resuming from a checkpoint if it was preempted
+before. The worker records the result in the job store itself.
+"""
+
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+import typer
+
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.queue.store import Job, JobStore
+from tlaplus_cli.tlc.affinity import Isolation
+from tlaplus_cli.tlc.budget import BUDGET_EXIT_CODE, Budget
+from tlaplus_cli.tlc.rundir import finalize_run_dir
+from tlaplus_cli.tlc.runner import run_tlc
+from tlaplus_cli.ui import info
+
+_CHECKPOINT_SUFFIX = ".chkpt"
+
+
+def latest_checkpoint(run_dirs: Sequence[str | Path | None]) -> str | None:
+    """The run directory holding the newest TLC checkpoint, if any does."""
+    newest: tuple[float, str] | None = None
+    for run_dir in [d for d in run_dirs if d]:
+        for path in Path(run_dir).rglob(f"*{_CHECKPOINT_SUFFIX}"):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if newest is None or mtime > newest[0]:
+                newest = (mtime, str(run_dir))
+    return newest[1] if newest is not None else None
+
+
+def run_job(store: JobStore, job: Job, *, pin_cpus: bool = True) -> int:
+    """Run *job* and record its result; returns TLC's exit code."""
+    job_id = job.id or 0
+    stop_file = store.stop_path(job_id)
+    stop_file.unlink(missing_ok=True)
+    tlc_args = ["-config", job.cfg] if job.cfg else []
+    if job.recover:
+        tlc_args.extend(["-recover", job.recover])
+        info(f"Resuming job {job_id} from the checkpoint in {job.recover}")
+    if not pin_cpus:
+        tlc_args.extend(["-workers", str(job.cores)])
+    run_dirs: list[Path] = []
+
+    def on_run_dir(run_dir: Path) -> None:
+        run_dirs.append(run_dir)
+        store.set_run_dir(job_id, run_dir)
+
+    try:
+        exit_code = run_tlc(
+            job.spec,
+            profile=job.profile,
+            checkpoint=job.checkpoint,
+            budget=Budget(stop_file=stop_file),
+            isolation=Isolation(cpus=job.cores) if pin_cpus else None,
+            tlc_args=tlc_args,
+            on_run_dir=on_run_dir,
+        )
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        store.fail(job_id, str(e))
+        return 1
+    finally:
+        stop_file.unlink(missing_ok=True)
+
+    if exit_code == BUDGET_EXIT_CODE:
+        recover = latest_checkpoint([*run_dirs, job.recover])
+        store.requeue(job_id, recover=recover)
+        info(f"Job {job_id} was preempted and is queued again" + (f" (checkpoint: {recover})" if recover else ""))
+    else:
+        recover = None
+        store.finish(job_id, exit_code)
+    if job.recover and job.recover != recover:
+        # The checkpoint is no longer needed: hand its directory back to the retention policy.
+        finalize_run_dir(Path(job.recover), success=False)
+    return exit_code
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    directory, job_id = argv if argv is not None else sys.argv[1:]
+    store = JobStore(Path(directory))
+    job = store.get(int(job_id))
+    if job is None:
+        typer.echo(f"Error: no job {job_id} in {directory}", err=True)
+        return 1
+    return run_job(store, job, pin_cpus=load_config().queue.pin_cpus)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
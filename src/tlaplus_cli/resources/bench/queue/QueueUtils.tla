@@ -0,0 +1,5 @@
+---- MODULE QueueUtils ----
+(* Defines the operator interface. *)
+(* TLC will ignore this definition and use the Java override instead. *)
+LogState(buffer, wait_set) == TRUE 
+===========================
@@ -0,0 +1,30 @@
+from tlaplus_cli.sany.batch import parse_specs, workspace_specs
+from tlaplus_cli.sany.cache import ParseCache, file_digest
+from tlaplus_cli.sany.driver import (
+    CACHED,
+    FAILED,
+    OK,
+    ParseError,
+    ParseResult,
+    locate_error,
+    parse_driver_output,
+    run_sany,
+)
+from tlaplus_cli.sany.modules import module_references, spec_dependencies
+
+__all__ = [
+    "CACHED",
+    "FAILED",
+    "OK",
+    "ParseCache",
+    "ParseError",
+    "ParseResult",
+    "file_digest",
+    "locate_error",
+    "module_references",
+    "parse_driver_output",
+    "parse_specs",
+    "run_sany",
+    "spec_dependencies",
+    "workspace_specs",
+]
@@ -0,0 +1,67 @@
+"""Cache of successful SANY parses, keyed by content.
+
+A spec's key hashes the toolset jar and the name and content of every
+module in its dependency closure (see ``spec_dependencies``). A stamp
+file named after the key records that this exact input parsed cleanly,
+so an unchanged spec costs one ``stat`` and the hashing of its sources.
+Failed parses are never cached.
+"""
+
+import hashlib
+from collections.abc import Sequence
+from pathlib import Path
+
+from tlaplus_cli.config.loader import cache_dir
+
+_CHUNK = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = directory or cache_dir() / "parse"
+        self._digests: dict[Path, str] = {}
+
+    def _digest(self, path: Path) -> str:
+        """Digest of *path*, computed once per cache instance (modules are shared between specs)."""
+        if path not in self._digests:
+            self._digests[path] = file_digest(path)
+        return self._digests[path]
+
+    def key(self, jar_digest: str, modules: Sequence[Path]) -> str:
+        """Cache key of a spec whose dependency closure is *modules* (the spec first).
+
+        Raises:
+            OSError: if a module cannot be read.
+        """
+        h = hashlib.sha256(jar_digest.encode())
+        h.update(modules[0].name.encode())
+        for module in sorted(modules, key=lambda p: p.name):
+            h.update(b"\0" + module.name.encode() + b"\0" + self._digest(module).encode())
+        return h.hexdigest()
+
+    def _stamp(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def hit(self, key: str) -> bool:
+        return self._stamp(key).is_file()
+
+    def store(self, key: str) -> None:
+        stamp = self._stamp(key)
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+
+    def clear(self) -> int:
+        """Remove every stamp. Returns how many were removed."""
+        removed = 0
+        for stamp in self.directory.glob("*/*"):
+            stamp.unlink(missing_ok=True)
+            removed += 1
+        return removed
@@ -0,0 +1,189 @@
+"""Running SANY over many specs in one JVM.
+
+A small Java driver (compiled once per classpath, see ``java_helper``) calls
+``SANY.frontEndMain`` for each file on its command line and reports the
+errors SANY collected, one protocol line each::
+
+    BEGIN\t<file>
+    ERROR\t<phase>\t<message>
+    LOG\t<SANY's own output>
+    OK\t<file>        (or FAIL\t<file>)
+
+Messages have backslashes and newlines escaped as ``\\\\`` and ``\\n``.
+"""
+
+import os
+import re
+import subprocess
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from tlaplus_cli.tlc.compile_server import java_helper
+
+DRIVER_CLASS = "TlaParse"
+DRIVER_SOURCE = """\
+import java.io.*;
+import tla2sany.drivers.SANY;
+import tla2sany.modanalyzer.SpecObj;
+import tla2sany.semantic.Errors;
+import util.SimpleFilenameToStream;
+
+public final class TlaParse {
+    public static void main(String[] args) throws IOException {
+        PrintStream out = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+        for (String file : args) {
+            out.println("BEGIN\\t" + file);
+            ByteArrayOutputStream log = new ByteArrayOutputStream();
+            SpecObj spec = new SpecObj(file, new SimpleFilenameToStream());
+            boolean ok;
+            try {
+                SANY.frontEndMain(spec, file, new PrintStream(log, true, "UTF-8"));
+                ok = spec.getErrorLevel() == 0;
+            } catch (Exception e) {
+                ok = false;
+                out.println("ERROR\\tfrontend\\t" + escape(String.valueOf(e)));
+            }
+            report(out, "init", spec.initErrors);
+            report(out, "parse", spec.parseErrors);
+            report(out, "context", spec.globalContextErrors);
+            report(out, "semantic", spec.semanticErrors);
+            out.println("LOG\\t" + escape(log.toString("UTF-8")));
+            out.println((ok ? "OK\\t" : "FAIL\\t") + file);
+        }
+    }
+
+    private static void report(PrintStream out, String phase, Errors errors) {
+        if (errors == null) {
+            return;
+        }
+        for (String message : errors.getErrors()) {
+            out.println("ERROR\\t" + phase + "\\t" + escape(message));
+        }
+    }
+
+    private static String escape(String s) {
+        return s.replace("\\\\", "\\\\\\\\").replace("\\n", "\\\\n").replace("\\r", "");
+    }
+}
+"""
+_ESCAPE_RE = re.compile(r"\\(.)")
+_RANGE_RE = re.compile(r"line (\d+), col (\d+) to line (\d+), col (\d+) of module (\w+)")
+_POINT_RE = re.compile(r"at line (\d+), column (\d+)")
+_MODULE_RE = re.compile(r"module (\w+)")
+
+OK = "ok"
+CACHED = "cached"
+FAILED = "error"
+
+
+def _unescape(text: str) -> str:
+    return _ESCAPE_RE.sub(lambda m: "\n" if m[1] == "n" else m[1], text)
+
+
+@dataclass
+class ParseError:
+    phase: str
+    message: str
+    module: str | None = None
+    line: int | None = None
+    column: int | None = None
+    end_line: int | None = None
+    end_column: int | None = None
+
+    def __str__(self) -> str:
+        where = self.module or "?"
+        if self.line is not None:
+            where += f":{self.line}:{self.column}"
+        first = self.message.strip().splitlines()[0] if self.message.strip() else self.phase
+        return f"{where}: {self.phase} error: {first}"
+
+
+@dataclass
+class ParseResult:
+    spec: Path
+    status: str
+    errors: list[ParseError] = field(default_factory=list)
+    log: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status != FAILED
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "spec": str(self.spec),
+            "status": self.status,
+            "errors": [asdict(e) for e in self.errors],
+            **({"log": self.log} if self.status == FAILED else {}),
+        }
+
+
+def locate_error(phase: str, message: str, log: str = "") -> ParseError:
+    """A ``ParseError`` with the source range SANY mentions in *message* (or a parse position in *log*)."""
+    error = ParseError(phase, message)
+    m = _RANGE_RE.search(message)
+    if m:
+        error.line, error.column, error.end_line, error.end_column = (int(g) for g in m.groups()[:4])
+        error.module = m.group(5)
+        return error
+    m = _MODULE_RE.search(message)
+    if m:
+        error.module = m.group(1)
+    m = _POINT_RE.search(message) or (_POINT_RE.search(log) if phase == "parse" else None)
+    if m:
+        error.line, error.column = int(m.group(1)), int(m.group(2))
+    return error
+
+
+def parse_driver_output(text: str) -> dict[str, ParseResult]:
+    """Results by file name from the driver's protocol output."""
+    results: dict[str, ParseResult] = {}
+    current: ParseResult | None = None
+    pending: list[tuple[str, str]] = []
+    for line in text.splitlines():
+        tag, _, rest = line.partition("\t")
+        if tag == "BEGIN":
+            current = results[rest] = ParseResult(Path(rest), FAILED)
+            pending = []
+        elif current is None:
+            continue
+        elif tag == "ERROR":
+            phase, _, message = rest.partition("\t")
+            pending.append((phase, _unescape(message)))
+        elif tag == "LOG":
+            current.log = _unescape(rest)
+        elif tag in {"OK", "FAIL"}:
+            current.status = OK if tag == "OK" else FAILED
+            current.errors = [locate_error(phase, message, current.log) for phase, message in pending]
+            current = None
+    return results
+
+
+def run_sany(files: Sequence[Path], classpath: Sequence[str], java_opts: Sequence[str] = ()) -> list[ParseResult]:
+    """Parse and semantically check *files* in a single JVM.
+
+    Raises:
+        FileNotFoundError: if ``java`` or ``javac`` is missing.
+        RuntimeError: if the driver does not compile or the JVM fails before reporting.
+    """
+    driver = java_helper(DRIVER_CLASS, DRIVER_SOURCE, classpath)
+    cmd = [
+        "java",
+        *java_opts,
+        "-cp",
+        os.pathsep.join([*classpath, str(driver)]),
+        DRIVER_CLASS,
+        *(str(f) for f in files),
+    ]
+    try:
+        completed = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except FileNotFoundError as err:
+        msg = "'java' not found. Please install Java."
+        raise FileNotFoundError(msg) from err
+    by_name = parse_driver_output(completed.stdout)
+    if not by_name and files:
+        msg = f"SANY failed to start:\n{(completed.stderr or completed.stdout).strip()}"
+        raise RuntimeError(msg)
+    return [by_name.get(str(f)) or ParseResult(f, FAILED, log=completed.stderr) for f in files]
@@ -0,0 +1,40 @@
+"""Module references between TLA+ sources, found without running SANY."""
+
+import re
+from collections.abc import Sequence
+from pathlib import Path
+
+_COMMENT_RE = re.compile(r"\(\*.*?\*\)|\\\*[^\n]*", re.DOTALL)
+_EXTENDS_RE = re.compile(r"\bEXTENDS\s+(\w+(?:\s*,\s*\w+)*)")
+_INSTANCE_RE = re.compile(r"\bINSTANCE\s+(\w+)")
+
+
+def module_references(text: str) -> list[str]:
+    """Names of the modules a TLA+ source extends or instantiates."""
+    text = _COMMENT_RE.sub(" ", text)
+    names = [n.strip() for m in _EXTENDS_RE.finditer(text) for n in m.group(1).split(",")]
+    names.extend(m.group(1) for m in _INSTANCE_RE.finditer(text))
+    return list(dict.fromkeys(names))
+
+
+def spec_dependencies(spec_file: Path, search_dirs: Sequence[Path]) -> list[Path]:
+    """*spec_file* and the transitive closure of the modules it references that exist in *search_dirs*.
+
+    Standard modules (``Naturals``, ``TLC``, ...) are not found on disk and
+    are skipped.
+    """
+    found = [spec_file]
+    queue = [spec_file]
+    while queue:
+        try:
+            text = queue.pop().read_text(errors="replace")
+        except OSError:
+            continue
+        for name in module_references(text):
+            for d in search_dirs:
+                candidate = d / f"{name}.tla"
+                if candidate.is_file() and candidate not in found:
+                    found.append(candidate)
+                    queue.append(candidate)
+                    break
+    return found
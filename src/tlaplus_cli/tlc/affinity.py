@@ -0,0 +1,299 @@
+"""CPU pinning and resource limits for concurrent TLC runs.
+
+Several TLC JVMs on one host otherwise spread their workers over every core
+and evict each other's caches. An ``Isolation`` gives a run a disjoint set of
+CPUs: the CPUs are leased in ``cache_dir()/cpu-leases`` (one file per CPU,
+created exclusively and holding the owner's pid), so concurrent ``tla``
+processes never pick the same ones. The TLC child process is pinned with
+``os.sched_setaffinity`` before ``exec``, TLC gets ``-workers`` and the JVM
+``-XX:ActiveProcessorCount`` to match, and ``RLIMIT_AS``/``RLIMIT_NOFILE``
+are applied if requested. ``wait_with_rusage`` reaps a child and reports
+its own peak RSS.
+
+Automatic assignments prefer CPUs of a single NUMA node (the fullest node
+that still fits), so a run's workers share a memory controller.
+"""
+
+import contextlib
+import os
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from tlaplus_cli.config.loader import cache_dir
+from tlaplus_cli.units import format_size
+
+if TYPE_CHECKING:
+    import subprocess
+
+_NODES_DIR = Path("/sys/devices/system/node")
+_LEASE_DIR = "cpu-leases"
+
+
+def _resource() -> ModuleType | None:
+    """The ``resource`` module, or None where it does not exist (Windows)."""
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return None
+    return resource
+
+
+def parse_cpu_list(text: str) -> frozenset[int]:
+    """Parse a Linux CPU list such as ``0-3,8,10-11``.
+
+    Raises:
+        ValueError: if *text* is not a valid CPU list.
+    """
+    cpus: set[int] = set()
+    try:
+        for part in filter(None, (p.strip() for p in text.split(","))):
+            low, sep, high = part.partition("-")
+            cpus.update(range(int(low), int(high) + 1) if sep else [int(low)])
+    except ValueError:
+        msg = f"invalid CPU list: {text!r} (expected e.g. '0-3,8')"
+        raise ValueError(msg) from None
+    if not cpus or min(cpus) < 0:
+        msg = f"invalid CPU list: {text!r} (expected e.g. '0-3,8')"
+        raise ValueError(msg)
+    return frozenset(cpus)
+
+
+def format_cpu_list(cpus: Iterable[int]) -> str:
+    """The compact form of *cpus*, e.g. ``[0, 1, 2, 3, 8]`` -> ``0-3,8``."""
+    ranges: list[list[int]] = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+
+
+def available_cpus() -> frozenset[int]:
+    """The CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return frozenset(os.sched_getaffinity(0))
+    return frozenset(range(os.cpu_count() or 1))
+
+
+def numa_nodes(root: Path = _NODES_DIR) -> list[frozenset[int]]:
+    """The CPUs of each NUMA node (one node with every CPU if the topology is unknown)."""
+    nodes = []
+    for path in sorted(root.glob("node[0-9]*/cpulist")):
+        with contextlib.suppress(OSError, ValueError):
+            nodes.append(parse_cpu_list(path.read_text()))
+    return nodes or [available_cpus()]
+
+
+def pid_alive(pid: int) -> bool:
+    """True if a process with *pid* exists (it may belong to another user)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def wait_with_rusage(proc: "subprocess.Popen[Any]") -> tuple[int, int | None]:
+    """Reap *proc* and return (exit code, its peak RSS in bytes if available).
+
+    Unlike ``RUSAGE_CHILDREN``, the peak is that of *proc* alone, not the
+    largest child this process has reaped so far.
+    """
+    if not hasattr(os, "wait4"):
+        return proc.wait(), None
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    except ChildProcessError:  # Already reaped (e.g. by a poll() in another thread).
+        proc.wait()
+        return proc.returncode, None
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return proc.returncode, rusage.ru_maxrss * scale or None
+
+
+class CpuLeases:
+    """Exclusive, crash-safe claims on CPUs shared by every ``tla`` process of the user.
+
+    A lease whose owner is no longer running is stale and is taken over.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        cpus: frozenset[int] | None = None,
+        nodes: Sequence[frozenset[int]] | None = None,
+    ) -> None:
+        self.directory = directory or cache_dir() / _LEASE_DIR
+        self.cpus = cpus if cpus is not None else available_cpus()
+        self.nodes = [n & self.cpus for n in (nodes if nodes is not None else numa_nodes())]
+
+    def _path(self, cpu: int) -> Path:
+        return self.directory / f"cpu{cpu}"
+
+    def owner(self, cpu: int) -> int | None:
+        """The pid of the live process holding *cpu*, or None if it is free."""
+        try:
+            pid = int(self._path(cpu).read_text().strip())
+        except (OSError, ValueError):
+            return None
+        return pid if pid_alive(pid) else None
+
+    def free(self) -> frozenset[int]:
+        return frozenset(c for c in self.cpus if self.owner(c) is None)
+
+    def _claim(self, cpu: int) -> bool:
+        path = self._path(cpu)
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                if self.owner(cpu) is not None:
+                    return False
+                path.unlink(missing_ok=True)
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            return True
+        return False
+
+    def pick(self, count: int) -> list[int]:
+        """Choose *count* free CPUs, from one NUMA node if any node has room.
+
+        Raises:
+            RuntimeError: if fewer than *count* CPUs are free.
+        """
+        free = self.free()
+        if count > len(free):
+            msg = f"{count} CPUs requested but only {len(free)} of {len(self.cpus)} are free"
+            raise RuntimeError(msg)
+        fitting = [n & free for n in self.nodes if len(n & free) >= count]
+        if fitting:
+            fitting.sort(key=lambda n: (len(n), min(n)))
+            return sorted(fitting[0])[:count]
+        # Span nodes, taking the emptiest ones first.
+        chosen: list[int] = []
+        for node in sorted((n & free for n in self.nodes), key=len, reverse=True):
+            chosen.extend(sorted(node)[: count - len(chosen)])
+        return sorted(chosen)
+
+    def acquire(self, cpus: int | frozenset[int]) -> list[int]:
+        """Lease *cpus* (a count to choose, or specific CPUs).
+
+        Raises:
+            RuntimeError: if the CPUs are not available or are held by other runs.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if isinstance(cpus, int):
+            wanted = self.pick(cpus)
+        else:
+            if missing := cpus - self.cpus:
+                msg = f"CPUs {format_cpu_list(missing)} are not available to this process"
+                raise RuntimeError(msg)
+            wanted = sorted(cpus)
+        claimed: list[int] = []
+        for cpu in wanted:
+            if not self._claim(cpu):
+                self.release(claimed)
+                msg = f"CPU {cpu} is in use by another TLC run (pid {self.owner(cpu)})"
+                raise RuntimeError(msg)
+            claimed.append(cpu)
+        return claimed
+
+    def release(self, cpus: Iterable[int]) -> None:
+        for cpu in cpus:
+            if self.owner(cpu) == os.getpid():
+                self._path(cpu).unlink(missing_ok=True)
+
+
+def _replace_flag(args: Sequence[str], flag: str, value: str) -> list[str]:
+    """*args* with ``flag value`` set to *value* (added if missing)."""
+    result = list(args)
+    if flag in result[:-1]:
+        result[result.index(flag) + 1] = value
+    else:
+        result.extend([flag, value])
+    return result
+
+
+@dataclass
+class Isolation:
+    """CPU set and resource limits for one TLC process.
+
+    *cpus* is a number of CPUs to choose or a specific set; ``assigned`` holds
+    the leased CPUs while ``lease`` is active.
+    """
+
+    cpus: int | frozenset[int] | None = None
+    address_space: int | None = None
+    open_files: int | None = None
+    assigned: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if (self.address_space is not None or self.open_files is not None) and _resource() is None:
+            msg = "resource limits (--max-address-space, --max-open-files) are not supported on this platform"
+            raise ValueError(msg)
+
+    @property
+    def cpu_count(self) -> int | None:
+        if self.cpus is None:
+            return None
+        return self.cpus if isinstance(self.cpus, int) else len(self.cpus)
+
+    def tlc_options(self, java_opts: Sequence[str], tlc_args: Sequence[str]) -> tuple[list[str], list[str]]:
+        """JVM options and TLC arguments with the worker count matched to the CPU set."""
+        count = self.cpu_count
+        if count is None:
+            return list(java_opts), list(tlc_args)
+        opts = [o for o in java_opts if not o.startswith("-XX:ActiveProcessorCount=")]
+        return [*opts, f"-XX:ActiveProcessorCount={count}"], _replace_flag(tlc_args, "-workers", str(count))
+
+    @contextlib.contextmanager
+    def lease(self, leases: CpuLeases | None = None) -> Iterator["Isolation"]:
+        """Hold the CPUs for the duration of the block.
+
+        Raises:
+            RuntimeError: if CPU pinning is unsupported or the CPUs cannot be leased.
+        """
+        if self.cpus is None:
+            yield self
+            return
+        if not hasattr(os, "sched_setaffinity"):
+            msg = "CPU pinning is not supported on this platform"
+            raise RuntimeError(msg)
+        leases = leases or CpuLeases()
+        self.assigned = leases.acquire(self.cpus)
+        try:
+            yield self
+        finally:
+            leases.release(self.assigned)
+
+    def preexec(self) -> None:
+        """Apply the CPU set and limits; runs in the child between ``fork`` and ``exec``."""
+        if self.assigned:
+            os.sched_setaffinity(0, self.assigned)
+        resource = _resource()
+        if resource is None:
+            return
+        for limit, value in ((resource.RLIMIT_AS, self.address_space), (resource.RLIMIT_NOFILE, self.open_files)):
+            if value is not None:
+                hard = resource.getrlimit(limit)[1]
+                resource.setrlimit(limit, (value if hard == resource.RLIM_INFINITY else min(value, hard), hard))
+
+    def describe(self) -> str:
+        parts = []
+        if self.assigned:
+            parts.append(f"CPUs {format_cpu_list(self.assigned)} ({len(self.assigned)} workers)")
+        if self.address_space is not None:
+            parts.append(f"address space ≤ {format_size(self.address_space)}")
+        if self.open_files is not None:
+            parts.append(f"open files ≤ {self.open_files:,}")
+        return ", ".join(parts)
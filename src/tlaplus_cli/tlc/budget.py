@@ -0,0 +1,257 @@
+"""Run budgets for ``tla tlc``: stop a model check that runs too long or grows too large.
+
+A ``BudgetSupervisor`` watches one TLC process. It reads TLC's parsed
+progress (distinct states, states generated) from the output stream and
+polls the clock and the size of the run's metadir from a background thread.
+When a budget is exceeded it stops TLC gracefully: TLC cannot be asked to
+checkpoint from outside, so the supervisor waits for TLC's next periodic
+checkpoint (at most one ``-checkpoint`` interval, 30 minutes by default)
+and then terminates the JVM. The run then exits with ``BUDGET_EXIT_CODE``
+and its metadir is kept so it can be resumed with TLC's ``-recover``.
+
+A budget's ``stop_file`` lets another process stop a run the same way: once
+the file exists, the run is stopped after its next checkpoint (the job queue
+uses this to preempt low-priority jobs).
+"""
+
+import contextlib
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from tlaplus_cli.config.schema import TlcBudgetConfig
+from tlaplus_cli.tlc.output import TlcOutputParser
+from tlaplus_cli.units import format_size, parse_count, parse_duration, parse_size
+
+# EX_TEMPFAIL: the run did not finish but can be resumed; TLC itself never exits with 75.
+BUDGET_EXIT_CODE = 75
+DEFAULT_CHECKPOINT_MINUTES = 30
+DEFAULT_THROUGHPUT_WINDOW = 600.0
+_CHECKPOINT_DONE = "Checkpointing completed"
+_THROUGHPUT_RE = re.compile(r"^\s*([\d,.]+[KMGT]?)\s*/\s*(s|sec|m|min)\s*(?:over\s+(\S+))?\s*$", re.IGNORECASE)
+_TERMINATE_TIMEOUT = 10.0
+
+
+def parse_throughput(text: str) -> tuple[float, float]:
+    """Parse ``RATE/s [over WINDOW]`` (or ``RATE/min``) into (states per second, window in seconds).
+
+    Raises:
+        ValueError: if *text* is not a valid throughput.
+    """
+    m = _THROUGHPUT_RE.match(text)
+    if not m:
+        msg = f"invalid throughput: {text!r} (expected e.g. '5000/s over 10m')"
+        raise ValueError(msg)
+    rate = float(parse_count(m.group(1)))
+    if m.group(2).lower().startswith("m"):
+        rate /= 60
+    window = parse_duration(m.group(3)) if m.group(3) else DEFAULT_THROUGHPUT_WINDOW
+    return rate, window
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{secs:02d}s"
+
+
+def _stop_reason(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8").strip() or "stop requested"
+    except OSError:
+        return "stop requested"
+
+
+def checkpoint_interval(tlc_args: Sequence[str]) -> float:
+    """TLC's checkpoint interval in seconds for *tlc_args* (0 if checkpoints are disabled)."""
+    minutes = DEFAULT_CHECKPOINT_MINUTES
+    for i, arg in enumerate(tlc_args[:-1]):
+        if arg == "-checkpoint":
+            with contextlib.suppress(ValueError):
+                minutes = int(tlc_args[i + 1])
+    return minutes * 60.0
+
+
+def disk_usage(path: Path) -> int:
+    """Total size in bytes of the files under *path*."""
+    total = 0
+    stack = [path]
+    while stack:
+        with contextlib.suppress(OSError), os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                with contextlib.suppress(OSError):
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+@dataclass
+class Budget:
+    """Limits for one run; None means unlimited."""
+
+    max_time: float | None = None
+    max_states: int | None = None
+    max_disk: int | None = None
+    min_throughput: float | None = None
+    throughput_window: float = DEFAULT_THROUGHPUT_WINDOW
+    stop_file: Path | None = None
+
+    @property
+    def active(self) -> bool:
+        limits = (self.max_time, self.max_states, self.max_disk, self.min_throughput, self.stop_file)
+        return any(v is not None for v in limits)
+
+    @classmethod
+    def from_options(
+        cls,
+        config: TlcBudgetConfig,
+        *,
+        max_time: str | None = None,
+        max_states: str | None = None,
+        max_disk: str | None = None,
+        min_throughput: str | None = None,
+    ) -> "Budget":
+        """Build a budget from command-line values, falling back to ``tlc.budget``.
+
+        Raises:
+            ValueError: if a value cannot be parsed.
+        """
+        max_time = max_time or config.max_time
+        max_states = max_states or config.max_states
+        max_disk = max_disk or config.max_disk
+        min_throughput = min_throughput or config.min_throughput
+        budget = cls(
+            max_time=parse_duration(max_time) if max_time else None,
+            max_states=parse_count(max_states) if max_states else None,
+            max_disk=parse_size(max_disk) if max_disk else None,
+        )
+        if min_throughput:
+            budget.min_throughput, budget.throughput_window = parse_throughput(min_throughput)
+        return budget
+
+
+class BudgetSupervisor:
+    """Enforce a ``Budget`` on one TLC process.
+
+    ``feed`` takes TLC's output lines; ``attach`` hands over the process and
+    starts the polling thread; ``close`` stops it. ``exceeded`` names the
+    budget that stopped the run (e.g. ``max-time``) and ``reason`` explains it.
+    """
+
+    def __init__(
+        self,
+        budget: Budget,
+        metadir: Path,
+        *,
+        checkpoint_every: float,
+        poll: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.budget = budget
+        self.metadir = metadir
+        self.checkpoint_every = checkpoint_every
+        self.poll = poll
+        self.clock = clock
+        self.exceeded: str | None = None
+        self.reason: str | None = None
+        self.checkpointed = False
+        self._parser = TlcOutputParser()
+        self._started = clock()
+        self._samples: deque[tuple[float, int]] = deque([(self._started, 0)])
+        self._stop_by: float | None = None
+        self._proc: subprocess.Popen[bytes] | subprocess.Popen[str] | None = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def feed(self, line: str) -> None:
+        before = self._parser.stats.states_generated
+        self._parser.feed(line)
+        stats = self._parser.stats
+        if _CHECKPOINT_DONE in line and self.exceeded is not None:
+            self.checkpointed = True
+            self._terminate()
+            return
+        if stats.states_generated is not None and stats.states_generated != before:
+            self._samples.append((self.clock(), stats.states_generated))
+        budget = self.budget
+        if budget.max_states is not None and (stats.distinct_states or 0) > budget.max_states:
+            self._exceed("max-states", f"{stats.distinct_states:,} distinct states > {budget.max_states:,}")
+
+    def attach(self, proc: "subprocess.Popen[bytes] | subprocess.Popen[str]") -> None:
+        self._proc = proc
+        self._thread = threading.Thread(target=self._watch, name="tlc-budget", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._done.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def check(self) -> None:
+        """Check the clock, disk and throughput budgets (called periodically)."""
+        budget, now = self.budget, self.clock()
+        elapsed = now - self._started
+        if budget.max_time is not None and elapsed > budget.max_time:
+            self._exceed("max-time", f"ran {_format_duration(elapsed)} > {_format_duration(budget.max_time)}")
+        if budget.max_disk is not None and (used := disk_usage(self.metadir)) > budget.max_disk:
+            self._exceed("max-disk", f"metadir uses {format_size(used)} > {format_size(budget.max_disk)}")
+        rate = self.throughput(now) if budget.min_throughput is not None else None
+        if rate is not None and budget.min_throughput is not None and rate < budget.min_throughput:
+            window = _format_duration(budget.throughput_window)
+            self._exceed("min-throughput", f"{rate:,.0f} states/s over {window} < {budget.min_throughput:,.0f}")
+        if budget.stop_file is not None and budget.stop_file.exists():
+            self._exceed("stop-request", _stop_reason(budget.stop_file))
+        if self._stop_by is not None and now >= self._stop_by:
+            self._terminate()
+
+    def throughput(self, now: float) -> float | None:
+        """States generated per second over the last window, or None before a full window has passed."""
+        window = self.budget.throughput_window
+        if now - self._started < window:
+            return None
+        while len(self._samples) > 1 and self._samples[1][0] <= now - window:
+            self._samples.popleft()
+        since, states = self._samples[0]
+        latest = self._samples[-1][1]
+        return (latest - states) / (now - since) if now > since else None
+
+    def _exceed(self, name: str, reason: str) -> None:
+        with self._lock:
+            if self.exceeded is not None:
+                return
+            self.exceeded, self.reason = name, reason
+        if self.checkpoint_every > 0:
+            # Wait for TLC's next periodic checkpoint, plus a poll interval of slack.
+            self._stop_by = self.clock() + self.checkpoint_every + self.poll
+        else:
+            self._terminate()
+
+    def _terminate(self) -> None:
+        self._stop_by = None
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            with contextlib.suppress(OSError):
+                proc.terminate()
+
+    def _watch(self) -> None:
+        while not self._done.wait(self.poll):
+            proc = self._proc
+            if proc is None or proc.poll() is not None:
+                return
+            self.check()
+            if self.exceeded is not None and self._stop_by is None:
+                # Terminated: give the JVM time to shut down, then kill it.
+                try:
+                    proc.wait(timeout=_TERMINATE_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                return
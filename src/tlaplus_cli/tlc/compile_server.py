@@ -0,0 +1,295 @@
+"""A long-lived ``javax.tools`` compiler process for ``tla modules build --watch``.
+
+The server is a small Java program that keeps one ``JavaCompiler`` and its
+file manager (with the toolset and dependency jars already opened) across
+builds. It reads requests on stdin::
+
+    COMPILE <n>
+    <path 1>
+    ...
+    <path n>
+
+and answers with one ``DIAG <kind>\\t<source>\\t<line>\\t<message>`` line per
+diagnostic (newlines in the message escaped as ``\\n``), then ``DONE OK`` or
+``DONE FAILED``. The classes directory is on the server's classpath, so
+sources that did not change resolve against their existing class files.
+The JVM's own stderr (e.g. "Picked up JAVA_TOOL_OPTIONS") goes to the
+terminal, and any stdout before the ``READY`` greeting is skipped.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from tlaplus_cli.config.loader import cache_dir
+
+SERVER_CLASS = "TlaCompileServer"
+SERVER_SOURCE = """\
+import java.io.*;
+import java.nio.charset.StandardCharsets;
+import java.util.*;
+import javax.tools.*;
+
+public final class TlaCompileServer {
+    public static void main(String[] args) throws IOException {
+        PrintStream out = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+        JavaCompiler compiler = ToolProvider.getSystemJavaCompiler();
+        if (compiler == null) {
+            out.println("ERROR no system Java compiler; run with a JDK, not a JRE");
+            return;
+        }
+        StandardJavaFileManager files = compiler.getStandardFileManager(null, null, StandardCharsets.UTF_8);
+        List<String> options = List.of("-cp", args[0], "-d", args[1], "-implicit:none");
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        out.println("READY");
+        String line;
+        while ((line = in.readLine()) != null) {
+            if (!line.startsWith("COMPILE ")) {
+                continue;
+            }
+            int n = Integer.parseInt(line.substring(8).trim());
+            List<File> sources = new ArrayList<>();
+            for (int i = 0; i < n; i++) {
+                sources.add(new File(in.readLine()));
+            }
+            DiagnosticCollector<JavaFileObject> diagnostics = new DiagnosticCollector<>();
+            boolean ok;
+            try {
+                ok = compiler.getTask(null, files, diagnostics, options, null,
+                        files.getJavaFileObjectsFromFiles(sources)).call();
+            } catch (RuntimeException e) {
+                ok = false;
+                out.println("DIAG ERROR\\t-\\t-1\\t" + escape(String.valueOf(e)));
+            }
+            for (Diagnostic<? extends JavaFileObject> d : diagnostics.getDiagnostics()) {
+                String source = d.getSource() == null ? "-" : d.getSource().getName();
+                out.println("DIAG " + d.getKind() + "\\t" + source + "\\t" + d.getLineNumber() + "\\t"
+                        + escape(d.getMessage(Locale.ROOT)));
+            }
+            out.println(ok ? "DONE OK" : "DONE FAILED");
+        }
+    }
+
+    private static String escape(String s) {
+        return s.replace("\\\\", "\\\\\\\\").replace("\\n", "\\\\n").replace("\\r", "");
+    }
+}
+"""
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    kind: str
+    source: str | None
+    line: int | None
+    message: str
+
+    @property
+    def is_error(self) -> bool:
+        return self.kind == "ERROR"
+
+    def __str__(self) -> str:
+        where = self.source or "javac"
+        if self.line is not None:
+            where += f":{self.line}"
+        return f"{where}: {self.kind.lower().replace('_', ' ')}: {self.message}"
+
+
+@dataclass
+class CompileResult:
+    ok: bool
+    files: list[Path]
+    diagnostics: list[Diagnostic] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def errors(self) -> list[Diagnostic]:
+        return [d for d in self.diagnostics if d.is_error]
+
+
+def parse_diagnostic(line: str) -> Diagnostic:
+    """Parse a ``DIAG`` line of the server protocol (without the ``DIAG `` prefix)."""
+    kind, source, number, message = [*line.split("\t", 3), "", "", ""][:4]
+    line_number = int(number) if number.lstrip("-").isdigit() and int(number) > 0 else None
+    text = _ESCAPE_RE.sub(lambda m: "\n" if m[1] == "n" else m[1], message)
+    return Diagnostic(kind, None if source in {"", "-"} else source, line_number, text)
+
+
+def java_helper(class_name: str, source: str, classpath: Sequence[str] = ()) -> Path:
+    """Compile a single-class helper once per source revision into the cache; return its class directory.
+
+    A helper compiled against *classpath* (e.g. tla2tools.jar) is cached
+    separately for each classpath.
+
+    Raises:
+        FileNotFoundError: if ``javac`` is not on PATH.
+        RuntimeError: if the helper does not compile.
+    """
+    digest = hashlib.sha256("\0".join([source, *classpath]).encode()).hexdigest()[:12]
+    target = cache_dir() / "java-helpers" / class_name / digest
+    if (target / f"{class_name}.class").is_file():
+        return target
+    target.mkdir(parents=True, exist_ok=True)
+    source_file = target / f"{class_name}.java"
+    source_file.write_text(source)
+    try:
+        completed = subprocess.run(
+            ["javac", *(["-cp", os.pathsep.join(classpath)] if classpath else []), "-d", str(target), str(source_file)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError as err:
+        msg = "'javac' not found. Ensure JDK is installed and in PATH."
+        raise FileNotFoundError(msg) from err
+    if completed.returncode != 0:
+        msg = f"Compiling {class_name} failed:\n{(completed.stderr or completed.stdout).strip()}"
+        raise RuntimeError(msg)
+    return target
+
+
+def server_classes() -> Path:
+    """Class directory of the compile server (see ``java_helper``)."""
+    return java_helper(SERVER_CLASS, SERVER_SOURCE)
+
+
+class CompileServer:
+    """A warm compiler process bound to one classpath and output directory."""
+
+    def __init__(self, classpath: str, classes_dir: Path) -> None:
+        self.classpath = classpath
+        self.classes_dir = classes_dir
+        self._proc: subprocess.Popen[str] | None = None
+
+    def __enter__(self) -> "CompileServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self) -> None:
+        """Launch the server and wait until it is ready.
+
+        Raises:
+            FileNotFoundError: if ``java`` or ``javac`` is missing.
+            RuntimeError: if the server does not start.
+        """
+        self.classes_dir.mkdir(parents=True, exist_ok=True)
+        cmd = [
+            "java",
+            "-cp",
+            str(server_classes()),
+            SERVER_CLASS,
+            os.pathsep.join([str(self.classes_dir), self.classpath]),
+            str(self.classes_dir),
+        ]
+        try:
+            self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
+        except FileNotFoundError as err:
+            msg = "'java' not found. Ensure JDK is installed and in PATH."
+            raise FileNotFoundError(msg) from err
+        greeting = self._greeting()
+        if greeting != "READY":
+            self.close()
+            msg = f"Compile server did not start: {greeting.removeprefix('ERROR ') or 'it exited (see above)'}"
+            raise RuntimeError(msg)
+
+    def _greeting(self) -> str:
+        """The ``READY`` or ``ERROR ...`` line, skipping anything printed before it; empty at EOF."""
+        stdout: IO[str] | None = self._proc.stdout if self._proc else None
+        if stdout is None:
+            return ""
+        for raw in iter(stdout.readline, ""):
+            line = raw.rstrip("\n")
+            if line == "READY" or line.startswith("ERROR "):
+                return line
+        return ""
+
+    def _readline(self) -> str:
+        stdout: IO[str] | None = self._proc.stdout if self._proc else None
+        return stdout.readline().rstrip("\n") if stdout else ""
+
+    def compile(self, files: Sequence[Path]) -> CompileResult:
+        """Compile *files* in the running server.
+
+        Raises:
+            RuntimeError: if the server is not running or exits mid-build.
+        """
+        if self._proc is None or self._proc.stdin is None or not self.running:
+            msg = "Compile server is not running"
+            raise RuntimeError(msg)
+        started = time.perf_counter()
+        self._proc.stdin.write(f"COMPILE {len(files)}\n" + "".join(f"{f}\n" for f in files))
+        self._proc.stdin.flush()
+        result = CompileResult(ok=False, files=list(files))
+        while True:
+            line = self._readline()
+            if line.startswith("DIAG "):
+                result.diagnostics.append(parse_diagnostic(line.removeprefix("DIAG ")))
+            elif line.startswith("DONE "):
+                result.ok = line == "DONE OK"
+                break
+            elif not line and not self.running:
+                msg = "Compile server exited during the build"
+                raise RuntimeError(msg)
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        if self._proc.stdin is not None:
+            self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        if self._proc.stdout is not None:
+            self._proc.stdout.close()
+        self._proc = None
+
+
+def affected_sources(changed: Iterable[Path], java_files: Sequence[Path]) -> list[Path]:
+    """Changed sources plus the sources that mention one of their top-level class names.
+
+    Mentions are found textually, which over-approximates the dependants
+    javac would need to recheck without parsing any Java.
+    """
+    changed = {p.resolve() for p in changed}
+    direct = [f for f in java_files if f.resolve() in changed]
+    if not direct:
+        return []
+    names = re.compile(r"\b(?:" + "|".join(re.escape(f.stem) for f in direct) + r")\b")
+    affected = list(direct)
+    for f in java_files:
+        if f in affected:
+            continue
+        try:
+            if names.search(f.read_text(errors="replace")):
+                affected.append(f)
+        except OSError:
+            continue
+    return affected
+
+
+def clean_classes(classes_dir: Path) -> None:
+    """Remove compiled classes (but not the service file) before a full rebuild."""
+    for f in classes_dir.rglob("*.class"):
+        f.unlink(missing_ok=True)
+    for d in sorted((d for d in classes_dir.rglob("*") if d.is_dir()), reverse=True):
+        if d.name != "META-INF" and not any(d.iterdir()):
+            shutil.rmtree(d, ignore_errors=True)
@@ -1,9 +1,12 @@
 import os
 import subprocess
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from tlaplus_cli.config.loader import cache_dir, load_config, workspace_root
-from tlaplus_cli.versioning import get_pinned_version_dir
+from tlaplus_cli.versioning import get_pinned_version_dir, record_usage
+
+SERVICE_NAME = "tlc2.overrides.ITLCOverrides"
 
 
 def get_tlc_jar_path() -> Path:
@@ -14,8 +17,35 @@ def get_tlc_jar_path() -> Path:
     return pinned_jar if (pinned_jar and pinned_jar.exists()) else legacy
 
 
-def compile_modules(base_dir: Path | None = None, verbose: bool = False) -> Path:  # noqa: PLR0912, PLR0915
-    """Compile custom Java modules. Returns the classes directory path."""
+def record_jar_usage(jar_path: Path) -> None:
+    """Mark the version directory owning *jar_path* as recently used (no-op for the legacy jar)."""
+    if jar_path.parent != cache_dir():
+        record_usage(jar_path.parent)
+
+
+@dataclass
+class ModuleSources:
+    """Inputs of a custom module build, resolved as ``compile_modules`` uses them."""
+
+    jar_path: Path
+    source_dirs: list[Path]
+    lib_jars: list[Path]
+    java_files: list[Path]
+    classes_dir: Path
+    lib_dirs: list[Path] = field(default_factory=list)
+
+    @property
+    def classpath(self) -> str:
+        """Compile classpath: the toolset jar and the dependency jars."""
+        return os.pathsep.join([str(self.jar_path)] + [str(j) for j in self.lib_jars])
+
+
+def module_sources(base_dir: Path | None = None) -> ModuleSources:
+    """Resolve the toolset jar, module source directories, dependency jars and classes directory.
+
+    Raises:
+        FileNotFoundError: if tla2tools.jar or the modules directory is missing.
+    """
     config = load_config()
     base_dir = base_dir or workspace_root()
 
@@ -23,6 +53,7 @@ def compile_modules(base_dir: Path | None = None, verbose: bool = False) -> Path
     if not jar_path.exists():
         msg = "tla2tools.jar not found. Run 'tla tools install' first."
         raise FileNotFoundError(msg)
+    record_jar_usage(jar_path)
 
     local_modules_dir = base_dir / config.workspace.modules_dir
     classes_dir = base_dir / config.workspace.classes_dir
@@ -38,40 +69,36 @@ def compile_modules(base_dir: Path | None = None, verbose: bool = False) -> Path
         msg = f"modules directory not found: {local_modules_dir}"
         raise FileNotFoundError(msg)
 
-    lib_jars = []
     if config.module_lib_path:
-        lib_dir = Path(config.module_lib_path)
-        if lib_dir.is_dir():
-            lib_jars.extend(sorted(lib_dir.glob("*.jar")))
+        lib_dirs = [Path(config.module_lib_path)]
     else:
-        if custom_modules_dir:
-            custom_lib = custom_modules_dir / "lib"
-            if custom_lib.is_dir():
-                lib_jars.extend(sorted(custom_lib.glob("*.jar")))
-        local_lib = local_modules_dir / "lib"
-        if local_lib.is_dir():
-            lib_jars.extend(sorted(local_lib.glob("*.jar")))
+        lib_dirs = [d / "lib" for d in (custom_modules_dir, local_modules_dir) if d is not None]
+    lib_dirs = [d for d in lib_dirs if d.is_dir()]
+    lib_jars = [j for d in lib_dirs for j in sorted(d.glob("*.jar"))]
 
     # Remove duplicates preserving order
     unique_jars = []
     for jar in lib_jars:
         if jar not in unique_jars:
             unique_jars.append(jar)
-    lib_jars = unique_jars
 
-    classpath = os.pathsep.join([str(jar_path)] + [str(j) for j in lib_jars])
+    source_dirs = [d for d in (custom_modules_dir, local_modules_dir) if d is not None and d.exists()]
+    java_files = [f for d in source_dirs for f in d.rglob("*.java")]
 
-    java_files = []
-    if custom_modules_dir:
-        java_files.extend(list(custom_modules_dir.rglob("*.java")))
-    if local_modules_dir.exists():
-        java_files.extend(list(local_modules_dir.rglob("*.java")))
+    return ModuleSources(jar_path, source_dirs, unique_jars, java_files, classes_dir, lib_dirs)
 
-    if not java_files:
+
+def compile_modules(base_dir: Path | None = None, verbose: bool = False) -> Path:
+    """Compile custom Java modules. Returns the classes directory path."""
+    config = load_config()
+    sources = module_sources(base_dir)
+    classes_dir = sources.classes_dir
+
+    if not sources.java_files:
         return classes_dir
 
     classes_dir.mkdir(parents=True, exist_ok=True)
-    cmd = ["javac", "-cp", classpath, "-d", str(classes_dir), *[str(f) for f in java_files]]
+    cmd = ["javac", "-cp", sources.classpath, "-d", str(classes_dir), *[str(f) for f in sources.java_files]]
 
     try:
         subprocess.run(cmd, check=True, capture_output=not verbose, text=True)
@@ -79,10 +106,15 @@ def compile_modules(base_dir: Path | None = None, verbose: bool = False) -> Path
         msg = "'javac' not found. Ensure JDK is installed and in PATH."
         raise FileNotFoundError(msg) from err
 
+    write_service_file(classes_dir, config.tlc.overrides_class)
+    return classes_dir
+
+
+def write_service_file(classes_dir: Path, overrides_class: str) -> Path:
+    """Register *overrides_class* as TLC's ``ITLCOverrides`` service provider."""
     meta_inf = classes_dir / "META-INF" / "services"
     meta_inf.mkdir(parents=True, exist_ok=True)
-    service_file = meta_inf / "tlc2.overrides.ITLCOverrides"
+    service_file = meta_inf / SERVICE_NAME
     with service_file.open("w") as f:
-        f.write(f"{config.tlc.overrides_class}\n")
-
-    return classes_dir
+        f.write(f"{overrides_class}\n")
+    return service_file
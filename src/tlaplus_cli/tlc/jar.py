@@ -0,0 +1,173 @@
+"""Packaging compiled modules into a single reproducible jar.
+
+``tla modules build --jar`` writes ``modules.jar`` next to the classes
+directory. Entries are sorted and carry a fixed timestamp, so identical
+classes always give a byte-identical jar. With *lib_jars*, the dependency
+jars are merged in: the first copy of a class wins, ``META-INF/services``
+files are concatenated, and manifests and signatures are dropped.
+
+The inputs of a build (the size and mtime of every class file and merged
+jar) are recorded next to the jar in ``modules.jar.inputs.json``, so a
+jar goes stale when a class changes or is deleted or a merged jar is
+updated, not only when a class is newer than the jar.
+
+A jar (unlike a directory) can be part of an application class-data-sharing
+archive, and the JVM opens one file instead of probing the directory tree.
+"""
+
+import json
+import zipfile
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+MODULES_JAR = "modules.jar"
+INPUTS_SUFFIX = ".inputs.json"
+_EPOCH = (1980, 1, 1, 0, 0, 0)
+_MANIFEST = "META-INF/MANIFEST.MF"
+_SERVICES = "META-INF/services/"
+_SIGNATURE_SUFFIXES = (".SF", ".RSA", ".DSA", ".EC")
+
+
+def modules_jar_path(classes_dir: Path) -> Path:
+    """Where ``--jar`` puts the packaged modules for *classes_dir*."""
+    return classes_dir.with_name(MODULES_JAR)
+
+
+def jar_inputs_path(jar: Path) -> Path:
+    """The record of what *jar* was built from."""
+    return jar.with_name(jar.name + INPUTS_SUFFIX)
+
+
+def _stat(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _class_inputs(classes_dir: Path) -> dict[str, list[int]]:
+    inputs = {}
+    for f in classes_dir.rglob("*"):
+        if f.is_file() and (stat := _stat(f)) is not None:
+            inputs[f.relative_to(classes_dir).as_posix()] = stat
+    return inputs
+
+
+def _lib_inputs(lib_jars: Iterable[Path]) -> dict[str, list[int] | None]:
+    return {str(lib.absolute()): _stat(lib) for lib in lib_jars}
+
+
+def _read_inputs(jar: Path) -> dict[str, Any] | None:
+    try:
+        inputs = json.loads(jar_inputs_path(jar).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(inputs, dict) or not isinstance(inputs.get("classes"), dict):
+        return None
+    if not isinstance(inputs.get("libs"), dict):
+        return None
+    return inputs
+
+
+def merged_lib_jars(jar: Path) -> list[Path]:
+    """The dependency jars merged into *jar*, as recorded when it was built."""
+    inputs = _read_inputs(jar)
+    return [Path(lib) for lib in inputs["libs"]] if inputs is not None else []
+
+
+def jar_is_current(jar: Path, classes_dir: Path) -> bool:
+    """True if *jar* was built from the files now under *classes_dir* and its merged jars as they are now.
+
+    A jar without a record of its inputs counts as stale. Without a
+    *classes_dir*, only the merged jars are checked.
+    """
+    inputs = _read_inputs(jar)
+    if inputs is None or not jar.is_file():
+        return False
+    if _lib_inputs(Path(lib) for lib in inputs["libs"]) != inputs["libs"]:
+        return False
+    return not classes_dir.is_dir() or _class_inputs(classes_dir) == inputs["classes"]
+
+
+def _skipped(name: str) -> bool:
+    upper = name.upper()
+    return (
+        name.endswith(("/", "module-info.class"))
+        or upper == _MANIFEST
+        or (upper.startswith("META-INF/") and upper.endswith(_SIGNATURE_SUFFIXES))
+    )
+
+
+@dataclass
+class JarContents:
+    entries: dict[str, bytes] = field(default_factory=dict)
+    services: dict[str, list[str]] = field(default_factory=dict)
+    duplicates: list[str] = field(default_factory=list)
+
+    def add(self, name: str, data: bytes) -> None:
+        if _skipped(name):
+            return
+        if name.startswith(_SERVICES):
+            providers = self.services.setdefault(name, [])
+            for line in data.decode("utf-8", errors="replace").splitlines():
+                line = line.strip()  # noqa: PLW2901
+                if line and not line.startswith("#") and line not in providers:
+                    providers.append(line)
+        elif name in self.entries:
+            self.duplicates.append(name)
+        else:
+            self.entries[name] = data
+
+
+def _entry(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=_EPOCH)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def write_modules_jar(classes_dir: Path, jar: Path, *, lib_jars: Sequence[Path] = ()) -> JarContents:
+    """Package *classes_dir* (and optionally *lib_jars*) into *jar*. Returns what was written.
+
+    The jar is written to a temporary file and moved into place, so a
+    concurrent ``tla tlc`` never sees a partial jar.
+
+    Raises:
+        FileNotFoundError: if *classes_dir* does not exist.
+        ValueError: if a dependency jar is not a valid zip file.
+    """
+    if not classes_dir.is_dir():
+        msg = f"classes directory not found: {classes_dir}"
+        raise FileNotFoundError(msg)
+
+    # Stat before reading: a file changed while packaging makes the jar stale, never wrongly current.
+    inputs = {"classes": _class_inputs(classes_dir), "libs": _lib_inputs(lib_jars)}
+    contents = JarContents()
+    for f in sorted(classes_dir.rglob("*")):
+        if f.is_file():
+            contents.add(f.relative_to(classes_dir).as_posix(), f.read_bytes())
+    for lib in lib_jars:
+        try:
+            with zipfile.ZipFile(lib) as z:
+                for name in z.namelist():
+                    contents.add(name, z.read(name))
+        except zipfile.BadZipFile:
+            msg = f"not a valid jar: {lib}"
+            raise ValueError(msg) from None
+
+    jar.parent.mkdir(parents=True, exist_ok=True)
+    tmp = jar.with_name(f".{jar.name}.tmp")
+    with zipfile.ZipFile(tmp, "w") as z:
+        z.writestr(_entry(_MANIFEST), "Manifest-Version: 1.0\r\nCreated-By: tlaplus-cli\r\n\r\n")
+        files = {**contents.entries, **{k: "".join(f"{p}\n" for p in v).encode() for k, v in contents.services.items()}}
+        for name in sorted(files):
+            z.writestr(_entry(name), files[name])
+    tmp.replace(jar)
+    record = jar_inputs_path(jar)
+    tmp = record.with_name(f".{record.name}.tmp")
+    tmp.write_text(json.dumps(inputs), encoding="utf-8")
+    tmp.replace(record)
+    return contents
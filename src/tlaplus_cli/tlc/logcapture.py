@@ -0,0 +1,191 @@
+"""Capturing TLC's output into rotated, gzip-compressed log files (``tla tlc --log-dir``).
+
+TLC's stdout and stderr go through one pipe into ``<log-dir>/<run>.log.gz``.
+When a file has taken ``max_size`` bytes of output it is closed and rotated
+to ``<run>.log.1.gz`` (the previous ``.1`` becoming ``.2`` and so on, up
+to ``backups`` files), so a run that prints gigabytes keeps only its most
+recent output on disk. Lines are read with a length limit and compressed as
+they arrive, so memory use does not grow with the output.
+
+The console gets either a rate-limited copy of the output (``tail``) or
+nothing until the run ends (``summary``); the parsed ``TlcStats`` are
+always available for a summary.
+"""
+
+import gzip
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tlaplus_cli.tlc.affinity import wait_with_rusage
+from tlaplus_cli.tlc.output import TlcOutputParser, TlcStats
+
+TAIL = "tail"
+SUMMARY = "summary"
+CONSOLE_MODES = (TAIL, SUMMARY)
+_MAX_LINE = 1 << 16
+_PIPE_BUFFER = 1 << 20
+_COMPRESS_LEVEL = 3
+
+
+def _echo(text: str) -> None:
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
+
+class RotatingGzipLog:
+    """A gzip log file that rotates after *max_size* bytes of (uncompressed) output."""
+
+    def __init__(self, path: Path, *, max_size: int, backups: int) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.backups = backups
+        self.written = 0
+        self.rotations = 0
+        self._size = 0
+        self._file: gzip.GzipFile | None = None
+
+    def rotated(self, n: int) -> Path:
+        return self.path.with_name(self.path.name.removesuffix(".gz") + f".{n}.gz")
+
+    @property
+    def files(self) -> list[Path]:
+        """The log files on disk, newest first."""
+        candidates = [self.path, *(self.rotated(n) for n in range(1, self.backups + 1))]
+        return [p for p in candidates if p.exists()]
+
+    def _open(self) -> gzip.GzipFile:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self.path, "wb", compresslevel=_COMPRESS_LEVEL)  # noqa: SIM115
+        return self._file
+
+    def _rotate(self) -> None:
+        self.close()
+        self.rotations += 1
+        if self.backups == 0:
+            self.path.unlink(missing_ok=True)
+        else:
+            self.rotated(self.backups).unlink(missing_ok=True)
+            for n in range(self.backups - 1, 0, -1):
+                if self.rotated(n).exists():
+                    self.rotated(n).replace(self.rotated(n + 1))
+            self.path.replace(self.rotated(1))
+        self._size = 0
+
+    def write(self, data: bytes) -> None:
+        if self._size and self._size + len(data) > self.max_size:
+            self._rotate()
+        self._open().write(data)
+        self._size += len(data)
+        self.written += len(data)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RateLimiter:
+    """Let through at most *rate* lines per second (bursts up to *rate*), counting the rest."""
+
+    def __init__(self, rate: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.clock = clock
+        self.suppressed = 0
+        self._pending = 0
+        self._tokens = float(rate)
+        self._last = clock()
+
+    def allow(self) -> bool:
+        now = self.clock()
+        self._tokens = min(float(self.rate), self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        self.suppressed += 1
+        self._pending += 1
+        return False
+
+    def take_pending(self) -> int:
+        """Lines suppressed since the last call."""
+        pending, self._pending = self._pending, 0
+        return pending
+
+
+@dataclass
+class TlcLog:
+    """Capture settings for one TLC run; ``log``, ``stats`` and ``peak_rss`` are set by ``run``."""
+
+    directory: Path
+    max_size: int
+    backups: int = 4
+    console: str = TAIL
+    console_rate: int = 20
+    log: RotatingGzipLog | None = None
+    lines: int = 0
+    suppressed: int = 0
+    stats: TlcStats = field(default_factory=TlcStats)
+    peak_rss: int | None = None
+
+    def run(  # noqa: PLR0913
+        self,
+        cmd: Sequence[str],
+        cwd: Path,
+        run_name: str,
+        consumers: Sequence[Callable[[str], None]] = (),
+        *,
+        echo: Callable[[str], None] = _echo,
+        on_start: Callable[["subprocess.Popen[bytes]"], None] | None = None,
+        preexec_fn: Callable[[], None] | None = None,
+    ) -> int:
+        """Run *cmd*, writing its output to the log and passing every line to *consumers*.
+
+        *on_start* is called with the process as soon as it has started;
+        *preexec_fn* runs in the child before ``exec``.
+
+        Raises:
+            FileNotFoundError: if the executable is missing.
+        """
+        self.log = log = RotatingGzipLog(
+            self.directory / f"{run_name}.log.gz", max_size=self.max_size, backups=self.backups
+        )
+        parser = TlcOutputParser()
+        limiter = RateLimiter(self.console_rate) if self.console == TAIL else None
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=_PIPE_BUFFER,
+            preexec_fn=preexec_fn,  # noqa: PLW1509
+        )
+        if on_start is not None:
+            on_start(proc)
+        try:
+            for raw in iter(lambda: proc.stdout.readline(_MAX_LINE) if proc.stdout else b"", b""):
+                log.write(raw)
+                self.lines += 1
+                line = raw.decode("utf-8", errors="replace")
+                parser.feed(line)
+                for consume in consumers:
+                    consume(line)
+                if limiter is not None and limiter.allow():
+                    if skipped := limiter.take_pending():
+                        echo(f"… {skipped:,} lines not shown (see {log.path})")
+                    echo(line.rstrip("\n"))
+            _, self.peak_rss = wait_with_rusage(proc)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+            log.close()
+        self.stats = parser.stats
+        self.suppressed = limiter.suppressed if limiter is not None else self.lines
+        return proc.returncode
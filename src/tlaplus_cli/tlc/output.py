@@ -0,0 +1,64 @@
+"""Incremental parsing of TLC's console output."""
+
+import re
+from dataclasses import dataclass
+
+_STATES_RE = re.compile(
+    r"([\d,]+) states generated(?: \(([\d,]+) s/min\))?, ([\d,]+) distinct states found, ([\d,]+) states left on queue"
+)
+_DEPTH_RE = re.compile(r"The depth of the complete state graph search is (\d+)")
+_COMPLETED = "Model checking completed. No error has been found."
+
+
+def _to_int(text: str) -> int:
+    return int(text.replace(",", ""))
+
+
+@dataclass
+class TlcStats:
+    states_generated: int | None = None
+    distinct_states: int | None = None
+    states_left: int | None = None
+    depth: int | None = None
+    peak_states_per_min: int | None = None
+    completed: bool = False
+    error: str | None = None
+
+
+class TlcOutputParser:
+    """Accumulate ``TlcStats`` from TLC output, one line at a time.
+
+    Both the periodic ``Progress(...)`` lines and the final summary update
+    the state counters, so ``stats`` always reflects the latest figures.
+    """
+
+    def __init__(self) -> None:
+        self.stats = TlcStats()
+
+    def feed(self, line: str) -> None:
+        stats = self.stats
+        m = _STATES_RE.search(line)
+        if m:
+            stats.states_generated = _to_int(m.group(1))
+            stats.distinct_states = _to_int(m.group(3))
+            stats.states_left = _to_int(m.group(4))
+            if m.group(2):
+                rate = _to_int(m.group(2))
+                stats.peak_states_per_min = max(rate, stats.peak_states_per_min or 0)
+            return
+
+        m = _DEPTH_RE.search(line)
+        if m:
+            stats.depth = int(m.group(1))
+        elif _COMPLETED in line:
+            stats.completed = True
+        elif line.startswith("Error:") and stats.error is None:
+            stats.error = line.strip()
+
+
+def parse_tlc_output(text: str) -> TlcStats:
+    """Parse a complete TLC output transcript."""
+    parser = TlcOutputParser()
+    for line in text.splitlines():
+        parser.feed(line)
+    return parser.stats
@@ -0,0 +1,99 @@
+"""Resolved TLC launch plans, cached per spec.
+
+Resolving a launch plan runs ``java -version``, reads the pin file, probes
+the spec candidates, walks for a project root and globs ``lib/*.jar``. The
+result is stored as JSON under ``cache_dir()/plans`` together with *stamps*:
+the paths that resolution looked at and what they looked like, either
+their existence (``exists``) or their mtime and size (``mtime``). A cached
+plan is reused while every stamp still matches, so a repeated launch costs
+one ``stat`` per stamp instead of a resolution.
+
+The cache key covers everything that is not a file on disk: the spec
+argument, the working directory, ``PATH``, the profile, the command-line
+TLC arguments and the loaded settings (so any config change is a miss).
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import stat
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from tlaplus_cli.config.loader import cache_dir
+from tlaplus_cli.config.schema import Settings
+
+EXISTS = "exists"
+MTIME = "mtime"
+_FORMAT = 1
+
+
+def fingerprint(path: Path, mode: str) -> str | None:
+    """What a stamp of *path* records under *mode*; None if the path does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    kind = "d" if stat.S_ISDIR(st.st_mode) else "f"
+    return kind if mode == EXISTS else f"{kind}:{st.st_mtime_ns}:{st.st_size}"
+
+
+class Stamps:
+    """The paths a plan depends on, with their fingerprints at resolution time."""
+
+    def __init__(self, entries: Sequence[Sequence[Any]] = ()) -> None:
+        self.entries: list[tuple[str, str, str | None]] = [(str(p), m, v) for p, m, v in entries]
+
+    def exists(self, path: Path) -> None:
+        self.entries.append((str(path), EXISTS, fingerprint(path, EXISTS)))
+
+    def mtime(self, path: Path) -> None:
+        self.entries.append((str(path), MTIME, fingerprint(path, MTIME)))
+
+    def changed(self) -> str | None:
+        """The first path whose fingerprint differs now, or None if all still match."""
+        for path, mode, value in self.entries:
+            if fingerprint(Path(path), mode) != value:
+                return path
+        return None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class PlanCache:
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = directory or cache_dir() / "plans"
+
+    def key(self, spec: str, config: Settings, *, profile: str | None, cli_args: Sequence[str]) -> str:
+        parts = [_FORMAT, spec, str(Path.cwd()), os.environ.get("PATH", ""), profile, list(cli_args)]
+        h = hashlib.sha256(json.dumps(parts).encode())
+        h.update(config.model_dump_json().encode())
+        return h.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key[:32]}.json"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """The cache entry (``plan``, ``resolved``, ``stamps``), or None if missing, unreadable or out of date."""
+        try:
+            data: dict[str, Any] = json.loads(self.path(key).read_text(encoding="utf-8"))
+            stamps = Stamps(data["stamps"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if data.get("key") != key or "plan" not in data or stamps.changed() is not None:
+            return None
+        return data
+
+    def store(self, key: str, plan: dict[str, Any], stamps: Stamps) -> None:
+        """Write the plan atomically; failures are ignored, a missing plan is just resolved again."""
+        target = self.path(key)
+        data = {"key": key, "resolved": time.time(), "plan": plan, "stamps": stamps.entries}
+        with contextlib.suppress(OSError):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(target)
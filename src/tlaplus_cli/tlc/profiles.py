@@ -0,0 +1,148 @@
+"""Named JVM/TLC option profiles and how they merge into a TLC launch.
+
+Settings are layered, later layers winning:
+
+1. ``java.opts`` from the user config.
+2. The selected profile: ``--profile``, else the spec's saved default
+   (``java.spec_profiles``), else the last matching rule in the project's
+   ``tla-tuning.yaml``. A profile's ``opts`` replace ``java.opts``.
+3. TLC flags: the profile's ``tlc_args``, then the matching manifest rules
+   (in order), then command-line flags. A flag given by a later layer
+   replaces the same flag from an earlier one.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from tlaplus_cli.config.loader import load_config, save_config
+from tlaplus_cli.config.schema import JavaConfig, JavaProfile, ManifestRule
+from tlaplus_cli.project import MANIFEST_FILE, load_project_manifest, matching_rules
+from tlaplus_cli.ui import warn
+
+DEFAULT_PROFILE = "default"
+
+
+@dataclass
+class TlcOptions:
+    java_opts: list[str]
+    tlc_args: list[str]
+    profile: str | None = None
+    profile_source: str | None = None
+
+
+def get_profile(profiles: Mapping[str, JavaProfile], name: str) -> JavaProfile:
+    """Look up a profile by name. ``default`` (unless redefined) means plain ``java.opts``.
+
+    Raises:
+        ValueError: if no such profile is defined.
+    """
+    if name in profiles:
+        return profiles[name]
+    if name == DEFAULT_PROFILE:
+        return JavaProfile()
+    defined = ", ".join(sorted(profiles)) or "none"
+    msg = f"unknown profile '{name}' (defined: {defined})"
+    raise ValueError(msg)
+
+
+def jvm_opts(java: JavaConfig, profile: JavaProfile) -> list[str]:
+    """JVM options for *profile*: its own ``opts`` if set, else ``java.opts``."""
+    return list(java.opts if profile.opts is None else profile.opts)
+
+
+def merge_tlc_args(*layers: Sequence[str]) -> list[str]:
+    """Merge TLC flag lists; a flag from a later layer replaces the same flag from an earlier one.
+
+    A flag's value is the following token unless that token is itself a flag.
+    Flags keep the position of their first occurrence.
+    """
+    merged: dict[str, list[str]] = {}
+    for layer in layers:
+        args = list(layer)
+        i = 0
+        while i < len(args):
+            flag = args[i]
+            value = args[i + 1 : i + 2]
+            if value and value[0].startswith("-"):
+                value = []
+            merged[flag] = [flag, *value]
+            i += 1 + len(value)
+    return [token for tokens in merged.values() for token in tokens]
+
+
+def rule_tlc_args(rule: ManifestRule) -> list[str]:
+    """TLC flags contributed by a manifest rule."""
+    args: list[str] = []
+    if rule.workers is not None:
+        args.extend(["-workers", str(rule.workers)])
+    if rule.fpmem is not None:
+        args.extend(["-fpmem", str(rule.fpmem)])
+    if rule.checkpoint is not None:
+        args.extend(["-checkpoint", str(rule.checkpoint)])
+    return [*args, *rule.tlc_args]
+
+
+def config_path(spec_file: Path, tlc_args: Sequence[str]) -> Path:
+    """The ``.cfg`` TLC reads for *spec_file*: ``-config`` if given, else next to the spec."""
+    if "-config" in tlc_args[:-1]:
+        return spec_file.parent / tlc_args[list(tlc_args).index("-config") + 1]
+    return spec_file.with_suffix(".cfg")
+
+
+def spec_key(spec_file: Path) -> str:
+    """Key for a spec in ``java.spec_profiles``."""
+    return str(spec_file.resolve())
+
+
+def spec_default_profile(java: JavaConfig, spec_file: Path) -> str | None:
+    """Name of the profile saved as the default for *spec_file*, if any."""
+    return java.spec_profiles.get(spec_key(spec_file))
+
+
+def save_spec_profile(spec_file: Path, name: str) -> None:
+    """Persist *name* as the default profile for *spec_file* in the user config."""
+    config = load_config().model_copy(deep=True)
+    config.java.spec_profiles[spec_key(spec_file)] = name
+    save_config(config)
+
+
+def resolve_tlc_options(
+    java: JavaConfig,
+    spec_file: Path,
+    project_root: Path | None,
+    *,
+    profile: str | None = None,
+    cli_args: Sequence[str] = (),
+) -> TlcOptions:
+    """Merge user config, project manifest and command-line settings for one spec.
+
+    Raises:
+        ValueError: if the manifest is invalid or an explicitly selected
+            profile (``--profile`` or a manifest rule) is not defined.
+    """
+    manifest = load_project_manifest(project_root)
+    profiles = dict(java.profiles)
+    rules: list[ManifestRule] = []
+    if manifest is not None and project_root is not None:
+        profiles.update(manifest.profiles)
+        rules = matching_rules(manifest, project_root, spec_file, config_path(spec_file, cli_args))
+
+    name, source = profile, "--profile"
+    if name is None:
+        saved = spec_default_profile(java, spec_file)
+        if saved is not None and saved not in profiles and saved != DEFAULT_PROFILE:
+            warn(f"Ignoring the default profile '{saved}' saved for {spec_file.name}: it is no longer defined.")
+        elif saved is not None:
+            name, source = saved, "java.spec_profiles"
+    if name is None:
+        name = next((r.profile for r in reversed(rules) if r.profile), None)
+        source = MANIFEST_FILE
+
+    selected = get_profile(profiles, name) if name else JavaProfile()
+    return TlcOptions(
+        java_opts=jvm_opts(java, selected),
+        tlc_args=merge_tlc_args(selected.tlc_args, *(rule_tlc_args(r) for r in rules), cli_args),
+        profile=name,
+        profile_source=source if name else None,
+    )
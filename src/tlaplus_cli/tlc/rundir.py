@@ -0,0 +1,176 @@
+"""Per-run TLC metadirs (fingerprint sets, state queues and checkpoints).
+
+Each TLC run gets its own ``-metadir`` so that runs never write into the spec's
+source tree and concurrent runs of the same spec never collide. Configured
+scratch locations (e.g. ``/dev/shm`` or a local NVMe mount) are preferred when
+the estimated metadir size fits; otherwise the directory is created under the
+user cache.
+"""
+
+import contextlib
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from tlaplus_cli.config.loader import cache_dir
+from tlaplus_cli.config.schema import RunDirConfig
+from tlaplus_cli.units import format_size, parse_duration, parse_size
+
+ACTIVE_MARKER = ".active"
+_SCRATCH_SUBDIR = "tla-runs"
+
+
+def runs_dir() -> Path:
+    """Default location for run directories."""
+    return cache_dir() / "runs"
+
+
+def _run_roots(config: RunDirConfig) -> list[Path]:
+    """Candidate parents for run directories, fastest first."""
+    return [Path(d).expanduser() / _SCRATCH_SUBDIR for d in config.scratch_dirs] + [runs_dir()]
+
+
+def _free_space(path: Path) -> int | None:
+    """Free bytes on the filesystem that holds (or would hold) *path*."""
+    probe = path
+    while not probe.exists() and probe != probe.parent:
+        probe = probe.parent
+    try:
+        return shutil.disk_usage(probe).free
+    except OSError:
+        return None
+
+
+def _is_active(run_dir: Path) -> bool:
+    """Return True if the process that owns *run_dir* is still running."""
+    try:
+        pid = int((run_dir / ACTIVE_MARKER).read_text().strip())
+    except (OSError, ValueError):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def create_run_dir(spec_name: str, config: RunDirConfig) -> Path:
+    """Create a fresh metadir for one TLC run.
+
+    Scratch locations are used only if they exist and have room for the
+    estimated metadir size plus the configured free-space reserve. The default
+    location under the user cache must pass the same preflight.
+
+    Raises:
+        RuntimeError: if no location has enough free space, or the size
+            settings are invalid.
+    """
+    try:
+        needed = parse_size(config.estimated_size) + parse_size(config.min_free)
+    except ValueError as e:
+        msg = f"Invalid tlc.run_dir setting: {e}"
+        raise RuntimeError(msg) from None
+
+    roots = _run_roots(config)
+    default_root = roots[-1]
+    for root in roots:
+        if root != default_root and not root.parent.is_dir():
+            continue
+        free = _free_space(root)
+        if free is not None and free < needed:
+            continue
+        try:
+            root.mkdir(parents=True, exist_ok=True)
+            stamp = time.strftime("%Y%m%dT%H%M%S")
+            run_dir = Path(tempfile.mkdtemp(prefix=f"{spec_name}-{stamp}-", dir=root))
+            (run_dir / ACTIVE_MARKER).write_text(str(os.getpid()))
+        except OSError:
+            continue
+        return run_dir
+
+    locations = ", ".join(str(r.parent if r != default_root else r) for r in roots)
+    msg = f"Not enough free disk space for the TLC metadir (need {format_size(needed)}; tried {locations})."
+    raise RuntimeError(msg)
+
+
+def finalize_run_dir(run_dir: Path, *, success: bool, keep: bool = False) -> bool:
+    """Clean up after a run. Returns True if the directory was kept.
+
+    The directory is removed after a successful run unless *keep* is set
+    (e.g. a checkpoint was requested); failed runs are always kept for
+    inspection and later removed by ``prune_run_dirs``.
+    """
+    if success and not keep:
+        shutil.rmtree(run_dir, ignore_errors=True)
+        return False
+    with contextlib.suppress(OSError):
+        (run_dir / ACTIVE_MARKER).unlink()
+    return True
+
+
+def list_run_dirs(config: RunDirConfig) -> list[Path]:
+    """All run directories, newest first."""
+    found: list[tuple[float, Path]] = []
+    for root in _run_roots(config):
+        if not root.is_dir():
+            continue
+        for d in root.iterdir():
+            try:
+                if d.is_dir():
+                    found.append((d.stat().st_mtime, d))
+            except OSError:
+                continue
+    found.sort(reverse=True)
+    return [d for _, d in found]
+
+
+def find_run_dir(ref: str | None, config: RunDirConfig, *, containing: str | None = None) -> Path:
+    """Resolve a run by path, directory name or spec name (newest matching run).
+
+    With no *ref*, the newest run is returned. *containing* restricts the
+    search to runs that have that entry (e.g. a stored trace).
+
+    Raises:
+        FileNotFoundError: if no run matches.
+    """
+    if ref is not None and Path(ref).is_dir():
+        return Path(ref).resolve()
+    for d in list_run_dirs(config):
+        if containing is not None and not (d / containing).exists():
+            continue
+        if ref is None or d.name == ref or d.name.startswith(f"{ref}-"):
+            return d
+    what = f"run matching '{ref}'" if ref else "run"
+    extra = f" with a {containing}" if containing else ""
+    msg = f"No {what}{extra} found."
+    raise FileNotFoundError(msg)
+
+
+def prune_run_dirs(config: RunDirConfig, *, now: float | None = None) -> list[Path]:
+    """Apply the retention policy to kept run directories. Returns the removed paths.
+
+    At most ``config.keep`` directories (newest first) are retained and any
+    older than ``config.max_age`` are removed. Directories of runs that are
+    still in progress are never touched.
+    """
+    now = time.time() if now is None else now
+    try:
+        max_age = parse_duration(config.max_age)
+    except ValueError:
+        max_age = None
+
+    kept = [d for d in list_run_dirs(config) if not _is_active(d)]
+    removed = []
+    for i, d in enumerate(kept):
+        try:
+            mtime = d.stat().st_mtime
+        except OSError:
+            continue
+        if i >= config.keep or (max_age is not None and now - mtime > max_age):
+            shutil.rmtree(d, ignore_errors=True)
+            removed.append(d)
+    return removed
@@ -1,27 +1,54 @@
+import contextlib
+import dataclasses
 import os
+import shutil
+import sqlite3
 import subprocess
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.config.loader import cache_dir, load_config
+from tlaplus_cli.config.schema import Settings
+from tlaplus_cli.coverage import CoverageParser, CoverageReport, record_coverage
+from tlaplus_cli.graph import GraphDump
+from tlaplus_cli.history import RunHistory, RunRecord, content_hash, host_fingerprint, outcome_of
 from tlaplus_cli.java import validate_java_version
-from tlaplus_cli.project import find_project_root
-from tlaplus_cli.tlc.compiler import get_tlc_jar_path
+from tlaplus_cli.jfr import FlightRecording
+from tlaplus_cli.project import MANIFEST_FILE, find_project_root
+from tlaplus_cli.tlc.affinity import Isolation, format_cpu_list, wait_with_rusage
+from tlaplus_cli.tlc.budget import BUDGET_EXIT_CODE, Budget, BudgetSupervisor, checkpoint_interval
+from tlaplus_cli.tlc.compiler import SERVICE_NAME, get_tlc_jar_path, record_jar_usage
+from tlaplus_cli.tlc.jar import jar_inputs_path, jar_is_current, merged_lib_jars, modules_jar_path
+from tlaplus_cli.tlc.logcapture import TlcLog
+from tlaplus_cli.tlc.output import TlcOutputParser, TlcStats
+from tlaplus_cli.tlc.plan_cache import PlanCache, Stamps
+from tlaplus_cli.tlc.profiles import config_path, resolve_tlc_options
+from tlaplus_cli.tlc.rundir import create_run_dir, finalize_run_dir, prune_run_dirs
+from tlaplus_cli.trace import TraceRecorder
+from tlaplus_cli.ui import info, warn
+from tlaplus_cli.versioning import get_pinned_path, get_tools_dir, read_version_metadata
 
 
-def resolve_spec_file(spec: str) -> tuple[Path, str]:
-    """Resolve a .tla spec file from a string name.
-
-    Returns (absolute_path, display_name).
-    Raises FileNotFoundError if not found.
-    """
+def _spec_candidates(spec: str) -> list[Path]:
     spec_path = Path(spec)
-    candidates = [
+    return [
         spec_path,
         spec_path.with_suffix(".tla"),
         spec_path.parent / "spec" / (spec_path.name + ".tla"),
     ]
 
-    spec_file = next((c for c in candidates if c.is_file()), None)
+
+def resolve_spec_file(spec: str) -> tuple[Path, str]:
+    """Resolve a .tla spec file from a string name.
+
+    Returns (absolute_path, display_name).
+    Raises FileNotFoundError if not found.
+    """
+    spec_file = next((c for c in _spec_candidates(spec) if c.is_file()), None)
     if not spec_file:
         msg = f"Could not find a TLA+ spec file for '{spec}'"
         raise FileNotFoundError(msg)
@@ -29,22 +56,22 @@ def resolve_spec_file(spec: str) -> tuple[Path, str]:
     return spec_file.absolute(), spec_file.name
 
 
-def run_tlc(spec: str) -> int:
-    """Run TLC model checker on a TLA+ specification. Returns exit code."""
-    config = load_config()
-
-    validate_java_version(config.java.min_version)
+def require_tlc_jar() -> Path:
+    """Return the tla2tools.jar to run with, recording its use.
 
+    Raises:
+        FileNotFoundError: if no toolset is installed.
+    """
     jar_path = get_tlc_jar_path()
     if not jar_path.exists():
         msg = "tla2tools.jar not found. Run 'tla tools install' first."
         raise FileNotFoundError(msg)
+    record_jar_usage(jar_path)
+    return jar_path
 
-    spec_file, _ = resolve_spec_file(spec)
-    project_root = find_project_root(
-        spec_file, modules_dir=config.workspace.modules_dir, classes_dir=config.workspace.classes_dir
-    )
 
+def resolve_classpath(config: Settings, jar_path: Path, project_root: Path | None) -> tuple[list[str], list[str]]:
+    """Return (classpath entries, extra JVM options) for the toolset jar, custom modules and project."""
     classpath_parts = [str(jar_path)]
     extra_jvm_opts: list[str] = []
 
@@ -56,7 +83,13 @@ def run_tlc(spec: str) -> int:
 
     if project_root:
         classes_path = project_root / config.workspace.classes_dir
-        if classes_path.is_dir():
+        modules_jar = modules_jar_path(classes_path)
+        if jar_is_current(modules_jar, classes_path):
+            classpath_parts.insert(0, str(modules_jar))
+        elif classes_path.is_dir():
+            if modules_jar.exists():
+                warn(f"{modules_jar.name} is out of date with {classes_path}; using the classes directory.")
+                info("Run 'tla modules build --jar' to repackage.")
             classpath_parts.insert(0, str(classes_path))
         lib_dir = project_root / "lib"
         if lib_dir.is_dir():
@@ -65,23 +98,473 @@ def run_tlc(spec: str) -> int:
         if modules_path.is_dir():
             extra_jvm_opts.append(f"-DTLA-Library={modules_path}")
 
-    cmd = [
-        "java",
-        *config.java.opts,
-        *extra_jvm_opts,
-        "-cp",
-        os.pathsep.join(classpath_parts),
-        config.tlc.java_class,
-        spec_file.name,
-    ]
+    return classpath_parts, extra_jvm_opts
+
+
+@dataclass
+class TlcPlan:
+    """Everything needed to launch TLC on a spec, except the per-run metadir."""
+
+    spec_file: Path
+    java_opts: list[str]
+    classpath: list[str]
+    java_class: str
+    tlc_args: list[str]
+    profile: str | None = None
+    profile_source: str | None = None
+
+    @property
+    def checkpoints(self) -> bool:
+        return "-checkpoint" in self.tlc_args
+
+    @property
+    def coverage(self) -> bool:
+        return "-coverage" in self.tlc_args
+
+    def arguments(self, metadir: Path | str, extra_args: Sequence[str] = ()) -> list[str]:
+        """TLC's own arguments, i.e. everything after the main class."""
+        return ["-metadir", str(metadir), *self.tlc_args, *extra_args, self.spec_file.name]
+
+    def command(self, metadir: Path | str, extra_args: Sequence[str] = ()) -> list[str]:
+        return [
+            "java",
+            *self.java_opts,
+            "-cp",
+            os.pathsep.join(self.classpath),
+            self.java_class,
+            *self.arguments(metadir, extra_args),
+        ]
+
+
+@dataclass
+class LaunchPlan:
+    """A ``TlcPlan`` with the Java and toolset it was resolved against (see ``resolve_launch_plan``)."""
+
+    plan: TlcPlan
+    jar: Path
+    java: str | None
+    resolved: float
+    cached: bool = False
+    plan_file: Path | None = None
+    stamps: int = 0
+
+    @property
+    def library_paths(self) -> list[str]:
+        """Module directories passed to TLC as ``-DTLA-Library``."""
+        prefix = "-DTLA-Library="
+        return [o.removeprefix(prefix) for o in self.plan.java_opts if o.startswith(prefix)]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "plan": {**dataclasses.asdict(self.plan), "spec_file": str(self.plan.spec_file)},
+            "jar": str(self.jar),
+            "java": self.java,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], *, resolved: float) -> "LaunchPlan":
+        plan = TlcPlan(**{**data["plan"], "spec_file": Path(data["plan"]["spec_file"])})
+        return cls(plan=plan, jar=Path(data["jar"]), java=data["java"], resolved=resolved, cached=True)
+
+
+def _launch_stamps(config: Settings, spec: str, launch: LaunchPlan, project_root: Path | None) -> Stamps | None:
+    """What resolving *launch* depended on, or None if it must not be cached.
+
+    Mirrors ``get_pinned_version_dir``, ``resolve_spec_file``,
+    ``find_project_root`` and ``resolve_classpath``: existence for the
+    paths they probe, mtimes for the files and directories whose contents
+    they read.
+    """
+    stamps = Stamps()
+    if launch.java:
+        stamps.mtime(Path(launch.java))
+    # Installing, removing or migrating a version changes the tools directory.
+    stamps.exists(cache_dir() / "tlc")
+    stamps.mtime(get_tools_dir())
+    stamps.mtime(get_pinned_path())
+    stamps.exists(launch.jar)
+
+    for candidate in _spec_candidates(spec):
+        stamps.exists(candidate)
+        if candidate.is_file():
+            break
+    spec_dir = launch.plan.spec_file.parent.resolve()
+    for directory in (spec_dir, spec_dir.parent):
+        for marker in (config.workspace.classes_dir, config.workspace.modules_dir, "lib", MANIFEST_FILE):
+            stamps.exists(directory / marker)
+        if directory == project_root:
+            break
+
+    if config.module_path:
+        stamps.exists(Path(config.module_path))
+    if project_root is not None:
+        stamps.mtime(project_root / MANIFEST_FILE)
+        stamps.mtime(project_root / "lib")
+        classes_path = project_root / config.workspace.classes_dir
+        modules_jar = modules_jar_path(classes_path)
+        if modules_jar.exists() and str(modules_jar) not in launch.plan.classpath:
+            # A stale modules.jar is warned about on every launch until it is rebuilt.
+            return None
+        stamps.mtime(modules_jar)
+        stamps.mtime(jar_inputs_path(modules_jar))
+        for lib in merged_lib_jars(modules_jar):
+            stamps.mtime(lib)
+        stamps.mtime(classes_path / "META-INF" / "services" / SERVICE_NAME)
+    return stamps
+
+
+def resolve_launch_plan(
+    spec: str, *, profile: str | None = None, cli_args: Sequence[str] = (), use_cache: bool = True
+) -> LaunchPlan:
+    """Resolve the spec, toolset, classpath and merged options for a TLC run, or reuse them.
+
+    A plan resolved before for the same spec, working directory, settings,
+    profile and *cli_args* is reused while the files it was resolved from
+    are unchanged (see ``tlaplus_cli.tlc.plan_cache``). See
+    ``tlaplus_cli.tlc.profiles`` for how profiles, the project manifest and
+    *cli_args* are merged.
+
+    Raises:
+        FileNotFoundError: if the spec or tla2tools.jar is missing.
+        RuntimeError: if Java is missing or too old.
+        ValueError: if a profile or the project manifest is invalid.
+    """
+    config = load_config()
+    cache = PlanCache()
+    key = cache.key(spec, config, profile=profile, cli_args=cli_args)
+    entry = cache.load(key) if use_cache else None
+    if entry is not None:
+        try:
+            launch = LaunchPlan.from_json(entry["plan"], resolved=entry["resolved"])
+        except (KeyError, TypeError):
+            pass
+        else:
+            launch.plan_file, launch.stamps = cache.path(key), len(entry["stamps"])
+            record_jar_usage(launch.jar)
+            return launch
 
+    validate_java_version(config.java.min_version)
+
+    jar_path = require_tlc_jar()
+    spec_file, _ = resolve_spec_file(spec)
+    project_root = find_project_root(
+        spec_file, modules_dir=config.workspace.modules_dir, classes_dir=config.workspace.classes_dir
+    )
+    options = resolve_tlc_options(config.java, spec_file, project_root, profile=profile, cli_args=cli_args)
+    classpath, extra_jvm_opts = resolve_classpath(config, jar_path, project_root)
+
+    plan = TlcPlan(
+        spec_file=spec_file,
+        java_opts=[*options.java_opts, *extra_jvm_opts],
+        classpath=classpath,
+        java_class=config.tlc.java_class,
+        tlc_args=options.tlc_args,
+        profile=options.profile,
+        profile_source=options.profile_source,
+    )
+    launch = LaunchPlan(plan=plan, jar=jar_path, java=shutil.which("java"), resolved=time.time())
+    stamps = _launch_stamps(config, spec, launch, project_root) if use_cache else None
+    if stamps is not None:
+        cache.store(key, launch.to_json(), stamps)
+        launch.plan_file, launch.stamps = cache.path(key), len(stamps)
+    return launch
+
+
+def config_file(plan: TlcPlan) -> Path:
+    """The ``.cfg`` TLC reads: ``-config`` if given, else next to the spec."""
+    return config_path(plan.spec_file, plan.tlc_args)
+
+
+def plan_tlc_run(spec: str, *, profile: str | None = None, cli_args: Sequence[str] = ()) -> TlcPlan:
+    """The ``TlcPlan`` of ``resolve_launch_plan``.
+
+    Raises:
+        FileNotFoundError: if the spec or tla2tools.jar is missing.
+        RuntimeError: if Java is missing or too old.
+        ValueError: if a profile or the project manifest is invalid.
+    """
+    return resolve_launch_plan(spec, profile=profile, cli_args=cli_args).plan
+
+
+def _run_streaming(
+    cmd: list[str],
+    cwd: Path,
+    consumers: Sequence[Callable[[str], None]],
+    on_start: Callable[["subprocess.Popen[str]"], None] | None = None,
+    preexec_fn: Callable[[], None] | None = None,
+) -> tuple[int, int | None]:
+    """Run *cmd*, echoing its output live while passing every line to *consumers*.
+
+    Returns the exit code and the peak RSS of the process (if available).
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        preexec_fn=preexec_fn,  # noqa: PLW1509
+    )
+    if on_start is not None:
+        on_start(proc)
+    with proc:
+        for line in proc.stdout or ():
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            for consume in consumers:
+                consume(line)
+        return wait_with_rusage(proc)
+
+
+def _launch(  # noqa: PLR0913
+    cmd: list[str],
+    cwd: Path,
+    consumers: Sequence[Callable[[str], None]],
+    *,
+    log: TlcLog | None = None,
+    run_name: str = "tlc",
+    supervisor: BudgetSupervisor | None = None,
+    preexec_fn: Callable[[], None] | None = None,
+) -> tuple[int, int | None]:
+    """Run TLC, capturing its output in *log* if given, else streaming it only when something consumes it.
+
+    A *supervisor* reads the output and is attached to the TLC process while
+    it runs; *preexec_fn* runs in the TLC child process before ``exec``.
+    Returns TLC's exit code and peak RSS (None when TLC's output is not read).
+    """
+    if supervisor is not None:
+        consumers = [*consumers, supervisor.feed]
+    on_start = supervisor.attach if supervisor is not None else None
     try:
-        result = subprocess.run(cmd, cwd=str(spec_file.parent), check=False)
-    except FileNotFoundError:
-        msg = "'java' not found. Please install Java."
-        raise FileNotFoundError(msg) from None
-    else:
-        return result.returncode
+        if log is not None:
+            returncode = log.run(cmd, cwd, run_name, consumers, on_start=on_start, preexec_fn=preexec_fn)
+            return returncode, log.peak_rss
+        if consumers:
+            return _run_streaming(cmd, cwd, consumers, on_start, preexec_fn)
+        return subprocess.run(cmd, cwd=str(cwd), check=False, preexec_fn=preexec_fn).returncode, None
+    finally:
+        if supervisor is not None:
+            supervisor.close()
+
+
+def _store_coverage(spec_file: Path, report: CoverageReport) -> None:
+    try:
+        store = record_coverage(spec_file, report)
+    except ValueError as e:
+        warn(f"Coverage not recorded: {e}")
+        return
+    info(
+        f"Coverage merged into the store for {spec_file.stem} at {store.directory.name} "
+        f"({store.runs} runs; see 'tla coverage show {spec_file.stem}')"
+    )
+
+
+def _budget_stop(supervisor: BudgetSupervisor | None, run_dir: Path) -> str | None:
+    """Report a budget stop; returns the reason, or None if the run was not stopped."""
+    if supervisor is None or supervisor.exceeded is None:
+        return None
+    reason = f"Budget exceeded: {supervisor.exceeded} ({supervisor.reason})"
+    warn(f"{reason}; TLC was stopped {'after a checkpoint' if supervisor.checkpointed else 'without a checkpoint'}")
+    if supervisor.checkpointed:
+        info(f"Resume from the checkpoint with TLC's -recover {run_dir}")
+    return reason
+
+
+def _record_run(  # noqa: PLR0913
+    plan: TlcPlan,
+    jar: Path,
+    stats: TlcStats,
+    *,
+    started_at: float,
+    wall_time: float,
+    exit_code: int,
+    peak_rss: int | None,
+    run_dir: Path | None,
+    stopped: str | None = None,
+    cpus: str | None = None,
+) -> None:
+    """Add the run to the history database (see ``tla runs``); failures only warn.
+
+    *stopped* is the reason a budget stopped the run, if one did.
+    """
+    metadata = read_version_metadata(jar.parent) or {}
+    host, host_info = host_fingerprint()
+    record = RunRecord(
+        spec=str(plan.spec_file),
+        spec_name=plan.spec_file.stem,
+        started_at=started_at,
+        wall_time=wall_time,
+        exit_code=exit_code,
+        outcome=outcome_of(exit_code, stats.error, stopped=stopped is not None),
+        spec_hash=content_hash(plan.spec_file),
+        cfg_hash=content_hash(config_file(plan)),
+        tools_version=metadata.get("tag_name"),
+        tools_sha=metadata.get("sha") or None,
+        java_opts=plan.java_opts,
+        tlc_args=plan.tlc_args,
+        profile=plan.profile,
+        host=host,
+        host_info=host_info,
+        states_generated=stats.states_generated,
+        distinct_states=stats.distinct_states,
+        depth=stats.depth,
+        peak_states_per_sec=stats.peak_states_per_min / 60 if stats.peak_states_per_min is not None else None,
+        peak_rss=peak_rss,
+        error=stopped or stats.error,
+        run_dir=str(run_dir) if run_dir is not None else None,
+        cpus=cpus,
+    )
+    try:
+        RunHistory().add(record)
+    except (OSError, sqlite3.Error) as e:
+        warn(f"Run not recorded in the history: {e}")
+
+
+def _enter_contexts(
+    stack: contextlib.ExitStack, run_dir: Path, dump: GraphDump | None, isolation: Isolation | None
+) -> None:
+    """Lease the run's CPUs and start the graph dump; a lease failure removes the unused run directory."""
+    if isolation is not None:
+        try:
+            stack.enter_context(isolation.lease())
+        except RuntimeError:
+            finalize_run_dir(run_dir, success=True)
+            raise
+        info(f"Isolation: {isolation.describe()}")
+    if dump is not None:
+        stack.enter_context(dump)
+
+
+def _report_outputs(
+    plan: TlcPlan, run_dir: Path, *, graph: Path | None, coverage_parser: CoverageParser | None, trace_states: int
+) -> None:
+    """Announce the state graph and counterexample of a finished run and store its coverage."""
+    if graph is not None:
+        info(f"State graph written to {graph} (see 'tla graph stats {graph}')")
+    if coverage_parser is not None and coverage_parser.report:
+        _store_coverage(plan.spec_file, coverage_parser.report)
+    if trace_states:
+        info(f"Counterexample with {trace_states} states saved; view it with 'tla trace show {run_dir.name}'")
+
+
+def run_tlc(  # noqa: PLR0913
+    spec: str,
+    *,
+    profile: str | None = None,
+    checkpoint: int | None = None,
+    keep_metadir: bool = False,
+    record_trace: bool | None = None,
+    graph: Path | None = None,
+    coverage: int | None = None,
+    coverage_parser: CoverageParser | None = None,
+    flight_recording: FlightRecording | None = None,
+    log: TlcLog | None = None,
+    budget: Budget | None = None,
+    isolation: Isolation | None = None,
+    tlc_args: Sequence[str] = (),
+    on_run_dir: Callable[[Path], None] | None = None,
+) -> int:
+    """Run TLC model checker on a TLA+ specification. Returns exit code.
+
+    TLC gets a fresh ``-metadir`` (see ``tlaplus_cli.tlc.rundir``), removed
+    after a successful run unless *keep_metadir* is set or a checkpoint
+    interval (minutes) is in effect. With *record_trace* (default:
+    ``tlc.record_trace``), TLC's output is streamed through a
+    ``TraceRecorder`` that stores any counterexample in the run directory.
+    With *graph*, TLC's state-graph dump is converted to the binary format of
+    ``tlaplus_cli.graph`` at that path while TLC runs. Whenever ``-coverage``
+    is in effect (*coverage* minutes, or a profile's ``tlc_args``), the final
+    coverage statistics are merged into the spec's coverage store; pass a
+    *coverage_parser* to read them afterwards. With *flight_recording*, TLC
+    runs under Java Flight Recorder and the run directory holding the
+    recording is kept. With ``tlc.history``, TLC's output is parsed and the
+    run is recorded in the history database (see ``tlaplus_cli.history``).
+    With *log*, TLC's output goes to compressed, rotated log files instead
+    of the terminal (see ``tlaplus_cli.tlc.logcapture``). With an active
+    *budget*, a ``BudgetSupervisor`` stops TLC (after its next checkpoint)
+    once a limit is exceeded and the run returns ``BUDGET_EXIT_CODE``. With
+    *isolation*, TLC runs pinned to leased CPUs with a matching worker count
+    and the given resource limits (see ``tlaplus_cli.tlc.affinity``).
+    *tlc_args* are extra TLC arguments (e.g. ``-config`` or ``-recover``) and
+    *on_run_dir* is called with the run directory before TLC starts.
+    """
+    cli_args = [
+        *(["-checkpoint", str(checkpoint)] if checkpoint is not None else []),
+        *(["-coverage", str(coverage)] if coverage is not None else []),
+        *tlc_args,
+    ]
+    launch = resolve_launch_plan(spec, profile=profile, cli_args=cli_args)
+    plan = launch.plan
+    if plan.profile:
+        info(f"Using profile '{plan.profile}' (from {plan.profile_source})")
+
+    config = load_config()
+    prune_run_dirs(config.tlc.run_dir)
+    run_dir = create_run_dir(plan.spec_file.stem, config.tlc.run_dir)
+    if on_run_dir is not None:
+        on_run_dir(run_dir)
+    if flight_recording is not None:
+        plan = dataclasses.replace(plan, java_opts=[*plan.java_opts, *flight_recording.java_opts(run_dir)])
+    if isolation is not None:
+        java_opts, tlc_args = isolation.tlc_options(plan.java_opts, plan.tlc_args)
+        plan = dataclasses.replace(plan, java_opts=java_opts, tlc_args=tlc_args)
+    if record_trace is None:
+        record_trace = config.tlc.record_trace
+    recorder = TraceRecorder(run_dir, plan.spec_file.name) if record_trace else None
+    if coverage_parser is None and plan.coverage:
+        coverage_parser = CoverageParser()
+    history = TlcOutputParser() if config.tlc.history else None
+    consumers = [c.feed for c in (recorder, coverage_parser, history) if c is not None]
+    dump = GraphDump(run_dir, graph.absolute(), plan.spec_file.name) if graph is not None else None
+    cmd = plan.command(run_dir, dump.tlc_args if dump is not None else ())
+    supervisor = None
+    if budget is not None and budget.active:
+        supervisor = BudgetSupervisor(budget, run_dir, checkpoint_every=checkpoint_interval(plan.tlc_args))
+
+    with contextlib.ExitStack() as stack:
+        _enter_contexts(stack, run_dir, dump, isolation)
+        started_at, started = time.time(), time.perf_counter()
+        try:
+            returncode, peak_rss = _launch(
+                cmd,
+                plan.spec_file.parent,
+                consumers,
+                log=log,
+                run_name=run_dir.name,
+                supervisor=supervisor,
+                preexec_fn=isolation.preexec if isolation is not None else None,
+            )
+        except FileNotFoundError:
+            finalize_run_dir(run_dir, success=True)
+            msg = "'java' not found. Please install Java."
+            raise FileNotFoundError(msg) from None
+
+    stopped = _budget_stop(supervisor, run_dir)
+    if stopped is not None:
+        returncode = BUDGET_EXIT_CODE
+    trace_states = recorder.close() if recorder is not None else 0
+    recorded = flight_recording is not None and flight_recording.exists
+    keep = keep_metadir or plan.checkpoints or trace_states > 0 or recorded
+    wall_time = time.perf_counter() - started
+    kept = finalize_run_dir(run_dir, success=returncode == 0, keep=keep)
+    if kept:
+        info(f"TLC metadir kept at {run_dir}")
+    if history is not None:
+        _record_run(
+            plan,
+            launch.jar,
+            history.stats,
+            started_at=started_at,
+            wall_time=wall_time,
+            exit_code=returncode,
+            peak_rss=peak_rss,
+            run_dir=run_dir if kept else None,
+            stopped=stopped,
+            cpus=format_cpu_list(isolation.assigned) if isolation is not None and isolation.assigned else None,
+        )
+    _report_outputs(plan, run_dir, graph=graph, coverage_parser=coverage_parser, trace_states=trace_states)
+    return returncode
 
 
 def get_tlc_version() -> str | None:
@@ -0,0 +1,65 @@
+"""A/B comparison of JVM/TLC option profiles on a single spec."""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tlaplus_cli.bench import MeasuredRuns, RunMeasurement, measure_tlc
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.tlc.rundir import create_run_dir, finalize_run_dir
+from tlaplus_cli.tlc.runner import plan_tlc_run
+
+
+@dataclass
+class ProfileResult(MeasuredRuns):
+    profile: str
+    runs: list[RunMeasurement] = field(default_factory=list)
+
+
+def compare_profiles(
+    spec: str,
+    names: Sequence[str],
+    *,
+    repeat: int,
+    warmup: int = 1,
+    on_run: Callable[[ProfileResult, RunMeasurement, bool], None] | None = None,
+) -> tuple[Path, list[ProfileResult]]:
+    """Run *spec* under each named profile and collect measurements.
+
+    Each profile runs with the command ``tla tlc --profile NAME`` would use,
+    so project manifest flags still apply. After *warmup* discarded rounds, the *repeat* measured rounds run the
+    profiles alternately so that drift in machine load affects all of them
+    alike. Every run gets a fresh metadir. Returns the resolved spec file and
+    one result per profile, in the order given.
+
+    Raises:
+        ValueError: if a profile is not configured.
+        FileNotFoundError: if the spec, tla2tools.jar or java is missing.
+    """
+    config = load_config()
+    plans = {name: plan_tlc_run(spec, profile=name) for name in names}
+    spec_file = next(iter(plans.values())).spec_file
+
+    results = {name: ProfileResult(profile=name) for name in plans}
+    for round_no in range(warmup + repeat):
+        warm = round_no < warmup
+        for name, plan in plans.items():
+            run_dir = create_run_dir(spec_file.stem, config.tlc.run_dir)
+            try:
+                measurement, _ = measure_tlc(plan.command(run_dir), spec_file.parent)
+            finally:
+                finalize_run_dir(run_dir, success=True)
+            result = results[name]
+            if not warm:
+                result.runs.append(measurement)
+            if on_run:
+                on_run(result, measurement, warm)
+    return spec_file, list(results.values())
+
+
+def pick_winner(results: Sequence[ProfileResult]) -> ProfileResult | None:
+    """The profile with the highest median throughput among those that never failed."""
+    scored = [(s.median, r) for r in results if not r.failed and (s := r.summary("states_per_sec"))]
+    if not scored:
+        return None
+    return max(scored, key=lambda item: item[0])[1]
@@ -0,0 +1,319 @@
+"""Re-checking a spec on every save for ``tla tlc --watch``.
+
+The watched inputs are the spec, the modules it ``EXTENDS`` or
+``INSTANCE``\\s (transitively, as far as they are found next to the spec
+or in the module directories), its ``.cfg`` and the project's override
+sources. A change cancels the run in progress.
+
+TLC cannot be run twice in one JVM, so instead each run is handed to a
+*standby* JVM: one started ahead of time, with TLC's classes already
+loaded, that waits on stdin for TLC's arguments. After every run a new
+standby is started while the user edits, which takes JVM startup and
+class loading off the edit-to-result path. Without ``javac`` (a JRE
+only) runs fall back to a fresh JVM.
+"""
+
+import collections
+import contextlib
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tlaplus_cli.config.loader import load_config
+from tlaplus_cli.project import find_project_root
+from tlaplus_cli.sany.modules import spec_dependencies
+from tlaplus_cli.tlc.compile_server import CompileResult, CompileServer, affected_sources, java_helper
+from tlaplus_cli.tlc.compiler import ModuleSources, module_sources, write_service_file
+from tlaplus_cli.tlc.output import TlcOutputParser, TlcStats
+from tlaplus_cli.tlc.rundir import create_run_dir, finalize_run_dir
+from tlaplus_cli.tlc.runner import TlcPlan, config_file, plan_tlc_run
+from tlaplus_cli.trace import TraceRecorder
+from tlaplus_cli.watch import Watcher, create_watcher
+
+STANDBY_CLASS = "TlaStandby"
+STANDBY_SOURCE = """\
+import java.io.*;
+import java.lang.reflect.*;
+import java.nio.charset.StandardCharsets;
+import java.util.*;
+
+public final class TlaStandby {
+    public static void main(String[] args) throws Throwable {
+        Method entry = Class.forName(args[0]).getMethod("main", String[].class);
+        for (int i = 1; i < args.length; i++) {
+            try {
+                Class.forName(args[i]);
+            } catch (ClassNotFoundException | LinkageError e) {
+                // Preloading is best effort.
+            }
+        }
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        List<String> tlcArgs = new ArrayList<>();
+        String line;
+        while ((line = in.readLine()) != null && !line.isEmpty()) {
+            tlcArgs.add(line);
+        }
+        if (line == null) {
+            return;
+        }
+        try {
+            entry.invoke(null, (Object) tlcArgs.toArray(new String[0]));
+        } catch (InvocationTargetException e) {
+            throw e.getCause();
+        }
+    }
+}
+"""
+PRELOAD = ("tla2sany.drivers.SANY", "tlc2.tool.impl.Tool", "tlc2.tool.ModelChecker")
+WATCHED_SUFFIXES = frozenset({".tla", ".cfg", ".java", ".jar"})
+_TAIL_LINES = 20
+_CANCEL_POLL = 0.1
+
+
+class StandbyJvm:
+    """A JVM started ahead of time with TLC loaded, waiting for TLC's arguments on stdin."""
+
+    def __init__(self, plan: TlcPlan, helper_dir: Path) -> None:
+        self.key = (tuple(plan.java_opts), tuple(plan.classpath), plan.java_class, plan.spec_file.parent)
+        cmd = [
+            "java",
+            *plan.java_opts,
+            "-cp",
+            os.pathsep.join([*plan.classpath, str(helper_dir)]),
+            STANDBY_CLASS,
+            plan.java_class,
+            *PRELOAD,
+        ]
+        self.proc = subprocess.Popen(
+            cmd,
+            cwd=str(plan.spec_file.parent),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+    def matches(self, plan: TlcPlan) -> bool:
+        key = (tuple(plan.java_opts), tuple(plan.classpath), plan.java_class, plan.spec_file.parent)
+        return key == self.key and self.proc.poll() is None
+
+    def launch(self, args: Sequence[str]) -> "subprocess.Popen[str]":
+        """Start TLC with *args* in this JVM and hand over the process."""
+        if self.proc.stdin is not None:
+            self.proc.stdin.write("".join(f"{a}\n" for a in args) + "\n")
+            self.proc.stdin.flush()
+        return self.proc
+
+    def discard(self) -> None:
+        """Stop the waiting JVM; closing stdin lets it exit without running TLC."""
+        if self.proc.stdin is not None:
+            with contextlib.suppress(OSError):
+                self.proc.stdin.close()
+        _terminate(self.proc)
+        _close_pipes(self.proc)
+
+
+def _terminate(proc: "subprocess.Popen[str]") -> None:
+    if proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+def _close_pipes(proc: "subprocess.Popen[str]") -> None:
+    for pipe in (proc.stdin, proc.stdout):
+        if pipe is not None:
+            with contextlib.suppress(OSError):
+                pipe.close()
+
+
+@dataclass
+class CheckOutcome:
+    """The result of one watch-mode run; ``returncode`` is None if it was cancelled."""
+
+    returncode: int | None
+    stats: TlcStats
+    elapsed: float
+    trace_states: int = 0
+    run_dir: Path | None = None
+    tail: list[str] = field(default_factory=list)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.returncode is None
+
+    @property
+    def passed(self) -> bool:
+        return self.returncode == 0
+
+
+class WatchSession:
+    """State kept between runs: the standby JVM, the override compiler and the watched inputs."""
+
+    def __init__(self, spec: str, *, profile: str | None = None) -> None:
+        self.spec = spec
+        self.profile = profile
+        self.standby: StandbyJvm | None = None
+        self.compiler: CompileServer | None = None
+        self._helper: Path | None = None
+        self._helper_failed = False
+
+    def plan(self) -> TlcPlan:
+        return plan_tlc_run(self.spec, profile=self.profile)
+
+    def _project_root(self, plan: TlcPlan) -> Path | None:
+        config = load_config()
+        return find_project_root(
+            plan.spec_file, modules_dir=config.workspace.modules_dir, classes_dir=config.workspace.classes_dir
+        )
+
+    def overrides(self, plan: TlcPlan) -> ModuleSources | None:
+        """Override sources of the spec's project, if it has any."""
+        root = self._project_root(plan)
+        if root is None:
+            return None
+        try:
+            sources = module_sources(root)
+        except FileNotFoundError:
+            return None
+        return sources if sources.java_files else None
+
+    def inputs(self, plan: TlcPlan, overrides: ModuleSources | None) -> list[Path]:
+        """Files and directories whose changes trigger a new run."""
+        config = load_config()
+        search = [plan.spec_file.parent]
+        root = self._project_root(plan)
+        if root is not None:
+            search.append(root / config.workspace.modules_dir)
+        if config.module_path:
+            search.append(Path(config.module_path))
+        paths = [*spec_dependencies(plan.spec_file, search), config_file(plan)]
+        if overrides is not None:
+            paths.extend([*overrides.source_dirs, *overrides.lib_dirs])
+        return paths
+
+    def watcher(self, paths: Iterable[Path], *, poll: bool) -> Watcher:
+        return create_watcher(paths, accept=lambda p: p.suffix in WATCHED_SUFFIXES, poll=poll)
+
+    def rebuild_overrides(self, sources: ModuleSources, changed: Iterable[Path]) -> CompileResult | None:
+        """Recompile the overrides affected by *changed* in a warm compiler; None if none are.
+
+        Raises:
+            FileNotFoundError, RuntimeError: if the compiler cannot be started.
+        """
+        changed = list(changed)
+        jars_changed = any(p.suffix == ".jar" for p in changed)
+        files = sources.java_files if jars_changed else affected_sources(changed, sources.java_files)
+        if not files:
+            return None
+        if self.compiler is None or jars_changed or not self.compiler.running:
+            if self.compiler is not None:
+                self.compiler.close()
+            self.compiler = CompileServer(sources.classpath, sources.classes_dir)
+            self.compiler.start()
+        result = self.compiler.compile(files)
+        if result.ok:
+            write_service_file(sources.classes_dir, load_config().tlc.overrides_class)
+            self.discard_standby()
+        return result
+
+    def _helper_dir(self) -> Path | None:
+        if self._helper is None and not self._helper_failed:
+            try:
+                self._helper = java_helper(STANDBY_CLASS, STANDBY_SOURCE)
+            except (FileNotFoundError, RuntimeError):
+                self._helper_failed = True
+        return self._helper
+
+    def prepare(self, plan: TlcPlan) -> None:
+        """Start a standby JVM for *plan* unless a matching one is waiting."""
+        if self.standby is not None and self.standby.matches(plan):
+            return
+        self.discard_standby()
+        helper = self._helper_dir()
+        if helper is not None:
+            with contextlib.suppress(OSError):
+                self.standby = StandbyJvm(plan, helper)
+
+    def discard_standby(self) -> None:
+        if self.standby is not None:
+            self.standby.discard()
+            self.standby = None
+
+    def _start(self, plan: TlcPlan, run_dir: Path) -> "subprocess.Popen[str]":
+        if self.standby is not None and self.standby.matches(plan):
+            standby, self.standby = self.standby, None
+            return standby.launch(plan.arguments(run_dir))
+        self.discard_standby()
+        return subprocess.Popen(
+            plan.command(run_dir),
+            cwd=str(plan.spec_file.parent),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+    def check(self, plan: TlcPlan, watcher: Watcher) -> tuple[CheckOutcome, set[Path]]:
+        """Run TLC once, cancelling it if *watcher* reports a change. Returns the outcome and those changes.
+
+        Raises:
+            FileNotFoundError: if ``java`` is missing.
+        """
+        config = load_config()
+        run_dir = create_run_dir(plan.spec_file.stem, config.tlc.run_dir)
+        parser = TlcOutputParser()
+        recorder = TraceRecorder(run_dir, plan.spec_file.name)
+        tail: collections.deque[str] = collections.deque(maxlen=_TAIL_LINES)
+        started = time.perf_counter()
+        try:
+            proc = self._start(plan, run_dir)
+        except FileNotFoundError:
+            finalize_run_dir(run_dir, success=True)
+            msg = "'java' not found. Please install Java."
+            raise FileNotFoundError(msg) from None
+
+        def pump() -> None:
+            for line in proc.stdout or ():
+                parser.feed(line)
+                recorder.feed(line)
+                if line.strip():
+                    tail.append(line.rstrip("\n"))
+
+        reader = threading.Thread(target=pump, daemon=True)
+        reader.start()
+        changed: set[Path] = set()
+        while proc.poll() is None and not changed:
+            changed = watcher.wait(_CANCEL_POLL)
+        if changed:
+            _terminate(proc)
+        else:
+            proc.wait()
+        reader.join()
+        _close_pipes(proc)
+
+        trace_states = recorder.close()
+        kept = finalize_run_dir(run_dir, success=True, keep=trace_states > 0 and not changed)
+        outcome = CheckOutcome(
+            returncode=None if changed else proc.returncode,
+            stats=parser.stats,
+            elapsed=time.perf_counter() - started,
+            trace_states=0 if changed else trace_states,
+            run_dir=run_dir if kept else None,
+            tail=list(tail),
+        )
+        return outcome, changed
+
+    def close(self) -> None:
+        self.discard_standby()
+        if self.compiler is not None:
+            self.compiler.close()
+            self.compiler = None
@@ -0,0 +1,25 @@
+from tlaplus_cli.trace.diff import (
+    DiffSummary,
+    TraceColumns,
+    change_masks,
+    changed_steps,
+    load_columns,
+    summarize_changes,
+)
+from tlaplus_cli.trace.parser import TraceParser, TraceState
+from tlaplus_cli.trace.store import TRACE_DIR, TraceReader, TraceRecorder, TraceWriter
+
+__all__ = [
+    "TRACE_DIR",
+    "DiffSummary",
+    "TraceColumns",
+    "TraceParser",
+    "TraceReader",
+    "TraceRecorder",
+    "TraceState",
+    "TraceWriter",
+    "change_masks",
+    "changed_steps",
+    "load_columns",
+    "summarize_changes",
+]
@@ -0,0 +1,106 @@
+"""Per-step change analysis of a stored trace.
+
+The trace is loaded into one column per variable holding a 64-bit hash of
+the printed value, so comparing states never touches the (possibly huge)
+values themselves. Change masks for all steps are computed column-wise with
+C-level loops (``map`` over arrays, big-integer bit operations) instead of a
+Python loop per step and variable.
+"""
+
+import hashlib
+import itertools
+import operator
+from array import array
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from tlaplus_cli.trace.parser import action_name
+from tlaplus_cli.trace.store import TraceReader
+
+
+def value_hash(value: str) -> int:
+    """64-bit hash of a printed TLA+ value."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+@dataclass
+class TraceColumns:
+    variables: list[str]
+    numbers: "array[int]"
+    actions: list[str]
+    hashes: "dict[str, array[int]]" = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+
+def load_columns(trace: TraceReader) -> TraceColumns:
+    """Read every state once, keeping only value hashes.
+
+    A variable missing from a state (e.g. TLC's explicit ``Stuttering``
+    state) keeps its previous value.
+    """
+    columns = TraceColumns(
+        variables=list(trace.variables),
+        numbers=array("Q"),
+        actions=[],
+        hashes={name: array("Q") for name in trace.variables},
+    )
+    cols = [columns.hashes[name] for name in trace.variables]
+    for i in range(len(trace)):
+        number, label, values = trace.record(i)
+        columns.numbers.append(number)
+        columns.actions.append(action_name(label))
+        for col, value in zip(cols, values, strict=True):
+            col.append(value_hash(value) if value is not None else (col[-1] if col else 0))
+    return columns
+
+
+def change_masks(columns: TraceColumns) -> dict[str, bytes]:
+    """For each variable, a byte per step (state *k* to *k* + 1): 1 if its value changed."""
+    return {name: bytes(map(operator.ne, col[1:], col[:-1])) for name, col in columns.hashes.items()}
+
+
+def _union(masks: Sequence[bytes], steps: int) -> bytes:
+    """Bytewise OR of 0/1 masks, via big-integer arithmetic."""
+    combined = 0
+    for mask in masks:
+        combined |= int.from_bytes(mask, "little")
+    return combined.to_bytes(steps, "little")
+
+
+@dataclass
+class DiffSummary:
+    steps: int
+    stutter_steps: list[int]  # state numbers reached by a step that changed nothing
+    changes: Counter[str]
+    actions: Counter[str]
+
+
+def summarize_changes(columns: TraceColumns, masks: dict[str, bytes]) -> DiffSummary:
+    steps = max(len(columns) - 1, 0)
+    any_change = _union(list(masks.values()), steps)
+    stutters = itertools.compress(columns.numbers[1:], map(operator.not_, any_change))
+    return DiffSummary(
+        steps=steps,
+        stutter_steps=list(stutters),
+        changes=Counter({name: mask.count(1) for name, mask in masks.items()}),
+        actions=Counter(columns.actions[1:]),
+    )
+
+
+def changed_steps(
+    columns: TraceColumns,
+    masks: dict[str, bytes],
+    *,
+    variables: Sequence[str] | None = None,
+    action: str | None = None,
+) -> Iterator[tuple[int, list[str]]]:
+    """Yield (index of the state reached, changed variables) for each step that changed a selected variable."""
+    names = list(variables) if variables else columns.variables
+    selected = _union([masks[n] for n in names], max(len(columns) - 1, 0))
+    for step in itertools.compress(range(len(selected)), selected):
+        if action is not None and columns.actions[step + 1] != action:
+            continue
+        yield step + 1, [n for n in names if masks[n][step]]
@@ -0,0 +1,106 @@
+"""Incremental parser for the counterexample TLC prints to stdout.
+
+A trace looks like::
+
+    State 1: <Initial predicate>
+    /\\ x = 0
+    /\\ q = << [id |-> 1,
+         payload |-> "a"] >>
+
+    State 2: <Send line 12, col 5 to line 14, col 20 of module Queue>
+    ...
+    Back to state 2: <Recv line 16, col 5 to line 18, col 30 of module Queue>
+
+Values that span several lines are kept verbatim (joined with newlines).
+"""
+
+import re
+from dataclasses import dataclass, field
+
+_STATE_RE = re.compile(r"^State (\d+): (.*)$")
+_STUTTER_RE = re.compile(r"^(\d+): (Stuttering)\s*$")
+_BACK_TO_RE = re.compile(r"^Back to state (\d+): ?(.*)$")
+_VAR_RE = re.compile(r"^(?:/\\ )?([A-Za-z_][A-Za-z0-9_]*) = (.*)$")
+_ACTION_RE = re.compile(r"^<([^\s>(]+)")
+INITIAL_ACTION = "Init"
+
+
+def action_name(label: str) -> str:
+    """Action name from a state label (``Init`` for the initial state)."""
+    if label.startswith("<Initial predicate"):
+        return INITIAL_ACTION
+    m = _ACTION_RE.match(label)
+    return m.group(1) if m else label
+
+
+@dataclass
+class TraceState:
+    number: int
+    label: str
+    values: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def action(self) -> str:
+        return action_name(self.label)
+
+
+class TraceParser:
+    """Turn TLC output lines into ``TraceState`` objects, one state at a time.
+
+    ``feed`` returns a state once its block is complete. Only the first trace
+    in the output is parsed. ``back_to`` is set when the trace ends in a
+    lasso (liveness violations).
+    """
+
+    def __init__(self) -> None:
+        self._current: TraceState | None = None
+        self._var: str | None = None
+        self._seen_first = False
+        self.done = False
+        self.back_to: int | None = None
+
+    def feed(self, line: str) -> TraceState | None:
+        line = line.rstrip("\n")
+        if self.done:
+            return None
+        header = _STATE_RE.match(line) or _STUTTER_RE.match(line)
+        if header:
+            return self._start_state(int(header.group(1)), header.group(2))
+        back = _BACK_TO_RE.match(line)
+        if back:
+            return self._end_lasso(int(back.group(1)))
+
+        current = self._current
+        if current is None:
+            return None
+        if not line.strip():
+            return self.flush()
+
+        m = _VAR_RE.match(line)
+        if m and (line.startswith("/\\ ") or not current.values):
+            self._var = m.group(1)
+            current.values[self._var] = m.group(2)
+        elif self._var is not None:
+            current.values[self._var] += "\n" + line
+        return None
+
+    def _start_state(self, number: int, label: str) -> TraceState | None:
+        finished = self.flush()
+        if number == 1 and self._seen_first:
+            self.done = True
+            return finished
+        self._seen_first = True
+        self._current = TraceState(number=number, label=label)
+        return finished
+
+    def _end_lasso(self, number: int) -> TraceState | None:
+        if not self._seen_first:
+            return None
+        self.back_to = number
+        self.done = True
+        return self.flush()
+
+    def flush(self) -> TraceState | None:
+        """Return the state being parsed (if any), e.g. at end of output."""
+        finished, self._current, self._var = self._current, None, None
+        return finished
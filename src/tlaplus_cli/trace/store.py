@@ -0,0 +1,172 @@
+"""Compact on-disk trace store with an offset index for random access.
+
+A store is a directory with three files:
+
+- ``trace.dat``: one zlib-compressed JSON record per state,
+  ``[number, label, [value per variable]]``.
+- ``trace.idx``: little-endian uint64 offsets into ``trace.dat``; entry *i*
+  is where state *i* starts and the last entry is the end of the data.
+- ``trace.json``: metadata (variable names, state count, error, lasso).
+
+States are written as they are parsed and read back through ``mmap``, so
+memory use does not depend on the length of the trace.
+"""
+
+import json
+import mmap
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Self
+
+from tlaplus_cli.tlc.output import TlcOutputParser
+from tlaplus_cli.trace.parser import TraceParser, TraceState
+
+TRACE_DIR = "trace"
+DATA_FILE = "trace.dat"
+INDEX_FILE = "trace.idx"
+META_FILE = "trace.json"
+FORMAT_VERSION = 1
+
+_OFFSET = struct.Struct("<Q")
+
+
+class TraceWriter:
+    """Append states to a new trace store."""
+
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.variables: list[str] = []
+        self._var_index: dict[str, int] = {}
+        self.count = 0
+        self._offset = 0
+        self._data = (directory / DATA_FILE).open("wb")
+        self._index = (directory / INDEX_FILE).open("wb")
+        self._index.write(_OFFSET.pack(0))
+
+    def append(self, state: TraceState) -> None:
+        for name in state.values:
+            if name not in self._var_index:
+                self._var_index[name] = len(self.variables)
+                self.variables.append(name)
+        values: list[str | None] = [None] * len(self.variables)
+        for name, value in state.values.items():
+            values[self._var_index[name]] = value
+        record = zlib.compress(json.dumps([state.number, state.label, values]).encode("utf-8"))
+        self._data.write(record)
+        self._offset += len(record)
+        self._index.write(_OFFSET.pack(self._offset))
+        self.count += 1
+
+    def close(self, **meta: Any) -> None:
+        """Flush the data and write the metadata (extra *meta* keys are stored as-is)."""
+        self._data.close()
+        self._index.close()
+        info = {"format": FORMAT_VERSION, "states": self.count, "variables": self.variables, **meta}
+        (self.directory / META_FILE).write_text(json.dumps(info, indent=2), encoding="utf-8")
+
+
+class TraceRecorder:
+    """Feed TLC output lines; stores the counterexample (if any) under ``<run_dir>/trace``.
+
+    The store is only created once the first trace state appears.
+    """
+
+    def __init__(self, run_dir: Path, spec: str) -> None:
+        self.directory = run_dir / TRACE_DIR
+        self.spec = spec
+        self._parser = TraceParser()
+        self._output = TlcOutputParser()
+        self._writer: TraceWriter | None = None
+
+    def feed(self, line: str) -> None:
+        self._output.feed(line)
+        state = self._parser.feed(line)
+        if state is not None:
+            self._write(state)
+
+    def _write(self, state: TraceState) -> None:
+        if self._writer is None:
+            self._writer = TraceWriter(self.directory)
+        self._writer.append(state)
+
+    def close(self) -> int:
+        """Finish the store. Returns the number of states recorded."""
+        state = self._parser.flush()
+        if state is not None:
+            self._write(state)
+        if self._writer is None:
+            return 0
+        self._writer.close(spec=self.spec, error=self._output.stats.error, back_to=self._parser.back_to)
+        return self._writer.count
+
+
+class TraceReader:
+    """Random access to the states of a trace store."""
+
+    def __init__(self, directory: Path) -> None:
+        meta_path = directory / META_FILE
+        if not meta_path.is_file():
+            msg = f"No trace recorded in {directory.parent}"
+            raise FileNotFoundError(msg)
+        self.directory = directory
+        self.meta: dict[str, Any] = json.loads(meta_path.read_text(encoding="utf-8"))
+        if self.meta.get("format") != FORMAT_VERSION:
+            msg = f"Unsupported trace format in {directory}"
+            raise ValueError(msg)
+        self.variables: list[str] = self.meta["variables"]
+        self._data_file = (directory / DATA_FILE).open("rb")
+        self._index_file = (directory / INDEX_FILE).open("rb")
+        self._data = _map(self._data_file)
+        self._index = _map(self._index_file)
+
+    def __len__(self) -> int:
+        return int(self.meta["states"])
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for m in (self._data, self._index):
+            if isinstance(m, mmap.mmap):
+                m.close()
+        self._data_file.close()
+        self._index_file.close()
+
+    def record(self, i: int) -> tuple[int, str, list[str | None]]:
+        """Raw record of the *i*-th stored state (0-based): (number, label, values by variable index)."""
+        if not 0 <= i < len(self):
+            msg = f"state index {i} out of range (trace has {len(self)} states)"
+            raise IndexError(msg)
+        (start,) = _OFFSET.unpack_from(self._index, i * _OFFSET.size)
+        (end,) = _OFFSET.unpack_from(self._index, (i + 1) * _OFFSET.size)
+        number, label, values = json.loads(zlib.decompress(self._data[start:end]))
+        return number, label, values + [None] * (len(self.variables) - len(values))
+
+    def state(self, i: int) -> TraceState:
+        """The *i*-th stored state (0-based)."""
+        number, label, values = self.record(i)
+        return TraceState(
+            number=number,
+            label=label,
+            values={name: v for name, v in zip(self.variables, values, strict=True) if v is not None},
+        )
+
+    def __iter__(self) -> Iterator[TraceState]:
+        for i in range(len(self)):
+            yield self.state(i)
+
+
+def _map(f: BinaryIO) -> mmap.mmap | bytes:
+    """Memory-map a file read-only (empty files cannot be mapped)."""
+    if Path(f.name).stat().st_size == 0:
+        return b""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
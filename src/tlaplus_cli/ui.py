@@ -4,3 +4,8 @@ import typer
 def warn(message: str) -> None:
     """Print a standardized warning message to stderr."""
     typer.echo(f"⚠ Warning: {message}", err=True)
+
+
+def info(message: str) -> None:
+    """Print a standardized informational message to stderr."""
+    typer.echo(f"→ {message}", err=True)
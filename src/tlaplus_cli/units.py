@@ -0,0 +1,61 @@
+"""Parsing and formatting of human-readable sizes, counts and durations."""
+
+import re
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+_COUNT_RE = re.compile(r"^\s*(\d[\d,]*(?:\.\d+)?)\s*([KMGT]?)\s*$", re.IGNORECASE)
+_COUNT_UNITS = {"": 1, "K": 10**3, "M": 10**6, "G": 10**9, "T": 10**12}
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*$", re.IGNORECASE)
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+def parse_size(text: str) -> int:
+    """Parse a human-readable size such as '2G', '500M' or '1.5GiB' into bytes.
+
+    Raises:
+        ValueError: if *text* is not a valid size.
+    """
+    m = _SIZE_RE.match(text)
+    if not m:
+        msg = f"invalid size: {text!r} (expected e.g. '500M' or '2G')"
+        raise ValueError(msg)
+    return int(float(m.group(1)) * _SIZE_UNITS[m.group(2).upper()])
+
+
+def parse_count(text: str) -> int:
+    """Parse a count such as '500M', '1.5G' or '2,000,000' (decimal suffixes).
+
+    Raises:
+        ValueError: if *text* is not a valid count.
+    """
+    m = _COUNT_RE.match(text)
+    if not m:
+        msg = f"invalid count: {text!r} (expected e.g. '500M' or '2,000,000')"
+        raise ValueError(msg)
+    return int(float(m.group(1).replace(",", "")) * _COUNT_UNITS[m.group(2).upper()])
+
+
+def parse_duration(text: str) -> float:
+    """Parse a duration such as '30d', '12h' or '2w' into seconds.
+
+    Raises:
+        ValueError: if *text* is not a valid duration.
+    """
+    m = _DURATION_RE.match(text)
+    if not m:
+        msg = f"invalid duration: {text!r} (expected e.g. '12h' or '30d')"
+        raise ValueError(msg)
+    return float(m.group(1)) * _DURATION_UNITS[m.group(2).lower()]
+
+
+def format_size(size: int) -> str:
+    """Format a byte count for display, e.g. 12582912 -> '12.0 MiB'."""
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TiB"
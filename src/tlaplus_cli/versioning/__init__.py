@@ -1,7 +1,17 @@
 from tlaplus_cli.versioning.api import fetch_remote_versions
 from tlaplus_cli.versioning.downloader import (
+    DownloadResult,
     download_version,
     download_version_from_url,
+    download_versions,
+    sync_mirror,
+)
+from tlaplus_cli.versioning.gc import (
+    GcEntry,
+    auto_gc,
+    collect_gc_entries,
+    plan_gc,
+    remove_entries,
 )
 from tlaplus_cli.versioning.metadata import (
     _utc_now_iso,
@@ -9,6 +19,7 @@ from tlaplus_cli.versioning.metadata import (
     write_version_metadata,
     write_version_metadata_from_url,
 )
+from tlaplus_cli.versioning.mirror import load_mirror_versions
 from tlaplus_cli.versioning.paths import (
     _migrate_legacy_pin,
     clear_cache,
@@ -26,28 +37,40 @@ from tlaplus_cli.versioning.resolver import (
     resolve_latest_version,
 )
 from tlaplus_cli.versioning.schema import FetchStatus, LocalVersion, RemoteVersion
+from tlaplus_cli.versioning.usage import get_last_used, record_usage
 
 __all__ = [
+    "DownloadResult",
     "FetchStatus",
+    "GcEntry",
     "LocalVersion",
     "RemoteVersion",
     "_migrate_legacy_pin",
     "_utc_now_iso",
+    "auto_gc",
     "clear_cache",
     "clear_pin",
+    "collect_gc_entries",
     "download_version",
     "download_version_from_url",
+    "download_versions",
     "extract_version_from_url",
     "fetch_remote_versions",
     "get_github_cache_file",
+    "get_last_used",
     "get_pinned_path",
     "get_pinned_version_dir",
     "get_tools_dir",
     "is_url",
     "list_local_versions",
+    "load_mirror_versions",
+    "plan_gc",
     "read_version_metadata",
+    "record_usage",
+    "remove_entries",
     "resolve_latest_version",
     "set_pin",
+    "sync_mirror",
     "write_version_metadata",
     "write_version_metadata_from_url",
 ]
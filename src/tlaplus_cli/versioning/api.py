@@ -6,6 +6,7 @@ import requests
 
 from tlaplus_cli.cache.github import load_github_cache, save_github_cache
 from tlaplus_cli.ui import warn
+from tlaplus_cli.versioning.mirror import load_mirror_versions
 from tlaplus_cli.versioning.paths import get_github_cache_file
 from tlaplus_cli.versioning.schema import FetchStatus, RemoteVersion
 
@@ -75,9 +76,19 @@ def _process_remote_versions(
 
 
 def fetch_remote_versions(
-    tags_url: str, releases_url: str, per_page: int = 30
+    tags_url: str, releases_url: str, per_page: int = 30, *, mirror: str | None = None
 ) -> tuple[list[RemoteVersion], FetchStatus]:
-    """Fetch available TLC versions from GitHub API."""
+    """Fetch available TLC versions from GitHub API.
+
+    When *mirror* (a directory or ``file://`` URL) is given, versions are read
+    from its ``versions.json`` index instead and GitHub is never contacted.
+    """
+    if mirror:
+        mirrored = load_mirror_versions(mirror)
+        if mirrored is None:
+            return [], FetchStatus.UNAVAILABLE
+        return mirrored, FetchStatus.MIRROR
+
     cache_file = get_github_cache_file()
 
     # Check cache TTL
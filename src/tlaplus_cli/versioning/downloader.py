@@ -1,4 +1,6 @@
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
 import requests
@@ -9,13 +11,46 @@ from tlaplus_cli.versioning.metadata import (
     write_version_metadata,
     write_version_metadata_from_url,
 )
+from tlaplus_cli.versioning.mirror import (
+    install_local_file,
+    is_file_url,
+    load_mirror_versions,
+    local_path,
+    mirror_jar_relpath,
+    write_mirror_index,
+)
 from tlaplus_cli.versioning.paths import get_tools_dir
 from tlaplus_cli.versioning.resolver import extract_version_from_url
 from tlaplus_cli.versioning.schema import RemoteVersion
 
 
-def _download_jar(url: str, jar_path: Path, label: str) -> None:
-    """Download tla2tools.jar from *url* with a progress bar."""
+@dataclass
+class DownloadResult:
+    target: RemoteVersion
+    version_dir: Path | None = None
+    error: Exception | None = None
+
+
+def _make_progress() -> Progress:
+    return Progress(
+        "[progress.description]{task.description}",
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+    )
+
+
+def _download_jar(url: str, jar_path: Path, label: str, progress: Progress | None = None) -> None:
+    """Download tla2tools.jar from *url* with a progress bar.
+
+    ``file://`` URLs (local mirrors) are installed with a zero-copy link or
+    in-kernel copy instead of being streamed. When *progress* is given the
+    download is added to it as a new task (used for concurrent downloads).
+    """
+    if is_file_url(url):
+        install_local_file(local_path(url), jar_path)
+        return
+
     response = requests.get(
         url,
         stream=True,
@@ -25,20 +60,22 @@ def _download_jar(url: str, jar_path: Path, label: str) -> None:
     response.raise_for_status()
     total = int(response.headers.get("content-length", 0))
 
-    with Progress(
-        "[progress.description]{task.description}",
-        BarColumn(),
-        DownloadColumn(),
-        TransferSpeedColumn(),
-    ) as progress:
-        task = progress.add_task(f"Downloading {label}...", total=total or None)
-        with jar_path.open("wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                progress.update(task, advance=len(chunk))
+    if progress is None:
+        with _make_progress() as own_progress:
+            _write_response(response, jar_path, label, total, own_progress)
+    else:
+        _write_response(response, jar_path, label, total, progress)
+
 
+def _write_response(response: requests.Response, jar_path: Path, label: str, total: int, progress: Progress) -> None:
+    task = progress.add_task(f"Downloading {label}...", total=total or None)
+    with jar_path.open("wb") as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            f.write(chunk)
+            progress.update(task, advance=len(chunk))
 
-def download_version(target: RemoteVersion, *, force: bool = False) -> Path:
+
+def download_version(target: RemoteVersion, *, force: bool = False, progress: Progress | None = None) -> Path:
     """Download a TLC version jar. Returns the version directory path."""
     tools_dir = get_tools_dir()
     version_dir = tools_dir / f"{target.name}-{target.short_sha}"
@@ -53,7 +90,7 @@ def download_version(target: RemoteVersion, *, force: bool = False) -> Path:
     jar_path = version_dir / "tla2tools.jar"
 
     try:
-        _download_jar(target.jar_download_url, jar_path, target.name)
+        _download_jar(target.jar_download_url, jar_path, target.name, progress)
     except (requests.RequestException, OSError):
         shutil.rmtree(version_dir, ignore_errors=True)
         raise
@@ -63,6 +100,31 @@ def download_version(target: RemoteVersion, *, force: bool = False) -> Path:
     return version_dir
 
 
+def download_versions(
+    targets: list[RemoteVersion], *, force: bool = False, max_workers: int = 4
+) -> list[DownloadResult]:
+    """Download several versions concurrently on a bounded thread pool.
+
+    Each worker downloads one jar (shown as its own bar in a shared progress
+    display) and then extracts its metadata, so the ``java -version`` probes
+    run in parallel too. Returns one result per target, in input order.
+    """
+    results = [DownloadResult(target=t) for t in targets]
+    if not results:
+        return results
+
+    workers = max(1, min(max_workers, len(results)))
+    with _make_progress() as progress, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(download_version, r.target, force=force, progress=progress): r for r in results}
+        for future in as_completed(futures):
+            result = futures[future]
+            try:
+                result.version_dir = future.result()
+            except (requests.RequestException, OSError) as e:
+                result.error = e
+    return results
+
+
 def download_version_from_url(url: str) -> Path:
     """Download tla2tools.jar from *url* and store it in a timestamped version directory.
 
@@ -91,3 +153,32 @@ def download_version_from_url(url: str) -> Path:
 
     write_version_metadata_from_url(version_dir, version_name=version_name, tag=tag, url=url)
     return version_dir
+
+
+def sync_mirror(mirror_dir: Path, versions: list[RemoteVersion]) -> list[RemoteVersion]:
+    """Download *versions* into the local mirror at *mirror_dir* and update its index.
+
+    Versions whose jar is already present are not downloaded again. Entries
+    already in the index are preserved. Returns the versions that were
+    downloaded.
+    """
+    mirror_dir.mkdir(parents=True, exist_ok=True)
+    indexed = {(v.name, v.short_sha): v for v in (load_mirror_versions(str(mirror_dir)) or [])}
+
+    fetched = []
+    for v in versions:
+        jar_path = mirror_dir / mirror_jar_relpath(v)
+        if not jar_path.exists():
+            jar_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = jar_path.with_suffix(".part")
+            try:
+                _download_jar(v.jar_download_url, tmp_path, v.name)
+            except (requests.RequestException, OSError):
+                tmp_path.unlink(missing_ok=True)
+                raise
+            tmp_path.replace(jar_path)
+            fetched.append(v)
+        indexed[(v.name, v.short_sha)] = v
+
+    write_mirror_index(mirror_dir, list(indexed.values()))
+    return fetched
@@ -0,0 +1,174 @@
+"""Garbage collection for the local tools cache.
+
+Version sizes are cached in ``tools/.sizes.json`` together with each
+version directory's mtime, so only versions added or changed since the
+last collection are walked.
+"""
+
+import contextlib
+import json
+import shutil
+import time
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from tlaplus_cli.ui import warn
+from tlaplus_cli.units import parse_size
+from tlaplus_cli.versioning.paths import get_pinned_version_dir, get_tools_dir
+from tlaplus_cli.versioning.resolver import list_local_versions
+from tlaplus_cli.versioning.schema import LocalVersion
+from tlaplus_cli.versioning.usage import get_last_used
+
+SIZES_FILE = ".sizes.json"
+
+
+@dataclass
+class GcEntry:
+    version: LocalVersion
+    size: int
+    last_used: float
+    pinned: bool
+
+
+def dir_size(path: Path) -> int:
+    """Return the total size in bytes of all regular files under *path*."""
+    total = 0
+    for f in path.rglob("*"):
+        try:
+            if f.is_file() and not f.is_symlink():
+                total += f.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def version_sizes(versions: Sequence[LocalVersion]) -> dict[Path, int]:
+    """Sizes of *versions*, walking only directories whose mtime differs from the cached one."""
+    sizes_file = get_tools_dir() / SIZES_FILE
+    try:
+        cached = json.loads(sizes_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = {}
+    records: dict[str, list[int]] = {}
+    for lv in versions:
+        try:
+            mtime = lv.path.stat().st_mtime_ns
+        except OSError:
+            continue
+        record = cached.get(lv.path.name) if isinstance(cached, dict) else None
+        if not (isinstance(record, list) and len(record) == 2 and record[1] == mtime):
+            record = [dir_size(lv.path), mtime]
+        records[lv.path.name] = record
+    if records != cached:
+        tmp = sizes_file.with_name(sizes_file.name + ".tmp")
+        with contextlib.suppress(OSError):
+            tmp.write_text(json.dumps(records), encoding="utf-8")
+            tmp.replace(sizes_file)
+    return {lv.path: records[lv.path.name][0] for lv in versions if lv.path.name in records}
+
+
+def collect_gc_entries(versions: Sequence[LocalVersion] | None = None) -> list[GcEntry]:
+    """Return *versions* (default: all installed versions), most recently used first."""
+    versions = list_local_versions() if versions is None else versions
+    pinned_dir = get_pinned_version_dir()
+    pinned = pinned_dir.resolve() if pinned_dir else None
+    sizes = version_sizes(versions)
+    entries = [
+        GcEntry(
+            version=lv,
+            size=sizes.get(lv.path, 0),
+            last_used=get_last_used(lv.path),
+            pinned=pinned is not None and lv.path.resolve() == pinned,
+        )
+        for lv in versions
+    ]
+    entries.sort(key=lambda e: e.last_used, reverse=True)
+    return entries
+
+
+def plan_gc(  # noqa: PLR0913
+    entries: list[GcEntry],
+    *,
+    keep_last: int | None = None,
+    max_size: int | None = None,
+    older_than: float | None = None,
+    now: float | None = None,
+    protect: Collection[Path] = (),
+) -> list[GcEntry]:
+    """Select the versions to evict, least recently used first.
+
+    *entries* must be sorted most recently used first (as returned by
+    ``collect_gc_entries``). The pinned version, the *keep_last* most
+    recently used versions and any directory in *protect* are never evicted. Among the rest, versions unused
+    for more than *older_than* seconds are evicted, then further versions in
+    LRU order until the total cache size is at most *max_size* bytes.
+    """
+    now = time.time() if now is None else now
+    protected = {id(e) for e in entries if e.pinned or e.version.path in protect}
+    if keep_last is not None:
+        protected.update(id(e) for e in entries[:keep_last])
+
+    candidates = [e for e in reversed(entries) if id(e) not in protected]
+    victims: list[GcEntry] = []
+
+    if older_than is not None:
+        victims.extend(e for e in candidates if now - e.last_used > older_than)
+
+    if max_size is not None:
+        chosen = {id(e) for e in victims}
+        remaining = sum(e.size for e in entries) - sum(e.size for e in victims)
+        for e in candidates:
+            if remaining <= max_size:
+                break
+            if id(e) not in chosen:
+                victims.append(e)
+                remaining -= e.size
+
+    if older_than is None and max_size is None and keep_last is not None:
+        victims = candidates
+
+    victims.sort(key=lambda e: e.last_used)
+    return victims
+
+
+def remove_entries(entries: list[GcEntry]) -> int:
+    """Delete the version directories of *entries*. Returns the number of bytes reclaimed."""
+    reclaimed = 0
+    for e in entries:
+        try:
+            shutil.rmtree(e.version.path)
+        except OSError as err:
+            warn(f"Failed to remove {e.version.path.name}: {err}")
+        else:
+            reclaimed += e.size
+    return reclaimed
+
+
+def auto_gc(max_size: str | None, keep_last: int, *, protect: Collection[Path] = ()) -> list[GcEntry]:
+    """Evict versions if the cache exceeds the configured *max_size* threshold.
+
+    Directories in *protect* (e.g. versions that were just installed) are kept.
+    With no more than *keep_last* versions installed, sizes are not even looked up.
+
+    Returns the evicted entries (empty when no threshold is configured or the
+    cache is within budget).
+    """
+    if not max_size:
+        return []
+    try:
+        limit = parse_size(max_size)
+    except ValueError as e:
+        warn(f"Ignoring tools.gc.max_size: {e}")
+        return []
+
+    versions = list_local_versions()
+    if len(versions) <= keep_last:
+        return []  # Nothing could be evicted: skip the size walk.
+    entries = collect_gc_entries(versions)
+    if sum(e.size for e in entries) <= limit:
+        return []
+
+    victims = plan_gc(entries, keep_last=keep_last, max_size=limit, protect=protect)
+    remove_entries(victims)
+    return victims
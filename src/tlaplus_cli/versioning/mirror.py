@@ -0,0 +1,127 @@
+"""Local mirror support: a directory (or ``file://`` URL) holding a version index and jar blobs.
+
+Layout::
+
+    <mirror>/versions.json
+    <mirror>/v1.8.0-5a47802/tla2tools.jar
+    ...
+
+``versions.json`` is a list of objects with the ``RemoteVersion`` fields, where
+``jar`` (a path relative to the mirror root) replaces ``jar_download_url``.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from tlaplus_cli.ui import warn
+from tlaplus_cli.versioning.schema import RemoteVersion
+
+MIRROR_INDEX = "versions.json"
+_COPY_CHUNK = 64 * 1024 * 1024
+
+
+def is_file_url(text: str) -> bool:
+    """Return True if *text* is a ``file://`` URL."""
+    return text.lower().startswith("file://")
+
+
+def local_path(location: str) -> Path:
+    """Return the filesystem path for a directory path or ``file://`` URL."""
+    if is_file_url(location):
+        return Path(url2pathname(urlparse(location).path))
+    return Path(location).expanduser()
+
+
+def mirror_jar_relpath(version: RemoteVersion) -> str:
+    """Relative location of a version's jar inside a mirror."""
+    return f"{version.name}-{version.short_sha}/tla2tools.jar"
+
+
+def load_mirror_versions(location: str) -> list[RemoteVersion] | None:
+    """Read the version index of the mirror at *location*.
+
+    Jar locations are returned as ``file://`` URLs. Returns None if the index
+    is missing or malformed.
+    """
+    root = local_path(location)
+    index = root / MIRROR_INDEX
+    try:
+        with index.open("r", encoding="utf-8") as f:
+            data: list[dict[str, Any]] = json.load(f)
+        return [
+            RemoteVersion(
+                name=item["name"],
+                short_sha=item["short_sha"],
+                full_sha=item["full_sha"],
+                jar_download_url=(root / item["jar"]).absolute().as_uri(),
+                published_at=item.get("published_at", ""),
+                prerelease=bool(item.get("prerelease", False)),
+            )
+            for item in data
+        ]
+    except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+        warn(f"Failed to read mirror index {index}: {e}")
+    return None
+
+
+def write_mirror_index(root: Path, versions: list[RemoteVersion]) -> None:
+    """Write ``versions.json`` for *versions* into the mirror at *root* atomically."""
+    entries = []
+    for v in versions:
+        item = asdict(v)
+        del item["jar_download_url"]
+        item["jar"] = mirror_jar_relpath(v)
+        entries.append(item)
+
+    tmp = root / f".{MIRROR_INDEX}.tmp"
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=2)
+    tmp.replace(root / MIRROR_INDEX)
+
+
+def _copy_file_range(src: Path, dst: Path) -> None:
+    """Copy *src* to *dst* in-kernel (reflink on filesystems that support it)."""
+    with src.open("rb") as fin, dst.open("wb") as fout:
+        remaining = os.fstat(fin.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fin.fileno(), fout.fileno(), min(remaining, _COPY_CHUNK))
+            if copied == 0:
+                # Some filesystems (e.g. procfs, some FUSE mounts) report no progress instead of an error.
+                msg = f"copy_file_range made no progress copying {src}"
+                raise OSError(msg)
+            remaining -= copied
+
+
+def install_local_file(src: Path, dst: Path) -> None:
+    """Place *src* at *dst* without streaming it through Python.
+
+    Tries, in order: a hard link, ``os.copy_file_range`` (which reflinks on
+    btrfs/XFS and copies in-kernel elsewhere) and finally ``shutil.copyfile``
+    (which uses ``sendfile`` where available).
+    """
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        pass
+    else:
+        return
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            _copy_file_range(src, dst)
+        except OSError:
+            with contextlib.suppress(OSError):
+                dst.unlink()
+        else:
+            return
+
+    shutil.copyfile(src, dst)
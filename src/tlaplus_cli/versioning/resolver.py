@@ -10,8 +10,8 @@ _SEMVER_RE = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)")
 
 
 def is_url(text: str) -> bool:
-    """Return True if *text* looks like an HTTP(S) URL."""
-    return text.lower().startswith(("http://", "https://"))
+    """Return True if *text* looks like an HTTP(S) or ``file://`` URL."""
+    return text.lower().startswith(("http://", "https://", "file://"))
 
 
 def extract_version_from_url(url: str) -> str | None:
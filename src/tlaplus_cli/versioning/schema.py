@@ -24,4 +24,5 @@ class FetchStatus(Enum):
     ONLINE = "online"
     CACHED = "cached"
     STALE = "stale"
+    MIRROR = "mirror"
     UNAVAILABLE = "unavailable"
@@ -0,0 +1,31 @@
+"""Per-version usage tracking for the local tools cache."""
+
+import contextlib
+from pathlib import Path
+
+LAST_USED_FILE = "last-used"
+
+
+def record_usage(version_dir: Path) -> None:
+    """Mark *version_dir* as used now.
+
+    The timestamp is the mtime of a marker file, so recording costs a single
+    ``utime``/``open`` call. Failures are ignored: usage tracking must never
+    prevent a run or a build.
+    """
+    with contextlib.suppress(OSError):
+        (version_dir / LAST_USED_FILE).touch()
+
+
+def get_last_used(version_dir: Path) -> float:
+    """Return the last-used timestamp of *version_dir*.
+
+    Falls back to the directory mtime (install time) for versions that were
+    never used, and to 0.0 if the directory cannot be inspected.
+    """
+    for candidate in (version_dir / LAST_USED_FILE, version_dir):
+        try:
+            return candidate.stat().st_mtime
+        except OSError:
+            continue
+    return 0.0
@@ -0,0 +1,3 @@
+from tlaplus_cli.watch.watcher import InotifyWatcher, PollingWatcher, Watcher, create_watcher, debounced
+
+__all__ = ["InotifyWatcher", "PollingWatcher", "Watcher", "create_watcher", "debounced"]
@@ -0,0 +1,224 @@
+"""File watching for ``--watch`` modes: inotify on Linux, mtime polling elsewhere.
+
+A watcher is given files and directories. Directories are watched
+recursively; files are watched through their parent directory. ``wait``
+returns the set of changed paths (possibly empty on timeout), filtered by
+the optional *accept* predicate so editor swap files do not trigger work.
+"""
+
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Protocol
+
+Accept = Callable[[Path], bool]
+
+_IN_MODIFY = 0x2
+_IN_ATTRIB = 0x4
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_ISDIR = 0x40000000
+_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 1 << 16
+
+
+class Watcher(Protocol):
+    def wait(self, timeout: float | None) -> set[Path]:
+        """Block up to *timeout* seconds (forever if None) and return the changed paths."""
+        ...
+
+    def close(self) -> None: ...
+
+
+def _split(paths: Iterable[Path]) -> tuple[list[Path], set[Path]]:
+    """Directories to watch recursively, and individual files."""
+    dirs: list[Path] = []
+    files: set[Path] = set()
+    for p in paths:
+        p = p.resolve()  # noqa: PLW2901
+        if p.is_dir():
+            dirs.append(p)
+        else:
+            files.add(p)
+    return dirs, files
+
+
+class PollingWatcher:
+    """Detect changes by comparing (mtime, size) snapshots every *interval* seconds."""
+
+    def __init__(self, paths: Iterable[Path], *, accept: Accept | None = None, interval: float = 0.25) -> None:
+        self.dirs, self.files = _split(paths)
+        self.accept = accept
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        candidates = [*self.files, *(f for d in self.dirs for f in d.rglob("*"))]
+        snapshot = {}
+        for f in candidates:
+            if self.accept is not None and not self.accept(f):
+                continue
+            with contextlib.suppress(OSError):
+                st = f.stat()
+                if not f.is_dir():
+                    snapshot[f] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def poll(self) -> set[Path]:
+        current = self._scan()
+        changed = {p for p in current.keys() | self._snapshot.keys() if current.get(p) != self._snapshot.get(p)}
+        self._snapshot = current
+        return changed
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self.poll()
+            if changed:
+                return changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher; new subdirectories are picked up as they appear.
+
+    Raises:
+        OSError: if inotify is unavailable (not Linux, no libc, or out of watches).
+    """
+
+    def __init__(self, paths: Iterable[Path], *, accept: Accept | None = None) -> None:
+        if not sys.platform.startswith("linux"):
+            msg = "inotify is only available on Linux"
+            raise OSError(msg)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.accept = accept
+        self._dirs: dict[int, Path] = {}
+        self._recursive: set[Path] = set()
+        dirs, self.files = _split(paths)
+        try:
+            for d in dirs:
+                self._recursive.add(d)
+                self._add_tree(d)
+            for f in self.files:
+                self._add(f.parent)
+        except OSError:
+            self.close()
+            raise
+
+    def _add(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+        self._dirs[wd] = directory
+
+    def _add_tree(self, directory: Path) -> None:
+        self._add(directory)
+        for sub in directory.rglob("*"):
+            if sub.is_dir():
+                self._add(sub)
+
+    def _under_recursive(self, path: Path) -> bool:
+        return any(path == d or d in path.parents for d in self._recursive)
+
+    def _relevant(self, path: Path) -> bool:
+        if not (path in self.files or self._under_recursive(path)):
+            return False
+        return self.accept is None or self.accept(path)
+
+    def _drain(self) -> set[Path]:
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self.fd, _READ_SIZE)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+                raw = data[offset + _EVENT.size : offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    changed.update(self._recursive | self.files)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None or not raw:
+                    continue
+                path = directory / os.fsdecode(raw)
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO) and self._under_recursive(path):
+                        with contextlib.suppress(OSError):
+                            self._add_tree(path)
+                    continue
+                if self._relevant(path):
+                    changed.add(path)
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed = self._drain()
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(paths: Iterable[Path], *, accept: Accept | None = None, poll: bool = False) -> Watcher:
+    """An inotify watcher where possible, else a polling one (always polling with *poll*)."""
+    paths = list(paths)
+    if not poll:
+        try:
+            return InotifyWatcher(paths, accept=accept)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths, accept=accept)
+
+
+def debounced(watcher: Watcher, debounce: float) -> Iterator[set[Path]]:
+    """Yield batches of changes, each closed once *debounce* seconds pass without another change."""
+    while True:
+        changed = watcher.wait(None)
+        if not changed:
+            continue
+        while more := watcher.wait(debounce):
+            changed |= more
+        yield changed
@@ -0,0 +1,134 @@
+import json
+import sys
+
+import pytest
+
+from tlaplus_cli.bench import (
+    BenchResult,
+    BenchSettings,
+    RunMeasurement,
+    Workload,
+    materialize_builtin_workloads,
+    measure_tlc,
+    relative_change,
+    run_benchmarks,
+    select_workloads,
+    summarize,
+)
+from tlaplus_cli.bench.runner import build_bench_command
+from tlaplus_cli.cli import app
+from tlaplus_cli.versioning import LocalVersion
+
+
+def _local(name, path):
+    return LocalVersion(name=name, short_sha="aaaaaaa", path=path)
+
+
+def test_summarize_median_and_mad():
+    summary = summarize([10.0, 12.0, 11.0, 50.0, 9.0])
+    assert summary.median == 11.0
+    assert summary.mad == 1.0
+    assert summary.n == 5
+    assert summary.spread == pytest.approx(1 / 11)
+    assert summarize([]) is None
+
+
+def test_measure_tlc_parses_output(tmp_path):
+    script = "print('1,000 states generated, 400 distinct states found, 0 states left on queue.')"
+    measurement, stats = measure_tlc([sys.executable, "-c", script], tmp_path)
+    assert measurement.exit_code == 0
+    assert measurement.states_generated == 1000
+    assert measurement.distinct_states == 400
+    assert measurement.wall_time > 0
+    assert measurement.states_per_sec == pytest.approx(1000 / measurement.wall_time)
+    assert stats.states_left == 0
+
+
+def test_build_bench_command_fixes_seed_and_workers(tmp_path):
+    workload = Workload(name="queue", spec=tmp_path / "queue.tla", cfg=tmp_path / "queue.cfg")
+    cmd = build_bench_command(
+        tmp_path / "tla2tools.jar", workload, BenchSettings(workers=2, seed=7), ["-Xmx1g"], tmp_path / "meta"
+    )
+    assert cmd[:5] == ["java", "-Xmx1g", "-cp", str(tmp_path / "tla2tools.jar"), "tlc2.TLC"]
+    assert cmd[cmd.index("-workers") + 1] == "2"
+    assert cmd[cmd.index("-seed") + 1] == "7"
+    assert cmd[cmd.index("-config") + 1] == str(tmp_path / "queue.cfg")
+    assert cmd[-1] == "queue.tla"
+
+
+def test_run_benchmarks_round_robin_discards_warmup(mocker, tmp_path):
+    calls = []
+
+    def fake_measure(version, workload, *_args):
+        calls.append(version.name)
+        return RunMeasurement(exit_code=0, wall_time=1.0, states_generated=len(calls))
+
+    mocker.patch("tlaplus_cli.bench.runner._measure", side_effect=fake_measure)
+    versions = [_local("v1.7.0", tmp_path / "a"), _local("v1.8.0", tmp_path / "b")]
+    workload = Workload(name="queue", spec=tmp_path / "queue.tla")
+
+    results = run_benchmarks(versions, [workload], BenchSettings(warmup=1, repeat=2), [])
+
+    assert calls == ["v1.7.0", "v1.8.0"] * 3
+    assert [len(r.runs) for r in results] == [2, 2]
+    assert results[0].values("states_generated") == [3.0, 5.0]
+
+
+def test_materialize_builtin_workloads(tmp_path):
+    workloads = materialize_builtin_workloads(tmp_path)
+    assert {w.name for w in workloads} == {"cli", "queue"}
+    for w in workloads:
+        assert w.spec.is_file()
+        assert w.cfg.is_file()
+    assert (tmp_path / "queue" / "QueueUtils.tla").is_file()
+
+
+def test_select_workloads_unknown(tmp_path):
+    with pytest.raises(ValueError, match="unknown workload"):
+        select_workloads([Workload(name="queue", spec=tmp_path / "q.tla")], ["raft"])
+
+
+def test_bench_cli_reports_and_writes_json(mocker, mock_load_config, make_installed_version, tmp_path, runner):
+    version_dir = make_installed_version("v1.8.0", "aaaaaaa")
+    mocker.patch("tlaplus_cli.cmd.bench.run.load_config", return_value=mock_load_config.return_value)
+    mocker.patch("tlaplus_cli.cmd.bench.run.validate_java_version")
+    mocker.patch(
+        "tlaplus_cli.bench.runner._measure",
+        return_value=RunMeasurement(exit_code=0, wall_time=2.0, states_generated=1000, distinct_states=500),
+    )
+    out = tmp_path / "bench.json"
+
+    result = runner.invoke(
+        app, ["bench", "-V", "v1.8.0", "-w", "queue", "--repeat", "3", "--warmup", "0", "--json", str(out)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "v1.8.0-aaaaaaa" in result.stdout
+    data = json.loads(out.read_text())
+    [entry] = data["results"]
+    assert entry["version"] == version_dir.name
+    assert entry["workload"] == "queue"
+    assert len(entry["runs"]) == 3
+    assert entry["summary"]["states_per_sec"]["median"] == 500.0
+
+
+def test_bench_cli_unknown_version(mocker, mock_load_config, mock_cache, runner):
+    mocker.patch("tlaplus_cli.cmd.bench.run.load_config", return_value=mock_load_config.return_value)
+    mocker.patch("tlaplus_cli.cmd.bench.run.validate_java_version")
+    result = runner.invoke(app, ["bench", "-V", "v9.9.9"])
+    assert result.exit_code == 1
+    assert "not installed" in result.output
+
+
+def test_bench_result_failed():
+    result = BenchResult(version="v", workload="w", runs=[RunMeasurement(exit_code=12, wall_time=1.0)])
+    assert result.failed
+    assert result.summary("wall_time") is None
+
+
+def test_relative_change_interval_brackets_delta():
+    change = relative_change([100.0, 102.0, 98.0, 101.0], [120.0, 118.0, 123.0, 121.0])
+    assert change.delta == pytest.approx(120.5 / 100.5 - 1)
+    assert change.low <= change.delta <= change.high
+    assert change.low > 0
+    assert relative_change([], [1.0]) is None
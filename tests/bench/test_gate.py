@@ -0,0 +1,154 @@
+import json
+import subprocess
+
+import pytest
+
+from tlaplus_cli.bench import (
+    BenchResult,
+    BenchSettings,
+    RunMeasurement,
+    baseline_results,
+    check_metric,
+    gate_results,
+    load_baseline,
+    parse_tolerances,
+    results_to_json,
+)
+from tlaplus_cli.cli import app
+
+
+def _runs(wall_times, states=1000, distinct=500):
+    return [
+        RunMeasurement(exit_code=0, wall_time=t, states_generated=states, distinct_states=distinct) for t in wall_times
+    ]
+
+
+def _baseline_file(path, version, wall_times, distinct=500):
+    results = [BenchResult(version=version, workload="queue", runs=_runs(wall_times, distinct=distinct))]
+    path.write_text(json.dumps(results_to_json(results, BenchSettings(workers=2, seed=3))))
+    return path
+
+
+def test_check_metric_noise_widens_the_threshold():
+    quiet = check_metric("w", "wall_time", [10.0] * 5, [11.5] * 5, tolerance=0.1, mad_factor=3.0)
+    assert quiet.delta == pytest.approx(0.15)
+    assert quiet.allowed == pytest.approx(0.1)
+    assert quiet.regressed
+
+    noisy = check_metric("w", "wall_time", [8.0, 10.0, 12.0, 10.0, 9.0], [11.5] * 5, tolerance=0.1, mad_factor=3.0)
+    assert noisy.allowed > 0.4
+    assert not noisy.regressed
+
+
+def test_check_metric_direction():
+    faster = check_metric("w", "states_per_sec", [100.0] * 3, [150.0] * 3, tolerance=0.1, mad_factor=3.0)
+    assert faster.improved
+    assert not faster.regressed
+    slower = check_metric("w", "states_per_sec", [100.0] * 3, [50.0] * 3, tolerance=0.1, mad_factor=3.0)
+    assert slower.regressed
+    assert check_metric("w", "wall_time", [], [1.0], tolerance=0.1, mad_factor=3.0) is None
+
+
+def test_gate_results_flags_doubled_state_space():
+    base = {"queue": BenchResult(version="v", workload="queue", runs=_runs([1.0] * 3))}
+    candidate = [BenchResult(version="v", workload="queue", runs=_runs([1.0] * 3, distinct=1000))]
+
+    checks = gate_results(base, candidate, {"distinct_states": 0.05, "wall_time": 0.1}, mad_factor=3.0)
+
+    assert [(c.metric, c.regressed) for c in checks] == [("distinct_states", True), ("wall_time", False)]
+
+
+def test_parse_tolerances():
+    defaults = {"wall_time": 0.1}
+    assert parse_tolerances(["wall_time=20%", "distinct_states=0"], defaults) == {
+        "wall_time": 0.2,
+        "distinct_states": 0.0,
+    }
+    with pytest.raises(ValueError, match="METRIC one of"):
+        parse_tolerances(["rss=0.1"], defaults)
+    with pytest.raises(ValueError, match="not a number"):
+        parse_tolerances(["wall_time=fast"], defaults)
+
+
+def test_baseline_prefers_the_same_version(tmp_path):
+    data = {
+        "results": [
+            {"version": "old", "workload": "queue", "runs": [{"exit_code": 0, "wall_time": 1.0}]},
+            {"version": "new", "workload": "queue", "runs": [{"exit_code": 0, "wall_time": 2.0}]},
+        ]
+    }
+    assert baseline_results(data, "new")["queue"].version == "new"
+    assert baseline_results(data, "other")["queue"].version == "old"
+
+
+def test_load_baseline_from_git_ref(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run(["git", "init", "-q"], check=True)
+    _baseline_file(tmp_path / "bench-baseline.json", "v1", [1.0])
+    subprocess.run(["git", "add", "bench-baseline.json"], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "baseline"], check=True)
+    (tmp_path / "bench-baseline.json").unlink()
+
+    assert load_baseline("HEAD", "bench-baseline.json")["settings"]["seed"] == 3
+    with pytest.raises(ValueError, match=r"cannot read baseline HEAD:missing\.json"):
+        load_baseline("HEAD:missing.json", "bench-baseline.json")
+    (tmp_path / "bad.json").write_text("[]")
+    with pytest.raises(ValueError, match="not a tla bench JSON file"):
+        load_baseline(str(tmp_path / "bad.json"), "bench-baseline.json")
+
+
+@pytest.fixture
+def gate_env(mocker, mock_load_config, make_installed_version):
+    version_dir = make_installed_version("v1.8.0", "aaaaaaa")
+    mocker.patch("tlaplus_cli.cmd.bench.gate.load_config", return_value=mock_load_config.return_value)
+    mocker.patch("tlaplus_cli.cmd.bench.gate.validate_java_version")
+    return version_dir
+
+
+def test_gate_cli_passes_within_tolerance(gate_env, mocker, runner, tmp_path):
+    baseline = _baseline_file(tmp_path / "base.json", gate_env.name, [2.0, 2.1, 1.9])
+    measure = mocker.patch(
+        "tlaplus_cli.bench.runner._measure",
+        return_value=RunMeasurement(exit_code=0, wall_time=2.05, states_generated=1000, distinct_states=500),
+    )
+
+    result = runner.invoke(
+        app,
+        ["bench", "gate", "-b", str(baseline), "-V", "v1.8.0", "--repeat", "3", "--warmup", "0"],
+        env={"COLUMNS": "200"},
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Gate passed: 3 check(s) within tolerance." in result.stdout
+    settings = measure.call_args[0][2]
+    assert (settings.workers, settings.seed) == (2, 3)
+
+
+def test_gate_cli_fails_after_confirming_a_regression(gate_env, mocker, runner, tmp_path):
+    baseline = _baseline_file(tmp_path / "base.json", gate_env.name, [1.0, 1.0, 1.0])
+    measure = mocker.patch(
+        "tlaplus_cli.bench.runner._measure",
+        return_value=RunMeasurement(exit_code=0, wall_time=2.0, states_generated=1000, distinct_states=500),
+    )
+    out = tmp_path / "new.json"
+
+    result = runner.invoke(
+        app,
+        ["bench", "gate", "-b", str(baseline), "-V", "v1.8.0", "-n", "3", "--warmup", "0", "--json", str(out)],
+        env={"COLUMNS": "200"},
+    )
+
+    assert result.exit_code == 1
+    assert measure.call_count == 6
+    assert "Re-measuring queue to confirm" in result.stdout
+    assert "Regression: queue wall_time +100.0% (allowed ±10.0%)" in result.output
+    assert "Regression: queue states_per_sec -50.0%" in result.output
+    assert "Gate failed: 2 regression(s), 0 failed workload(s)." in result.output
+    assert len(json.loads(out.read_text())["results"][0]["runs"]) == 6
+
+
+def test_gate_cli_bad_baseline(gate_env, runner, tmp_path):
+    result = runner.invoke(app, ["bench", "gate", "-b", str(tmp_path / "nope"), "-V", "v1.8.0"])
+    assert result.exit_code == 1
+    assert "Error: cannot read baseline" in result.output
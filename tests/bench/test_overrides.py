@@ -0,0 +1,169 @@
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tlaplus_cli.bench.overrides import (
+    harness_source,
+    java_value,
+    load_fixtures,
+    override_classes,
+    tla_harness,
+    tla_value,
+)
+from tlaplus_cli.cli import app
+from tlaplus_cli.config.schema import OverrideBenchCase
+
+FIXTURES = """\
+benchmarks:
+  - module: FastSets
+    operator: Union2
+    inputs:
+      - [{set: [1, 2, 3]}, {range: [2, 10]}]
+      - [{set: []}, {set: ["a"]}]
+"""
+WIDE = {"COLUMNS": "200"}
+
+
+@pytest.mark.parametrize(
+    ("value", "java", "tla"),
+    [
+        (3, "IntValue.gen(3)", "3"),
+        (True, "BoolValue.ValTrue", "TRUE"),
+        ('a"b', 'new StringValue("a\\"b")', '"a\\"b"'),
+        ([1, "x"], 'new TupleValue(new Value[] {IntValue.gen(1), new StringValue("x")})', '<<1, "x">>'),
+        ({"set": [1]}, "new SetEnumValue(new Value[] {IntValue.gen(1)}, false)", "{1}"),
+        ({"range": [1, 5]}, "new IntervalValue(1, 5)", "1..5"),
+        (
+            {"a": 1},
+            'new RecordValue(new UniqueString[] {UniqueString.uniqueStringOf("a")}, '
+            "new Value[] {IntValue.gen(1)}, false)",
+            "[a |-> 1]",
+        ),
+    ],
+)
+def test_fixture_values(value, java, tla):
+    assert java_value(value) == java
+    assert tla_value(value) == tla
+
+
+def test_fixture_values_reject_unsupported():
+    with pytest.raises(ValueError, match="unsupported fixture value"):
+        java_value(1.5)
+    with pytest.raises(ValueError, match="unsupported fixture value"):
+        tla_value({})
+
+
+def test_load_fixtures(tmp_path):
+    path = tmp_path / "bench.yaml"
+    path.write_text(FIXTURES)
+    fixtures = load_fixtures(path)
+    assert [len(c.inputs) for c in fixtures.benchmarks] == [2]
+
+    path.write_text("benchmarks: [{module: X}]")
+    with pytest.raises(ValueError, match="Invalid benchmark fixtures"):
+        load_fixtures(path)
+
+
+def test_harness_source_calls_each_input():
+    case = OverrideBenchCase(module="FastSets", operator="Union2", inputs=[[1, 2], [{"set": []}, 3]])
+    source = harness_source([case])
+    assert "public final class TlaModulesBench" in source
+    assert 'bench(classes, "FastSets", "Union2", 0, new Object[] {IntValue.gen(1), IntValue.gen(2)}' in source
+    assert 'bench(classes, "FastSets", "Union2", 1, new Object[] {new SetEnumValue(new Value[] {}, false)' in source
+
+
+def test_tla_harness_applies_operator_n_times():
+    case = OverrideBenchCase(module="FastSets", operator="Union2")
+    module = tla_harness(case, [{"set": [1]}, 2], 500)
+    assert "EXTENDS FastSets, Sequences" in module
+    assert "BenchIn1 == {1}" in module
+    assert "ASSUME \\A bench_i \\in 1..500 : Len(<<Union2(BenchIn1, BenchIn2)>>) = 1" in module
+    assert "Len(<<Zero>>)" in tla_harness(OverrideBenchCase(module="Sequences", operator="Zero"), [], 1)
+    assert "EXTENDS Sequences\n" in tla_harness(OverrideBenchCase(module="Sequences", operator="Zero"), [], 1)
+
+
+def test_override_classes(tmp_path):
+    (tmp_path / "com" / "example").mkdir(parents=True)
+    (tmp_path / "com" / "example" / "Ops.class").write_bytes(b"")
+    (tmp_path / "com" / "example" / "Ops$1.class").write_bytes(b"")
+    (tmp_path / "META-INF" / "versions").mkdir(parents=True)
+    (tmp_path / "META-INF" / "versions" / "X.class").write_bytes(b"")
+    assert sorted(override_classes(tmp_path)) == ["com.example.Ops", "com.example.Ops$1"]
+
+
+@pytest.fixture
+def override_project(mocker, tmp_path, base_settings):
+    project = tmp_path / "project"
+    modules = project / "modules"
+    modules.mkdir(parents=True)
+    (modules / "FastSets.java").write_text("class FastSets {}")
+    (modules / "FastSets.tla").write_text("---- MODULE FastSets ----\n====\n")
+    (modules / "bench.yaml").write_text(FIXTURES)
+    pinned = tmp_path / "tools" / "v1.8.0"
+    pinned.mkdir(parents=True)
+    (pinned / "tla2tools.jar").write_bytes(b"fake")
+    mocker.patch("tlaplus_cli.tlc.compiler.load_config", return_value=base_settings)
+    mocker.patch("tlaplus_cli.cmd.modules.bench.load_config", return_value=base_settings)
+    mocker.patch("tlaplus_cli.tlc.compiler.get_pinned_version_dir", return_value=pinned)
+    return project
+
+
+def fake_toolchain(calls):
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd[0] == "javac":
+            out = cmd[cmd.index("-d") + 1]
+            (Path(out) / "FastSets.class").write_bytes(b"")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+        if "TlaModulesBench" in cmd:
+            lines = [
+                {"module": "FastSets", "operator": "Union2", "input": 0, "ns_per_op": [40, 42, 41], "bytes_per_op": 96},
+                {"module": "FastSets", "operator": "Union2", "input": 1, "error": "java.lang.ClassCastException"},
+            ]
+            return subprocess.CompletedProcess(cmd, 0, "\n".join(map(json.dumps, lines)), "")
+        return subprocess.CompletedProcess(cmd, 0, "Model checking completed.", "")
+
+    return run
+
+
+def test_modules_bench(mocker, override_project, tmp_path, runner):
+    calls = []
+    mocker.patch("tlaplus_cli.tlc.compiler.subprocess.run", side_effect=fake_toolchain(calls))
+    out = tmp_path / "results.json"
+
+    result = runner.invoke(
+        app, ["modules", "bench", str(override_project), "--rounds", "3", "--json", str(out)], env=WIDE
+    )
+
+    assert result.exit_code == 1, result.output
+    assert "FastSets!Union2" in result.stdout
+    assert "ClassCastException" in result.stdout
+    harness = next(c for c in calls if "TlaModulesBench" in c)
+    assert harness[-4:] == ["500", "1000", "3", "FastSets"]
+    tlc = [c for c in calls if "tlc2.TLC" in c]
+    assert len(tlc) == 2 * 2 * 2
+    assert not any(str(override_project / "classes") in part for part in tlc[0][tlc[0].index("-cp") + 1].split(":"))
+    assert any(a.startswith("-DTLA-Library=") and str(override_project / "modules") in a for a in tlc[0])
+    rows = json.loads(out.read_text())
+    assert rows[0]["java_ns_per_op"] == 41
+    assert rows[0]["bytes_per_op"] == 96
+    assert rows[0]["tla_ns_per_op"] is not None
+    assert rows[1]["error"] == "java.lang.ClassCastException"
+
+
+def test_modules_bench_no_tla(mocker, override_project, runner):
+    calls = []
+    mocker.patch("tlaplus_cli.tlc.compiler.subprocess.run", side_effect=fake_toolchain(calls))
+    result = runner.invoke(app, ["modules", "bench", str(override_project), "--no-tla"], env=WIDE)
+    assert "FastSets!Union2" in result.stdout
+    assert not any("tlc2.TLC" in c for c in calls)
+
+
+def test_modules_bench_requires_fixtures(mocker, override_project, runner):
+    (override_project / "modules" / "bench.yaml").unlink()
+    mocker.patch("tlaplus_cli.tlc.compiler.subprocess.run", side_effect=fake_toolchain([]))
+    result = runner.invoke(app, ["modules", "bench", str(override_project)])
+    assert result.exit_code == 1
+    assert "No bench.yaml found" in result.output
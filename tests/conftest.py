@@ -15,6 +15,36 @@ def fixtures_dir():
     return FIXTURES_DIR
 
 
+@pytest.fixture(autouse=True)
+def isolated_run_dirs(mocker, tmp_path):
+    """Keep per-run TLC metadirs out of the real user cache."""
+    mocker.patch("tlaplus_cli.tlc.rundir.cache_dir", return_value=tmp_path / "run-cache")
+
+
+@pytest.fixture(autouse=True)
+def isolated_plan_cache(mocker, tmp_path):
+    """Keep cached launch plans out of the real user cache."""
+    mocker.patch("tlaplus_cli.tlc.plan_cache.cache_dir", return_value=tmp_path / "plan-cache")
+
+
+@pytest.fixture(autouse=True)
+def isolated_history(mocker, tmp_path):
+    """Keep the run history database out of the real user cache."""
+    mocker.patch("tlaplus_cli.history.store.cache_dir", return_value=tmp_path / "history")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cpu_leases(mocker, tmp_path):
+    """Keep CPU leases out of the real user cache."""
+    mocker.patch("tlaplus_cli.tlc.affinity.cache_dir", return_value=tmp_path / "cpu-leases")
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_queue(mocker, tmp_path):
+    """Keep the job queue out of the real user cache."""
+    mocker.patch("tlaplus_cli.queue.store.cache_dir", return_value=tmp_path / "cache")
+
+
 @pytest.fixture
 def runner():
     return CliRunner()
@@ -39,6 +69,8 @@ def base_settings():
         tlc={
             "java_class": "tlc2.TLC",
             "overrides_class": "tlc2.overrides.TLCOverrides",
+            # Recording history streams TLC's output; tests of the history enable it.
+            "history": False,
         },
         java={"min_version": 11, "opts": []},
     )
@@ -91,3 +123,18 @@ def java_available(mocker):
 def javac_available(mocker):
     """Mock shutil.which to find 'javac'."""
     return mocker.patch("shutil.which", side_effect=lambda x: "/usr/bin/javac" if x == "javac" else None)
+
+
+@pytest.fixture
+def mock_tlc_env(mocker, tmp_path, base_settings):
+    mocker.patch("tlaplus_cli.tlc.runner.load_config", return_value=base_settings)
+    mocker.patch("tlaplus_cli.tlc.runner.validate_java_version")
+
+    pinned_dir = (tmp_path / "tools" / "v1.8.0").absolute()
+    pinned_dir.mkdir(parents=True)
+    (pinned_dir / "tla2tools.jar").write_bytes(b"fake")
+    mocker.patch("tlaplus_cli.tlc.compiler.get_pinned_version_dir", return_value=pinned_dir)
+
+    mock_run = mocker.patch("tlaplus_cli.tlc.runner.subprocess.run")
+    mock_run.return_value.returncode = 0
+    return mock_run
@@ -0,0 +1,160 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.coverage import ActionKey, CoverageStore, coverage_delta, open_store, parse_coverage, record_coverage
+
+COVERAGE_OUTPUT = """\
+Starting... (2024-09-01 12:00:00)
+The coverage statistics at 2024-09-01 12:01:00
+<Init line 10, col 1 to line 10, col 4 of module Queue>: 1:1
+  line 11, col 5 to line 11, col 14 of module Queue: 1
+End of statistics.
+The coverage statistics at 2024-09-01 12:02:00
+<Init line 10, col 1 to line 10, col 4 of module Queue>: 1:1
+  line 11, col 5 to line 11, col 14 of module Queue: 1
+<Send line 13, col 1 to line 13, col 4 of module Queue>: 5:20
+  line 14, col 5 to line 14, col 20 of module Queue: 20
+  |line 15, col 8 to line 15, col 12 of module Queue: 40:120
+  ||line 15, col 8 to line 15, col 12 of module Queue: 2
+<Drop line 17, col 1 to line 17, col 4 of module Queue>: 0:0
+  line 18, col 5 to line 18, col 10 of module Queue: 0
+<TypeOK line 20, col 1 to line 20, col 6 of module Queue>
+  line 21, col 5 to line 21, col 30 of module Queue: 6
+End of statistics.
+Model checking completed. No error has been found.
+"""
+
+
+@pytest.fixture(autouse=True)
+def coverage_cache(mocker, tmp_path):
+    mocker.patch("tlaplus_cli.coverage.store.cache_dir", return_value=tmp_path / "cache")
+    mocker.patch("tlaplus_cli.coverage.store.current_commit", return_value="abc1234")
+
+
+@pytest.fixture
+def spec(tmp_path):
+    spec = tmp_path / "Queue.tla"
+    spec.write_text("---- MODULE Queue ----\n====\n")
+    return spec
+
+
+def test_parse_coverage_keeps_last_block():
+    report = parse_coverage(COVERAGE_OUTPUT)
+
+    assert report.actions[ActionKey("Queue", "Send", 13, 1)] == (5, 20)
+    assert report.actions[ActionKey("Queue", "Drop", 17, 1)] == (0, 0)
+    assert not any(key.name == "TypeOK" for key in report.actions)
+    nested = [v for k, v in report.expressions.items() if k.action == "Send" and k.line == 15]
+    assert nested == [(42, 120)]
+    assert any(k.action == "TypeOK" for k in report.expressions)
+
+
+def test_parse_coverage_ignores_incomplete_block():
+    truncated = COVERAGE_OUTPUT.split("<Send", maxsplit=1)[0]
+    report = parse_coverage(truncated)
+    assert list(report.actions) == [ActionKey("Queue", "Init", 10, 1)]
+    assert parse_coverage("no coverage here") is None
+
+
+def test_store_accumulates_runs_and_reloads(spec):
+    report = parse_coverage(COVERAGE_OUTPUT)
+    record_coverage(spec, report)
+    other = parse_coverage(COVERAGE_OUTPUT.replace("<Drop line 17, col 1 to line 17, col 4 of module Queue>: 0:0", ""))
+    other.actions[ActionKey("Queue", "Recv", 30, 1)] = (3, 3)
+    store = record_coverage(spec, other)
+
+    reloaded = open_store("Queue")
+    assert reloaded.runs == 2
+    counts = reloaded.action_counts()
+    assert counts[ActionKey("Queue", "Send", 13, 1)] == (10, 40)
+    assert counts[ActionKey("Queue", "Recv", 30, 1)] == (3, 3)
+    assert [str(k) for k in reloaded.cold_actions()] == ["Queue!Drop"]
+    assert reloaded.total_evaluations() == store.total_evaluations() == 2 * (1 + 20 + 42 + 0 + 6)
+    top, count, cost = reloaded.hot_expressions(1)[0]
+    assert (top.line, count, cost) == (15, 84, 240)
+
+
+def test_concurrent_merges_keep_every_run(spec):
+    report = parse_coverage(COVERAGE_OUTPUT)
+    threads = [threading.Thread(target=record_coverage, args=(spec, report)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    store = open_store("Queue")
+    assert store.runs == 8
+    assert store.action_counts()[ActionKey("Queue", "Send", 13, 1)] == (40, 160)
+    assert sorted(p.name for p in store.directory.iterdir()) == [".lock", "counters.bin", "keys.json"]
+
+
+def test_store_rejects_corrupt_counters(spec):
+    store = record_coverage(spec, parse_coverage(COVERAGE_OUTPUT))
+    (store.directory / "counters.bin").write_bytes(b"\0" * 8)
+    with pytest.raises(ValueError, match="Corrupt coverage store"):
+        CoverageStore(store.directory)
+
+
+def test_coverage_delta_matches_actions_by_name(spec):
+    report = parse_coverage(COVERAGE_OUTPUT)
+    old = record_coverage(spec, report, report, commit="old")
+    moved = parse_coverage(COVERAGE_OUTPUT.replace("line 13, col 1 to line 13", "line 33, col 1 to line 33"))
+    moved.actions[ActionKey("Queue", "Send", 33, 1)] = (5, 30)
+    new = record_coverage(spec, moved, commit="new")
+
+    deltas = {d.action: d for d in coverage_delta(old, new)}
+    assert deltas["Queue!Send"].old == 20
+    assert deltas["Queue!Send"].new == 30
+    assert deltas["Queue!Send"].change == pytest.approx(0.5)
+
+
+def test_tlc_coverage_merges_into_store(mocker, mock_tlc_env, spec, runner):
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = iter(COVERAGE_OUTPUT.splitlines(keepends=True))
+    proc.returncode = 0
+    popen = mocker.patch("tlaplus_cli.tlc.runner.subprocess.Popen", return_value=proc)
+
+    result = runner.invoke(app, ["tlc", str(spec), "--coverage", "1"])
+
+    assert result.exit_code == 0, result.output
+    cmd = popen.call_args.args[0]
+    assert cmd[cmd.index("-coverage") + 1] == "1"
+    assert "Coverage merged" in result.output
+    assert open_store("Queue", "abc1234").runs == 1
+
+
+def test_coverage_import_show_and_diff(spec, tmp_path, runner):
+    logs = []
+    for i in range(3):
+        log = tmp_path / f"run{i}.log"
+        log.write_text(COVERAGE_OUTPUT)
+        logs.append(str(log))
+    empty = tmp_path / "empty.log"
+    empty.write_text("nothing\n")
+
+    result = runner.invoke(app, ["coverage", "import", str(spec), *logs, str(empty)])
+    assert result.exit_code == 0, result.output
+    assert "Skipping" in result.stdout
+    assert "now covers 3 runs" in result.stdout
+
+    result = runner.invoke(app, ["coverage", "show", "Queue", "--top", "2"])
+    assert result.exit_code == 0, result.output
+    assert "Runs:        3" in result.stdout
+    assert "Never enabled in 3 runs: Queue!Drop" in result.stdout
+    assert "Queue:15:8-15:12" in result.stdout
+
+    runner.invoke(app, ["coverage", "import", str(spec), logs[0], "--commit", "next"])
+    result = runner.invoke(app, ["coverage", "diff", "Queue", "abc1234", "next"])
+    assert result.exit_code == 0, result.output
+    assert "Queue!Send" in result.stdout
+    assert "Evaluations per run: 69 → 69" in result.stdout
+
+
+def test_coverage_show_without_data(runner):
+    result = runner.invoke(app, ["coverage", "show", "Missing"])
+    assert result.exit_code == 1
+    assert "No coverage recorded for Missing" in result.output
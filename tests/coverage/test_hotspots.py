@@ -0,0 +1,102 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.coverage import SourceMap, annotate_module, parse_coverage, rank_hotspots, speedscope_profile
+
+SPEC = """\
+---- MODULE Sets ----
+EXTENDS Naturals, FiniteSets
+VARIABLE s
+Init == s = {}
+Next == \\E t \\in SUBSET (1..4) :
+          /\\ Cardinality(t) > Cardinality(s)
+          /\\ s' = t
+====
+"""
+
+OUTPUT = """\
+The coverage statistics at 2024-09-01 12:00:00
+<Init line 4, col 1 to line 4, col 4 of module Sets>: 1:1
+  line 4, col 9 to line 4, col 14 of module Sets: 1
+<Next line 5, col 1 to line 5, col 4 of module Sets>: 15:80
+  line 5, col 9 to line 7, col 19 of module Sets: 16
+  |line 5, col 18 to line 5, col 30 of module Sets: 16:256
+  |line 6, col 14 to line 6, col 44 of module Sets: 256
+  ||line 6, col 14 to line 6, col 27 of module Sets: 256
+  line 1, col 1 to line 1, col 5 of module Naturals: 3
+End of statistics.
+"""
+
+
+@pytest.fixture(autouse=True)
+def coverage_cache(mocker, tmp_path):
+    mocker.patch("tlaplus_cli.coverage.store.cache_dir", return_value=tmp_path / "cache")
+    mocker.patch("tlaplus_cli.coverage.store.current_commit", return_value="abc1234")
+
+
+@pytest.fixture
+def sources(tmp_path):
+    (tmp_path / "Sets.tla").write_text(SPEC)
+    return SourceMap([tmp_path])
+
+
+def test_rank_hotspots_maps_to_source(sources):
+    spots = rank_hotspots(parse_coverage(OUTPUT), sources, top=3)
+
+    assert (spots[0].location.line, spots[0].location.col) == (5, 18)
+    assert spots[0].source == "SUBSET (1..4)"
+    assert spots[0].weight == 16 + 256
+    assert spots[1].source == "Cardinality(t) > Cardinality(s)"
+
+
+def test_snippet_joins_multi_line_expressions_and_misses_library_modules(sources):
+    report = parse_coverage(OUTPUT)
+    by_line = {(k.module, k.line, k.col): k for k in report.expressions}
+    assert sources.snippet(by_line[("Sets", 5, 9)]).startswith("\\E t \\in SUBSET (1..4) : /\\ Cardinality(t)")
+    assert sources.snippet(by_line[("Naturals", 1, 1)]) is None
+
+
+def test_annotate_module_takes_max_evaluations_per_line(sources):
+    lines = annotate_module(parse_coverage(OUTPUT), sources, "Sets")
+
+    assert len(lines) == SPEC.count("\n")
+    assert (lines[5].evaluations, lines[5].cost) == (256, 0)
+    assert (lines[4].evaluations, lines[4].cost) == (16, 256)
+    assert lines[2].evaluations == 0
+    assert annotate_module(parse_coverage(OUTPUT), sources, "Naturals") is None
+
+
+def test_speedscope_profile_is_weighted_by_evaluations(sources):
+    profile = speedscope_profile(parse_coverage(OUTPUT), sources, "Sets.tla")
+
+    frames = profile["shared"]["frames"]
+    sampled = profile["profiles"][0]
+    assert sampled["type"] == "sampled"
+    assert sampled["endValue"] == sum(sampled["weights"]) == 1 + 16 + 16 + 256 + 256 + 3
+    assert len(sampled["samples"]) == len(sampled["weights"])
+    assert {frames[stack[0]]["name"] for stack in sampled["samples"]} == {"Init", "Next"}
+    assert frames[sampled["samples"][0][1]]["line"] == 4
+
+
+def test_tlc_profile_spec(mocker, mock_tlc_env, tmp_path, runner):
+    spec = tmp_path / "Sets.tla"
+    spec.write_text(SPEC)
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = iter(OUTPUT.splitlines(keepends=True))
+    proc.returncode = 0
+    popen = mocker.patch("tlaplus_cli.tlc.runner.subprocess.Popen", return_value=proc)
+    out = tmp_path / "profile.speedscope.json"
+
+    result = runner.invoke(app, ["tlc", str(spec), "--speedscope", str(out)])
+
+    assert result.exit_code == 0, result.output
+    cmd = popen.call_args.args[0]
+    assert cmd[cmd.index("-coverage") + 1] == "1"
+    assert "Expression hot spots" in result.stdout
+    assert "SUBSET (1..4)" in result.stdout
+    assert "7 |           /\\ s' = t" in result.stdout
+    assert json.loads(out.read_text())["profiles"][0]["type"] == "sampled"
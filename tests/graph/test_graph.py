@@ -0,0 +1,138 @@
+import itertools
+import threading
+from array import array
+from pathlib import Path
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.graph import GraphDump, GraphReader, GraphWriter, compute_stats, convert_dot, scc_sizes
+
+# 1 -> 2 -> 3 -> 2 (cycle {2, 3}), 1 -> 4, 4 -> 4 (self-loop)
+DOT = """\
+strict digraph DiskGraph {
+nodesep=0.35
+subgraph cluster_graph {
+color="white"
+1 [label="/\\\\ x = 0",style = filled]
+1 -> 2 [label="Inc",color="black",fontcolor="black"];
+2 [label="/\\\\ x = 1"];
+1 -> -4 [label="Reset",color="black",fontcolor="black"];
+-4 [label="/\\\\ x = 9"];
+2 -> 3 [label="Inc",color="black",fontcolor="black"];
+3 [label="/\\\\ x = 2"];
+3 -> 2 [label="Dec",color="black",fontcolor="black"];
+-4 -> -4 [label="Reset",color="black",fontcolor="black"];
+}
+}
+"""
+
+
+@pytest.fixture
+def graph_file(tmp_path):
+    path = tmp_path / "out.bin"
+    writer = GraphWriter(path)
+    convert_dot(DOT.splitlines(keepends=True), writer)
+    writer.close(spec="Counter.tla")
+    return path
+
+
+def test_convert_dot(graph_file):
+    with GraphReader(graph_file) as graph:
+        assert graph.node_count == 4
+        assert graph.edge_count == 5
+        assert graph.actions == ["Inc", "Reset", "Dec"]
+        assert list(graph.nodes()) == [(1, 0), (2, 1), (-4, 1), (3, 2)]
+        assert next(graph.edges()) == (0, 1, 0)
+
+
+def test_writer_ids_survive_table_growth(tmp_path):
+    # Fingerprints that differ only in their high bits, across several table resizes.
+    fingerprints = [(i << 40) - (1 << 62) for i in range(5000)]
+    writer = GraphWriter(tmp_path / "out.bin")
+    writer.add_node(fingerprints[0], initial=True)
+    for src, dst in itertools.pairwise(fingerprints):
+        writer.add_edge(src, dst)
+    writer.add_edge(fingerprints[-1], fingerprints[0])
+    writer.close()
+
+    with GraphReader(tmp_path / "out.bin") as graph:
+        assert [fp for fp, _ in graph.nodes()] == fingerprints
+        assert list(graph.edges())[-1] == (4999, 0, 0xFFFF)
+        assert graph.node_count == 5000
+
+
+def test_scc_sizes():
+    # 0 -> 1 -> 2 -> 0, 2 -> 3
+    offsets = array("Q", [0, 1, 2, 4, 4])
+    targets = array("I", [1, 2, 0, 3])
+    assert sorted(scc_sizes(offsets, targets)) == [1, 3]
+
+
+def test_compute_stats(graph_file):
+    with GraphReader(graph_file) as graph:
+        stats = compute_stats(graph)
+
+    assert stats.initial == 1
+    assert stats.depth == 3
+    assert stats.level_widths == {0: 1, 1: 2, 2: 1}
+    assert stats.out_degrees == {2: 1, 1: 3}
+    assert stats.action_edges == {"Inc": 2, "Reset": 2, "Dec": 1}
+    assert stats.scc_count == 3
+    assert stats.largest_scc == 2
+    assert stats.nontrivial_sccs == 1
+    assert stats.self_loops == 1
+
+
+def _write_dump(path: Path) -> None:
+    with path.open("w") as f:
+        f.write(DOT)
+
+
+def test_graph_dump_streams_through_pipe(tmp_path):
+    output = tmp_path / "out.bin"
+    with GraphDump(tmp_path, output, "Counter.tla") as dump:
+        tlc = threading.Thread(target=_write_dump, args=(dump.dump_path,))
+        tlc.start()
+        tlc.join(timeout=5)
+
+    assert not dump.dump_path.exists()
+    with GraphReader(output) as graph:
+        assert graph.edge_count == 5
+
+
+def test_graph_dump_without_writer_does_not_hang(tmp_path):
+    output = tmp_path / "out.bin"
+    with GraphDump(tmp_path, output, "Counter.tla"):
+        pass
+    with GraphReader(output) as graph:
+        assert graph.edge_count == 0
+
+
+def test_tlc_graph_option(mocker, mock_tlc_env, tmp_path, runner):
+    def fake_tlc(cmd, **_kwargs):
+        _write_dump(Path(cmd[cmd.index("-dump") + 2]))
+        return mocker.Mock(returncode=0)
+
+    mock_tlc_env.side_effect = fake_tlc
+    spec = tmp_path / "Counter.tla"
+    spec.write_text("---- MODULE Counter ----\n====\n")
+    output = tmp_path / "out.bin"
+
+    result = runner.invoke(app, ["tlc", str(spec), "--graph", str(output)])
+
+    assert result.exit_code == 0, result.output
+    cmd = mock_tlc_env.call_args.args[0]
+    assert cmd[cmd.index("-dump") + 1] == "dot,actionlabels"
+    assert "State graph written" in result.output
+
+    result = runner.invoke(app, ["graph", "stats", str(output)])
+    assert result.exit_code == 0, result.output
+    assert "States: 4 (1 initial)" in result.stdout
+    assert "SCCs:   3 (largest 2 states, 1 with more than one state)" in result.stdout
+
+
+def test_graph_stats_missing_file(tmp_path, runner):
+    result = runner.invoke(app, ["graph", "stats", str(tmp_path / "nope.bin")])
+    assert result.exit_code == 1
+    assert "Not a state graph" in result.output
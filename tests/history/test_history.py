@@ -0,0 +1,158 @@
+import sqlite3
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.history import CRASH, FAIL, PASS, RunHistory, RunRecord, outcome_of
+from tlaplus_cli.history.store import _SCHEMA, SCHEMA_VERSION
+
+TLC_OUTPUT = (
+    "TLC2 Version 2.18\n"
+    "Progress(3) at 2024-01-01 00:00:01: 1,200 states generated (6,000 s/min), "
+    "800 distinct states found, 10 states left on queue.\n"
+    "Model checking completed. No error has been found.\n"
+    "2,000 states generated, 1,500 distinct states found, 0 states left on queue.\n"
+    "The depth of the complete state graph search is 12.\n"
+)
+
+
+def _record(spec_name="Queue", started_at=1.0, **kwargs):
+    values = {"spec": f"/specs/{spec_name}.tla", "wall_time": 2.0, "exit_code": 0, "outcome": PASS, "host": "h"}
+    return RunRecord(spec_name=spec_name, started_at=started_at, **{**values, **kwargs})
+
+
+@pytest.fixture
+def history(tmp_path):
+    return RunHistory(tmp_path / "history.db")
+
+
+def test_outcome_of():
+    assert outcome_of(0, None) == PASS
+    assert outcome_of(12, "Error: Invariant violated.") == FAIL
+    assert outcome_of(1, None) == CRASH
+
+
+def test_version_1_database_is_upgraded(tmp_path):
+    path = tmp_path / "history.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA.replace(",\n    cpus TEXT", "") + "PRAGMA user_version = 1;")
+    conn.close()
+
+    history = RunHistory(path)
+    run_id = history.add(_record(cpus="0-3"))
+
+    assert history.get(run_id).cpus == "0-3"
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_add_and_query(history):
+    first = history.add(_record(started_at=1.0, java_opts=["-Xmx1g"], host_info={"cpus": 8}))
+    history.add(_record("Other", started_at=2.0))
+    history.add(_record(started_at=3.0, exit_code=12, outcome=FAIL, error="Error: x"))
+
+    record = history.get(first)
+    assert record.java_opts == ["-Xmx1g"]
+    assert record.host_info == {"cpus": 8}
+    assert [r.started_at for r in history.runs()] == [3.0, 2.0, 1.0]
+    assert [r.started_at for r in history.runs(spec="Queue")] == [3.0, 1.0]
+    assert [r.error for r in history.runs(outcome=FAIL)] == ["Error: x"]
+    assert len(history.runs(limit=1)) == 1
+    assert history.get(99) is None
+    assert history.count() == 3
+
+
+def test_empty_history(tmp_path):
+    history = RunHistory(tmp_path / "missing.db")
+    assert history.runs() == []
+    assert history.count() == 0
+    assert not history.path.exists()
+
+
+def test_indexes(history):
+    history.add(_record())
+    with sqlite3.connect(history.path) as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert {"runs_by_spec", "runs_by_time", "runs_by_spec_hash", "runs_by_host"} <= indexes
+    assert mode == "wal"
+
+
+def test_concurrent_writers(history):
+    def work(n):
+        for i in range(20):
+            RunHistory(history.path).add(_record(f"Spec{n}", started_at=float(i)))
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert history.count() == 80
+    assert len(history.runs(spec="Spec3", limit=100)) == 20
+
+
+def test_tlc_run_is_recorded(mocker, mock_tlc_env, base_settings, tmp_path, runner):
+    base_settings.tlc.history = True
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = iter(TLC_OUTPUT.splitlines(keepends=True))
+    proc.returncode = 0
+    mocker.patch("tlaplus_cli.tlc.runner.subprocess.Popen", return_value=proc)
+    mocker.patch("tlaplus_cli.tlc.affinity.os.wait4", return_value=(1, 0, MagicMock(ru_maxrss=2048)))
+    spec = tmp_path / "Queue.tla"
+    spec.write_text("---- MODULE Queue ----\n====\n")
+    (tmp_path / "Queue.cfg").write_text("INIT Init\n")
+
+    result = runner.invoke(app, ["tlc", str(spec)])
+
+    assert result.exit_code == 0, result.output
+    (run,) = RunHistory().runs()
+    assert run.spec == str(spec)
+    assert run.outcome == PASS
+    assert run.states_generated == 2000
+    assert run.distinct_states == 1500
+    assert run.depth == 12
+    assert run.peak_states_per_sec == 100
+    assert run.peak_rss == 2048 * 1024
+    assert run.spec_hash is not None
+    assert run.cfg_hash is not None
+    assert run.host
+    assert run.run_dir is None
+
+
+def test_runs_commands(history, mocker, runner):
+    mocker.patch("tlaplus_cli.history.store.history_path", return_value=history.path)
+    old = history.add(_record(states_generated=1000, distinct_states=500, tools_version="v1.8.0"))
+    new = history.add(_record(started_at=5.0, wall_time=1.0, states_generated=1000, tools_version="v1.9.0"))
+    env = {"COLUMNS": "200"}
+
+    listed = runner.invoke(app, ["runs", "list"], env=env)
+    assert listed.exit_code == 0, listed.output
+    assert "Queue" in listed.stdout
+    assert "v1.9.0" in listed.stdout
+
+    shown = runner.invoke(app, ["runs", "show", str(old)], env=env)
+    assert shown.exit_code == 0, shown.output
+    assert "1,000 generated, 500 distinct" in shown.stdout
+
+    compared = runner.invoke(app, ["runs", "compare", str(old)], env=env)
+    assert compared.exit_code == 0, compared.output
+    assert f"#{new}" in compared.stdout
+    assert "-50.0%" in compared.stdout
+    assert "Tools: v1.8.0 → v1.9.0" in compared.stdout
+
+
+def test_runs_show_unknown(runner):
+    result = runner.invoke(app, ["runs", "show", "7"])
+    assert result.exit_code == 1
+    assert "No run with ID 7" in result.output
+
+
+def test_runs_list_bad_outcome(runner):
+    result = runner.invoke(app, ["runs", "list", "--outcome", "meh"])
+    assert result.exit_code == 1
+    assert "Unknown outcome 'meh'" in result.output
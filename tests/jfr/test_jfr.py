@@ -0,0 +1,152 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.jfr import FlightRecording, code_origin, iter_events, summarize_events
+from tlaplus_cli.jfr.summary import parse_duration, parse_timestamp
+
+
+def frame(cls, method):
+    return {"method": {"type": {"name": cls}, "name": method, "descriptor": "()V"}, "lineNumber": 1}
+
+
+def sample(ts, *frames):
+    return {
+        "type": "jdk.ExecutionSample",
+        "values": {"startTime": ts, "stackTrace": {"truncated": False, "frames": [frame(*f) for f in frames]}},
+    }
+
+
+EVENTS = [
+    sample("2024-09-01T12:00:00.000000001+02:00", ("tlc2.tool.Worker", "run")),
+    sample("2024-09-01T12:00:01.5+02:00", ("com.example.Counter", "next"), ("tlc2.tool.Worker", "run")),
+    sample("2024-09-01T12:00:02.25+02:00", ("java.util.HashMap", "get"), ("com.example.Counter", "next")),
+    sample("2024-09-01T12:00:03.999999999+02:00", ("tlc2.tool.Worker", "run")),
+    {
+        "type": "jdk.JavaMonitorEnter",
+        "values": {
+            "startTime": "2024-09-01T12:00:02+02:00",
+            "duration": "PT0.25S",
+            "monitorClass": {"name": "com.example.Counter"},
+            "stackTrace": {"frames": [frame("com.example.Counter", "next")]},
+        },
+    },
+    {
+        "type": "jdk.JavaMonitorEnter",
+        "values": {
+            "startTime": "2024-09-01T12:00:02+02:00",
+            "duration": 500_000_000,
+            "monitorClass": {"name": "com.example.Counter"},
+            "stackTrace": {"frames": [frame("com.example.Counter", "next")]},
+        },
+    },
+    {"type": "jdk.ObjectAllocationSample", "values": {"startTime": "2024-09-01T12:00:01+02:00", "weight": 4096}},
+    {
+        "type": "jdk.GarbageCollection",
+        "values": {"startTime": "2024-09-01T12:00:03+02:00", "sumOfPauses": "PT0.012S", "longestPause": "PT0.01S"},
+    },
+]
+
+
+def jfr_json(events):
+    return json.dumps({"recording": {"events": events}}, indent=2)
+
+
+def test_iter_events_streams_in_small_chunks(mocker):
+    mocker.patch("tlaplus_cli.jfr.recording._CHUNK", 7)
+    assert list(iter_events(io.StringIO(jfr_json(EVENTS)))) == EVENTS
+    assert list(iter_events(io.StringIO(jfr_json([])))) == []
+
+
+def test_iter_events_rejects_truncated_output():
+    text = jfr_json(EVENTS)
+    with pytest.raises(ValueError, match="truncated"):
+        list(iter_events(io.StringIO(text[: len(text) // 2])))
+
+
+def test_parse_duration_and_timestamp():
+    assert parse_duration("PT1M2.5S") == pytest.approx(62.5)
+    assert parse_duration(2_000_000) == pytest.approx(0.002)
+    assert parse_duration(None) == 0
+    assert parse_timestamp("2024-09-01T12:00:03.999999999Z") == pytest.approx(1725192003.999999)
+    assert parse_timestamp("yesterday") is None
+
+
+def test_code_origin():
+    assert code_origin("tlc2.tool.Worker") == "TLC"
+    assert code_origin("java.util.HashMap") == "JDK"
+    assert code_origin("com.example.Counter") == "user"
+
+
+def test_summarize_events():
+    summary = summarize_events(EVENTS)
+
+    assert summary.total_samples == 4
+    assert summary.cpu_samples["tlc2.tool.Worker.run"] == 2
+    assert summary.origin_samples == {"TLC": 2, "user": 1, "JDK": 1}
+    assert summary.user_on_stack == 2
+    site = ("com.example.Counter", "com.example.Counter.next")
+    assert summary.contention_count[site] == 2
+    assert summary.contention_time[site] == pytest.approx(0.75)
+    assert summary.user_contention() == [site]
+    assert summary.span == pytest.approx(4, abs=1e-5)
+    assert summary.allocation_rate == pytest.approx(1024, rel=1e-5)
+    assert (summary.gc_count, summary.gc_pause_total, summary.gc_pause_max) == (1, 0.012, 0.01)
+
+
+def test_flight_recording_options(tmp_path):
+    recording = FlightRecording(duration=30)
+    (opt,) = recording.java_opts(tmp_path)
+    assert opt.startswith("-XX:StartFlightRecording=")
+    assert f"filename={tmp_path / 'tlc.jfr'}" in opt
+    assert "settings=profile" in opt
+    assert opt.endswith(",duration=30s")
+    assert not recording.exists
+
+
+@pytest.fixture
+def spec(tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+    return spec
+
+
+def test_tlc_jfr_keeps_recording_and_summarizes(mocker, mock_tlc_env, spec, runner):
+    def fake_run(cmd, **kwargs):
+        opt = next(a for a in cmd if a.startswith("-XX:StartFlightRecording="))
+        path = Path(opt.split("filename=")[1].split(",")[0])
+        path.write_bytes(b"JFR")
+        return mocker.Mock(returncode=0)
+
+    mock_tlc_env.side_effect = fake_run
+    events = mocker.patch("tlaplus_cli.cmd.tlc.print_events", return_value=iter(EVENTS))
+
+    result = runner.invoke(app, ["tlc", str(spec), "--jfr"])
+
+    assert result.exit_code == 0, result.output
+    recording = events.call_args.args[0]
+    assert recording.is_file()
+    assert "TLC metadir kept" in result.output
+    assert "Self time by code: TLC 50.0%, user 25.0%, JDK 25.0%" in result.stdout
+    assert "Monitor contention" in result.stdout
+    assert "thread-safty-note" in result.output
+
+
+def test_tlc_jfr_without_recording(mock_tlc_env, spec, runner):
+    result = runner.invoke(app, ["tlc", str(spec), "--jfr-duration", "5"])
+
+    assert result.exit_code == 0
+    cmd = mock_tlc_env.call_args.args[0]
+    assert any(a.endswith(",duration=5s") for a in cmd)
+    assert cmd.index(next(a for a in cmd if a.startswith("-XX:StartFlightRecording"))) < cmd.index("-cp")
+    assert "No flight recording was written" in result.output
+
+
+def test_tlc_jfr_dry_run(mock_tlc_env, spec, runner):
+    result = runner.invoke(app, ["tlc", str(spec), "--jfr", "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "-XX:StartFlightRecording=filename=<run-dir>/tlc.jfr" in result.stdout
+    mock_tlc_env.assert_not_called()
@@ -0,0 +1,345 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.queue import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    Capacity,
+    Job,
+    JobStore,
+    QueueDaemon,
+    daemon_pid,
+    pick_victims,
+    plan_starts,
+)
+from tlaplus_cli.queue.worker import latest_checkpoint, run_job
+from tlaplus_cli.tlc.budget import BUDGET_EXIT_CODE
+from tlaplus_cli.tlc.rundir import ACTIVE_MARKER
+
+# Tests patch Popen on the subprocess module; keep the real one for helper processes.
+POPEN = subprocess.Popen
+
+
+def _job(job_id, user="alice", priority=0, cores=1, memory=None, **kwargs):
+    return Job(
+        spec=f"/specs/Spec{job_id}.tla",
+        cwd="/specs",
+        user=user,
+        submitted_at=float(job_id),
+        priority=priority,
+        cores=cores,
+        memory=memory,
+        id=job_id,
+        **kwargs,
+    )
+
+
+def _submit(store, tmp_path, user="alice", **kwargs):
+    job = Job(spec=str(tmp_path / "Spec.tla"), cwd=str(tmp_path), user=user, submitted_at=time.time(), **kwargs)
+    store.submit(job)
+    return job
+
+
+def _dead_pid():
+    proc = POPEN([sys.executable, "-c", ""])
+    proc.wait()
+    return proc.pid
+
+
+@pytest.fixture
+def store():
+    return JobStore()
+
+
+@pytest.fixture
+def fake_worker(mocker):
+    """Replace worker processes by live-looking stand-ins; returns the mocked Popen."""
+    proc = mocker.MagicMock(pid=os.getpid())
+    proc.poll.return_value = None
+    return mocker.patch("tlaplus_cli.queue.daemon.subprocess.Popen", return_value=proc)
+
+
+def test_plan_starts_priority_then_fair_share():
+    queued = [
+        _job(1, "alice", cores=2),
+        _job(2, "alice", cores=2),
+        _job(3, "bob", cores=2),
+        _job(4, "carol", priority=5),
+    ]
+
+    schedule = plan_starts(queued, [], Capacity(cores=5))
+
+    assert [j.id for j in schedule.start] == [4, 1, 3]
+    assert schedule.blocked is not None
+    assert schedule.blocked.id == 2
+
+
+def test_plan_starts_fair_share_counts_running_jobs():
+    running = [_job(1, "alice", cores=2, state=RUNNING)]
+    queued = [_job(2, "alice"), _job(3, "bob")]
+
+    schedule = plan_starts(queued, running, Capacity(cores=3))
+
+    assert [j.id for j in schedule.start] == [3]
+
+
+def test_blocked_job_is_not_overtaken_by_lower_priorities():
+    running = [_job(1, cores=3, state=RUNNING)]
+
+    lower = plan_starts([_job(2, priority=5, cores=2), _job(3, cores=1)], running, Capacity(cores=4))
+    assert lower.start == []
+    assert lower.blocked is not None
+    assert lower.blocked.id == 2
+
+    same = plan_starts([_job(2, priority=5, cores=2), _job(3, priority=5, cores=1)], running, Capacity(cores=4))
+    assert [j.id for j in same.start] == [3]
+
+
+def test_plan_starts_packs_memory():
+    gib = 1 << 30
+    running = [_job(1, memory=6 * gib, state=RUNNING)]
+    queued = [_job(2, memory=8 * gib), _job(3, memory=2 * gib)]
+
+    schedule = plan_starts(queued, running, Capacity(cores=8, memory=10 * gib))
+
+    assert [j.id for j in schedule.start] == [3]
+    assert schedule.blocked is not None
+    assert schedule.blocked.id == 2
+
+
+def test_pick_victims_prefers_old_low_priority_jobs():
+    now = 10_000.0
+    running = [
+        _job(1, priority=0, cores=2, started_at=now - 7200),
+        _job(2, priority=1, cores=2, started_at=now - 7200),
+        _job(3, priority=0, cores=2, started_at=now - 60),
+    ]
+    blocked = _job(4, priority=5, cores=4)
+    capacity = Capacity(cores=6)
+
+    assert [j.id for j in pick_victims(blocked, running, capacity, now=now, preempt_after=3600)] == [1, 2]
+
+    running[1].stop_requested = now
+    assert [j.id for j in pick_victims(blocked, running, capacity, now=now, preempt_after=3600)] == [1]
+    assert pick_victims(_job(5, priority=5, cores=6), running, capacity, now=now, preempt_after=3600) == []
+
+
+def test_store_life_cycle(store, tmp_path):
+    job = _submit(store, tmp_path)
+    job_id = job.id
+
+    assert store.claim(job_id)
+    assert not store.claim(job_id)
+    assert store.cancel(job_id).cancel_requested
+    store.requeue(job_id, recover="/runs/Spec-1")
+    requeued = store.get(job_id)
+    assert (requeued.state, requeued.preemptions, requeued.recover) == (QUEUED, 1, "/runs/Spec-1")
+
+    store.claim(job_id)
+    store.finish(job_id, 12, error="Invariant violated")
+    finished = store.get(job_id)
+    assert (finished.state, finished.exit_code, finished.finished) == (FAILED, 12, True)
+    with pytest.raises(ValueError, match="already finished"):
+        store.cancel(job_id)
+    with pytest.raises(KeyError):
+        store.cancel(99)
+
+
+def test_daemon_starts_what_fits_and_notices_dead_workers(store, fake_worker, tmp_path):
+    first = _submit(store, tmp_path, cores=2)
+    second = _submit(store, tmp_path, cores=1)
+    daemon = QueueDaemon(store, Capacity(cores=2), pin_cpus=False)
+
+    daemon.step()
+
+    assert fake_worker.call_count == 1
+    cmd = fake_worker.call_args[0][0]
+    assert cmd[-3:] == ["tlaplus_cli.queue.worker", str(store.directory), str(first.id)]
+    assert fake_worker.call_args.kwargs["start_new_session"]
+    assert store.get(first.id).worker_pid == os.getpid()
+    assert store.get(second.id).state == QUEUED
+
+    store.finish(first.id, 0)
+    fake_worker.return_value.poll.return_value = 0
+    fake_worker.return_value.pid = _dead_pid()
+    daemon.step()
+    assert store.get(first.id).state == DONE
+    assert store.get(second.id).state == RUNNING
+
+    daemon.step()
+    crashed = store.get(second.id)
+    assert crashed.state == FAILED
+    assert crashed.error == "the worker exited without recording a result"
+
+
+def test_daemon_cancels_the_worker_process_group(store, mocker, tmp_path):
+    mocker.patch(
+        "tlaplus_cli.queue.daemon.subprocess.Popen",
+        side_effect=lambda _cmd, **kwargs: POPEN([sys.executable, "-c", "import time; time.sleep(30)"], **kwargs),
+    )
+    job = _submit(store, tmp_path)
+    daemon = QueueDaemon(store, Capacity(cores=1), pin_cpus=False)
+    daemon.step()
+    proc = daemon._children[job.id]
+
+    store.cancel(job.id)
+    daemon.step()
+    assert proc.wait(timeout=10) == -15
+    daemon.step()
+
+    assert store.get(job.id).state == CANCELLED
+
+
+def test_daemon_preempts_long_running_lower_priority_jobs(store, fake_worker, tmp_path):
+    low = _submit(store, tmp_path, cores=2)
+    daemon = QueueDaemon(store, Capacity(cores=2), pin_cpus=False, preempt_after=0)
+    daemon.step()
+    high = _submit(store, tmp_path, cores=2, priority=5)
+
+    daemon.step()
+    daemon.step()
+
+    stop = store.stop_path(low.id)
+    assert stop.read_text() == f"preempted by job {high.id} (priority 5)\n"
+    assert store.get(low.id).stop_requested is not None
+    assert store.get(high.id).state == QUEUED
+    assert fake_worker.call_count == 1
+
+
+def test_daemon_rejects_jobs_that_never_fit_and_holds_checkpoints(store, fake_worker, tmp_path):
+    big = _submit(store, tmp_path, cores=8)
+    checkpoint = tmp_path / "Spec-run"
+    checkpoint.mkdir()
+    resumed = _submit(store, tmp_path, cores=2, recover=str(checkpoint))
+    daemon = QueueDaemon(store, Capacity(cores=1), pin_cpus=False)
+
+    daemon.step()
+
+    assert store.get(big.id).state == FAILED
+    assert "needs more than the queue's 1 cores" in store.get(big.id).error
+    assert store.get(resumed.id).state == FAILED
+    assert not (checkpoint / ACTIVE_MARKER).exists()
+
+    waiting = _submit(store, tmp_path, cores=1, recover=str(checkpoint))
+    store.claim(_submit(store, tmp_path).id)
+    store.set_worker(waiting.id + 1, os.getpid())
+    daemon.step()
+    assert store.get(waiting.id).state == QUEUED
+    assert (checkpoint / ACTIVE_MARKER).read_text() == str(os.getpid())
+
+
+def test_only_one_daemon_per_queue(store):
+    first, second = QueueDaemon(store, Capacity(cores=1)), QueueDaemon(store, Capacity(cores=1))
+    with first.lock():
+        assert daemon_pid(store) == os.getpid()
+        with pytest.raises(RuntimeError, match="another queue daemon is running"), second.lock():
+            pass
+    assert daemon_pid(store) is None
+
+
+def test_daemon_needs_fcntl(store, mocker):
+    mocker.patch.dict(sys.modules, {"fcntl": None})
+    with pytest.raises(RuntimeError, match="not supported on this platform"), QueueDaemon(store, Capacity(1)).lock():
+        pass
+
+
+def test_latest_checkpoint(tmp_path):
+    old, new = tmp_path / "old", tmp_path / "new"
+    (old / "states").mkdir(parents=True)
+    new.mkdir()
+    (old / "states" / "queue.chkpt").write_text("x")
+    assert latest_checkpoint([new, None, old]) == str(old)
+    (new / "MC.st.chkpt").write_text("x")
+    os.utime(old / "states" / "queue.chkpt", (0, 0))
+    assert latest_checkpoint([str(old), new]) == str(new)
+
+
+def test_run_job_requeues_a_preempted_run_and_resumes_it(store, mocker, tmp_path):
+    job = _submit(store, tmp_path, cores=2, cfg="/specs/Small.cfg")
+    store.claim(job.id)
+    run_dir = tmp_path / "Spec-1"
+
+    def preempted(spec, **kwargs):
+        kwargs["on_run_dir"](run_dir)
+        run_dir.mkdir()
+        (run_dir / "queue.chkpt").write_text("x")
+        assert kwargs["budget"].stop_file == store.stop_path(job.id)
+        return BUDGET_EXIT_CODE
+
+    run = mocker.patch("tlaplus_cli.queue.worker.run_tlc", side_effect=preempted)
+    assert run_job(store, store.get(job.id), pin_cpus=False) == BUDGET_EXIT_CODE
+    requeued = store.get(job.id)
+    assert (requeued.state, requeued.recover, requeued.preemptions) == (QUEUED, str(run_dir), 1)
+    assert run.call_args.kwargs["tlc_args"] == ["-config", "/specs/Small.cfg", "-workers", "2"]
+
+    (run_dir / ACTIVE_MARKER).write_text("1")
+    store.claim(job.id)
+    run = mocker.patch("tlaplus_cli.queue.worker.run_tlc", return_value=0)
+    assert run_job(store, store.get(job.id)) == 0
+    assert run.call_args.kwargs["tlc_args"] == ["-config", "/specs/Small.cfg", "-recover", str(run_dir)]
+    assert run.call_args.kwargs["isolation"].cpus == 2
+    assert store.get(job.id).state == DONE
+    assert not (run_dir / ACTIVE_MARKER).exists()
+
+
+@pytest.fixture
+def queue_config(mocker, base_settings):
+    for module in ("submit", "serve"):
+        mocker.patch(f"tlaplus_cli.cmd.queue.{module}.load_config", return_value=base_settings)
+    mocker.patch("tlaplus_cli.cmd.queue.serve.available_cpus", return_value=frozenset({0, 1}))
+    return base_settings
+
+
+def test_queue_cli(queue_config, runner, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Spec.tla").write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["queue", "submit", "Spec", "--priority", "3", "--user", "alice", "-m", "1G"])
+    assert result.exit_code == 0, result.output
+    assert "Submitted job 1 (Spec, alice, priority 3, 1 core, 1.0 GiB)." in result.output
+    assert "No queue daemon is running" in result.output
+    assert JobStore().get(1).spec == str(tmp_path / "Spec.tla")
+
+    result = runner.invoke(app, ["queue", "submit", "Spec", "--cores", "4"])
+    assert result.exit_code == 1
+    assert "The job can never run; the queue has 2 cores" in result.output
+
+    result = runner.invoke(app, ["queue", "list"], env={"COLUMNS": "200"})
+    assert "alice" in result.output
+    assert "queued" in result.output
+
+    assert "No output for job 1 yet (queued)." in runner.invoke(app, ["queue", "logs", "1"]).output
+    assert "Cancelled job 1." in runner.invoke(app, ["queue", "cancel", "1"]).output
+    assert "No jobs in the queue." in runner.invoke(app, ["queue", "list"]).output
+
+    result = runner.invoke(app, ["queue", "wait", "1"])
+    assert result.exit_code == 1
+    assert "Job 1: cancelled" in result.output
+
+    result = runner.invoke(app, ["queue", "cancel", "1", "7"])
+    assert result.exit_code == 1
+    assert "job 1 has already finished (cancelled)" in result.output
+    assert "No job with ID 7" in result.output
+
+
+def test_queue_logs_and_wait_for_a_finished_job(runner, store, tmp_path):
+    job = _submit(store, tmp_path)
+    store.claim(job.id)
+    store.log_path(job.id).parent.mkdir(parents=True)
+    store.log_path(job.id).write_text("Model checking completed. No error has been found.\n")
+    store.finish(job.id, 0)
+
+    result = runner.invoke(app, ["queue", "logs", str(job.id), "--follow"])
+    assert result.output == "Model checking completed. No error has been found.\n"
+
+    result = runner.invoke(app, ["queue", "wait", str(job.id), "--timeout", "5"])
+    assert result.exit_code == 0
+    assert "Job 1: done (exit code 0)" in result.output
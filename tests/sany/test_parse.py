@@ -0,0 +1,218 @@
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.sany import (
+    CACHED,
+    FAILED,
+    OK,
+    ParseCache,
+    ParseResult,
+    locate_error,
+    module_references,
+    parse_driver_output,
+    parse_specs,
+    run_sany,
+    spec_dependencies,
+)
+
+DRIVER_OUTPUT = """\
+BEGIN\t/w/Good.tla
+LOG\tParsing file /w/Good.tla\\nSemantic processing of module Good
+OK\t/w/Good.tla
+BEGIN\t/w/Bad.tla
+ERROR\tsemantic\tline 4, col 9 to line 4, col 9 of module Bad\\n\\nUnknown operator: `y'.
+LOG\tParsing file /w/Bad.tla
+FAIL\t/w/Bad.tla
+BEGIN\t/w/Broken.tla
+ERROR\tparse\tCould not parse module Broken from file /w/Broken.tla
+LOG\t***Parse Error***\\nEncountered "==" at line 3, column 7 and token "x"
+FAIL\t/w/Broken.tla
+"""
+
+
+def test_module_references():
+    text = """---- MODULE Spec ----
+EXTENDS Naturals, Helpers,
+        Queue
+\\* EXTENDS Commented
+(* INSTANCE Hidden *)
+Q == INSTANCE Buffer WITH x <- y
+====
+"""
+    assert module_references(text) == ["Naturals", "Helpers", "Queue", "Buffer"]
+
+
+def test_spec_dependencies(tmp_path):
+    spec_dir = tmp_path / "spec"
+    modules = tmp_path / "modules"
+    spec_dir.mkdir()
+    modules.mkdir()
+    spec = spec_dir / "Spec.tla"
+    spec.write_text("EXTENDS Naturals, Helpers\n")
+    (spec_dir / "Helpers.tla").write_text("EXTENDS Queue, TLC\n")
+    (modules / "Queue.tla").write_text("EXTENDS Helpers\n")
+    (spec_dir / "Unused.tla").write_text("")
+
+    assert spec_dependencies(spec, [spec_dir, modules]) == [spec, spec_dir / "Helpers.tla", modules / "Queue.tla"]
+
+
+def test_parse_driver_output():
+    results = parse_driver_output(DRIVER_OUTPUT)
+
+    assert results["/w/Good.tla"].status == OK
+    assert results["/w/Good.tla"].errors == []
+
+    bad = results["/w/Bad.tla"]
+    assert bad.status == FAILED
+    (error,) = bad.errors
+    assert (error.phase, error.module, error.line, error.column, error.end_line, error.end_column) == (
+        "semantic",
+        "Bad",
+        4,
+        9,
+        4,
+        9,
+    )
+    assert str(error) == "Bad:4:9: semantic error: line 4, col 9 to line 4, col 9 of module Bad"
+    assert "Unknown operator" in error.message
+
+    (broken,) = results["/w/Broken.tla"].errors
+    assert (broken.module, broken.line, broken.column) == ("Broken", 3, 7)
+
+
+def test_locate_error_without_position():
+    error = locate_error("init", "File not found: Missing.tla")
+    assert (error.module, error.line) == (None, None)
+
+
+def test_run_sany(mocker, tmp_path):
+    mocker.patch("tlaplus_cli.sany.driver.java_helper", return_value=tmp_path / "driver")
+    run = mocker.patch(
+        "tlaplus_cli.sany.driver.subprocess.run",
+        return_value=MagicMock(stdout=DRIVER_OUTPUT, stderr=""),
+    )
+    files = [Path("/w/Good.tla"), tmp_path / "x" / "Missing.tla"]
+
+    results = run_sany(files, ["tla2tools.jar"], ["-DTLA-Library=/w/modules"])
+
+    cmd = run.call_args[0][0]
+    assert cmd[:2] == ["java", "-DTLA-Library=/w/modules"]
+    assert cmd[-2:] == ["/w/Good.tla", str(files[1])]
+    assert [r.status for r in results] == [OK, FAILED]
+
+
+def test_run_sany_reports_startup_failure(mocker, tmp_path):
+    mocker.patch("tlaplus_cli.sany.driver.java_helper", return_value=tmp_path)
+    mocker.patch(
+        "tlaplus_cli.sany.driver.subprocess.run",
+        return_value=MagicMock(stdout="", stderr="Error: Could not find or load main class TlaParse"),
+    )
+    with pytest.raises(RuntimeError, match="Could not find or load main class"):
+        run_sany([tmp_path / "Spec.tla"], ["tla2tools.jar"])
+
+
+def test_parse_cache_key(tmp_path):
+    a = tmp_path / "A.tla"
+    b = tmp_path / "B.tla"
+    a.write_text("EXTENDS B")
+    b.write_text("x == 1")
+    cache = ParseCache(tmp_path / "cache")
+
+    key = cache.key("jar1", [a, b])
+    assert key == ParseCache(tmp_path / "cache").key("jar1", [a, b])
+    assert key != cache.key("jar2", [a, b])
+    assert key != cache.key("jar1", [b, a])
+
+    b.write_text("x == 2")
+    assert key != ParseCache(tmp_path / "cache").key("jar1", [a, b])
+
+    assert not cache.hit(key)
+    cache.store(key)
+    assert cache.hit(key)
+    assert cache.clear() == 1
+    assert not cache.hit(key)
+
+
+@pytest.fixture
+def workspace(mocker, tmp_path, base_settings):
+    root = tmp_path / "ws"
+    (root / "spec").mkdir(parents=True)
+    (root / "modules").mkdir()
+    (root / "classes").mkdir()
+    (root / "spec" / "A.tla").write_text("---- MODULE A ----\nEXTENDS Naturals, Lib\n====\n")
+    (root / "spec" / "B.tla").write_text("---- MODULE B ----\n====\n")
+    (root / "modules" / "Lib.tla").write_text("---- MODULE Lib ----\n====\n")
+    (root / "classes" / "Gen.tla").write_text("generated")
+    (root / ".git").mkdir()
+    (root / ".git" / "Hidden.tla").write_text("")
+    jar = tmp_path / "tla2tools.jar"
+    jar.write_bytes(b"jar")
+
+    mocker.patch("tlaplus_cli.sany.batch.load_config", return_value=base_settings)
+    mocker.patch("tlaplus_cli.tlc.runner.load_config", return_value=base_settings)
+    mocker.patch("tlaplus_cli.sany.batch.workspace_root", return_value=root)
+    mocker.patch("tlaplus_cli.sany.batch.require_tlc_jar", return_value=jar)
+    mocker.patch("tlaplus_cli.sany.batch.validate_java_version")
+    mocker.patch("tlaplus_cli.sany.cache.cache_dir", return_value=tmp_path / "cache")
+    return root
+
+
+def _sany(files, classpath, java_opts=()):
+    return [ParseResult(f, FAILED if f.stem == "B" else OK) for f in files]
+
+
+def test_parse_specs_skips_unchanged(mocker, workspace):
+    run = mocker.patch("tlaplus_cli.sany.batch.run_sany", side_effect=_sany)
+    specs = [workspace / "spec" / "A.tla", workspace / "spec" / "B.tla"]
+
+    first = parse_specs(specs)
+    second = parse_specs(specs)
+    (workspace / "modules" / "Lib.tla").write_text("---- MODULE Lib ----\nx == 1\n====\n")
+    third = parse_specs(specs)
+
+    assert [r.status for r in first] == [OK, FAILED]
+    assert [r.status for r in second] == [CACHED, FAILED]
+    assert [r.status for r in third] == [OK, FAILED]
+    assert [c.args[0] for c in run.call_args_list] == [specs, specs[1:], specs]
+    assert f"-DTLA-Library={workspace / 'modules'}" in run.call_args.args[2]
+
+    parse_specs(specs, use_cache=False)
+    assert run.call_args.args[0] == specs
+
+
+def test_parse_all(mocker, workspace, runner):
+    mocker.patch("tlaplus_cli.sany.batch.run_sany", side_effect=_sany)
+
+    result = runner.invoke(app, ["parse", "--all", "--json", "-"])
+
+    assert result.exit_code == 1
+    data = json.loads(result.stdout)
+    assert [(d["spec"].removeprefix(str(workspace) + "/"), d["status"]) for d in data] == [
+        ("modules/Lib.tla", OK),
+        ("spec/A.tla", OK),
+        ("spec/B.tla", FAILED),
+    ]
+
+
+def test_parse_reports_errors(mocker, tmp_path, runner):
+    spec = tmp_path / "Bad.tla"
+    spec.write_text("")
+    results = parse_driver_output(DRIVER_OUTPUT)
+    mocker.patch("tlaplus_cli.cmd.parse.parse_specs", return_value=[results["/w/Good.tla"], results["/w/Bad.tla"]])
+
+    result = runner.invoke(app, ["parse", str(spec)])
+
+    assert result.exit_code == 1
+    assert "✗ /w/Bad.tla\n  Bad:4:9: semantic error:" in result.output
+    assert "Good.tla" not in result.output
+    assert "Checked 2 spec(s): 1 parsed, 0 unchanged, 1 failed" in result.output
+
+
+def test_parse_requires_specs(runner):
+    result = runner.invoke(app, ["parse"])
+    assert result.exit_code == 1
+    assert "no specs given" in result.output
@@ -1,4 +1,7 @@
+import os
+
 from tlaplus_cli.cli import app
+from tlaplus_cli.tlc.jar import write_modules_jar
 
 
 def test_tlc_classpath_includes_project_classes(mock_tlc_env, tmp_path, base_settings, runner):
@@ -78,3 +81,44 @@ def test_tlc_no_project_dirs_no_extra_classpath(mock_tlc_env, tmp_path, base_set
     assert "tla2tools.jar" in classpath
     assert "classes" not in classpath
     assert "lib" not in classpath
+
+
+def test_tlc_classpath_prefers_current_modules_jar(mock_tlc_env, tmp_path, base_settings, runner):
+    """An up-to-date modules.jar replaces the classes directory on the classpath."""
+    project_dir = tmp_path / "my_project"
+    project_dir.mkdir()
+    (project_dir / "queue.tla").write_text("MODULE queue\n===\n")
+    (project_dir / "classes").mkdir()
+    (project_dir / "classes" / "Ops.class").write_bytes(b"ops")
+    modules_jar = project_dir / "modules.jar"
+    write_modules_jar(project_dir / "classes", modules_jar)
+
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        result = runner.invoke(app, ["tlc", str(project_dir / "queue.tla")])
+
+    assert result.exit_code == 0
+    cmd = mock_tlc_env.call_args[0][0]
+    classpath = cmd[cmd.index("-cp") + 1].split(os.pathsep)
+    assert classpath[0] == str(modules_jar)
+    assert str(project_dir / "classes") not in classpath
+
+
+def test_tlc_classpath_ignores_stale_modules_jar(mock_tlc_env, tmp_path, base_settings, runner):
+    """A modules.jar not built from the current classes is ignored with a warning."""
+    project_dir = tmp_path / "my_project"
+    project_dir.mkdir()
+    (project_dir / "queue.tla").write_text("MODULE queue\n===\n")
+    (project_dir / "classes").mkdir()
+    modules_jar = project_dir / "modules.jar"
+    write_modules_jar(project_dir / "classes", modules_jar)
+    (project_dir / "classes" / "Ops.class").write_bytes(b"ops")
+
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        result = runner.invoke(app, ["tlc", str(project_dir / "queue.tla")])
+
+    assert result.exit_code == 0
+    assert "modules.jar is out of date" in result.output
+    cmd = mock_tlc_env.call_args[0][0]
+    classpath = cmd[cmd.index("-cp") + 1].split(os.pathsep)
+    assert classpath[0] == str(project_dir / "classes")
+    assert str(modules_jar) not in classpath
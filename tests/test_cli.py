@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 import typer
 
@@ -37,3 +40,12 @@ def test_cli_version_flag(mocker, runner):
     assert "Test summary" in result.stdout
 
     mock_metadata.assert_called_once_with("tlaplus-cli")
+
+
+@pytest.mark.parametrize("module", ["resource", "fcntl"])
+def test_cli_imports_without_posix_only_modules(module):
+    """The CLI must load where POSIX-only modules are missing (Windows)."""
+    code = f"import sys; sys.modules[{module!r}] = None; import tlaplus_cli.cli"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,155 @@
+import os
+import resource
+import subprocess
+import sys
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.tlc.affinity import (
+    CpuLeases,
+    Isolation,
+    format_cpu_list,
+    numa_nodes,
+    parse_cpu_list,
+    wait_with_rusage,
+)
+
+NODES = [frozenset(range(4)), frozenset(range(4, 8))]
+
+
+@pytest.fixture
+def leases(tmp_path):
+    return CpuLeases(tmp_path / "leases", cpus=frozenset(range(8)), nodes=NODES)
+
+
+def test_cpu_lists():
+    assert parse_cpu_list("0-3,8,10-11\n") == {0, 1, 2, 3, 8, 10, 11}
+    assert format_cpu_list([11, 0, 1, 2, 3, 8, 10]) == "0-3,8,10-11"
+    with pytest.raises(ValueError, match="invalid CPU list"):
+        parse_cpu_list("a-b")
+
+
+def test_numa_nodes_from_sysfs(tmp_path):
+    for node, cpus in (("node0", "0-3\n"), ("node1", "4-7\n")):
+        (tmp_path / node).mkdir()
+        (tmp_path / node / "cpulist").write_text(cpus)
+    assert numa_nodes(tmp_path) == NODES
+
+
+def test_leases_are_disjoint_and_prefer_one_node(leases, tmp_path):
+    other = CpuLeases(tmp_path / "leases", cpus=frozenset(range(8)), nodes=NODES)
+
+    assert leases.acquire(2) == [0, 1]
+    assert other.acquire(3) == [4, 5, 6]
+    assert leases.acquire(3) == [2, 3, 7]
+    with pytest.raises(RuntimeError, match="only 0 of 8 are free"):
+        other.acquire(1)
+
+    leases.release([0, 1])
+    assert other.free() == {0, 1}
+
+
+def test_specific_cpus_conflict(leases):
+    leases.acquire(frozenset({2, 3}))
+    with pytest.raises(RuntimeError, match=f"CPU 3 is in use by another TLC run \\(pid {os.getpid()}\\)"):
+        leases.acquire(frozenset({3, 4}))
+    assert leases.owner(4) is None
+    with pytest.raises(RuntimeError, match="CPUs 9 are not available"):
+        leases.acquire(frozenset({9}))
+
+
+def test_stale_lease_is_taken_over(leases, tmp_path):
+    proc = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    (tmp_path / "leases").mkdir()
+    (tmp_path / "leases" / "cpu0").write_text(proc.stdout)
+
+    assert leases.acquire(frozenset({0})) == [0]
+    assert leases.owner(0) == os.getpid()
+
+
+def test_tlc_options_match_the_cpu_set():
+    isolation = Isolation(cpus=frozenset({4, 5, 6}))
+    opts, args = isolation.tlc_options(["-XX:ActiveProcessorCount=32", "-Xmx1g"], ["-workers", "auto", "-deadlock"])
+
+    assert opts == ["-Xmx1g", "-XX:ActiveProcessorCount=3"]
+    assert args == ["-workers", "3", "-deadlock"]
+    assert Isolation(open_files=10).tlc_options(["-Xmx1g"], []) == (["-Xmx1g"], [])
+
+
+def test_preexec_pins_the_child():
+    isolation = Isolation(cpus=1, open_files=64, assigned=[min(os.sched_getaffinity(0))])
+    script = (
+        "import os, resource; print(sorted(os.sched_getaffinity(0)), resource.getrlimit(resource.RLIMIT_NOFILE)[0])"
+    )
+
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, preexec_fn=isolation.preexec
+    ).stdout
+
+    assert out.split() == [f"[{isolation.assigned[0]}]", "64"]
+
+
+def test_wait_with_rusage_reports_each_child_alone():
+    # A forked child starts out with our own RSS, so allocate well beyond it.
+    scale = 1 if sys.platform == "darwin" else 1024
+    size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale + 256 * 1024 * 1024
+    big = subprocess.Popen([sys.executable, "-c", f"b = bytearray({size}); exit(3)"])
+    code, big_peak = wait_with_rusage(big)
+    assert code == 3
+    small = subprocess.Popen([sys.executable, "-c", "pass"])
+
+    code, small_peak = wait_with_rusage(small)
+
+    assert code == 0
+    assert big_peak is not None
+    assert small_peak is not None
+    assert small_peak < big_peak
+
+
+def test_tlc_cpus(mock_tlc_env, runner, tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--cpus", "1", "--max-open-files", "4096"])
+
+    assert result.exit_code == 0, result.output
+    cpu = min(os.sched_getaffinity(0))
+    assert f"Isolation: CPUs {cpu} (1 workers), open files ≤ 4,096" in result.output
+    cmd = mock_tlc_env.call_args[0][0]
+    assert "-XX:ActiveProcessorCount=1" in cmd
+    assert cmd[cmd.index("-workers") + 1] == "1"
+    assert mock_tlc_env.call_args[1]["preexec_fn"] is not None
+    assert not list((tmp_path / "cpu-leases" / "cpu-leases").glob("cpu*"))
+
+
+def test_tlc_cpus_and_cpu_list_conflict(mock_tlc_env, runner, tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--cpus", "1", "--cpu-list", "0"])
+
+    assert result.exit_code == 1
+    assert "--cpus and --cpu-list cannot be combined" in result.output
+
+
+def test_tlc_watch_rejects_resource_limits(runner, tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--watch", "--max-address-space", "8G", "--max-open-files", "64"])
+
+    assert result.exit_code == 1
+    assert "--watch cannot be combined with --max-address-space, --max-open-files" in result.output
+
+
+def test_tlc_rejects_resource_limits_without_rlimits(mock_tlc_env, mocker, runner, tmp_path):
+    mocker.patch("tlaplus_cli.tlc.affinity._resource", return_value=None)
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--max-open-files", "64"])
+
+    assert result.exit_code == 1
+    assert "resource limits (--max-address-space, --max-open-files) are not supported" in result.output
+    mock_tlc_env.assert_not_called()
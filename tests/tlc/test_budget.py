@@ -0,0 +1,191 @@
+import subprocess
+import sys
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.config.schema import TlcBudgetConfig
+from tlaplus_cli.history import STOPPED, RunHistory
+from tlaplus_cli.tlc.budget import (
+    BUDGET_EXIT_CODE,
+    Budget,
+    BudgetSupervisor,
+    checkpoint_interval,
+    disk_usage,
+    parse_throughput,
+)
+from tlaplus_cli.units import parse_count
+
+PROGRESS = "Progress(3) at 2024-01-01: {generated} states generated ({rate} s/min), {distinct} distinct states found, 9 states left on queue.\n"  # noqa: E501
+
+
+def _progress(generated, distinct, rate=60):
+    return PROGRESS.format(generated=f"{generated:,}", distinct=f"{distinct:,}", rate=f"{rate:,}")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def proc(mocker):
+    proc = mocker.MagicMock()
+    proc.poll.return_value = None
+    return proc
+
+
+def test_parse_count_and_throughput():
+    assert parse_count("2,000,000") == 2_000_000
+    assert parse_count("1.5G") == 1_500_000_000
+    assert parse_throughput("5000/s over 10m") == (5000.0, 600.0)
+    assert parse_throughput("1.2M/min") == (20000.0, 600.0)
+    with pytest.raises(ValueError, match="invalid throughput"):
+        parse_throughput("fast")
+
+
+def test_budget_options_override_the_config():
+    config = TlcBudgetConfig(max_time="12h", max_disk="1G")
+    budget = Budget.from_options(config, max_time="30m", min_throughput="100/s over 1h")
+
+    assert budget.max_time == 1800
+    assert budget.max_disk == 1 << 30
+    assert budget.max_states is None
+    assert (budget.min_throughput, budget.throughput_window) == (100.0, 3600.0)
+    assert budget.active
+    assert not Budget.from_options(TlcBudgetConfig()).active
+
+
+def test_checkpoint_interval():
+    assert checkpoint_interval([]) == 1800
+    assert checkpoint_interval(["-workers", "4", "-checkpoint", "5"]) == 300
+    assert checkpoint_interval(["-checkpoint", "0"]) == 0
+
+
+def test_max_states_waits_for_the_next_checkpoint(proc, tmp_path):
+    clock = Clock()
+    supervisor = BudgetSupervisor(Budget(max_states=1000), tmp_path, checkpoint_every=600, clock=clock)
+    supervisor._proc = proc
+
+    supervisor.feed(_progress(5000, 1500))
+    assert supervisor.exceeded == "max-states"
+    assert supervisor.reason == "1,500 distinct states > 1,000"
+    proc.terminate.assert_not_called()
+
+    supervisor.feed("-- Checkpointing completed at (2024-01-01 10:00:00)\n")
+    assert supervisor.checkpointed
+    proc.terminate.assert_called_once()
+
+
+def test_stop_without_checkpoint_after_the_grace_period(proc, tmp_path):
+    clock = Clock()
+    supervisor = BudgetSupervisor(Budget(max_time=60), tmp_path, checkpoint_every=120, poll=5, clock=clock)
+    supervisor._proc = proc
+
+    clock.now = 61
+    supervisor.check()
+    assert supervisor.exceeded == "max-time"
+    proc.terminate.assert_not_called()
+
+    clock.now = 61 + 125
+    supervisor.check()
+    assert not supervisor.checkpointed
+    proc.terminate.assert_called_once()
+
+
+def test_min_throughput_over_a_window(proc, tmp_path):
+    clock = Clock()
+    budget = Budget(min_throughput=100, throughput_window=600)
+    supervisor = BudgetSupervisor(budget, tmp_path, checkpoint_every=0, clock=clock)
+    supervisor._proc = proc
+
+    for minute, generated in enumerate([0, 120_000, 240_000, 241_000, 242_000, 243_000, 244_000, 245_000], start=1):
+        clock.now = minute * 120.0
+        supervisor.feed(_progress(generated, generated // 2))
+        supervisor.check()
+        if supervisor.exceeded:
+            break
+
+    assert supervisor.exceeded == "min-throughput"
+    assert clock.now == 960.0
+    assert supervisor.reason == "8 states/s over 10m00s < 100"
+    proc.terminate.assert_called_once()
+
+
+def test_max_disk_measures_the_metadir(proc, tmp_path):
+    (tmp_path / "states").mkdir()
+    (tmp_path / "states" / "a.fp").write_bytes(b"x" * 3000)
+    (tmp_path / "queue").write_bytes(b"x" * 1000)
+    assert disk_usage(tmp_path) == 4000
+
+    supervisor = BudgetSupervisor(Budget(max_disk=2048), tmp_path, checkpoint_every=0)
+    supervisor._proc = proc
+    supervisor.check()
+    assert supervisor.exceeded == "max-disk"
+
+
+def test_stop_file_stops_after_the_next_checkpoint(proc, tmp_path):
+    stop = tmp_path / "stop"
+    supervisor = BudgetSupervisor(Budget(stop_file=stop), tmp_path, checkpoint_every=600)
+    supervisor._proc = proc
+    assert Budget(stop_file=stop).active
+
+    supervisor.check()
+    assert supervisor.exceeded is None
+
+    stop.write_text("preempted by job 7 (priority 5)\n")
+    supervisor.check()
+    assert (supervisor.exceeded, supervisor.reason) == ("stop-request", "preempted by job 7 (priority 5)")
+    supervisor.feed("-- Checkpointing completed at (2024-01-01 10:00:00)\n")
+    proc.terminate.assert_called_once()
+
+
+def test_tlc_stops_over_budget(mock_tlc_env, base_settings, mocker, runner, tmp_path):
+    base_settings.tlc.history = True
+    script = (
+        "import sys, time\n"
+        f"sys.stdout.write({_progress(10_000, 5_000)!r}); sys.stdout.flush()\n"
+        "time.sleep(0.2)\n"
+        "print('-- Checkpointing completed at (2024-01-01 10:00:00)', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    popen = subprocess.Popen
+    mocker.patch(
+        "tlaplus_cli.tlc.runner.subprocess.Popen",
+        side_effect=lambda _cmd, **kwargs: popen([sys.executable, "-c", script], **kwargs),
+    )
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--max-states", "1000"])
+
+    assert result.exit_code == BUDGET_EXIT_CODE, result.output
+    assert "Budget exceeded: max-states (5,000 distinct states > 1,000)" in result.output
+    assert "stopped after a checkpoint" in result.output
+    (run,) = RunHistory().runs()
+    assert run.outcome == STOPPED
+    assert run.error.startswith("Budget exceeded: max-states")
+
+
+def test_tlc_rejects_bad_budget(mock_tlc_env, runner, tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--min-throughput", "lots"])
+
+    assert result.exit_code == 1
+    assert "invalid throughput" in result.output
+
+
+def test_tlc_budget_is_rejected_with_compare_opts(mock_tlc_env, runner, tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--compare-opts", "a", "--compare-opts", "b", "--max-time", "1h"])
+
+    assert result.exit_code == 1
+    assert "--compare-opts cannot be combined with --max-time" in result.output
+    mock_tlc_env.assert_not_called()
@@ -0,0 +1,232 @@
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.tlc.compile_server import (
+    SERVER_CLASS,
+    CompileServer,
+    affected_sources,
+    clean_classes,
+    parse_diagnostic,
+    server_classes,
+)
+
+
+@pytest.fixture
+def server_cache(mocker, tmp_path):
+    cache = tmp_path / "cache"
+    mocker.patch("tlaplus_cli.tlc.compile_server.cache_dir", return_value=cache)
+    return cache
+
+
+def _fake_server(mocker, output):
+    proc = MagicMock()
+    proc.stdout = io.StringIO(output)
+    proc.stdin = io.StringIO()
+    proc.poll.return_value = None
+    popen = mocker.patch("tlaplus_cli.tlc.compile_server.subprocess.Popen", return_value=proc)
+    return popen, proc
+
+
+def test_parse_diagnostic():
+    d = parse_diagnostic("ERROR\t/src/Ops.java\t12\tcannot find symbol\\n  symbol: Foo\\\\bar")
+    assert (d.kind, d.source, d.line) == ("ERROR", "/src/Ops.java", 12)
+    assert d.message == "cannot find symbol\n  symbol: Foo\\bar"
+    assert str(d).startswith("/src/Ops.java:12: error: cannot find symbol")
+
+    note = parse_diagnostic("MANDATORY_WARNING\t-\t-1\tuses unchecked operations")
+    assert not note.is_error
+    assert str(note) == "javac: mandatory warning: uses unchecked operations"
+
+
+def test_server_classes_compiled_once(mocker, server_cache):
+    def javac(cmd, **kwargs):
+        target = cmd[cmd.index("-d") + 1]
+        (server_cache / target / f"{SERVER_CLASS}.class").write_bytes(b"class")
+        return MagicMock(returncode=0)
+
+    run = mocker.patch("tlaplus_cli.tlc.compile_server.subprocess.run", side_effect=javac)
+
+    first = server_classes()
+    assert server_classes() == first
+    assert run.call_count == 1
+    assert (first / f"{SERVER_CLASS}.java").read_text().startswith("import java.io.*;")
+
+
+def test_compile_round_trip(mocker, server_cache, tmp_path):
+    mocker.patch("tlaplus_cli.tlc.compile_server.server_classes", return_value=tmp_path / "server")
+    popen, proc = _fake_server(
+        mocker,
+        "READY\nDIAG ERROR\t/m/Ops.java\t3\t';' expected\nDONE FAILED\nDONE OK\n",
+    )
+    classes = tmp_path / "classes"
+
+    with CompileServer("tla2tools.jar", classes) as server:
+        failed = server.compile([tmp_path / "Ops.java"])
+        ok = server.compile([tmp_path / "Ops.java", tmp_path / "Util.java"])
+
+    cmd = popen.call_args[0][0]
+    assert cmd[:4] == ["java", "-cp", str(tmp_path / "server"), SERVER_CLASS]
+    assert cmd[4].startswith(str(classes))
+    assert classes.is_dir()
+    assert proc.stdin.closed
+    assert not failed.ok
+    assert [str(e) for e in failed.errors] == ["/m/Ops.java:3: error: ';' expected"]
+    assert ok.ok
+    assert ok.diagnostics == []
+
+
+def test_start_reports_missing_compiler(mocker, tmp_path):
+    mocker.patch("tlaplus_cli.tlc.compile_server.server_classes", return_value=tmp_path)
+    _fake_server(mocker, "ERROR no system Java compiler; run with a JDK, not a JRE\n")
+
+    with pytest.raises(RuntimeError, match="no system Java compiler"):
+        CompileServer("cp", tmp_path / "classes").start()
+
+
+def test_start_skips_output_before_ready(mocker, tmp_path):
+    mocker.patch("tlaplus_cli.tlc.compile_server.server_classes", return_value=tmp_path)
+    popen, _ = _fake_server(mocker, "Picked up JAVA_TOOL_OPTIONS: -Xss4m\n\nREADY\nDONE OK\n")
+
+    with CompileServer("cp", tmp_path / "classes") as server:
+        assert server.compile([tmp_path / "Ops.java"]).ok
+
+    assert "stderr" not in popen.call_args.kwargs
+
+
+def test_start_reports_early_exit(mocker, tmp_path):
+    mocker.patch("tlaplus_cli.tlc.compile_server.server_classes", return_value=tmp_path)
+    _fake_server(mocker, "Picked up JAVA_TOOL_OPTIONS: -Xss4m\n")
+
+    with pytest.raises(RuntimeError, match="did not start: it exited"):
+        CompileServer("cp", tmp_path / "classes").start()
+
+
+def test_affected_sources(tmp_path):
+    ops = tmp_path / "Ops.java"
+    ops.write_text("class Ops {}")
+    user = tmp_path / "Overrides.java"
+    user.write_text("class Overrides { Ops ops; }")
+    other = tmp_path / "Opsy.java"
+    other.write_text("class Opsy {}")
+
+    assert affected_sources([ops], [ops, user, other]) == [ops, user]
+    assert affected_sources([other], [ops, user, other]) == [other]
+    assert affected_sources([tmp_path / "Gone.java"], [ops, user]) == []
+
+
+def test_clean_classes_keeps_service_file(tmp_path):
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "sub" / "A.class").write_bytes(b"a")
+    (tmp_path / "META-INF" / "services").mkdir(parents=True)
+    (tmp_path / "META-INF" / "services" / "svc").write_text("A\n")
+
+    clean_classes(tmp_path)
+
+    assert not (tmp_path / "pkg").exists()
+    assert (tmp_path / "META-INF" / "services" / "svc").is_file()
+
+
+def test_build_watch(mocker, tmp_path, base_settings, runner):
+    """modules build --watch builds everything once, then only the affected sources per batch."""
+    project_dir = tmp_path / "my_project"
+    modules_dir = project_dir / "modules"
+    modules_dir.mkdir(parents=True)
+    ops = modules_dir / "Ops.java"
+    ops.write_text("class Ops {}")
+    (modules_dir / "Other.java").write_text("class Other {}")
+
+    settings = base_settings.model_copy(deep=True)
+    mocker.patch("tlaplus_cli.tlc.compiler.load_config", return_value=settings)
+    mocker.patch("tlaplus_cli.cmd.modules.build.load_config", return_value=settings)
+    pinned_dir = tmp_path / "tools" / "v1.8.0"
+    pinned_dir.mkdir(parents=True)
+    (pinned_dir / "tla2tools.jar").write_bytes(b"fake")
+    mocker.patch("tlaplus_cli.tlc.compiler.get_pinned_version_dir", return_value=pinned_dir)
+
+    server = MagicMock(running=True)
+    server.compile.side_effect = [
+        MagicMock(ok=True, diagnostics=[], elapsed=0.5),
+        MagicMock(ok=False, diagnostics=[parse_diagnostic("ERROR\tOps.java\t1\tboom")], errors=[1], elapsed=0.1),
+    ]
+    mocker.patch("tlaplus_cli.cmd.modules.build.CompileServer", return_value=server)
+    mocker.patch("tlaplus_cli.cmd.modules.build.debounced", return_value=iter([{ops}]))
+
+    result = runner.invoke(app, ["modules", "build", str(project_dir), "--watch", "--poll"])
+
+    assert result.exit_code == 0, result.output
+    first, second = (c.args[0] for c in server.compile.call_args_list)
+    assert sorted(first) == sorted(modules_dir.glob("*.java"))
+    assert second == [ops]
+    assert "Compiling 2 file(s)" in result.output
+    assert "Build succeeded in 0.50s" in result.output
+    assert "Ops.java:1: error: boom" in result.output
+    assert "Build failed: 1 error(s)" in result.output
+    assert (project_dir / "classes" / "META-INF" / "services" / "tlc2.overrides.ITLCOverrides").is_file()
+    server.close.assert_called()
+
+
+def test_build_watch_restarts_a_crashed_compiler(mocker, tmp_path, base_settings, runner):
+    project_dir = tmp_path / "my_project"
+    modules_dir = project_dir / "modules"
+    modules_dir.mkdir(parents=True)
+    ops = modules_dir / "Ops.java"
+    ops.write_text("class Ops {}")
+
+    settings = base_settings.model_copy(deep=True)
+    mocker.patch("tlaplus_cli.tlc.compiler.load_config", return_value=settings)
+    mocker.patch("tlaplus_cli.cmd.modules.build.load_config", return_value=settings)
+    pinned_dir = tmp_path / "tools" / "v1.8.0"
+    pinned_dir.mkdir(parents=True)
+    (pinned_dir / "tla2tools.jar").write_bytes(b"fake")
+    mocker.patch("tlaplus_cli.tlc.compiler.get_pinned_version_dir", return_value=pinned_dir)
+
+    server = MagicMock(running=True)
+    server.compile.side_effect = [
+        RuntimeError("Compile server exited during the build"),
+        MagicMock(ok=True, diagnostics=[], elapsed=0.5),
+    ]
+    mocker.patch("tlaplus_cli.cmd.modules.build.CompileServer", return_value=server)
+    mocker.patch("tlaplus_cli.cmd.modules.build.debounced", return_value=iter([]))
+
+    result = runner.invoke(app, ["modules", "build", str(project_dir), "--watch", "--poll"])
+
+    assert result.exit_code == 0, result.output
+    assert "Compile server exited during the build; restarting the compiler" in result.output
+    assert "Build succeeded in 0.50s" in result.output
+    assert server.start.call_count == 2
+
+
+def test_build_watch_survives_a_removed_modules_dir(mocker, tmp_path, base_settings, runner):
+    project_dir = tmp_path / "my_project"
+    modules_dir = project_dir / "modules"
+    modules_dir.mkdir(parents=True)
+    ops = modules_dir / "Ops.java"
+    ops.write_text("class Ops {}")
+
+    settings = base_settings.model_copy(deep=True)
+    mocker.patch("tlaplus_cli.tlc.compiler.load_config", return_value=settings)
+    mocker.patch("tlaplus_cli.cmd.modules.build.load_config", return_value=settings)
+    pinned_dir = tmp_path / "tools" / "v1.8.0"
+    pinned_dir.mkdir(parents=True)
+    (pinned_dir / "tla2tools.jar").write_bytes(b"fake")
+    mocker.patch("tlaplus_cli.tlc.compiler.get_pinned_version_dir", return_value=pinned_dir)
+
+    def changes():
+        ops.unlink()
+        modules_dir.rmdir()
+        yield {ops}
+
+    server = MagicMock(running=True)
+    server.compile.return_value = MagicMock(ok=True, diagnostics=[], elapsed=0.5)
+    mocker.patch("tlaplus_cli.cmd.modules.build.CompileServer", return_value=server)
+    mocker.patch("tlaplus_cli.cmd.modules.build.debounced", return_value=changes())
+
+    result = runner.invoke(app, ["modules", "build", str(project_dir), "--watch", "--poll"])
+
+    assert result.exit_code == 0, result.output
+    assert "; waiting for the next change" in result.output
+    server.compile.assert_called_once()
+    server.close.assert_called()
@@ -0,0 +1,146 @@
+import os
+import zipfile
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.tlc.jar import jar_inputs_path, jar_is_current, modules_jar_path, write_modules_jar
+
+SERVICE = "META-INF/services/tlc2.overrides.ITLCOverrides"
+
+
+@pytest.fixture
+def classes_dir(tmp_path):
+    classes = tmp_path / "classes"
+    (classes / "com" / "example").mkdir(parents=True)
+    (classes / "com" / "example" / "Ops.class").write_bytes(b"\xca\xfe\xba\xbe ops")
+    (classes / "TLCOverrides.class").write_bytes(b"\xca\xfe\xba\xbe overrides")
+    (classes / "META-INF" / "services").mkdir(parents=True)
+    (classes / SERVICE).write_text("TLCOverrides\n")
+    return classes
+
+
+def _lib_jar(path, entries):
+    with zipfile.ZipFile(path, "w") as z:
+        for name, data in entries.items():
+            z.writestr(name, data)
+    return path
+
+
+def test_jar_is_reproducible(classes_dir, tmp_path):
+    first = write_modules_jar(classes_dir, tmp_path / "a.jar")
+    os.utime(classes_dir / "TLCOverrides.class", (1, 1))
+    write_modules_jar(classes_dir, tmp_path / "b.jar")
+
+    assert (tmp_path / "a.jar").read_bytes() == (tmp_path / "b.jar").read_bytes()
+    assert sorted(first.entries) == ["TLCOverrides.class", "com/example/Ops.class"]
+
+
+def test_jar_layout(classes_dir, tmp_path):
+    jar = modules_jar_path(classes_dir)
+    write_modules_jar(classes_dir, jar)
+
+    assert jar == tmp_path / "modules.jar"
+    with zipfile.ZipFile(jar) as z:
+        names = z.namelist()
+        assert names[0] == "META-INF/MANIFEST.MF"
+        assert names[1:] == sorted(names[1:])
+        assert z.read(SERVICE) == b"TLCOverrides\n"
+        assert z.read("com/example/Ops.class") == b"\xca\xfe\xba\xbe ops"
+
+
+def test_merge_libs(classes_dir, tmp_path):
+    lib = _lib_jar(
+        tmp_path / "dep.jar",
+        {
+            "META-INF/MANIFEST.MF": "Manifest-Version: 1.0\n",
+            "META-INF/DEP.SF": "signature",
+            "module-info.class": b"mod",
+            "dep/Util.class": b"util",
+            "com/example/Ops.class": b"shadowed",
+            SERVICE: "# comment\nTLCOverrides\ndep.Overrides\n",
+        },
+    )
+    jar = tmp_path / "modules.jar"
+    contents = write_modules_jar(classes_dir, jar, lib_jars=[lib])
+
+    assert contents.duplicates == ["com/example/Ops.class"]
+    with zipfile.ZipFile(jar) as z:
+        names = set(z.namelist())
+        assert "dep/Util.class" in names
+        assert "META-INF/DEP.SF" not in names
+        assert "module-info.class" not in names
+        assert z.read("com/example/Ops.class") == b"\xca\xfe\xba\xbe ops"
+        assert z.read(SERVICE) == b"TLCOverrides\ndep.Overrides\n"
+        assert z.read("META-INF/MANIFEST.MF").startswith(b"Manifest-Version: 1.0")
+
+
+def test_invalid_lib_jar(classes_dir, tmp_path):
+    bad = tmp_path / "bad.jar"
+    bad.write_bytes(b"not a zip")
+    with pytest.raises(ValueError, match="not a valid jar"):
+        write_modules_jar(classes_dir, tmp_path / "modules.jar", lib_jars=[bad])
+    assert not (tmp_path / "modules.jar").exists()
+
+
+def test_jar_is_current(classes_dir, tmp_path):
+    jar = tmp_path / "modules.jar"
+    assert not jar_is_current(jar, classes_dir)
+    write_modules_jar(classes_dir, jar)
+    assert jar_is_current(jar, classes_dir)
+
+    newer = jar.stat().st_mtime + 10
+    os.utime(classes_dir / "TLCOverrides.class", (newer, newer))
+    assert not jar_is_current(jar, classes_dir)
+
+
+def test_jar_goes_stale_when_a_class_is_deleted(classes_dir, tmp_path):
+    jar = tmp_path / "modules.jar"
+    write_modules_jar(classes_dir, jar)
+    (classes_dir / "com" / "example" / "Ops.class").unlink()
+    assert not jar_is_current(jar, classes_dir)
+
+
+def test_jar_goes_stale_when_a_merged_jar_changes(classes_dir, tmp_path):
+    jar = tmp_path / "modules.jar"
+    lib = _lib_jar(tmp_path / "dep.jar", {"dep/Util.class": b"util"})
+    write_modules_jar(classes_dir, jar, lib_jars=[lib])
+    assert jar_is_current(jar, classes_dir)
+
+    _lib_jar(lib, {"dep/Util.class": b"util, version 2"})
+    assert not jar_is_current(jar, classes_dir)
+    lib.unlink()
+    assert not jar_is_current(jar, classes_dir)
+
+
+def test_jar_without_a_record_is_stale(classes_dir, tmp_path):
+    jar = tmp_path / "modules.jar"
+    write_modules_jar(classes_dir, jar)
+    jar_inputs_path(jar).unlink()
+    assert not jar_is_current(jar, classes_dir)
+
+
+def test_build_jar(mocker, tmp_path, base_settings, runner):
+    """modules build --merge-libs compiles, then packages the classes and dependency jars."""
+    project_dir = tmp_path / "my_project"
+    modules_dir = project_dir / "modules"
+    (modules_dir / "lib").mkdir(parents=True)
+    (modules_dir / "Foo.java").write_text("class Foo {}")
+    _lib_jar(modules_dir / "lib" / "dep.jar", {"dep/Util.class": b"util"})
+
+    mocker.patch("tlaplus_cli.tlc.compiler.load_config", return_value=base_settings.model_copy(deep=True))
+    mocker.patch("tlaplus_cli.tlc.compiler.workspace_root", return_value=tmp_path)
+    mocker.patch("tlaplus_cli.tlc.compiler.subprocess.run").return_value.returncode = 0
+    pinned_dir = tmp_path / "tools" / "v1.8.0"
+    pinned_dir.mkdir(parents=True)
+    (pinned_dir / "tla2tools.jar").write_bytes(b"fake")
+    mocker.patch("tlaplus_cli.tlc.compiler.get_pinned_version_dir", return_value=pinned_dir)
+
+    result = runner.invoke(app, ["modules", "build", str(project_dir), "--merge-libs"])
+
+    assert result.exit_code == 0, result.output
+    jar = project_dir / "modules.jar"
+    assert f"into {jar}" in result.output
+    assert "Merged 1 dependency jar(s)" in result.output
+    with zipfile.ZipFile(jar) as z:
+        assert {SERVICE, "dep/Util.class"} <= set(z.namelist())
@@ -0,0 +1,118 @@
+import gzip
+import io
+import sys
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.tlc.logcapture import SUMMARY, RateLimiter, RotatingGzipLog, TlcLog
+
+TLC_OUTPUT = b"""TLC2 Version 2.18
+Computing initial states...
+Error: Invariant TypeOK is violated.
+7 states generated, 5 distinct states found, 0 states left on queue.
+"""
+
+
+def _read(path):
+    with gzip.open(path, "rb") as f:
+        return f.read()
+
+
+def test_rotation_keeps_the_newest_output(tmp_path):
+    log = RotatingGzipLog(tmp_path / "run.log.gz", max_size=10, backups=2)
+    for i in range(5):
+        log.write(f"line {i}\n".encode())
+    log.close()
+
+    assert [p.name for p in log.files] == ["run.log.gz", "run.log.1.gz", "run.log.2.gz"]
+    assert _read(tmp_path / "run.log.gz") == b"line 4\n"
+    assert _read(tmp_path / "run.log.2.gz") == b"line 2\n"
+    assert log.rotations == 4
+    assert log.written == 35
+
+
+def test_rotation_without_backups(tmp_path):
+    log = RotatingGzipLog(tmp_path / "run.log.gz", max_size=4, backups=0)
+    log.write(b"first\n")
+    log.write(b"second\n")
+    log.close()
+
+    assert log.files == [tmp_path / "run.log.gz"]
+    assert _read(tmp_path / "run.log.gz") == b"second\n"
+
+
+def test_rate_limiter_refills_over_time():
+    now = [0.0]
+    limiter = RateLimiter(2, clock=lambda: now[0])
+
+    assert [limiter.allow() for _ in range(4)] == [True, True, False, False]
+    assert limiter.take_pending() == 2
+    now[0] = 0.5
+    assert limiter.allow()
+    assert not limiter.allow()
+    assert limiter.suppressed == 3
+
+
+def test_run_captures_output(tmp_path):
+    script = f"import sys; sys.stdout.buffer.write({TLC_OUTPUT!r})"
+    lines = []
+    echoed = []
+    log = TlcLog(tmp_path / "logs", max_size=1 << 20, console_rate=1)
+
+    code = log.run([sys.executable, "-c", script], tmp_path, "Spec-1", [lines.append], echo=echoed.append)
+
+    assert code == 0
+    assert _read(tmp_path / "logs" / "Spec-1.log.gz") == TLC_OUTPUT
+    assert len(lines) == 4
+    assert log.lines == 4
+    assert log.stats.error == "Error: Invariant TypeOK is violated."
+    assert log.stats.distinct_states == 5
+    assert echoed == ["TLC2 Version 2.18"]
+    assert log.suppressed == 3
+
+
+def test_summary_console_prints_nothing(tmp_path):
+    echoed = []
+    log = TlcLog(tmp_path, max_size=1 << 20, console=SUMMARY)
+    log.run([sys.executable, "-c", "print('hello')"], tmp_path, "Spec-2", echo=echoed.append)
+
+    assert echoed == []
+    assert log.suppressed == 1
+
+
+def test_tlc_log_dir(mock_tlc_env, mocker, runner, tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+    proc = mocker.MagicMock(stdout=io.BytesIO(TLC_OUTPUT), returncode=12)
+    proc.poll.return_value = 12
+    popen = mocker.patch("tlaplus_cli.tlc.logcapture.subprocess.Popen", return_value=proc)
+
+    result = runner.invoke(app, ["tlc", str(spec), "--log-dir", str(tmp_path / "logs"), "--log-console", "summary"])
+
+    assert result.exit_code == 12, result.output
+    assert popen.call_args[0][0][0] == "java"
+    assert "TLC output: 4 lines" in result.stdout
+    assert "Result: Error: Invariant TypeOK is violated. (5 distinct states)" in result.stdout
+    (log_file,) = (tmp_path / "logs").glob("Spec-*.log.gz")
+    assert _read(log_file) == TLC_OUTPUT
+    assert "TLC2 Version" not in result.stdout
+
+
+def test_tlc_log_console_must_be_known(mock_tlc_env, runner, tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--log-dir", str(tmp_path), "--log-console", "loud"])
+
+    assert result.exit_code == 1
+    assert "--log-console must be one of tail, summary" in result.output
+
+
+def test_tlc_log_options_need_log_dir(mock_tlc_env, runner, tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--log-max-size", "1G"])
+
+    assert result.exit_code == 1
+    assert "--log-max-size and --log-console need --log-dir" in result.output
+    mock_tlc_env.assert_not_called()
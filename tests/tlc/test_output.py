@@ -0,0 +1,30 @@
+from tlaplus_cli.tlc.output import TlcOutputParser, parse_tlc_output
+
+TRANSCRIPT = """\
+TLC2 Version 2.19 of 08 August 2024 (rev: 5a47802)
+Running breadth-first search Model-Checking with fp 22 and seed 0 with 1 worker on 8 cores
+Progress(4): 1,200 states generated (72,000 s/min), 900 distinct states found, 40 states left on queue.
+Progress(7): 9,000 states generated (468,000 s/min), 5,600 distinct states found, 0 states left on queue.
+Model checking completed. No error has been found.
+9,113 states generated, 5,650 distinct states found, 0 states left on queue.
+The depth of the complete state graph search is 12.
+"""
+
+
+def test_parse_tlc_output_summary():
+    stats = parse_tlc_output(TRANSCRIPT)
+    assert stats.states_generated == 9113
+    assert stats.distinct_states == 5650
+    assert stats.states_left == 0
+    assert stats.depth == 12
+    assert stats.peak_states_per_min == 468000
+    assert stats.completed
+    assert stats.error is None
+
+
+def test_parser_records_first_error():
+    parser = TlcOutputParser()
+    parser.feed("Error: Invariant TypeOK is violated.")
+    parser.feed("Error: The behavior up to this point is:")
+    assert parser.stats.error == "Error: Invariant TypeOK is violated."
+    assert not parser.stats.completed
@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.tlc.compiler import SERVICE_NAME
+from tlaplus_cli.tlc.plan_cache import EXISTS, MTIME, Stamps, fingerprint
+from tlaplus_cli.tlc.runner import resolve_launch_plan
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "proj"
+    (root / "spec").mkdir(parents=True)
+    (root / "lib").mkdir()
+    (root / "spec" / "Spec.tla").write_text("---- MODULE Spec ----\n====\n")
+    return root
+
+
+def test_fingerprint_modes(tmp_path):
+    f = tmp_path / "a.txt"
+    assert fingerprint(f, EXISTS) is None
+    f.write_text("x")
+    assert fingerprint(f, EXISTS) == "f"
+    assert fingerprint(tmp_path, EXISTS) == "d"
+    assert fingerprint(f, MTIME).startswith("f:")
+
+
+def test_stamps_report_the_first_changed_path(tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.write_text("1")
+    stamps = Stamps()
+    stamps.mtime(a)
+    stamps.exists(b)
+    assert stamps.changed() is None
+
+    b.write_text("now here")
+    assert stamps.changed() == str(b)
+    assert Stamps(stamps.entries).changed() == str(b)
+
+
+def test_second_launch_reuses_the_plan(mock_tlc_env, mocker, project):
+    validate = mocker.patch("tlaplus_cli.tlc.runner.validate_java_version")
+    spec = str(project / "spec" / "Spec.tla")
+
+    first = resolve_launch_plan(spec)
+    second = resolve_launch_plan(spec)
+
+    assert not first.cached
+    assert second.cached
+    assert second.plan == first.plan
+    assert second.plan_file == first.plan_file
+    assert validate.call_count == 1
+
+
+def test_new_lib_jar_invalidates_the_plan(mock_tlc_env, project):
+    spec = str(project / "spec" / "Spec.tla")
+    assert not any(p.endswith("dep.jar") for p in resolve_launch_plan(spec).plan.classpath)
+
+    (project / "lib" / "dep.jar").write_bytes(b"jar")
+    os.utime(project / "lib", ns=(0, 0))
+    launch = resolve_launch_plan(spec)
+
+    assert not launch.cached
+    assert str(project / "lib" / "dep.jar") in launch.plan.classpath
+
+
+def test_settings_and_arguments_are_part_of_the_key(mock_tlc_env, base_settings, project):
+    spec = str(project / "spec" / "Spec.tla")
+    resolve_launch_plan(spec)
+
+    assert not resolve_launch_plan(spec, cli_args=["-checkpoint", "5"]).cached
+    base_settings.java.opts = ["-Xmx1g"]
+    launch = resolve_launch_plan(spec)
+    assert not launch.cached
+    assert "-Xmx1g" in launch.plan.java_opts
+
+
+def test_rebuilt_overrides_invalidate_the_plan(mock_tlc_env, project):
+    spec = str(project / "spec" / "Spec.tla")
+    service = project / "classes" / "META-INF" / "services" / SERVICE_NAME
+    service.parent.mkdir(parents=True)
+    service.write_text("tlc2.overrides.TLCOverrides\n")
+    resolve_launch_plan(spec)
+
+    os.utime(service, ns=(0, 0))
+    assert not resolve_launch_plan(spec).cached
+
+
+def test_stale_modules_jar_is_not_cached(mock_tlc_env, project):
+    classes = project / "classes"
+    classes.mkdir()
+    (project / "modules.jar").write_bytes(b"jar")
+    os.utime(project / "modules.jar", ns=(0, 0))
+    (classes / "A.class").write_bytes(b"cafe")
+
+    launch = resolve_launch_plan(str(project / "spec" / "Spec.tla"))
+
+    assert launch.plan_file is None
+    assert not resolve_launch_plan(str(project / "spec" / "Spec.tla")).cached
+
+
+def test_print_plan(mock_tlc_env, project, runner):
+    spec = str(project / "spec" / "Spec.tla")
+
+    first = runner.invoke(app, ["tlc", spec, "--print-plan"])
+    second = runner.invoke(app, ["tlc", spec, "--print-plan"])
+
+    assert first.exit_code == 0, first.output
+    assert "Launch plan for Spec.tla (resolved now)" in first.stdout
+    assert "Launch plan for Spec.tla (cached, resolved" in second.stdout
+    assert "tla2tools.jar" in second.stdout
+    assert f"Working directory: {project / 'spec'}" in second.stdout
+    assert "paths checked per launch" in second.stdout
+    mock_tlc_env.assert_not_called()
@@ -0,0 +1,116 @@
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.config.schema import JavaProfile
+from tlaplus_cli.project import MANIFEST_FILE, find_project_root
+from tlaplus_cli.tlc.profiles import merge_tlc_args, resolve_tlc_options, spec_key
+
+MANIFEST = """\
+profiles:
+  huge:
+    opts: ["-Xmx200g", "-XX:MaxDirectMemorySize=64g"]
+    tlc_args: ["-workers", "2", "-fpbits", "1"]
+specs:
+  - spec: "*"
+    workers: auto
+  - spec: "spec/MC*.tla"
+    profile: huge
+    workers: 32
+    fpmem: 0.5
+    checkpoint: 60
+"""
+
+
+@pytest.fixture
+def project(tmp_path, base_settings):
+    base_settings.java.opts = ["-XX:+UseParallelGC"]
+    base_settings.java.profiles = {"smoke": JavaProfile(opts=["-XX:TieredStopAtLevel=1"])}
+    (tmp_path / MANIFEST_FILE).write_text(MANIFEST)
+    spec_dir = tmp_path / "spec"
+    spec_dir.mkdir()
+    for name in ("MCBig", "Small"):
+        (spec_dir / f"{name}.tla").write_text(f"---- MODULE {name} ----\n====\n")
+    return tmp_path
+
+
+def test_merge_tlc_args_later_layers_win():
+    merged = merge_tlc_args(["-workers", "2", "-deadlock"], ["-fpmem", "0.5", "-workers", "8"], ["-workers", "1"])
+    assert merged == ["-workers", "1", "-deadlock", "-fpmem", "0.5"]
+
+
+def test_manifest_marks_project_root(project):
+    assert find_project_root(project / "spec" / "Small.tla", modules_dir="modules", classes_dir="classes") == project
+
+
+def test_dry_run_applies_manifest_rules(mock_tlc_env, project, runner):
+    result = runner.invoke(app, ["tlc", str(project / "spec" / "MCBig.tla"), "--dry-run"])
+
+    assert result.exit_code == 0, result.output
+    assert f"Profile: huge (from {MANIFEST_FILE})" in result.stdout
+    cmd = result.stdout.splitlines()[-1]
+    assert "-Xmx200g" in cmd
+    assert "-XX:+UseParallelGC" not in cmd
+    assert "-workers 32 -fpbits 1 -fpmem 0.5 -checkpoint 60" in cmd
+    assert cmd.endswith("MCBig.tla")
+    mock_tlc_env.assert_not_called()
+
+
+def test_cfg_glob_matches_the_config_file(project, base_settings):
+    (project / MANIFEST_FILE).write_text('specs: [{spec: "*", cfg: "spec/Other.cfg", workers: 7}]\n')
+    spec = project / "spec" / "Small.tla"
+
+    default = resolve_tlc_options(base_settings.java, spec, project)
+    other = resolve_tlc_options(base_settings.java, spec, project, cli_args=["-config", "Other.cfg"])
+
+    assert "-workers" not in default.tlc_args
+    assert other.tlc_args[:2] == ["-workers", "7"]
+
+
+def test_dry_run_without_matching_profile(mock_tlc_env, project, runner):
+    result = runner.invoke(app, ["tlc", str(project / "spec" / "Small.tla"), "--dry-run"])
+
+    assert result.exit_code == 0, result.output
+    assert "Profile: none (java.opts)" in result.stdout
+    assert "-XX:+UseParallelGC -cp" in result.stdout
+    assert "-workers auto" in result.stdout
+
+
+def test_cli_profile_and_flags_override_manifest(mock_tlc_env, project, runner):
+    spec = project / "spec" / "MCBig.tla"
+    result = runner.invoke(app, ["tlc", str(spec), "--profile", "smoke", "--checkpoint", "5", "--dry-run"])
+
+    assert result.exit_code == 0, result.output
+    assert "Profile: smoke (from --profile)" in result.stdout
+    assert "-XX:TieredStopAtLevel=1" in result.stdout
+    assert "-Xmx200g" not in result.stdout
+    assert "-checkpoint 5" in result.stdout
+
+
+def test_saved_spec_profile_overrides_manifest(mock_tlc_env, project, base_settings, runner):
+    spec = project / "spec" / "MCBig.tla"
+    base_settings.java.spec_profiles = {spec_key(spec): "smoke"}
+
+    result = runner.invoke(app, ["tlc", str(spec), "--dry-run"])
+
+    assert "Profile: smoke (from java.spec_profiles)" in result.stdout
+
+
+def test_manifest_checkpoint_keeps_metadir(mock_tlc_env, project, runner):
+    result = runner.invoke(app, ["tlc", str(project / "spec" / "MCBig.tla")])
+
+    assert result.exit_code == 0
+    assert "Using profile 'huge'" in result.output
+    assert "metadir kept" in result.output
+
+
+def test_unknown_profile(mock_tlc_env, project, runner):
+    result = runner.invoke(app, ["tlc", str(project / "spec" / "Small.tla"), "--profile", "nope"])
+    assert result.exit_code == 1
+    assert "unknown profile 'nope'" in result.output
+
+
+def test_invalid_manifest(mock_tlc_env, project, runner):
+    (project / MANIFEST_FILE).write_text("specs: [{workers: [1, 2]}]\n")
+    result = runner.invoke(app, ["tlc", str(project / "spec" / "Small.tla"), "--dry-run"])
+    assert result.exit_code == 1
+    assert "Invalid project manifest" in result.output
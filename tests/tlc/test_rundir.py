@@ -0,0 +1,123 @@
+import os
+from collections import namedtuple
+from pathlib import Path
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.config.schema import RunDirConfig
+from tlaplus_cli.tlc.rundir import ACTIVE_MARKER, create_run_dir, finalize_run_dir, prune_run_dirs, runs_dir
+
+DiskUsage = namedtuple("DiskUsage", "total used free")
+
+
+def test_create_run_dir_defaults_to_cache():
+    run_dir = create_run_dir("queue", RunDirConfig())
+    assert run_dir.parent == runs_dir()
+    assert run_dir.name.startswith("queue-")
+    assert (run_dir / ACTIVE_MARKER).read_text() == str(os.getpid())
+
+
+def test_create_run_dir_prefers_scratch(tmp_path):
+    scratch = tmp_path / "shm"
+    scratch.mkdir()
+    run_dir = create_run_dir("queue", RunDirConfig(scratch_dirs=[str(scratch)]))
+    assert run_dir.parent == scratch / "tla-runs"
+
+
+def test_create_run_dir_skips_missing_scratch(tmp_path):
+    run_dir = create_run_dir("queue", RunDirConfig(scratch_dirs=[str(tmp_path / "missing")]))
+    assert run_dir.parent == runs_dir()
+
+
+def test_create_run_dir_skips_scratch_too_small(tmp_path, mocker):
+    scratch = tmp_path / "shm"
+    scratch.mkdir()
+
+    def disk_usage(path):
+        free = 10 if str(path).startswith(str(scratch)) else 100 * 1024**3
+        return DiskUsage(0, 0, free)
+
+    mocker.patch("tlaplus_cli.tlc.rundir.shutil.disk_usage", side_effect=disk_usage)
+    run_dir = create_run_dir("queue", RunDirConfig(scratch_dirs=[str(scratch)]))
+    assert run_dir.parent == runs_dir()
+
+
+def test_create_run_dir_preflight_fails(mocker):
+    mocker.patch("tlaplus_cli.tlc.rundir.shutil.disk_usage", return_value=DiskUsage(0, 0, 1024))
+    with pytest.raises(RuntimeError, match="Not enough free disk space"):
+        create_run_dir("queue", RunDirConfig())
+
+
+def test_finalize_removes_on_success_and_keeps_on_failure():
+    ok = create_run_dir("ok", RunDirConfig())
+    failed = create_run_dir("failed", RunDirConfig())
+    checkpointed = create_run_dir("ckpt", RunDirConfig())
+
+    assert finalize_run_dir(ok, success=True) is False
+    assert finalize_run_dir(failed, success=False) is True
+    assert finalize_run_dir(checkpointed, success=True, keep=True) is True
+
+    assert not ok.exists()
+    assert failed.exists()
+    assert not (failed / ACTIVE_MARKER).exists()
+    assert checkpointed.exists()
+
+
+def test_prune_run_dirs_applies_retention_and_skips_active():
+    config = RunDirConfig(keep=1, max_age="1d")
+    old = create_run_dir("old", config)
+    newer = create_run_dir("newer", config)
+    newest = create_run_dir("newest", config)
+    active = create_run_dir("active", config)
+    for d in (old, newer, newest):
+        finalize_run_dir(d, success=False)
+    now = 1_800_000_000
+    os.utime(old, (now - 3 * 86400, now - 3 * 86400))
+    os.utime(newer, (now - 3600, now - 3600))
+    os.utime(newest, (now - 60, now - 60))
+
+    removed = prune_run_dirs(config, now=now)
+
+    assert set(removed) == {old, newer}
+    assert newest.exists()
+    assert active.exists()
+
+
+def test_tlc_passes_metadir_and_cleans_up(mock_tlc_env, tmp_path, runner):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec)])
+
+    assert result.exit_code == 0
+    cmd = mock_tlc_env.call_args.args[0]
+    metadir = cmd[cmd.index("-metadir") + 1]
+    assert cmd[-1] == "Spec.tla"
+    assert not Path(metadir).exists()
+
+
+def test_tlc_keeps_metadir_on_failure(mock_tlc_env, tmp_path, runner):
+    mock_tlc_env.return_value.returncode = 12
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec)])
+
+    assert result.exit_code == 12
+    cmd = mock_tlc_env.call_args.args[0]
+    metadir = cmd[cmd.index("-metadir") + 1]
+    assert Path(metadir).is_dir()
+    assert "metadir kept" in result.output
+
+
+def test_tlc_checkpoint_keeps_metadir(mock_tlc_env, tmp_path, runner):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--checkpoint", "10"])
+
+    assert result.exit_code == 0
+    cmd = mock_tlc_env.call_args.args[0]
+    assert cmd[cmd.index("-checkpoint") + 1] == "10"
+    assert Path(cmd[cmd.index("-metadir") + 1]).is_dir()
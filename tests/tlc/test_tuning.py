@@ -0,0 +1,117 @@
+import pytest
+
+from tlaplus_cli.bench import RunMeasurement
+from tlaplus_cli.cli import app
+from tlaplus_cli.config.schema import JavaProfile
+from tlaplus_cli.tlc.profiles import get_profile, spec_key
+from tlaplus_cli.tlc.tuning import ProfileResult, pick_winner
+
+
+@pytest.fixture
+def profiled_settings(base_settings):
+    base_settings.java.opts = ["-XX:+UseParallelGC"]
+    base_settings.java.profiles = {
+        "g1": JavaProfile(opts=["-XX:+UseG1GC", "-Xmx2g"], tlc_args=["-workers", "2"]),
+        "fpbits": JavaProfile(tlc_args=["-fpbits", "1"]),
+    }
+    return base_settings
+
+
+@pytest.fixture
+def spec_file(tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+    return spec
+
+
+def test_get_profile(profiled_settings):
+    profiles = profiled_settings.java.profiles
+    assert get_profile(profiles, "default") == JavaProfile()
+    assert get_profile(profiles, "g1").tlc_args == ["-workers", "2"]
+    with pytest.raises(ValueError, match="unknown profile 'zgc'"):
+        get_profile(profiles, "zgc")
+
+
+def test_tlc_uses_saved_spec_profile(mock_tlc_env, profiled_settings, spec_file, runner):
+    profiled_settings.java.spec_profiles = {spec_key(spec_file): "g1"}
+
+    result = runner.invoke(app, ["tlc", str(spec_file)])
+
+    assert result.exit_code == 0
+    cmd = mock_tlc_env.call_args.args[0]
+    assert "-XX:+UseG1GC" in cmd
+    assert "-XX:+UseParallelGC" not in cmd
+    assert cmd[cmd.index("-workers") + 1] == "2"
+    assert "Using profile 'g1'" in result.output
+
+
+def test_tlc_profile_without_opts_keeps_java_opts(mock_tlc_env, profiled_settings, spec_file, runner):
+    profiled_settings.java.spec_profiles = {spec_key(spec_file): "fpbits"}
+
+    result = runner.invoke(app, ["tlc", str(spec_file)])
+
+    assert result.exit_code == 0
+    cmd = mock_tlc_env.call_args.args[0]
+    assert "-XX:+UseParallelGC" in cmd
+    assert cmd[cmd.index("-fpbits") + 1] == "1"
+
+
+def test_pick_winner_skips_failed_profiles():
+    fast = ProfileResult(profile="fast", runs=[RunMeasurement(exit_code=12, wall_time=1.0, states_generated=900)])
+    slow = ProfileResult(profile="slow", runs=[RunMeasurement(exit_code=0, wall_time=1.0, states_generated=100)])
+    assert pick_winner([fast, slow]) is slow
+    assert pick_winner([fast]) is None
+
+
+def _fake_measure(cmd, _cwd):
+    states = 2000 if "-XX:+UseG1GC" in cmd else 1000
+    return RunMeasurement(exit_code=0, wall_time=1.0, states_generated=states, peak_rss=1024**3), None
+
+
+def test_compare_opts_alternates_and_saves_winner(mocker, mock_tlc_env, profiled_settings, spec_file, runner):
+    mocker.patch("tlaplus_cli.tlc.tuning.load_config", return_value=profiled_settings)
+    mocker.patch("tlaplus_cli.cmd.tlc.load_config", return_value=profiled_settings)
+    measure = mocker.patch("tlaplus_cli.tlc.tuning.measure_tlc", side_effect=_fake_measure)
+    save = mocker.patch("tlaplus_cli.cmd.tlc.save_spec_profile")
+
+    result = runner.invoke(
+        app, ["tlc", str(spec_file), "--compare-opts", "default", "--compare-opts", "g1", "--repeat", "2"], input="y\n"
+    )
+
+    assert result.exit_code == 0, result.output
+    used_g1 = ["-XX:+UseG1GC" in call.args[0] for call in measure.call_args_list]
+    assert used_g1 == [False, True] * 3
+    assert "+100.0%" in result.stdout
+    save.assert_called_once_with(spec_file.absolute(), "g1")
+    mock_tlc_env.assert_not_called()
+
+
+def test_compare_opts_unknown_profile(mocker, mock_tlc_env, profiled_settings, spec_file, runner):
+    mocker.patch("tlaplus_cli.tlc.tuning.load_config", return_value=profiled_settings)
+
+    result = runner.invoke(app, ["tlc", str(spec_file), "--compare-opts", "default", "--compare-opts", "zgc"])
+
+    assert result.exit_code == 1
+    assert "unknown profile 'zgc'" in result.output
+
+
+def test_compare_opts_needs_two_profiles(mock_tlc_env, spec_file, runner):
+    result = runner.invoke(app, ["tlc", str(spec_file), "--compare-opts", "g1"])
+    assert result.exit_code == 1
+    assert "at least two" in result.output
+
+
+def test_compare_opts_rejects_conflicting_flags(mock_tlc_env, spec_file, runner):
+    args = ["--compare-opts", "default", "--compare-opts", "g1", "--checkpoint", "5", "--cpus", "2"]
+    result = runner.invoke(app, ["tlc", str(spec_file), *args])
+    assert result.exit_code == 1
+    assert "--compare-opts cannot be combined with --checkpoint, --cpus" in result.output
+    mock_tlc_env.assert_not_called()
+
+
+def test_compare_opts_rejects_profile_record_trace_and_watch(mock_tlc_env, spec_file, runner):
+    args = ["--compare-opts", "default", "--compare-opts", "g1", "--profile", "g1", "--record-trace", "--watch"]
+    result = runner.invoke(app, ["tlc", str(spec_file), *args])
+    assert result.exit_code == 1
+    assert "--compare-opts cannot be combined with --profile, --record-trace, --watch" in result.output
+    mock_tlc_env.assert_not_called()
@@ -0,0 +1,175 @@
+import io
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.tlc.output import TlcStats
+from tlaplus_cli.tlc.runner import TlcPlan
+from tlaplus_cli.tlc.watch import (
+    STANDBY_CLASS,
+    CheckOutcome,
+    StandbyJvm,
+    WatchSession,
+    config_file,
+)
+
+PASS_OUTPUT = """\
+Model checking completed. No error has been found.
+12 states generated, 5 distinct states found, 0 states left on queue.
+The depth of the complete state graph search is 3.
+"""
+
+
+def _plan(spec_file, tlc_args=()):
+    return TlcPlan(
+        spec_file=spec_file,
+        java_opts=["-Xmx1g"],
+        classpath=["tla2tools.jar"],
+        java_class="tlc2.TLC",
+        tlc_args=list(tlc_args),
+    )
+
+
+class _Watcher:
+    def __init__(self, *batches):
+        self.batches = list(batches)
+
+    def wait(self, _timeout):
+        return self.batches.pop(0) if self.batches else set()
+
+    def close(self):
+        pass
+
+
+def _proc(output, polls):
+    proc = MagicMock()
+    proc.stdout = io.StringIO(output)
+    proc.stdin = io.StringIO()
+    proc.poll.side_effect = [*polls, 0, 0, 0]
+    proc.returncode = 0
+    return proc
+
+
+def test_config_file(tmp_path):
+    spec = tmp_path / "Spec.tla"
+    assert config_file(_plan(spec)) == tmp_path / "Spec.cfg"
+    assert config_file(_plan(spec, ["-config", "MC.cfg", "-workers", "2"])) == tmp_path / "MC.cfg"
+
+
+def test_standby_jvm(mocker, tmp_path):
+    proc = _proc("", [None, None])
+    popen = mocker.patch("tlaplus_cli.tlc.watch.subprocess.Popen", return_value=proc)
+    plan = _plan(tmp_path / "Spec.tla")
+
+    standby = StandbyJvm(plan, tmp_path / "helper")
+
+    cmd = popen.call_args[0][0]
+    assert cmd[:4] == ["java", "-Xmx1g", "-cp", os.pathsep.join(["tla2tools.jar", str(tmp_path / "helper")])]
+    assert cmd[4:6] == [STANDBY_CLASS, "tlc2.TLC"]
+    assert popen.call_args.kwargs["cwd"] == str(tmp_path)
+    assert standby.matches(plan)
+    assert not standby.matches(_plan(tmp_path / "other" / "Spec.tla"))
+
+    assert standby.launch(["-metadir", "/run", "Spec.tla"]) is proc
+    assert proc.stdin.getvalue() == "-metadir\n/run\nSpec.tla\n\n"
+
+
+@pytest.fixture
+def session(mocker, base_settings):
+    mocker.patch("tlaplus_cli.tlc.watch.load_config", return_value=base_settings)
+    return WatchSession("Spec")
+
+
+def test_check_passes_and_removes_run_dir(mocker, session, tmp_path):
+    proc = _proc(PASS_OUTPUT, [None])
+    popen = mocker.patch("tlaplus_cli.tlc.watch.subprocess.Popen", return_value=proc)
+
+    outcome, changed = session.check(_plan(tmp_path / "Spec.tla"), _Watcher())
+
+    assert changed == set()
+    assert outcome.passed
+    assert outcome.stats.distinct_states == 5
+    assert outcome.run_dir is None
+    cmd = popen.call_args[0][0]
+    assert cmd[-1] == "Spec.tla"
+    assert not Path(cmd[cmd.index("-metadir") + 1]).exists()
+
+
+def test_check_uses_standby_jvm(mocker, session, tmp_path):
+    plan = _plan(tmp_path / "Spec.tla")
+    standby = MagicMock()
+    standby.matches.return_value = True
+    standby.launch.return_value = _proc(PASS_OUTPUT, [])
+    popen = mocker.patch("tlaplus_cli.tlc.watch.subprocess.Popen")
+    session.standby = standby
+
+    outcome, _ = session.check(plan, _Watcher())
+
+    assert outcome.passed
+    popen.assert_not_called()
+    assert standby.launch.call_args[0][0][-1] == "Spec.tla"
+    assert session.standby is None
+
+
+def test_check_cancelled_by_change(mocker, session, tmp_path):
+    proc = _proc("Starting...\n", [])
+    proc.poll.side_effect = lambda: 143 if proc.terminate.called else None
+    proc.returncode = 143
+    mocker.patch("tlaplus_cli.tlc.watch.subprocess.Popen", return_value=proc)
+    edited = tmp_path / "Spec.tla"
+
+    outcome, changed = session.check(_plan(edited), _Watcher(set(), {edited}))
+
+    assert changed == {edited}
+    assert outcome.cancelled
+    proc.terminate.assert_called_once()
+
+
+def test_tlc_watch_rejects_conflicting_flags(tmp_path, runner):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+    result = runner.invoke(app, ["tlc", str(spec), "--watch", "--coverage", "1"])
+    assert result.exit_code == 1
+    assert "--watch cannot be combined with --coverage" in result.output
+
+    result = runner.invoke(app, ["tlc", str(spec), "--watch", "--keep-metadir"])
+    assert result.exit_code == 1
+    assert "--watch cannot be combined with --keep-metadir" in result.output
+
+    result = runner.invoke(app, ["tlc", str(spec), "--watch", "--profile-spec"])
+    assert result.exit_code == 1
+    assert result.output.strip().endswith("--watch cannot be combined with --profile-spec")
+
+
+def test_tlc_watch_loop(mocker, tmp_path, runner):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+    plan = _plan(spec)
+    failure = CheckOutcome(
+        returncode=12,
+        stats=TlcStats(error="Error: Invariant TypeOK is violated."),
+        elapsed=0.4,
+        trace_states=3,
+        run_dir=tmp_path / "Spec-run",
+    )
+    success = CheckOutcome(returncode=0, stats=TlcStats(distinct_states=1234, depth=7), elapsed=0.2)
+    session = MagicMock()
+    session.plan.return_value = plan
+    session.overrides.return_value = None
+    session.inputs.return_value = [spec]
+    session.watcher.return_value = MagicMock(wait=MagicMock(side_effect=[{spec}, set(), KeyboardInterrupt]))
+    session.check.side_effect = [(failure, set()), (success, set())]
+    mocker.patch("tlaplus_cli.cmd.tlc.WatchSession", return_value=session)
+
+    result = runner.invoke(app, ["tlc", str(spec), "--watch"])
+
+    assert result.exit_code == 0, result.output
+    assert "✗ FAIL Spec.tla: Error: Invariant TypeOK is violated." in result.output
+    assert "Counterexample: 3 states ('tla trace show Spec-run')" in result.output
+    assert "✓ PASS Spec.tla: 1,234 distinct states, depth 7" in result.output
+    assert "Stopped watching." in result.output
+    assert session.prepare.call_count == 2
+    session.close.assert_called_once()
@@ -0,0 +1,151 @@
+import os
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.units import parse_duration, parse_size
+from tlaplus_cli.versioning import auto_gc, collect_gc_entries, get_last_used, plan_gc, record_usage
+from tlaplus_cli.versioning.usage import LAST_USED_FILE
+
+DAY = 86400
+
+
+@pytest.fixture
+def aged_versions(make_installed_version, mock_cache):
+    """Three installed versions, last used 1, 10 and 100 days ago; v1.8.0 is pinned."""
+    now = 1_800_000_000
+    dirs = {}
+    for name, sha, age_days in [("v1.8.0", "aaaaaaa", 1), ("v1.7.0", "bbbbbbb", 10), ("v1.6.0", "ccccccc", 100)]:
+        d = make_installed_version(name, sha)
+        marker = d / LAST_USED_FILE
+        marker.touch()
+        ts = now - age_days * DAY
+        os.utime(marker, (ts, ts))
+        dirs[name] = d
+    (mock_cache / "tools" / "tools-pinned-version.txt").write_text("v1.8.0-aaaaaaa")
+    return now, dirs
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("1024", 1024), ("2K", 2048), ("500M", 500 * 1024**2), ("2G", 2 * 1024**3), ("1.5GiB", int(1.5 * 1024**3))],
+)
+def test_parse_size(text, expected):
+    assert parse_size(text) == expected
+
+
+def test_parse_size_invalid():
+    with pytest.raises(ValueError, match="invalid size"):
+        parse_size("lots")
+
+
+def test_parse_duration():
+    assert parse_duration("30d") == 30 * DAY
+    assert parse_duration("12h") == 12 * 3600
+    with pytest.raises(ValueError, match="invalid duration"):
+        parse_duration("soon")
+
+
+def test_record_usage_updates_last_used(tmp_path):
+    version_dir = tmp_path / "v1.8.0-aaaaaaa"
+    version_dir.mkdir()
+    os.utime(version_dir, (1000, 1000))
+    assert get_last_used(version_dir) == 1000
+
+    record_usage(version_dir)
+    assert get_last_used(version_dir) > 1000
+
+
+def test_plan_gc_older_than_never_evicts_pinned(aged_versions):
+    now, _ = aged_versions
+    victims = plan_gc(collect_gc_entries(), older_than=5 * DAY, now=now)
+    assert [e.version.name for e in victims] == ["v1.6.0", "v1.7.0"]
+
+
+def test_plan_gc_keep_last(aged_versions):
+    now, _ = aged_versions
+    victims = plan_gc(collect_gc_entries(), keep_last=2, now=now)
+    assert [e.version.name for e in victims] == ["v1.6.0"]
+
+
+def test_plan_gc_max_size_evicts_lru_first(aged_versions):
+    now, _ = aged_versions
+    entries = collect_gc_entries()
+    one_version = entries[0].size
+    victims = plan_gc(entries, max_size=2 * one_version, now=now)
+    assert [e.version.name for e in victims] == ["v1.6.0"]
+
+
+def test_plan_gc_pinned_is_never_evicted_even_when_lru(aged_versions, mock_cache):
+    now, _ = aged_versions
+    (mock_cache / "tools" / "tools-pinned-version.txt").write_text("v1.6.0-ccccccc")
+    victims = plan_gc(collect_gc_entries(), max_size=0, now=now)
+    assert "v1.6.0" not in [e.version.name for e in victims]
+
+
+def test_sizes_are_cached_until_a_version_changes(aged_versions, mocker):
+    _, dirs = aged_versions
+    walk = mocker.patch("tlaplus_cli.versioning.gc.dir_size", return_value=100)
+    assert {e.size for e in collect_gc_entries()} == {100}
+    assert walk.call_count == 3
+
+    (dirs["v1.7.0"] / "extra.jar").write_bytes(b"x")
+    os.utime(dirs["v1.7.0"], ns=(0, dirs["v1.7.0"].stat().st_mtime_ns + 1))
+    collect_gc_entries()
+
+    assert [c.args[0] for c in walk.call_args_list[3:]] == [dirs["v1.7.0"]]
+
+
+def test_auto_gc_skips_the_size_walk_when_nothing_can_be_evicted(aged_versions, mocker):
+    walk = mocker.patch("tlaplus_cli.versioning.gc.dir_size", return_value=100)
+    assert auto_gc("1", keep_last=3) == []
+    walk.assert_not_called()
+
+    assert [e.version.name for e in auto_gc("1", keep_last=2)] == ["v1.6.0"]
+
+
+def test_gc_dry_run_reports_bytes(aged_versions, mock_load_config, runner):
+    _, dirs = aged_versions
+    result = runner.invoke(app, ["tools", "gc", "--keep-last", "1", "--dry-run"])
+    assert result.exit_code == 0
+    assert "Would remove v1.6.0-ccccccc" in result.stdout
+    assert "Would reclaim" in result.stdout
+    assert all(d.exists() for d in dirs.values())
+
+
+def test_gc_removes_versions(aged_versions, mock_load_config, runner):
+    _, dirs = aged_versions
+    result = runner.invoke(app, ["tools", "gc", "--keep-last", "1"])
+    assert result.exit_code == 0
+    assert "Reclaimed" in result.stdout
+    assert dirs["v1.8.0"].exists()
+    assert not dirs["v1.7.0"].exists()
+    assert not dirs["v1.6.0"].exists()
+
+
+def test_gc_requires_a_policy(mock_load_config, runner):
+    result = runner.invoke(app, ["tools", "gc"])
+    assert result.exit_code == 1
+    assert "Specify at least one" in result.output
+
+
+def test_gc_invalid_size(mock_load_config, runner):
+    result = runner.invoke(app, ["tools", "gc", "--max-size", "huge"])
+    assert result.exit_code == 1
+    assert "invalid size" in result.output
+
+
+def test_run_tlc_records_usage(mocker, tmp_path, base_settings, runner):
+    mocker.patch("tlaplus_cli.tlc.runner.load_config", return_value=base_settings)
+    mocker.patch("tlaplus_cli.tlc.runner.validate_java_version")
+    version_dir = tmp_path / "tools" / "v1.8.0-aaaaaaa"
+    version_dir.mkdir(parents=True)
+    (version_dir / "tla2tools.jar").write_bytes(b"fake")
+    mocker.patch("tlaplus_cli.tlc.compiler.get_pinned_version_dir", return_value=version_dir)
+    mocker.patch("tlaplus_cli.tlc.runner.subprocess.run").return_value.returncode = 0
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec)])
+    assert result.exit_code == 0
+    assert (version_dir / LAST_USED_FILE).exists()
@@ -196,3 +196,49 @@ def test_install_from_url_network_error(mock_cache, mock_load_config, mocker, ru
     result = runner.invoke(app, ["tools", "install", url])
     assert result.exit_code == 1
     assert "Failed to download" in result.output
+
+
+# --- Multi-version install ---
+
+
+def test_install_multiple_versions_single_fetch(mock_github_api, mock_load_config, mock_cache, runner):
+    """All versions are resolved from one remote fetch and installed; the first one is auto-pinned."""
+    get = requests.get
+    result = runner.invoke(app, ["tools", "install", "v1.7.0", "v1.8.0"])
+    assert result.exit_code == 0
+    assert "Successfully installed v1.7.0" in result.stdout
+    assert "Successfully installed v1.8.0" in result.stdout
+    assert (mock_cache / "tools" / "v1.7.0-bbbbbbb" / "tla2tools.jar").exists()
+    assert (mock_cache / "tools" / "v1.8.0-aaaaaaa" / "tla2tools.jar").exists()
+    tags_calls = [c for c in get.call_args_list if "tags" in c.args[0]]
+    assert len(tags_calls) == 1
+
+    pin_file = mock_cache / "tools" / "tools-pinned-version.txt"
+    assert pin_file.read_text().strip() == "v1.7.0-bbbbbbb"
+
+
+def test_install_multiple_unknown_version_fails_before_download(mock_github_api, mock_load_config, mock_cache, runner):
+    result = runner.invoke(app, ["tools", "install", "v1.8.0", "v9.9.9"])
+    assert result.exit_code == 1
+    assert "Version v9.9.9 not found" in result.output
+    assert not (mock_cache / "tools" / "v1.8.0-aaaaaaa").exists()
+
+
+def test_install_multiple_reports_per_version_failure(mock_github_api, mock_load_config, mock_cache, mocker, runner):
+    """A failed download is reported for its version; the others are still installed and pinned."""
+
+    def flaky(_url, jar_path, label, _progress=None):
+        if label == "v1.7.0":
+            msg = "connection reset"
+            raise requests.RequestException(msg)
+        jar_path.write_bytes(b"jar")
+
+    mocker.patch("tlaplus_cli.versioning.downloader._download_jar", side_effect=flaky)
+
+    result = runner.invoke(app, ["tools", "install", "v1.7.0", "v1.8.0"])
+    assert result.exit_code == 1
+    assert "Failed to download v1.7.0: connection reset" in result.output
+    assert "Successfully installed v1.8.0" in result.stdout
+    assert not (mock_cache / "tools" / "v1.7.0-bbbbbbb").exists()
+    pin_file = mock_cache / "tools" / "tools-pinned-version.txt"
+    assert pin_file.read_text().strip() == "v1.8.0-aaaaaaa"
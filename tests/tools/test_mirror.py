@@ -0,0 +1,23 @@
+from tlaplus_cli.cli import app
+
+
+def test_mirror_sync_populates_directory(mock_github_api, mock_cache, tmp_path, mocker, runner):
+    mocker.patch(
+        "tlaplus_cli.versioning.downloader._download_jar",
+        side_effect=lambda _url, path, _label: path.write_bytes(b"jar"),
+    )
+    mirror = tmp_path / "mirror"
+
+    result = runner.invoke(app, ["tools", "mirror", "sync", str(mirror), "v1.8.0"])
+
+    assert result.exit_code == 0
+    assert "Mirrored v1.8.0-aaaaaaa" in result.stdout
+    assert (mirror / "versions.json").exists()
+    assert (mirror / "v1.8.0-aaaaaaa" / "tla2tools.jar").exists()
+    assert not (mirror / "v1.7.0-bbbbbbb").exists()
+
+
+def test_mirror_sync_unknown_version(mock_github_api, mock_cache, tmp_path, runner):
+    result = runner.invoke(app, ["tools", "mirror", "sync", str(tmp_path / "mirror"), "v9.9.9"])
+    assert result.exit_code == 1
+    assert "not found" in result.output
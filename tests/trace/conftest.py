@@ -0,0 +1,42 @@
+import pytest
+
+from tlaplus_cli.trace import TraceRecorder
+
+TLC_OUTPUT = """\
+Starting... (2024-09-01 12:00:00)
+Error: Invariant Bounded is violated.
+Error: The behavior up to this point is:
+State 1: <Initial predicate>
+/\\ x = 0
+/\\ q = <<>>
+
+State 2: <Send line 12, col 5 to line 14, col 20 of module Queue>
+/\\ x = 1
+/\\ q = << [ id |-> 1,
+     payload |-> "a" ] >>
+
+State 3: <Send line 12, col 5 to line 14, col 20 of module Queue>
+/\\ x = 2
+/\\ q = << [ id |-> 1,
+     payload |-> "a" ] >>
+
+4: Stuttering
+3 states generated, 3 distinct states found, 0 states left on queue.
+"""
+
+
+@pytest.fixture
+def tlc_output():
+    return TLC_OUTPUT
+
+
+@pytest.fixture
+def recorded_run(mocker, tmp_path, base_settings, tlc_output):
+    mocker.patch("tlaplus_cli.cmd.trace.show.load_config", return_value=base_settings)
+    run_dir = tmp_path / "run-cache" / "runs" / "Queue-20240901T120000-abcd"
+    run_dir.mkdir(parents=True)
+    recorder = TraceRecorder(run_dir, "Queue.tla")
+    for line in tlc_output.splitlines(keepends=True):
+        recorder.feed(line)
+    recorder.close()
+    return run_dir
@@ -0,0 +1,80 @@
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.trace import (
+    TraceReader,
+    TraceState,
+    TraceWriter,
+    change_masks,
+    changed_steps,
+    load_columns,
+    summarize_changes,
+)
+
+
+@pytest.fixture
+def long_trace(tmp_path):
+    """x changes every step, y every third step; step 5 (to state 6) is a stutter."""
+    writer = TraceWriter(tmp_path)
+    x = y = 0
+    for n in range(1, 11):
+        if n > 1 and n != 6:
+            x += 1
+            if n % 3 == 0:
+                y += 1
+        label = "<Initial predicate>" if n == 1 else ("<Tick line 3, col 1>" if n % 3 else "<Tock line 5, col 1>")
+        writer.append(TraceState(number=n, label=label, values={"x": str(x), "y": f"<<{y}>>"}))
+    writer.close(spec="Clock.tla")
+    with TraceReader(tmp_path) as trace:
+        yield trace
+
+
+def test_change_masks(long_trace):
+    columns = load_columns(long_trace)
+    masks = change_masks(columns)
+
+    assert masks["x"] == bytes([1, 1, 1, 1, 0, 1, 1, 1, 1])
+    assert masks["y"] == bytes([0, 1, 0, 0, 0, 0, 0, 1, 0])
+
+
+def test_summarize_changes(long_trace):
+    columns = load_columns(long_trace)
+    summary = summarize_changes(columns, change_masks(columns))
+
+    assert summary.steps == 9
+    assert summary.stutter_steps == [6]
+    assert summary.changes.most_common(1) == [("x", 8)]
+    assert summary.actions == {"Tick": 6, "Tock": 3}
+
+
+def test_changed_steps_filters(long_trace):
+    columns = load_columns(long_trace)
+    masks = change_masks(columns)
+
+    assert list(changed_steps(columns, masks, variables=["y"])) == [(2, ["y"]), (8, ["y"])]
+    assert [i for i, _ in changed_steps(columns, masks, action="Tock")] == [2, 8]
+    assert list(changed_steps(columns, masks))[1] == (2, ["x", "y"])
+
+
+def test_missing_values_inherit_previous(tmp_path):
+    writer = TraceWriter(tmp_path)
+    writer.append(TraceState(number=1, label="<Initial predicate>", values={"x": "0"}))
+    writer.append(TraceState(number=2, label="Stuttering"))
+    writer.close()
+    with TraceReader(tmp_path) as trace:
+        columns = load_columns(trace)
+        summary = summarize_changes(columns, change_masks(columns))
+    assert summary.stutter_steps == [2]
+
+
+def test_trace_diff_cli(recorded_run, runner):
+    result = runner.invoke(app, ["trace", "diff", "Queue"])
+
+    assert result.exit_code == 0, result.output
+    assert "State 2: <Send line 12, col 5 to line 14, col 20 of module Queue>  [x, q]" in result.stdout
+    assert "State 3: <Send line 12, col 5 to line 14, col 20 of module Queue>  [x]" in result.stdout
+    assert "Steps: 3 (1 stutter step)" in result.stdout
+
+    result = runner.invoke(app, ["trace", "diff", "Queue", "--vars", "q", "--stats"])
+    assert result.exit_code == 0
+    assert "State 2" not in result.stdout
@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from tlaplus_cli.cli import app
+from tlaplus_cli.trace import TRACE_DIR, TraceParser, TraceReader, TraceRecorder, TraceState, TraceWriter
+
+
+def _parse(text):
+    parser = TraceParser()
+    states = [s for line in text.splitlines(keepends=True) if (s := parser.feed(line))]
+    if (last := parser.flush()) is not None:
+        states.append(last)
+    return parser, states
+
+
+def test_parser_reads_states_and_multiline_values(tlc_output):
+    _, states = _parse(tlc_output)
+
+    assert [s.number for s in states] == [1, 2, 3, 4]
+    assert [s.action for s in states] == ["Init", "Send", "Send", "Stuttering"]
+    assert states[1].values["q"] == '<< [ id |-> 1,\n     payload |-> "a" ] >>'
+    assert states[3].values == {}
+
+
+def test_parser_lasso_and_single_variable():
+    parser, states = _parse("State 1: <Initial predicate>\nx = 0\n\nState 2: <Inc>\nx = 1\n\nBack to state 1: <Inc>\n")
+    assert [s.values for s in states] == [{"x": "0"}, {"x": "1"}]
+    assert parser.back_to == 1
+
+
+def test_store_random_access(tmp_path):
+    writer = TraceWriter(tmp_path)
+    for i in range(1, 1001):
+        values = {"x": str(i)} if i < 500 else {"x": str(i), "y": f"<<{i}>>"}
+        writer.append(TraceState(number=i, label="<Next>", values=values))
+    writer.close(spec="Spec.tla")
+
+    with TraceReader(tmp_path) as trace:
+        assert len(trace) == 1000
+        assert trace.variables == ["x", "y"]
+        assert trace.state(9).values == {"x": "10"}
+        assert trace.state(811).values == {"x": "812", "y": "<<812>>"}
+        with pytest.raises(IndexError):
+            trace.state(1000)
+
+
+def test_recorder_without_trace_creates_nothing(tmp_path):
+    recorder = TraceRecorder(tmp_path, "Spec.tla")
+    recorder.feed("Model checking completed. No error has been found.\n")
+    assert recorder.close() == 0
+    assert not (tmp_path / TRACE_DIR).exists()
+
+
+def test_tlc_record_trace_streams_output(mocker, mock_tlc_env, tmp_path, runner, tlc_output):
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = iter(tlc_output.splitlines(keepends=True))
+    proc.returncode = 12
+    popen = mocker.patch("tlaplus_cli.tlc.runner.subprocess.Popen", return_value=proc)
+    spec = tmp_path / "Queue.tla"
+    spec.write_text("---- MODULE Queue ----\n====\n")
+
+    result = runner.invoke(app, ["tlc", str(spec), "--record-trace"])
+
+    assert result.exit_code == 12
+    assert "Invariant Bounded is violated" in result.stdout
+    assert "Counterexample with 4 states saved" in result.output
+    mock_tlc_env.assert_not_called()
+    cmd = popen.call_args.args[0]
+    run_dir = cmd[cmd.index("-metadir") + 1]
+    with TraceReader(tmp_path / run_dir / TRACE_DIR) as trace:
+        assert trace.meta["error"] == "Error: Invariant Bounded is violated."
+        assert trace.state(2).values["x"] == "2"
+
+
+def test_trace_show_summary(recorded_run, runner):
+    result = runner.invoke(app, ["trace", "show"])
+    assert result.exit_code == 0, result.output
+    assert "States:    4" in result.stdout
+    assert "Variables: x, q" in result.stdout
+
+
+def test_trace_show_state_and_vars(recorded_run, runner):
+    result = runner.invoke(app, ["trace", "show", "Queue", "--state", "3", "--vars", "x"])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "State 3: <Send line 12, col 5 to line 14, col 20 of module Queue>\n/\\ x = 2\n"
+
+    result = runner.invoke(app, ["trace", "show", recorded_run.name, "--state", "-1"])
+    assert result.stdout.startswith("State 4: Stuttering")
+
+
+def test_trace_show_errors(recorded_run, runner):
+    result = runner.invoke(app, ["trace", "show", "--state", "99"])
+    assert result.exit_code == 1
+    assert "out of range" in result.output
+
+    result = runner.invoke(app, ["trace", "show", "--state", "1", "--vars", "z"])
+    assert result.exit_code == 1
+    assert "Unknown variable" in result.output
+
+    result = runner.invoke(app, ["trace", "show", "Other"])
+    assert result.exit_code == 1
+    assert "No run matching 'Other'" in result.output
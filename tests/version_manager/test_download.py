@@ -1,7 +1,9 @@
+import threading
+
 import pytest
 import requests
 
-from tlaplus_cli.versioning import RemoteVersion, download_version
+from tlaplus_cli.versioning import RemoteVersion, download_version, download_versions
 
 
 def test_download_version_cleanup_on_failure(mocker, mock_cache):
@@ -53,3 +55,25 @@ def test_download_version_force_removes_existing(mocker, mock_cache):
     assert version_dir.exists()
     assert not old_file.exists()
     assert (version_dir / "tla2tools.jar").exists()
+
+
+def test_download_versions_runs_concurrently(mocker, mock_cache):
+    """All targets are downloaded on the pool and results keep input order."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _download(_url, jar_path, label, _progress=None):
+        barrier.wait()  # deadlocks (and times out) unless both downloads run at once
+        jar_path.write_bytes(label.encode())
+
+    mocker.patch("tlaplus_cli.versioning.downloader._download_jar", side_effect=_download)
+    mocker.patch("tlaplus_cli.versioning.downloader.write_version_metadata")
+    targets = [
+        RemoteVersion("v1.7.0", "bbbbbbb", "b" * 40, "http://example.com/v1.7.0", "", False),
+        RemoteVersion("v1.8.0", "aaaaaaa", "a" * 40, "http://example.com/v1.8.0", "", False),
+    ]
+
+    results = download_versions(targets, max_workers=2)
+
+    assert [r.target.name for r in results] == ["v1.7.0", "v1.8.0"]
+    assert all(r.error is None for r in results)
+    assert (results[1].version_dir / "tla2tools.jar").read_bytes() == b"v1.8.0"
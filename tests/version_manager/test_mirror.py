@@ -0,0 +1,100 @@
+import json
+
+from tlaplus_cli.versioning import FetchStatus, RemoteVersion, download_version, fetch_remote_versions, sync_mirror
+from tlaplus_cli.versioning.mirror import install_local_file, load_mirror_versions
+
+
+def _make_mirror(root):
+    jar = root / "v1.8.0-aaaaaaa" / "tla2tools.jar"
+    jar.parent.mkdir(parents=True)
+    jar.write_bytes(b"mirrored jar")
+    index = [
+        {
+            "name": "v1.8.0",
+            "short_sha": "aaaaaaa",
+            "full_sha": "a" * 40,
+            "jar": "v1.8.0-aaaaaaa/tla2tools.jar",
+            "published_at": "2024-01-01T00:00:00Z",
+            "prerelease": False,
+        }
+    ]
+    (root / "versions.json").write_text(json.dumps(index))
+    return jar
+
+
+def test_load_mirror_versions_accepts_file_url(tmp_path):
+    jar = _make_mirror(tmp_path)
+    versions = load_mirror_versions(tmp_path.as_uri())
+    assert versions is not None
+    assert versions[0].name == "v1.8.0"
+    assert versions[0].jar_download_url == jar.as_uri()
+
+
+def test_load_mirror_versions_missing_index(tmp_path):
+    assert load_mirror_versions(str(tmp_path)) is None
+
+
+def test_fetch_remote_versions_uses_mirror_without_network(tmp_path, mocker, mock_cache):
+    _make_mirror(tmp_path / "mirror")
+    get = mocker.patch("requests.get")
+    versions, status = fetch_remote_versions("tags", "releases", mirror=str(tmp_path / "mirror"))
+    assert status == FetchStatus.MIRROR
+    assert [v.name for v in versions] == ["v1.8.0"]
+    get.assert_not_called()
+
+
+def test_download_version_from_mirror_is_local(tmp_path, mocker, mock_cache):
+    src = _make_mirror(tmp_path / "mirror")
+    get = mocker.patch("requests.get")
+    mocker.patch("tlaplus_cli.versioning.downloader.write_version_metadata")
+    (target,) = load_mirror_versions(str(tmp_path / "mirror"))
+
+    version_dir = download_version(target)
+
+    get.assert_not_called()
+    assert (version_dir / "tla2tools.jar").read_bytes() == b"mirrored jar"
+    assert (version_dir / "tla2tools.jar").stat().st_ino == src.stat().st_ino
+
+
+def test_install_local_file_falls_back_to_copy(tmp_path, mocker):
+    src = tmp_path / "src.jar"
+    src.write_bytes(b"data")
+    mocker.patch("tlaplus_cli.versioning.mirror.os.link", side_effect=OSError("cross-device link"))
+    dst = tmp_path / "dst.jar"
+    install_local_file(src, dst)
+    assert dst.read_bytes() == b"data"
+    assert dst.stat().st_ino != src.stat().st_ino
+
+
+def test_install_local_file_copies_when_copy_file_range_stalls(tmp_path, mocker):
+    src = tmp_path / "src.jar"
+    src.write_bytes(b"data")
+    mocker.patch("tlaplus_cli.versioning.mirror.os.link", side_effect=OSError("cross-device link"))
+    mocker.patch("tlaplus_cli.versioning.mirror.os.copy_file_range", return_value=0, create=True)
+    dst = tmp_path / "dst.jar"
+    install_local_file(src, dst)
+    assert dst.read_bytes() == b"data"
+
+
+def test_sync_mirror_writes_index_and_skips_existing(tmp_path, mocker):
+    target = RemoteVersion(
+        name="v1.8.0",
+        short_sha="aaaaaaa",
+        full_sha="a" * 40,
+        jar_download_url="https://example.com/v1.8.0/tla2tools.jar",
+        published_at="2024-01-01T00:00:00Z",
+        prerelease=False,
+    )
+    download = mocker.patch(
+        "tlaplus_cli.versioning.downloader._download_jar",
+        side_effect=lambda _url, path, _label: path.write_bytes(b"jar"),
+    )
+    mirror = tmp_path / "mirror"
+
+    assert sync_mirror(mirror, [target]) == [target]
+    assert sync_mirror(mirror, [target]) == []
+    assert download.call_count == 1
+
+    (mirrored,) = load_mirror_versions(str(mirror))
+    assert mirrored.full_sha == target.full_sha
+    assert (mirror / "v1.8.0-aaaaaaa" / "tla2tools.jar").read_bytes() == b"jar"
@@ -0,0 +1,94 @@
+import sys
+import time
+
+import pytest
+
+from tlaplus_cli.watch import InotifyWatcher, PollingWatcher, create_watcher, debounced
+
+
+def _java(path):
+    return path.suffix == ".java"
+
+
+def test_polling_watcher_reports_changes(tmp_path):
+    src = tmp_path / "modules"
+    (src / "pkg").mkdir(parents=True)
+    existing = src / "pkg" / "Ops.java"
+    existing.write_text("class Ops {}")
+    watcher = PollingWatcher([src], accept=_java, interval=0.01)
+
+    assert watcher.wait(0.05) == set()
+
+    created = src / "New.java"
+    created.write_text("class New {}")
+    (src / ".New.java.swp").write_text("swap")
+    assert watcher.wait(1) == {created.resolve()}
+
+    existing.write_text("class Ops { int x; }")
+    existing.unlink()
+    assert watcher.wait(1) == {existing.resolve()}
+
+
+def test_polling_watcher_watches_single_files(tmp_path):
+    spec = tmp_path / "Spec.tla"
+    spec.write_text("---- MODULE Spec ----\n====\n")
+    (tmp_path / "Other.tla").write_text("x")
+    watcher = PollingWatcher([spec], interval=0.01)
+
+    (tmp_path / "Other.tla").write_text("changed")
+    assert watcher.wait(0.05) == set()
+    spec.write_text("---- MODULE Spec ----\nx == 1\n====\n")
+    assert watcher.wait(1) == {spec.resolve()}
+
+
+class _ScriptedWatcher:
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.timeouts = []
+
+    def wait(self, timeout):
+        self.timeouts.append(timeout)
+        return self.batches.pop(0) if self.batches else set()
+
+    def close(self):
+        pass
+
+
+def test_debounced_merges_changes_until_quiet(tmp_path):
+    a, b, c = (tmp_path / n for n in "abc")
+    watcher = _ScriptedWatcher([set(), {a}, {b}, set(), {c}, set()])
+
+    batches = debounced(watcher, 0.1)
+
+    assert next(batches) == {a, b}
+    assert next(batches) == {c}
+    assert watcher.timeouts == [None, None, 0.1, 0.1, None, 0.1]
+
+
+def test_create_watcher_polls_on_request(tmp_path):
+    assert isinstance(create_watcher([tmp_path], poll=True), PollingWatcher)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_follows_new_directories(tmp_path):
+    src = tmp_path / "modules"
+    src.mkdir()
+    try:
+        watcher = InotifyWatcher([src], accept=_java)
+    except OSError as e:
+        pytest.skip(f"inotify unavailable: {e}")
+    try:
+        assert watcher.wait(0.01) == set()
+        (src / "pkg").mkdir()
+        watcher.wait(0.05)
+        source = src / "pkg" / "Ops.java"
+        source.write_text("class Ops {}")
+        (src / "pkg" / "notes.txt").write_text("ignored")
+
+        deadline = time.monotonic() + 2
+        changed = set()
+        while source not in changed and time.monotonic() < deadline:
+            changed |= watcher.wait(0.1)
+        assert changed == {source}
+    finally:
+        watcher.close()